@@ -22,6 +22,7 @@ from eventum.api.routers.generators import router as generators_router
 from eventum.api.routers.generators import ws_router as ws_generators_router
 from eventum.api.routers.instance import router as instance_router
 from eventum.api.routers.instance import ws_router as ws_instance_router
+from eventum.api.routers.metrics import router as metrics_router
 from eventum.api.routers.preview import router as preview_router
 from eventum.api.routers.secrets import router as secrets_router
 from eventum.api.routers.startup import router as startup_router
@@ -147,6 +148,11 @@ def build_api_app(
         tags=['Secrets'],
         dependencies=[HttpAuthDepends],
     )
+    app.include_router(
+        metrics_router,
+        tags=['Metrics'],
+        dependencies=[HttpAuthDepends],
+    )
     app.include_router(docs_router, tags=['Docs'])
 
     asyncapi_schema = generate_asyncapi_schema(
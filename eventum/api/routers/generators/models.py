@@ -61,6 +61,74 @@ class OutputPluginStats(PluginStats, frozen=True, extra='forbid'):
     )
 
 
+class HistogramStats(BaseModel, frozen=True, extra='forbid'):
+    """Histogram of observed values."""
+
+    buckets: list[float] = Field(description='Upper bounds of buckets')
+    counts: list[int] = Field(
+        description=(
+            'Cumulative number of observations in each bucket, i.e. '
+            'number of observed values less or equal to bucket bound'
+        ),
+    )
+    count: int = Field(ge=0, description='Total number of observations')
+    sum: float = Field(description='Sum of all observed values')
+
+
+class QueueStats(BaseModel, frozen=True, extra='forbid'):
+    """State of queue between pipeline stages."""
+
+    size: int = Field(ge=0, description='Current number of batches')
+    max_size: int = Field(ge=0, description='Maximum number of batches')
+
+
+class OutputWriteStats(PluginStats, frozen=True, extra='forbid'):
+    """Write latency of output plugin."""
+
+    duration: HistogramStats = Field(
+        description='Duration (in seconds) of write operations',
+    )
+
+
+class PipelineStats(BaseModel, frozen=True, extra='forbid'):
+    """Stats of generation pipeline stages."""
+
+    input_batch_duration: HistogramStats = Field(
+        description=(
+            'Time (in seconds) of generating each batch of timestamps by '
+            'non interactive input plugins'
+        ),
+    )
+    timestamps_queue: QueueStats = Field(
+        description='State of queue with timestamp batches',
+    )
+    timestamps_queue_wait: HistogramStats = Field(
+        description='Time (in seconds) that timestamp batches wait in queue',
+    )
+    event_batch_duration: HistogramStats = Field(
+        description=(
+            'Time (in seconds) of producing events for each batch or its '
+            'chunk if flush size is set'
+        ),
+    )
+    events_queue: QueueStats = Field(
+        description='State of queue with event batches',
+    )
+    events_queue_wait: HistogramStats = Field(
+        description='Time (in seconds) that event batches wait in queue',
+    )
+    write_duration: list[OutputWriteStats] = Field(
+        description='Write latency of each output plugin',
+    )
+    lag: HistogramStats = Field(
+        description=(
+            'Lag (in seconds) between timestamp of first event in batch '
+            'and wall clock at the moment of completing write by each '
+            'output plugin, it is observed only in live mode'
+        ),
+    )
+
+
 class GeneratorStats(BaseModel, frozen=True, extra='forbid'):
     """Stats of generator."""
 
@@ -72,6 +140,10 @@ class GeneratorStats(BaseModel, frozen=True, extra='forbid'):
     output: list[OutputPluginStats] = Field(
         description='Output plugins statistics',
     )
+    pipeline: PipelineStats | None = Field(
+        default=None,
+        description='Pipeline stages statistics',
+    )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -27,11 +27,9 @@ from eventum.api.routers.generators.dependencies import (
 )
 from eventum.api.routers.generators.models import (
     BulkStartResponse,
-    EventPluginStats,
     GeneratorStats,
     GeneratorStatus,
-    InputPluginStats,
-    OutputPluginStats,
+    PipelineStats,
 )
 from eventum.api.utils.file_streaming import stream_file
 from eventum.api.utils.response_description import merge_responses
@@ -217,41 +215,44 @@ async def delete_generator(
     responses=_get_generator.responses,
 )
 async def get_generator_stats(generator: GeneratorDep) -> GeneratorStats:
-    if generator.is_running:
-        plugins = generator.get_plugins_info()
-    else:
+    if not generator.is_running:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='Generator is not running',
         )
 
-    return GeneratorStats(
-        start_time=generator.start_time,
-        input=[
-            InputPluginStats(
-                plugin_name=plugin.name,
-                plugin_id=plugin.id,
-                generated=plugin.generated,
-            )
-            for plugin in plugins.input
-        ],
-        event=EventPluginStats(
-            plugin_name=plugins.event.name,
-            plugin_id=plugins.event.id,
-            produced=plugins.event.produced,
-            produce_failed=plugins.event.produce_failed,
-        ),
-        output=[
-            OutputPluginStats(
-                plugin_name=plugin.name,
-                plugin_id=plugin.id,
-                written=plugin.written,
-                write_failed=plugin.write_failed,
-                format_failed=plugin.format_failed,
-            )
-            for plugin in plugins.output
-        ],
-    )
+    try:
+        stats = await asyncio.to_thread(generator.get_stats)
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from None
+
+    return GeneratorStats.model_validate(stats, from_attributes=True)
+
+
+@router.get(
+    '/{id}/stats/pipeline/',
+    description=(
+        'Get metrics of pipeline stages of running generator: latencies '
+        'of producing and writing batches, time that batches wait in '
+        'queues, queues occupancy and lag of events'
+    ),
+    responses=_get_generator.responses,
+)
+async def get_generator_pipeline_stats(
+    generator: GeneratorDep,
+) -> PipelineStats:
+    stats = await get_generator_stats(generator)
+
+    if stats.pipeline is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Pipeline stats are unavailable',
+        )
+
+    return stats.pipeline
 
 
 @router.post(
@@ -0,0 +1,5 @@
+"""Metrics router package."""
+
+from eventum.api.routers.metrics.routes import router
+
+__all__ = ['router']
@@ -0,0 +1,462 @@
+"""Rendering of generator stats in Prometheus text exposition format."""
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Literal
+
+from pytz import timezone
+
+from eventum.core.stats import GeneratorStats, HistogramStats
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+type MetricType = Literal['counter', 'gauge', 'histogram']
+type Labels = dict[str, str | int]
+
+
+@dataclass
+class _MetricFamily:
+    """Family of samples of the same metric.
+
+    Attributes
+    ----------
+    type : MetricType
+        Type of metric.
+
+    help : str
+        Description of metric.
+
+    samples : list[str]
+        Rendered samples.
+
+    """
+
+    type: MetricType
+    help: str
+    samples: list[str] = field(default_factory=list)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape label value.
+
+    Parameters
+    ----------
+    value : str
+        Value to escape.
+
+    Returns
+    -------
+    str
+        Escaped value.
+
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    """Format labels of sample.
+
+    Parameters
+    ----------
+    labels : Labels
+        Labels to format.
+
+    Returns
+    -------
+    str
+        Formatted labels in curly braces or empty string if there are
+        no labels.
+
+    """
+    if not labels:
+        return ''
+
+    pairs = ','.join(
+        f'{name}="{_escape_label_value(str(value))}"'
+        for name, value in labels.items()
+    )
+    return f'{{{pairs}}}'
+
+
+def _format_value(value: float) -> str:
+    """Format value of sample.
+
+    Parameters
+    ----------
+    value : float
+        Value to format.
+
+    Returns
+    -------
+    str
+        Formatted value.
+
+    """
+    if isinstance(value, int):
+        return str(value)
+
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    if math.isnan(value):
+        return 'NaN'
+
+    return repr(value)
+
+
+class MetricsExposition:
+    """Builder of metrics text in Prometheus exposition format."""
+
+    def __init__(self) -> None:
+        """Initialize builder."""
+        self._families: dict[str, _MetricFamily] = {}
+
+    def _get_family(
+        self,
+        name: str,
+        type: MetricType,
+        help: str,
+    ) -> _MetricFamily:
+        """Get family of metric creating it if it does not exist.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric.
+
+        type : MetricType
+            Type of the metric.
+
+        help : str
+            Description of the metric.
+
+        Returns
+        -------
+        _MetricFamily
+            Family of the metric.
+
+        """
+        family = self._families.get(name)
+        if family is None:
+            family = _MetricFamily(type=type, help=help)
+            self._families[name] = family
+
+        return family
+
+    def add(
+        self,
+        name: str,
+        type: Literal['counter', 'gauge'],
+        help: str,
+        labels: Labels,
+        value: float,
+    ) -> None:
+        """Add sample of counter or gauge metric.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric.
+
+        type : Literal['counter', 'gauge']
+            Type of the metric.
+
+        help : str
+            Description of the metric.
+
+        labels : Labels
+            Labels of the sample.
+
+        value : float
+            Value of the sample.
+
+        """
+        family = self._get_family(name=name, type=type, help=help)
+        family.samples.append(
+            f'{name}{_format_labels(labels)} {_format_value(value)}',
+        )
+
+    def add_histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Labels,
+        histogram: HistogramStats,
+    ) -> None:
+        """Add samples of histogram metric.
+
+        Parameters
+        ----------
+        name : str
+            Name of the metric.
+
+        help : str
+            Description of the metric.
+
+        labels : Labels
+            Labels of the samples.
+
+        histogram : HistogramStats
+            Histogram to add.
+
+        """
+        family = self._get_family(name=name, type='histogram', help=help)
+
+        for bound, count in zip(
+            histogram.buckets,
+            histogram.counts,
+            strict=True,
+        ):
+            bucket_labels = labels | {'le': _format_value(float(bound))}
+            family.samples.append(
+                f'{name}_bucket{_format_labels(bucket_labels)} {count}',
+            )
+
+        inf_labels = labels | {'le': '+Inf'}
+        family.samples.extend(
+            [
+                f'{name}_bucket{_format_labels(inf_labels)} {histogram.count}',
+                f'{name}_sum{_format_labels(labels)} '
+                f'{_format_value(histogram.sum)}',
+                f'{name}_count{_format_labels(labels)} {histogram.count}',
+            ],
+        )
+
+    def render(self) -> str:
+        """Render all added metrics.
+
+        Returns
+        -------
+        str
+            Metrics in text exposition format.
+
+        """
+        lines: list[str] = []
+        for name, family in self._families.items():
+            lines.append(f'# HELP {name} {family.help}')
+            lines.append(f'# TYPE {name} {family.type}')
+            lines.extend(family.samples)
+
+        return '\n'.join(lines) + '\n'
+
+
+def _add_generator_stats(
+    exposition: MetricsExposition,
+    generator_id: str,
+    stats: GeneratorStats,
+) -> None:
+    """Add metrics of running generator.
+
+    Parameters
+    ----------
+    exposition : MetricsExposition
+        Metrics builder.
+
+    generator_id : str
+        ID of the generator.
+
+    stats : GeneratorStats
+        Stats of the generator.
+
+    """
+    labels: Labels = {'generator': generator_id}
+
+    now = datetime.now().astimezone(tz=timezone('UTC'))
+    uptime = (now - stats.start_time).total_seconds()
+
+    exposition.add(
+        'eventum_generator_start_time_seconds',
+        'gauge',
+        'Start time of the generator since unix epoch',
+        labels,
+        stats.start_time.timestamp(),
+    )
+    exposition.add(
+        'eventum_generator_uptime_seconds',
+        'gauge',
+        'Number of seconds since generator start time',
+        labels,
+        uptime,
+    )
+
+    total_generated = 0
+    for plugin in stats.input:
+        total_generated += plugin.generated
+        exposition.add(
+            'eventum_input_generated_total',
+            'counter',
+            'Number of timestamps generated by input plugin',
+            labels
+            | {
+                'plugin_name': plugin.plugin_name,
+                'plugin_id': plugin.plugin_id,
+            },
+            plugin.generated,
+        )
+
+    event_labels = labels | {
+        'plugin_name': stats.event.plugin_name,
+        'plugin_id': stats.event.plugin_id,
+    }
+    exposition.add(
+        'eventum_event_produced_total',
+        'counter',
+        'Number of events produced by event plugin',
+        event_labels,
+        stats.event.produced,
+    )
+    exposition.add(
+        'eventum_event_produce_failed_total',
+        'counter',
+        'Number of events unsuccessfully produced by event plugin',
+        event_labels,
+        stats.event.produce_failed,
+    )
+
+    total_written = 0
+    for output_plugin in stats.output:
+        total_written += output_plugin.written
+        output_labels = labels | {
+            'plugin_name': output_plugin.plugin_name,
+            'plugin_id': output_plugin.plugin_id,
+        }
+        exposition.add(
+            'eventum_output_written_total',
+            'counter',
+            'Number of events written by output plugin',
+            output_labels,
+            output_plugin.written,
+        )
+        exposition.add(
+            'eventum_output_write_failed_total',
+            'counter',
+            'Number of events unsuccessfully written by output plugin',
+            output_labels,
+            output_plugin.write_failed,
+        )
+        exposition.add(
+            'eventum_output_format_failed_total',
+            'counter',
+            'Number of events unsuccessfully formatted by output plugin',
+            output_labels,
+            output_plugin.format_failed,
+        )
+
+    exposition.add(
+        'eventum_generator_input_eps',
+        'gauge',
+        'Average number of generated timestamps per second since start',
+        labels,
+        total_generated / uptime if uptime > 0 else 0.0,
+    )
+    exposition.add(
+        'eventum_generator_output_eps',
+        'gauge',
+        'Average number of written events per second since start',
+        labels,
+        total_written / uptime if uptime > 0 else 0.0,
+    )
+
+    pipeline = stats.pipeline
+    if pipeline is None:
+        return
+
+    for queue_name, queue in (
+        ('timestamps', pipeline.timestamps_queue),
+        ('events', pipeline.events_queue),
+    ):
+        queue_labels = labels | {'queue': queue_name}
+        exposition.add(
+            'eventum_queue_size',
+            'gauge',
+            'Current number of batches in queue',
+            queue_labels,
+            queue.size,
+        )
+        exposition.add(
+            'eventum_queue_max_size',
+            'gauge',
+            'Maximum number of batches in queue',
+            queue_labels,
+            queue.max_size,
+        )
+
+    for queue_name, histogram in (
+        ('timestamps', pipeline.timestamps_queue_wait),
+        ('events', pipeline.events_queue_wait),
+    ):
+        exposition.add_histogram(
+            'eventum_queue_wait_seconds',
+            'Time that batches wait in queue',
+            labels | {'queue': queue_name},
+            histogram,
+        )
+
+    exposition.add_histogram(
+        'eventum_input_batch_duration_seconds',
+        'Time of generating batch of timestamps by input plugins',
+        labels,
+        pipeline.input_batch_duration,
+    )
+    exposition.add_histogram(
+        'eventum_event_batch_duration_seconds',
+        'Time of producing events for batch of timestamps',
+        event_labels,
+        pipeline.event_batch_duration,
+    )
+    for write_stats in pipeline.write_duration:
+        exposition.add_histogram(
+            'eventum_output_write_duration_seconds',
+            'Duration of write operations of output plugin',
+            labels
+            | {
+                'plugin_name': write_stats.plugin_name,
+                'plugin_id': write_stats.plugin_id,
+            },
+            write_stats.duration,
+        )
+    exposition.add_histogram(
+        'eventum_event_lag_seconds',
+        'Lag between event timestamp and wall clock after write',
+        labels,
+        pipeline.lag,
+    )
+
+
+def render_metrics(stats: Mapping[str, GeneratorStats | None]) -> str:
+    """Render metrics of generators.
+
+    Parameters
+    ----------
+    stats : Mapping[str, GeneratorStats | None]
+        Stats of generators with generator IDs in keys, value is
+        `None` for generators that are not running.
+
+    Returns
+    -------
+    str
+        Metrics in text exposition format.
+
+    """
+    exposition = MetricsExposition()
+
+    for generator_id, generator_stats in stats.items():
+        exposition.add(
+            'eventum_generator_up',
+            'gauge',
+            'Whether the generator is running',
+            {'generator': generator_id},
+            int(generator_stats is not None),
+        )
+
+    for generator_id, generator_stats in stats.items():
+        if generator_stats is not None:
+            _add_generator_stats(
+                exposition=exposition,
+                generator_id=generator_id,
+                stats=generator_stats,
+            )
+
+    return exposition.render()
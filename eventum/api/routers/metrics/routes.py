@@ -0,0 +1,73 @@
+"""Routes."""
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from eventum.api.dependencies.app import GeneratorManagerDep
+from eventum.api.routers.metrics.exposition import CONTENT_TYPE, render_metrics
+from eventum.app.manager import GeneratorManager
+from eventum.core.stats import GeneratorStats
+
+router = APIRouter()
+
+STATS_TIMEOUT = 1.0
+
+
+def _collect_stats(
+    generator_manager: GeneratorManager,
+) -> dict[str, GeneratorStats | None]:
+    """Collect stats of all generators.
+
+    Parameters
+    ----------
+    generator_manager : GeneratorManager
+        Manager of generators.
+
+    Returns
+    -------
+    dict[str, GeneratorStats | None]
+        Stats of generators with generator IDs in keys, value is
+        `None` for generators that are not running.
+
+    Notes
+    -----
+    Stats are read without acquiring locks of generators, so
+    collecting does not wait for generators starting or stopping.
+    Generators running in separate processes that are busy for longer
+    than `STATS_TIMEOUT` are reported as not running.
+
+    """
+    stats: dict[str, GeneratorStats | None] = {}
+    for generator in generator_manager.get_generators():
+        generator_id = generator.params.id
+
+        if not generator.is_running:
+            stats[generator_id] = None
+            continue
+
+        try:
+            stats[generator_id] = generator.get_stats(timeout=STATS_TIMEOUT)
+        except RuntimeError:
+            stats[generator_id] = None
+
+    return stats
+
+
+@router.get(
+    '/metrics',
+    description=(
+        'Get metrics of all generators in Prometheus text exposition format'
+    ),
+    response_class=PlainTextResponse,
+    response_description='Metrics in Prometheus text exposition format',
+)
+async def get_metrics(
+    generator_manager: GeneratorManagerDep,
+) -> PlainTextResponse:
+    stats = await asyncio.to_thread(_collect_stats, generator_manager)
+    return PlainTextResponse(
+        content=render_metrics(stats),
+        media_type=CONTENT_TYPE,
+    )
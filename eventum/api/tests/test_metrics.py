@@ -0,0 +1,137 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytz import timezone
+
+from eventum.api.routers.metrics import router
+from eventum.api.routers.metrics.routes import STATS_TIMEOUT
+from eventum.api.routers.metrics.exposition import render_metrics
+from eventum.core.metrics import Histogram
+from eventum.core.stats import (
+    EventPluginStats,
+    GeneratorStats,
+    InputPluginStats,
+    OutputPluginStats,
+    OutputWriteStats,
+    PipelineStats,
+    QueueStats,
+)
+
+
+def _histogram(*values):
+    histogram = Histogram([0.1, 1])
+    for value in values:
+        histogram.observe(value)
+
+    return histogram.snapshot()
+
+
+STATS = GeneratorStats(
+    start_time=datetime(2025, 1, 1, tzinfo=timezone('UTC')),
+    input=[
+        InputPluginStats(plugin_name='timer', plugin_id=1, generated=10),
+        InputPluginStats(plugin_name='cron', plugin_id=2, generated=5),
+    ],
+    event=EventPluginStats(
+        plugin_name='template',
+        plugin_id=1,
+        produced=15,
+        produce_failed=0,
+    ),
+    output=[
+        OutputPluginStats(
+            plugin_name='file',
+            plugin_id=1,
+            written=14,
+            write_failed=1,
+            format_failed=0,
+        ),
+    ],
+    pipeline=PipelineStats(
+        input_batch_duration=_histogram(0.05),
+        timestamps_queue=QueueStats(size=3, max_size=10),
+        timestamps_queue_wait=_histogram(0.01),
+        event_batch_duration=_histogram(0.5),
+        events_queue=QueueStats(size=0, max_size=10),
+        events_queue_wait=_histogram(),
+        write_duration=[
+            OutputWriteStats(
+                plugin_name='file',
+                plugin_id=1,
+                duration=_histogram(0.05, 0.5, 5),
+            ),
+        ],
+        lag=_histogram(),
+    ),
+)
+
+
+def test_render_metrics():
+    text = render_metrics({'gen1': STATS, 'gen2': None})
+    lines = text.splitlines()
+
+    assert 'eventum_generator_up{generator="gen1"} 1' in lines
+    assert 'eventum_generator_up{generator="gen2"} 0' in lines
+    assert (
+        'eventum_input_generated_total'
+        '{generator="gen1",plugin_name="cron",plugin_id="2"} 5'
+    ) in lines
+    assert (
+        'eventum_output_write_failed_total'
+        '{generator="gen1",plugin_name="file",plugin_id="1"} 1'
+    ) in lines
+    assert 'eventum_queue_size{generator="gen1",queue="timestamps"} 3' in lines
+
+    labels = 'generator="gen1",plugin_name="file",plugin_id="1"'
+    name = 'eventum_output_write_duration_seconds'
+    assert f'{name}_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'{name}_bucket{{{labels},le="1.0"}} 2' in lines
+    assert f'{name}_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f'{name}_sum{{{labels}}} 5.55' in lines
+    assert f'{name}_count{{{labels}}} 3' in lines
+
+    # each metric family is declared once
+    type_lines = [line for line in lines if line.startswith('# TYPE')]
+    assert len(type_lines) == len(set(type_lines))
+    assert f'# TYPE {name} histogram' in type_lines
+
+
+def test_render_metrics_escaping():
+    text = render_metrics({'gen"\\\n': None})
+
+    assert 'eventum_generator_up{generator="gen\\"\\\\\\n"} 0' in text
+
+
+def test_get_metrics():
+    running = MagicMock()
+    running.params.id = 'gen1'
+    running.is_running = True
+    running.get_stats.return_value = STATS
+
+    stopped = MagicMock()
+    stopped.params.id = 'gen2'
+    stopped.is_running = False
+
+    busy = MagicMock()
+    busy.params.id = 'gen3'
+    busy.is_running = True
+    busy.get_stats.side_effect = RuntimeError('Generator process is busy')
+
+    manager = MagicMock()
+    manager.get_generators.return_value = [running, stopped, busy]
+
+    app = FastAPI()
+    app.state.generator_manager = manager
+    app.include_router(router)
+
+    response = TestClient(app).get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'eventum_generator_up{generator="gen1"} 1' in response.text
+    assert 'eventum_generator_up{generator="gen2"} 0' in response.text
+    assert 'eventum_generator_up{generator="gen3"} 0' in response.text
+    stopped.get_stats.assert_not_called()
+    busy.get_stats.assert_called_once_with(timeout=STATS_TIMEOUT)
@@ -2,6 +2,7 @@
 
 from collections.abc import Iterable, Iterator
 from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
 
 import structlog
 
@@ -17,11 +18,19 @@ class ManagingError(Exception):
 
 
 class GeneratorManager:
-    """Manager of generators."""
+    """Manager of generators.
+
+    Notes
+    -----
+    Mapping of managed generators is guarded with lock, so generators
+    can be added and removed while other threads read it.
+
+    """
 
     def __init__(self) -> None:
         """Initialize manager."""
         self._generators: dict[str, Generator] = {}
+        self._lock = Lock()
 
     def add(self, params: GeneratorParameters) -> None:
         """Add new generator with provided parameters to list of managed
@@ -38,11 +47,12 @@ class GeneratorManager:
             If generator with this id is already added.
 
         """
-        if params.id in self._generators:
-            msg = 'Generator with this id is already added'
-            raise ManagingError(msg)
+        with self._lock:
+            if params.id in self._generators:
+                msg = 'Generator with this id is already added'
+                raise ManagingError(msg)
 
-        self._generators[params.id] = Generator(params)
+            self._generators[params.id] = Generator(params)
 
     def remove(self, generator_id: str) -> None:
         """Remove generator from list of managed generators. Stop it in
@@ -62,7 +72,8 @@ class GeneratorManager:
         generator = self.get_generator(generator_id)
         generator.stop()
 
-        del self._generators[generator_id]
+        with self._lock:
+            self._generators.pop(generator_id, None)
 
     def bulk_remove(self, generator_ids: Iterable[str]) -> None:
         """Remove generators from list of managed generators. Stop
@@ -79,15 +90,14 @@ class GeneratorManager:
             thread_name_prefix='generators-stopping:',
         ) as executor:
             for id in generator_ids:
-                try:
-                    generator = self._generators[id]
-                    executor.submit(
-                        propagate_logger_context()(generator.stop),
-                    )
-                    del self._generators[id]
-                except KeyError:
+                with self._lock:
+                    generator = self._generators.pop(id, None)
+
+                if generator is None:
                     continue
 
+                executor.submit(propagate_logger_context()(generator.stop))
+
     def start(self, generator_id: str) -> bool:
         """Start generator. Ignore call if generator is already
         running.
@@ -149,16 +159,19 @@ class GeneratorManager:
             thread_name_prefix='generators-starting:',
         ) as executor:
             for id in generator_ids:
-                try:
-                    generator = self._generators[id]
-                    future = executor.submit(
-                        propagate_logger_context()(generator.start),
-                    )
-                    future.add_done_callback(
-                        lambda future, id=id: callback(future, id),  # type: ignore[misc]
-                    )
-                except KeyError:
+                with self._lock:
+                    generator = self._generators.get(id)
+
+                if generator is None:
                     non_running_generators.append(id)
+                    continue
+
+                future = executor.submit(
+                    propagate_logger_context()(generator.start),
+                )
+                future.add_done_callback(
+                    lambda future, id=id: callback(future, id),  # type: ignore[misc]
+                )
 
         return running_generators, non_running_generators
 
@@ -194,8 +207,10 @@ class GeneratorManager:
             thread_name_prefix='generators-stopping:',
         ) as executor:
             for id in generator_ids:
-                if id in self._generators:
-                    generator = self._generators[id]
+                with self._lock:
+                    generator = self._generators.get(id)
+
+                if generator is not None:
                     executor.submit(
                         propagate_logger_context()(generator.stop),
                     )
@@ -213,8 +228,10 @@ class GeneratorManager:
             thread_name_prefix='generators-joining:',
         ) as executor:
             for id in generator_ids:
-                if id in self._generators:
-                    generator = self._generators[id]
+                with self._lock:
+                    generator = self._generators.get(id)
+
+                if generator is not None:
                     executor.submit(
                         propagate_logger_context()(generator.join),
                     )
@@ -240,7 +257,8 @@ class GeneratorManager:
 
         """
         try:
-            return self._generators[generator_id]
+            with self._lock:
+                return self._generators[generator_id]
         except KeyError as e:
             msg = f'No such generator `{e}`'
             raise ManagingError(msg) from None
@@ -248,7 +266,20 @@ class GeneratorManager:
     @property
     def generator_ids(self) -> list[str]:
         """List of generator ids."""
-        return list(self._generators.keys())
+        with self._lock:
+            return list(self._generators.keys())
+
+    def get_generators(self) -> list[Generator]:
+        """Get snapshot of all generators that are added to manager.
+
+        Returns
+        -------
+        list[Generator]
+            Generator instances.
+
+        """
+        with self._lock:
+            return list(self._generators.values())
 
     def iter_generators(self) -> Iterator[Generator]:
         """Iterate over all generators that are added to manager.
@@ -258,5 +289,10 @@ class GeneratorManager:
         Generator
             Generator instance.
 
+        Notes
+        -----
+        Generators are iterated over snapshot, so adding or removing
+        generators during iteration does not affect it.
+
         """
-        yield from self._generators.values()
+        yield from self.get_generators()
@@ -119,3 +119,22 @@ def test_get_generator_property(manager, fake_params):
         manager.add(fake_params)
 
     assert manager.generator_ids == ['gen1']
+
+
+@patch('eventum.app.manager.Generator')
+def test_get_generators(_, manager):
+    for i in range(3):
+        manager.add(FakeParams(f'g{i}'))
+
+    generators = manager.get_generators()
+    assert len(generators) == 3
+
+    # snapshot is not affected by removing generators
+    manager.bulk_remove(['g0', 'g1'])
+    assert len(generators) == 3
+    assert len(manager.get_generators()) == 1
+
+    for generator in manager.iter_generators():
+        manager.add(FakeParams('g3'))
+
+    assert len(manager.get_generators()) == 2
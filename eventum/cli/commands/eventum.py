@@ -1,10 +1,11 @@
 """Commands for starting app or single generator."""
 
+import json
 import os
 import signal
 import sys
 from pathlib import Path
-from typing import Literal, NoReturn
+from typing import Any, Literal, NoReturn
 
 import click
 import structlog
@@ -20,8 +21,15 @@ from eventum.app.main import App, AppError
 from eventum.app.models.settings import Settings
 from eventum.cli.pydantic_converter import from_model
 from eventum.cli.splash_screen import SPLASH_SCREEN
+from eventum.core.benchmark import (
+    BenchmarkError,
+    BenchmarkResult,
+    dump_results,
+    find_regressions,
+    run_benchmark,
+)
 from eventum.core.generator import Generator
-from eventum.core.parameters import GeneratorParameters
+from eventum.core.parameters import BatchParameters, GeneratorParameters
 from eventum.security.manage import SECURITY_SETTINGS
 from eventum.utils.validation_prettier import prettify_validation_errors
 
@@ -226,5 +234,266 @@ def generate(
     sys.exit(0)
 
 
+BENCHMARK_CONFIG_NAME = 'generator.yml'
+
+
+def _collect_benchmarks(paths: tuple[Path, ...]) -> dict[str, Path]:
+    """Collect benchmark configurations from specified paths.
+
+    Parameters
+    ----------
+    paths : tuple[Path, ...]
+        Paths to generator configuration files, directories with
+        `generator.yml` file or directories with such directories.
+
+    Returns
+    -------
+    dict[str, Path]
+        Paths to configuration files with benchmark names in keys,
+        name of benchmark is a name of configuration file directory.
+
+    """
+    benchmarks: dict[str, Path] = {}
+    for path in paths:
+        if path.is_file():
+            config_paths = [path]
+        elif (path / BENCHMARK_CONFIG_NAME).is_file():
+            config_paths = [path / BENCHMARK_CONFIG_NAME]
+        else:
+            config_paths = sorted(path.glob(f'*/{BENCHMARK_CONFIG_NAME}'))
+
+        for config_path in config_paths:
+            benchmarks[config_path.parent.name] = config_path
+
+    return benchmarks
+
+
+def _format_benchmark_result(result: BenchmarkResult) -> str:
+    """Format benchmark result for printing.
+
+    Parameters
+    ----------
+    result : BenchmarkResult
+        Result of benchmark.
+
+    Returns
+    -------
+    str
+        Formatted result.
+
+    """
+    lines = [
+        (
+            f'{result.name}: {result.timestamps} timestamps, '
+            f'{result.events} events, {result.bytes} bytes '
+            f'in {result.elapsed:.3f}s '
+            f'({result.timestamps_per_second:.0f} timestamps/s, '
+            f'{result.events_per_second:.0f} events/s, '
+            f'{result.bytes_per_second:.0f} bytes/s)'
+        ),
+    ]
+    lines.extend(
+        (
+            f'  {stage.name:<8}'
+            f'{stage.items_per_second:>14.0f} items/s'
+            f'  p50 {stage.latency_p50 * 1000:>9.3f}ms'
+            f'  p99 {stage.latency_p99 * 1000:>9.3f}ms'
+        )
+        for stage in result.stages
+    )
+    return os.linesep.join(lines)
+
+
+def _load_json(path: Path) -> Any:
+    """Load content of JSON file exiting on failure.
+
+    Parameters
+    ----------
+    path : Path
+        Path to JSON file.
+
+    Returns
+    -------
+    Any
+        Loaded content.
+
+    """
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        click.echo(f'Error: Failed to read JSON file: {e}', err=True)
+        sys.exit(1)
+
+
+def _check_regressions(
+    baseline: dict[str, Any],
+    results: list[BenchmarkResult],
+    tolerance: float,
+) -> None:
+    """Compare benchmark results with baseline printing found
+    regressions and exiting if there are any.
+
+    Parameters
+    ----------
+    baseline : dict[str, Any]
+        Baseline results.
+
+    results : list[BenchmarkResult]
+        Current results.
+
+    tolerance : float
+        Allowed relative decrease of stage throughput.
+
+    """
+    try:
+        regressions = find_regressions(
+            baseline=baseline,
+            results=results,
+            tolerance=tolerance,
+        )
+    except ValueError as e:
+        click.echo(f'Error: {e}', err=True)
+        sys.exit(1)
+
+    for regression in regressions:
+        click.echo(
+            (
+                f'Regression: {regression.benchmark} {regression.stage} '
+                f'{regression.baseline:.0f} -> {regression.current:.0f} '
+                f'items/s ({regression.change:+.1%})'
+            ),
+            err=True,
+        )
+
+    if regressions:
+        sys.exit(1)
+
+
+@cli.command
+@click.argument(
+    'paths',
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, resolve_path=True, path_type=Path),
+)
+@click.option(
+    '-o',
+    '--output',
+    default=None,
+    type=click.Path(dir_okay=False, resolve_path=True, path_type=Path),
+    help='Path to file for saving results in JSON format',
+)
+@click.option(
+    '--baseline',
+    default=None,
+    type=click.Path(
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+        path_type=Path,
+    ),
+    help='Path to JSON results of previous run to compare results with',
+)
+@click.option(
+    '--tolerance',
+    default=0.1,
+    show_default=True,
+    type=click.FloatRange(0, 1),
+    help='Allowed relative decrease of stage throughput against baseline',
+)
+@click.option(
+    '--batch-size',
+    default=10_000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Batch size for generating events',
+)
+@click.option(
+    '--workers',
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Number of worker processes for producing events',
+)
+@click.option(
+    '-v',
+    '--verbose',
+    count=True,
+    type=click.IntRange(0, 5),
+    default=0,
+    show_default=True,
+    help=(
+        'Level of verbosity for printed logs '
+        '(default: disabled, -v: critical, -vv: errors, '
+        '-vvv: warnings, -vvvv: info, -vvvvv: debug)'
+    ),
+)
+def bench(  # noqa: PLR0913
+    paths: tuple[Path, ...],
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+    batch_size: int,
+    workers: int,
+    verbose: NonVerbose | VerbosityLevel,
+) -> None:
+    """Benchmark throughput of generators.
+
+    Each generator is executed in sample mode by the same executor as
+    in regular generation and its input, event and output stages are
+    measured by pipeline metrics. Benchmark configurations must have at
+    least one `null` output plugin.
+    """
+    if verbose == 0:
+        logconf.disable()
+    else:
+        logconf.use_stderr(level=VERBOSITY_TO_LOG_LEVEL[verbose])
+
+    baseline_results = None if baseline is None else _load_json(baseline)
+
+    benchmarks = _collect_benchmarks(paths)
+    if not benchmarks:
+        click.echo('Error: No benchmark configurations found', err=True)
+        sys.exit(1)
+
+    results: list[BenchmarkResult] = []
+    for name, config_path in benchmarks.items():
+        params = GeneratorParameters(
+            id=name,
+            path=config_path,
+            live_mode=False,
+            batch=BatchParameters(size=batch_size, delay=None),
+            workers=workers,
+        )
+        try:
+            result = run_benchmark(name=name, params=params)
+        except BenchmarkError as e:
+            context = ', '.join(f'{k}={v}' for k, v in e.context.items())
+            click.echo(
+                f'Error: Benchmark `{name}` failed: {e} ({context})',
+                err=True,
+            )
+            sys.exit(1)
+
+        click.echo(_format_benchmark_result(result))
+        results.append(result)
+
+    if output is not None:
+        try:
+            with output.open('w') as f:
+                json.dump(dump_results(results), f, indent=2)
+        except OSError as e:
+            click.echo(f'Error: Failed to save results: {e}', err=True)
+            sys.exit(1)
+
+    if baseline_results is not None:
+        _check_regressions(
+            baseline=baseline_results,
+            results=results,
+            tolerance=tolerance,
+        )
+
+
 if __name__ == '__main__':
     cli()
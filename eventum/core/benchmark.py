@@ -0,0 +1,503 @@
+"""Benchmark of generator pipeline throughput.
+
+Benchmark executes generator in sample mode with the same executor as
+regular generation, so all generation parameters are applied and
+stages are executed concurrently. Throughput and latency of each stage
+are computed from pipeline metrics collected by executor.
+"""
+
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import eventum
+from eventum.core.config_loader import ConfigurationLoadError, load
+from eventum.core.executor import (
+    ExecutionError,
+    Executor,
+    ImproperlyConfiguredError,
+)
+from eventum.core.parameters import GeneratorParameters
+from eventum.core.plugins_initializer import (
+    InitializationError,
+    InitializedPlugins,
+    init_plugins,
+)
+from eventum.core.stats import HistogramStats
+from eventum.exceptions import ContextualError
+from eventum.plugins.output.plugins.null.plugin import NullOutputPlugin
+
+
+class BenchmarkError(ContextualError):
+    """Benchmark cannot be performed."""
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """Result of benchmarking single stage of pipeline.
+
+    Attributes
+    ----------
+    name : str
+        Name of the stage.
+
+    batches : int
+        Number of processed batches.
+
+    items : int
+        Number of processed items (timestamps for input stage, events
+        for event stage and events written by all plugins for output
+        stage).
+
+    elapsed : float
+        Total time (in seconds) spent in the stage.
+
+    latency_p50 : float
+        Median latency (in seconds) of processing single batch,
+        estimated from histogram of executor metrics.
+
+    latency_p99 : float
+        99th percentile of latency (in seconds) of processing single
+        batch, estimated from histogram of executor metrics.
+
+    """
+
+    name: str
+    batches: int
+    items: int
+    elapsed: float
+    latency_p50: float
+    latency_p99: float
+
+    @property
+    def items_per_second(self) -> float:
+        """Number of processed items per second."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get representation of result as dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            Result with computed throughput.
+
+        """
+        return asdict(self) | {'items_per_second': self.items_per_second}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Result of benchmarking generator.
+
+    Attributes
+    ----------
+    name : str
+        Name of the benchmark.
+
+    timestamps : int
+        Number of generated timestamps.
+
+    events : int
+        Number of produced events.
+
+    bytes : int
+        Size of produced events in bytes (in UTF-8 encoding) after
+        formatting by `null` output plugin.
+
+    elapsed : float
+        Total time (in seconds) of executing generator.
+
+    stages : list[StageResult]
+        Results of each stage.
+
+    """
+
+    name: str
+    timestamps: int
+    events: int
+    bytes: int
+    elapsed: float
+    stages: list[StageResult]
+
+    @property
+    def timestamps_per_second(self) -> float:
+        """Number of generated timestamps per second."""
+        return self.timestamps / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Number of produced events per second."""
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Number of produced bytes per second."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get representation of result as dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            Result with computed throughput.
+
+        """
+        return {
+            'name': self.name,
+            'timestamps': self.timestamps,
+            'events': self.events,
+            'bytes': self.bytes,
+            'elapsed': self.elapsed,
+            'timestamps_per_second': self.timestamps_per_second,
+            'events_per_second': self.events_per_second,
+            'bytes_per_second': self.bytes_per_second,
+            'stages': [stage.as_dict() for stage in self.stages],
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """Throughput regression of stage compared to baseline.
+
+    Attributes
+    ----------
+    benchmark : str
+        Name of the benchmark.
+
+    stage : str
+        Name of the stage.
+
+    baseline : float
+        Baseline throughput (in items per second).
+
+    current : float
+        Current throughput (in items per second).
+
+    """
+
+    benchmark: str
+    stage: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of throughput."""
+        return self.current / self.baseline - 1
+
+
+def _merge_histograms(histograms: Sequence[HistogramStats]) -> HistogramStats:
+    """Merge histograms with the same buckets.
+
+    Parameters
+    ----------
+    histograms : Sequence[HistogramStats]
+        Histograms to merge, at least one must be provided.
+
+    Returns
+    -------
+    HistogramStats
+        Merged histogram.
+
+    """
+    return HistogramStats(
+        buckets=histograms[0].buckets,
+        counts=[
+            sum(counts)
+            for counts in zip(*(h.counts for h in histograms), strict=True)
+        ],
+        count=sum(h.count for h in histograms),
+        sum=sum(h.sum for h in histograms),
+    )
+
+
+def _estimate_quantile(histogram: HistogramStats, quantile: float) -> float:
+    """Estimate quantile of values observed in histogram with linear
+    interpolation inside the bucket the quantile falls into.
+
+    Parameters
+    ----------
+    histogram : HistogramStats
+        Histogram of observed values.
+
+    quantile : float
+        Quantile to estimate in range [0; 1].
+
+    Returns
+    -------
+    float
+        Estimated quantile, upper bound of the last bucket is returned
+        if quantile falls into values greater than it.
+
+    """
+    if histogram.count == 0:
+        return 0.0
+
+    rank = quantile * histogram.count
+    lower_bound, lower_count = 0.0, 0
+    for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+        if count >= rank and count > lower_count:
+            return lower_bound + (bound - lower_bound) * (
+                (rank - lower_count) / (count - lower_count)
+            )
+
+        lower_bound, lower_count = bound, count
+
+    return histogram.buckets[-1]
+
+
+def _stage_result(
+    name: str,
+    items: int,
+    histogram: HistogramStats,
+) -> StageResult:
+    """Build result of stage from histogram of its batch durations.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage.
+
+    items : int
+        Number of processed items.
+
+    histogram : HistogramStats
+        Histogram of durations of processing batches.
+
+    Returns
+    -------
+    StageResult
+        Result of the stage.
+
+    """
+    return StageResult(
+        name=name,
+        batches=histogram.count,
+        items=items,
+        elapsed=histogram.sum,
+        latency_p50=_estimate_quantile(histogram, 0.5),
+        latency_p99=_estimate_quantile(histogram, 0.99),
+    )
+
+
+def _execute(
+    name: str,
+    plugins: InitializedPlugins,
+    params: GeneratorParameters,
+) -> BenchmarkResult:
+    """Execute benchmark.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+
+    plugins : InitializedPlugins
+        Initialized plugins.
+
+    params : GeneratorParameters
+        Generator parameters.
+
+    Returns
+    -------
+    BenchmarkResult
+        Result of the benchmark.
+
+    Raises
+    ------
+    BenchmarkError
+        If any error occurs during benchmark execution.
+
+    """
+    interactive = [plugin for plugin in plugins.input if plugin.is_interactive]
+    if interactive:
+        msg = 'Interactive input plugins cannot be benchmarked'
+        raise BenchmarkError(
+            msg,
+            context={'plugin_name': interactive[0].name},
+        )
+
+    null_output = [
+        plugin
+        for plugin in plugins.output
+        if isinstance(plugin, NullOutputPlugin)
+    ]
+    if not null_output:
+        msg = 'At least one `null` output plugin is required'
+        raise BenchmarkError(msg, context={})
+
+    try:
+        executor = Executor(
+            input=plugins.input,
+            event=plugins.event,
+            output=plugins.output,
+            params=params.model_copy(update={'live_mode': False}),
+        )
+    except ImproperlyConfiguredError as e:
+        raise BenchmarkError(str(e), context=e.context) from None
+
+    start = time.perf_counter()
+    try:
+        executor.execute()
+    except ExecutionError as e:
+        raise BenchmarkError(str(e), context=e.context) from None
+    elapsed = time.perf_counter() - start
+
+    stats = executor.get_stats()
+    timestamps = sum(plugin.generated for plugin in plugins.input)
+
+    # events produced in worker processes are not counted by event
+    # plugin of current process, so they are counted at output
+    events = null_output[0].written
+
+    stages = [
+        _stage_result(
+            name='input',
+            items=timestamps,
+            histogram=stats.input_batch_duration,
+        ),
+        _stage_result(
+            name='event',
+            items=events,
+            histogram=stats.event_batch_duration,
+        ),
+        _stage_result(
+            name='output',
+            items=sum(plugin.written for plugin in plugins.output),
+            histogram=_merge_histograms(
+                [write_stats.duration for write_stats in stats.write_duration],
+            ),
+        ),
+    ]
+    return BenchmarkResult(
+        name=name,
+        timestamps=timestamps,
+        events=events,
+        bytes=null_output[0].written_bytes,
+        elapsed=elapsed,
+        stages=stages,
+    )
+
+
+def run_benchmark(name: str, params: GeneratorParameters) -> BenchmarkResult:
+    """Run benchmark of generator.
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+
+    params : GeneratorParameters
+        Parameters of generator to benchmark, live mode parameter is
+        ignored as benchmark is always executed in sample mode.
+
+    Returns
+    -------
+    BenchmarkResult
+        Result of the benchmark.
+
+    Raises
+    ------
+    BenchmarkError
+        If any error occurs during benchmark execution.
+
+    """
+    try:
+        config = load(params.path, params.params)
+    except ConfigurationLoadError as e:
+        raise BenchmarkError(str(e), context=e.context) from None
+
+    try:
+        plugins = init_plugins(
+            input=config.input,
+            event=config.event,
+            output=config.output,
+            params=params,
+        )
+    except InitializationError as e:
+        raise BenchmarkError(str(e), context=e.context) from None
+
+    return _execute(name=name, plugins=plugins, params=params)
+
+
+def dump_results(results: Iterable[BenchmarkResult]) -> dict[str, Any]:
+    """Dump results of benchmarks to JSON serializable representation.
+
+    Parameters
+    ----------
+    results : Iterable[BenchmarkResult]
+        Results of benchmarks.
+
+    Returns
+    -------
+    dict[str, Any]
+        Representation of results.
+
+    """
+    return {
+        'version': eventum.__version__,
+        'results': [result.as_dict() for result in results],
+    }
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    results: Sequence[BenchmarkResult],
+    tolerance: float,
+) -> list[Regression]:
+    """Find throughput regressions of stages compared to baseline.
+
+    Parameters
+    ----------
+    baseline : dict[str, Any]
+        Baseline results in representation of `dump_results` function.
+
+    results : Sequence[BenchmarkResult]
+        Current results of benchmarks.
+
+    tolerance : float
+        Allowed relative decrease of throughput.
+
+    Returns
+    -------
+    list[Regression]
+        Found regressions, benchmarks and stages that are missing in
+        baseline are not compared.
+
+    Raises
+    ------
+    ValueError
+        If baseline has invalid structure.
+
+    """
+    try:
+        baseline_throughput = {
+            (result['name'], stage['name']): float(stage['items_per_second'])
+            for result in baseline['results']
+            for stage in result['stages']
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        msg = f'Invalid structure of baseline results: {e}'
+        raise ValueError(msg) from None
+
+    regressions: list[Regression] = []
+    for result in results:
+        for stage in result.stages:
+            expected = baseline_throughput.get((result.name, stage.name))
+            if not expected:
+                continue
+
+            if stage.items_per_second < expected * (1 - tolerance):
+                regressions.append(
+                    Regression(
+                        benchmark=result.name,
+                        stage=stage.name,
+                        baseline=expected,
+                        current=stage.items_per_second,
+                    ),
+                )
+
+    return regressions
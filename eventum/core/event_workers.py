@@ -0,0 +1,200 @@
+"""Pool of worker processes for producing events in parallel."""
+
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+from pytz import BaseTzInfo
+from pytz import timezone as get_timezone
+
+import eventum.logging.config as logconf
+from eventum.plugins.event.base.plugin import (
+    EventPlugin,
+    EventPluginParams,
+    ProduceBatchParams,
+    ProduceBatchResult,
+)
+from eventum.plugins.input.protocols import IdentifiedTimestamps
+
+# State of worker process, it is set by worker initializer
+_plugin: EventPlugin | None = None
+_tags_map: dict[int, tuple[str, ...]] = {}
+_timezone: BaseTzInfo | None = None
+
+
+def _initialize_worker(
+    plugin_cls: type[EventPlugin],
+    config: Any,
+    params: EventPluginParams,
+    tags_map: dict[int, tuple[str, ...]],
+    timezone: str,
+) -> None:
+    """Initialize worker process with its own instance of event plugin.
+
+    Parameters
+    ----------
+    plugin_cls : type[EventPlugin]
+        Class of event plugin.
+
+    config : Any
+        Config of event plugin.
+
+    params : EventPluginParams
+        Parameters of event plugin.
+
+    tags_map : dict[int, tuple[str, ...]]
+        Tags map with input plugin id in keys and tags tuple in
+        values.
+
+    timezone : str
+        Time zone of timestamps.
+
+    """
+    global _plugin, _tags_map, _timezone  # noqa: PLW0603
+
+    # worker process has no configured logging, errors are
+    # returned to parent process within produce results
+    logconf.disable()
+
+    _plugin = plugin_cls(config=config, params=params)
+    _tags_map = tags_map
+    _timezone = get_timezone(timezone)
+
+
+def _produce(timestamps: IdentifiedTimestamps) -> ProduceBatchResult:
+    """Produce events in worker process.
+
+    Parameters
+    ----------
+    timestamps : IdentifiedTimestamps
+        Timestamps to produce events for.
+
+    Returns
+    -------
+    ProduceBatchResult
+        Result of producing.
+
+    """
+    if _plugin is None or _timezone is None:
+        msg = 'Worker is not initialized'
+        raise RuntimeError(msg)
+
+    return _plugin.produce_batch(
+        ProduceBatchParams(
+            timestamps=timestamps,
+            tags=_tags_map,
+            timezone=_timezone,
+        ),
+    )
+
+
+class EventWorkersPool:
+    """Pool of worker processes for producing events. Each worker
+    holds its own instance of event plugin initialized with the same
+    config and parameters as the original plugin.
+    """
+
+    def __init__(
+        self,
+        plugin: EventPlugin,
+        workers: int,
+        tags_map: dict[int, tuple[str, ...]],
+        timezone: str,
+    ) -> None:
+        """Initialize pool.
+
+        Parameters
+        ----------
+        plugin : EventPlugin
+            Event plugin to replicate in workers.
+
+        workers : int
+            Number of worker processes.
+
+        tags_map : dict[int, tuple[str, ...]]
+            Tags map with input plugin id in keys and tags tuple in
+            values.
+
+        timezone : str
+            Time zone of timestamps.
+
+        Raises
+        ------
+        ValueError
+            If number of workers is less than 1 or plugin is not
+            parallelizable.
+
+        """
+        if workers < 1:
+            msg = 'Number of workers must be greater or equal to 1'
+            raise ValueError(msg)
+
+        if not plugin.is_parallelizable:
+            msg = f'Plugin `{plugin.name}` cannot be used in several workers'
+            raise ValueError(msg)
+
+        self._workers = workers
+
+        params: EventPluginParams = {
+            'id': plugin.id,
+            'base_path': plugin.base_path,
+        }
+
+        # spawn is used since workers are started from multithreaded
+        # process where forking is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context('spawn'),
+            initializer=_initialize_worker,
+            initargs=(
+                type(plugin),
+                plugin.config,
+                params,
+                tags_map,
+                timezone,
+            ),
+        )
+
+    def produce(self, timestamps: IdentifiedTimestamps) -> ProduceBatchResult:
+        """Produce events for timestamps by sharding them across
+        workers.
+
+        Parameters
+        ----------
+        timestamps : IdentifiedTimestamps
+            Timestamps to produce events for.
+
+        Returns
+        -------
+        ProduceBatchResult
+            Result of producing with events in order of timestamps.
+
+        Raises
+        ------
+        concurrent.futures.process.BrokenProcessPool
+            If some of the workers terminated abruptly or failed to
+            initialize.
+
+        """
+        chunks = [
+            chunk
+            for chunk in np.array_split(timestamps, self._workers)
+            if chunk.size > 0
+        ]
+
+        merged = ProduceBatchResult()
+        for result in self._executor.map(_produce, chunks):
+            merged.events.extend(result.events)
+            merged.errors.extend(result.errors)
+            merged.produce_failed += result.produce_failed
+
+            if result.exhausted:
+                merged.exhausted = True
+                break
+
+        return merged
+
+    def shutdown(self) -> None:
+        """Shutdown pool with terminating worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
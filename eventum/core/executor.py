@@ -1,39 +1,63 @@
 """Executor of plugins that orchestrates data flow between them."""
 
 import asyncio
-from collections.abc import Sequence
-from datetime import datetime
-from typing import TypedDict, cast
+import time
+from collections.abc import Generator, Iterator, Sequence
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TypedDict, cast, override
 
 import janus
+import numpy as np
 import structlog
 import uvloop
 from aiostream import stream
 from pytz import timezone
 
+from eventum.core.event_workers import EventWorkersPool
+from eventum.core.metrics import Histogram, PipelineMetrics
 from eventum.core.parameters import GeneratorParameters
+from eventum.core.stats import PipelineStats, QueueStats
 from eventum.exceptions import ContextualError
 from eventum.logging.context import propagate_logger_context
-from eventum.plugins.event.base.plugin import EventPlugin, ProduceParams
-from eventum.plugins.event.exceptions import (
-    PluginExhaustedError,
-    PluginProduceError,
+from eventum.plugins.event.base.plugin import (
+    EventPlugin,
+    ProduceBatchParams,
 )
 from eventum.plugins.input.adapters import (
+    AsyncIdentifiedTimestampsAdapter,
+    AsyncIdentifiedTimestampsCooperativeAdapter,
     AsyncIdentifiedTimestampsEmptyAdapter,
     AsyncIdentifiedTimestampsSyncAdapter,
     IdentifiedTimestampsPluginAdapter,
 )
 from eventum.plugins.input.base.plugin import InputPlugin
-from eventum.plugins.input.batcher import TimestampsBatcher
+from eventum.plugins.input.batcher import (
+    AdaptiveBatchSize,
+    TimestampsBatcher,
+)
 from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.merger import InputPluginsMerger
 from eventum.plugins.input.protocols import (
     IdentifiedTimestamps,
     SupportsAsyncIdentifiedTimestampsIterate,
+    SupportsIdentifiedTimestampsIterate,
     SupportsIdentifiedTimestampsSizedIterate,
 )
-from eventum.plugins.input.scheduler import BatchScheduler
+from eventum.plugins.input.runs import (
+    batch_runs,
+    count_timestamps,
+    expand_runs,
+    is_runs,
+)
+from eventum.plugins.input.scheduler import (
+    AsyncBatchScheduler,
+    BatchScheduler,
+)
+from eventum.plugins.input.utils.time_utils import (
+    now64,
+    timedelta64_to_seconds,
+)
 from eventum.plugins.output.base.plugin import OutputPlugin
 from eventum.plugins.output.exceptions import PluginOpenError, PluginWriteError
 from eventum.utils.throttler import AsyncThrottler, Throttler
@@ -49,6 +73,99 @@ class ExecutionError(ContextualError):
     """Execution error."""
 
 
+@dataclass(frozen=True, slots=True)
+class _TimestampsBatch:
+    """Batch of timestamps in queue.
+
+    Attributes
+    ----------
+    timestamps : IdentifiedTimestamps
+        Timestamps.
+
+    enqueued_at : float
+        Monotonic time of putting batch to queue.
+
+    """
+
+    timestamps: IdentifiedTimestamps
+    enqueued_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _EventsBatch:
+    """Batch of events in queue.
+
+    Attributes
+    ----------
+    events : list[str]
+        Events.
+
+    timestamp : np.datetime64
+        Timestamp of first event in batch.
+
+    enqueued_at : float
+        Monotonic time of putting batch to queue.
+
+    """
+
+    events: list[str]
+    timestamp: np.datetime64
+    enqueued_at: float
+
+
+class _MeasuredTimestampsSource(SupportsIdentifiedTimestampsIterate):
+    """Source of identified timestamps that observes time of
+    generating each array by target source.
+
+    Notes
+    -----
+    Only time spent inside iteration of target is observed, so waiting
+    of consumers (e.g. scheduling of publishing) is not included.
+
+    """
+
+    def __init__(
+        self,
+        target: SupportsIdentifiedTimestampsIterate,
+        histogram: Histogram,
+    ) -> None:
+        """Initialize source.
+
+        Parameters
+        ----------
+        target : SupportsIdentifiedTimestampsIterate
+            Target source.
+
+        histogram : Histogram
+            Histogram to observe durations of generating arrays in.
+
+        """
+        self._target = target
+        self._histogram = histogram
+
+    @override
+    def iterate(
+        self,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[IdentifiedTimestamps]:
+        iterator = self._target.iterate(skip_past=skip_past)
+
+        try:
+            while True:
+                start = time.monotonic()
+                array = next(iterator, None)
+
+                if array is None:
+                    break
+
+                self._histogram.observe(time.monotonic() - start)
+                yield array
+        finally:
+            if isinstance(iterator, Generator):
+                iterator.close()
+
+
 class Executor:
     """Executor of plugins."""
 
@@ -99,16 +216,20 @@ class Executor:
             raise ValueError(msg)
 
         logger.debug('Initializing queues')
-        self._timestamps_queue: janus.Queue[IdentifiedTimestamps | None] = (
+        self._timestamps_queue: janus.Queue[_TimestampsBatch | None] = (
             janus.Queue(maxsize=params.queue.max_timestamp_batches)
         )
-        self._events_queue: janus.Queue[list[str] | None] = janus.Queue(
+        self._events_queue: janus.Queue[_EventsBatch | None] = janus.Queue(
             maxsize=params.queue.max_event_batches,
         )
 
+        self._metrics = PipelineMetrics(output=self._output)
+
         logger.debug('Collecting input plugin tags')
         self._input_tags = self._build_input_tags_map()
 
+        self._adaptive_batch_size = self._create_adaptive_batch_size()
+
         logger.debug('Configuring input')
         (
             self._configured_non_interactive_input,
@@ -141,6 +262,77 @@ class Executor:
 
         return tags_map
 
+    def _create_adaptive_batch_size(self) -> AdaptiveBatchSize | None:
+        """Create adaptive batch size if it is enabled in generator
+        parameters.
+
+        Returns
+        -------
+        AdaptiveBatchSize | None
+            Adaptive batch size or `None` if it is disabled.
+
+        Raises
+        ------
+        ImproperlyConfiguredError
+            If adaptive batch size cannot be created with provided
+            parameters.
+
+        """
+        params = self._params.batch.adaptive
+        if not params.enabled:
+            return None
+
+        try:
+            return AdaptiveBatchSize(
+                initial_size=self._params.batch.size or params.min_size,
+                min_size=params.min_size,
+                max_size=params.max_size,
+                target_latency=params.target_latency,
+            )
+        except ValueError as e:
+            msg = 'Failed to initialize adaptive batch size'
+            raise ImproperlyConfiguredError(
+                msg,
+                context={'reason': str(e)},
+            ) from None
+
+    def _adapt_non_interactive_input(
+        self,
+        batcher: TimestampsBatcher,
+        plugins: Sequence[InputPlugin],
+    ) -> SupportsAsyncIdentifiedTimestampsIterate:
+        """Adapt batcher of non interactive input plugins for async
+        iteration with measuring of generation.
+
+        Parameters
+        ----------
+        batcher : TimestampsBatcher
+            Batcher of input plugins.
+
+        plugins : Sequence[InputPlugin]
+            Non interactive input plugins of batcher.
+
+        Returns
+        -------
+        SupportsAsyncIdentifiedTimestampsIterate
+            Adapted batcher, it is iterated in separate thread if some
+            of plugins can block and directly in event loop otherwise.
+
+        """
+        measured = _MeasuredTimestampsSource(
+            target=batcher,
+            histogram=self._metrics.input_batch_duration,
+        )
+
+        if any(plugin.is_blocking for plugin in plugins):
+            logger.debug(
+                'Adapting batcher for async iteration in separate thread',
+            )
+            return AsyncIdentifiedTimestampsAdapter(target=measured)
+
+        logger.debug('Adapting batcher for async iteration in event loop')
+        return AsyncIdentifiedTimestampsCooperativeAdapter(target=measured)
+
     def _configure_input(
         self,
     ) -> tuple[
@@ -206,11 +398,22 @@ class Executor:
 
             logger.debug('Wrapping to timestamps batcher')
             try:
+                # batches of interactive plugins are not accumulated,
+                # so adapting their size makes no sense
                 batcher = TimestampsBatcher(
                     source=input,
                     batch_size=self._params.batch.size,
                     batch_delay=self._params.batch.delay,
                     lax=item['lax_batcher_mode'],
+                    adaptive_size=(
+                        None
+                        if item['lax_batcher_mode']
+                        else self._adaptive_batch_size
+                    ),
+                    run_length=(
+                        self._params.batch.run_length
+                        and not item['lax_batcher_mode']
+                    ),
                 )
             except ValueError as e:
                 msg = 'Failed to initialize batcher'
@@ -219,24 +422,54 @@ class Executor:
                     context={'reason': str(e)},
                 ) from None
 
-            if self._params.live_mode:
-                logger.debug(
-                    'Wrapping to batch scheduler and adapting '
-                    'for async iteration',
-                )
-                result.append(
-                    AsyncIdentifiedTimestampsSyncAdapter(
-                        target=BatchScheduler(
-                            source=batcher,
-                            timezone=self._timezone,
+            release_slice = self._params.batch.release_slice
+
+            # interactive plugins block while waiting for interactions,
+            # so they are iterated ahead in a separate thread; other
+            # plugins are advanced on demand, in a separate thread only
+            # if some of them can block (e.g. on reading files)
+            if item['lax_batcher_mode']:
+                if self._params.live_mode:
+                    logger.debug(
+                        'Wrapping to batch scheduler and adapting '
+                        'for async iteration in separate thread',
+                    )
+                    result.append(
+                        AsyncIdentifiedTimestampsSyncAdapter(
+                            target=BatchScheduler(
+                                source=batcher,
+                                timezone=self._timezone,
+                                slice_duration=release_slice,
+                            ),
                         ),
-                    ),
-                )
+                    )
+                else:
+                    logger.debug(
+                        'Adapting batcher for async iteration in separate '
+                        'thread',
+                    )
+                    result.append(
+                        AsyncIdentifiedTimestampsSyncAdapter(target=batcher),
+                    )
             else:
-                logger.debug('Adapting batcher for async iteration')
-                result.append(
-                    AsyncIdentifiedTimestampsSyncAdapter(target=batcher),
+                # generation of interactive plugins includes waiting
+                # for interactions, so only non interactive plugins are
+                # measured
+                adapted = self._adapt_non_interactive_input(
+                    batcher=batcher,
+                    plugins=plugins,
                 )
+                if self._params.live_mode:
+                    logger.debug('Wrapping to async batch scheduler')
+                    result.append(
+                        AsyncBatchScheduler(
+                            source=adapted,
+                            timezone=self._timezone,
+                            slice_duration=release_slice,
+                        ),
+                    )
+                else:
+                    result.append(adapted)
 
         return result[0], result[1]
 
@@ -291,9 +524,10 @@ class Executor:
         await logger.adebug('Opening output plugins')
         await self._open_output_plugins()
 
-        # input task is executed in underlying thread due to async adapter,
-        # event task is executed in separate thread of loop thread pool
-        # and output task is executed in current thread
+        # input task is executed in current thread (interactive and
+        # blocking input plugins are iterated in underlying threads of
+        # async adapters), event task is executed in separate thread of
+        # loop thread pool and output task is executed in current thread
         await logger.adebug('Starting input, event and output tasks')
         input_task = loop.create_task(
             self._execute_input(),
@@ -395,7 +629,12 @@ class Executor:
                             ),
                         )
 
-                    await self._timestamps_queue.async_q.put(timestamps)
+                    await self._timestamps_queue.async_q.put(
+                        _TimestampsBatch(
+                            timestamps=timestamps,
+                            enqueued_at=time.monotonic(),
+                        ),
+                    )
 
             await logger.adebug('Finishing input plugins execution')
         except asyncio.QueueShutDown:
@@ -419,63 +658,294 @@ class Executor:
                 await self._timestamps_queue.async_q.join()
                 await self._timestamps_queue.aclose()
 
+    def _produce_events(
+        self,
+        timestamps: IdentifiedTimestamps,
+    ) -> tuple[list[str], bool]:
+        """Produce events for timestamps using event plugin.
+
+        Parameters
+        ----------
+        timestamps : IdentifiedTimestamps
+            Timestamps to produce events for.
+
+        Returns
+        -------
+        tuple[list[str], bool]
+            Produced events and flag whether the event plugin is
+            exhausted.
+
+        """
+        try:
+            result = self._event.produce_batch(
+                ProduceBatchParams(
+                    timestamps=timestamps,
+                    tags=self._input_tags,
+                    timezone=self._timezone,
+                ),
+            )
+        except Exception as e:
+            logger.exception(
+                'Unexpected error during event plugin execution',
+                reason=str(e),
+            )
+            return [], False
+
+        for error in result.errors:
+            logger.error(str(error), **error.context)
+
+        return result.events, result.exhausted
+
+    def _produce_events_in_workers(
+        self,
+        pool: EventWorkersPool,
+        timestamps: IdentifiedTimestamps,
+    ) -> tuple[list[str], bool]:
+        """Produce events for timestamps using pool of workers.
+
+        Parameters
+        ----------
+        pool : EventWorkersPool
+            Pool of event workers.
+
+        timestamps : IdentifiedTimestamps
+            Timestamps to produce events for.
+
+        Returns
+        -------
+        tuple[list[str], bool]
+            Produced events and flag whether the event plugin is
+            exhausted.
+
+        """
+        try:
+            result = pool.produce(timestamps)
+        except BrokenProcessPool as e:
+            logger.error(
+                'Event workers pool is broken, some of the workers '
+                'failed to initialize or terminated abruptly',
+                reason=str(e),
+            )
+            return [], True
+        except Exception as e:
+            logger.exception(
+                'Unexpected error during event plugin execution',
+                reason=str(e),
+            )
+            return [], False
+
+        for error in result.errors:
+            logger.error(str(error), **error.context)
+
+        self._event.update_stats(
+            produced=len(result.events),
+            produce_failed=result.produce_failed,
+        )
+
+        return result.events, result.exhausted
+
+    def _create_workers_pool(self) -> EventWorkersPool | None:
+        """Create pool of event workers if it is required by generator
+        parameters.
+
+        Returns
+        -------
+        EventWorkersPool | None
+            Pool of event workers or `None` if events should be
+            produced in current process.
+
+        """
+        if self._params.workers == 1:
+            return None
+
+        if not self._event.is_parallelizable:
+            logger.warning(
+                'Event plugin cannot be used in several workers, '
+                'producing events in single process',
+                plugin_name=self._event.name,
+                workers=self._params.workers,
+            )
+            return None
+
+        logger.debug('Starting event workers', workers=self._params.workers)
+        return EventWorkersPool(
+            plugin=self._event,
+            workers=self._params.workers,
+            tags_map=self._input_tags,
+            timezone=self._params.timezone,
+        )
+
+    def _produce_and_flush(
+        self,
+        pool: EventWorkersPool | None,
+        timestamps: IdentifiedTimestamps,
+        throttler: Throttler,
+    ) -> tuple[bool, float]:
+        """Produce events for timestamps and put them to events queue.
+
+        Parameters
+        ----------
+        pool : EventWorkersPool | None
+            Pool of event workers or `None` if events should be
+            produced in current process.
+
+        timestamps : IdentifiedTimestamps
+            Timestamps to produce events for.
+
+        throttler : Throttler
+            Throttler for warnings about full events queue.
+
+        Returns
+        -------
+        tuple[bool, float]
+            Flag whether the event plugin is exhausted and time (in
+            seconds) spent for producing events.
+
+        """
+        start = time.monotonic()
+        if pool is None:
+            events, exhausted = self._produce_events(timestamps)
+        else:
+            events, exhausted = self._produce_events_in_workers(
+                pool=pool,
+                timestamps=timestamps,
+            )
+        duration = time.monotonic() - start
+        self._metrics.event_batch_duration.observe(duration)
+
+        if not events:
+            return exhausted, duration
+
+        if self._events_queue.sync_q.full() and self._params.live_mode:
+            throttler(
+                logger.warning,
+                (
+                    'Events queue is full, consider decreasing '
+                    'EPS or changing batching settings to avoid '
+                    'time lag with actual event timestamps'
+                ),
+            )
+
+        self._events_queue.sync_q.put(
+            _EventsBatch(
+                events=events,
+                timestamp=timestamps['timestamp'][0],
+                enqueued_at=time.monotonic(),
+            ),
+        )
+
+        return exhausted, duration
+
+    def _adapt_batch_size(
+        self,
+        size: int,
+        duration: float,
+        interval: float | None,
+    ) -> None:
+        """Adapt batch size to current state of pipeline.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps in processed batch.
+
+        duration : float
+            Time (in seconds) spent for producing events for batch.
+
+        interval : float | None
+            Time (in seconds) between enqueuing previous and processed
+            batch by input stage, `None` for the first batch.
+
+        """
+        if self._adaptive_batch_size is None:
+            return
+
+        fill = max(
+            self._timestamps_queue.sync_q.qsize()
+            / self._timestamps_queue.maxsize,
+            self._events_queue.sync_q.qsize() / self._events_queue.maxsize,
+        )
+        self._adaptive_batch_size.update(
+            fill=fill,
+            throughput=size / duration if duration > 0 else None,
+            input_rate=(
+                size / interval
+                if interval is not None and interval > 0
+                else None
+            ),
+        )
+
     def _execute_event(self) -> None:
         """Execute event plugin."""
         exhausted = False
 
         throttler = Throttler(limit=1, period=10)
 
+        pool = self._create_workers_pool()
+        last_enqueued_at: float | None = None
+
         logger.debug('Starting to consume timestamps queue')
-        while not exhausted:
-            timestamps = self._timestamps_queue.sync_q.get()
-            self._timestamps_queue.sync_q.task_done()
+        try:
+            while not exhausted:
+                batch = self._timestamps_queue.sync_q.get()
+                self._timestamps_queue.sync_q.task_done()
 
-            if timestamps is None:
-                break
+                if batch is None:
+                    break
 
-            dt_timestamps = timestamps['timestamp'].astype(dtype=datetime)
-            params: ProduceParams = ProduceParams(
-                tags=...,  # type: ignore[typeddict-item]
-                timestamp=...,  # type: ignore[typeddict-item]
-            )
-            events: list[str] = []
-            for id, timestamp in zip(
-                timestamps['id'],
-                dt_timestamps,
-                strict=False,
-            ):
-                params['tags'] = self._input_tags[id]
-                params['timestamp'] = self._timezone.localize(timestamp)
+                self._metrics.timestamps_queue_wait.observe(
+                    time.monotonic() - batch.enqueued_at,
+                )
 
-                try:
-                    events.extend(self._event.produce(params))
-                except PluginProduceError as e:
-                    logger.error(str(e), **e.context)
-                except PluginExhaustedError:
-                    logger.debug(
-                        'Events exhausted, closing upstream queue',
+                # events of batch are flushed to output stage in chunks,
+                # so writing starts before the whole batch is produced
+                timestamps = batch.timestamps
+                if is_runs(timestamps):
+                    size = count_timestamps(timestamps)
+                    chunks = (
+                        expand_runs(chunk)
+                        for chunk in batch_runs(
+                            [timestamps],
+                            size=self._params.batch.flush_size or size,
+                        )
                     )
-                    self._timestamps_queue.close()
-                    exhausted = True
-                    break
-                except Exception as e:
-                    logger.exception(
-                        'Unexpected error during event plugin execution',
-                        reason=str(e),
+                else:
+                    size = timestamps.size
+                    flush_size = self._params.batch.flush_size or size
+                    chunks = (
+                        timestamps[offset : offset + flush_size]
+                        for offset in range(0, size, flush_size)
                     )
 
-            if events:
-                if self._events_queue.sync_q.full() and self._params.live_mode:
-                    throttler(
-                        logger.warning,
-                        (
-                            'Events queue is full, consider decreasing EPS '
-                            'or changing batching settings to avoid time lag '
-                            'with actual event timestamps'
-                        ),
+                produce_duration = 0.0
+                for chunk in chunks:
+                    exhausted, duration = self._produce_and_flush(
+                        pool=pool,
+                        timestamps=chunk,
+                        throttler=throttler,
                     )
+                    produce_duration += duration
+                    if exhausted:
+                        break
+
+                self._adapt_batch_size(
+                    size=size,
+                    duration=produce_duration,
+                    interval=(
+                        batch.enqueued_at - last_enqueued_at
+                        if last_enqueued_at is not None
+                        else None
+                    ),
+                )
+                last_enqueued_at = batch.enqueued_at
 
-                self._events_queue.sync_q.put(events)
+                if exhausted:
+                    logger.debug('Events exhausted, closing upstream queue')
+                    self._timestamps_queue.close()
+        finally:
+            if pool is not None:
+                logger.debug('Shutting down event workers')
+                pool.shutdown()
 
         logger.debug('Finishing event plugin execution')
         self._events_queue.sync_q.put(None)
@@ -516,6 +986,45 @@ class Executor:
             self._output_semaphore.release()
             self._output_tasks.remove(task)
 
+    async def _write(
+        self,
+        plugin: OutputPlugin,
+        events: list[str],
+        timestamp: np.datetime64,
+    ) -> int:
+        """Write events with output plugin observing write latency and
+        lag of written events.
+
+        Parameters
+        ----------
+        plugin : OutputPlugin
+            Output plugin.
+
+        events : list[str]
+            Events to write.
+
+        timestamp : np.datetime64
+            Timestamp of first event.
+
+        Returns
+        -------
+        int
+            Number of successfully written events.
+
+        """
+        start = time.monotonic()
+        try:
+            written = await plugin.write(events)
+        finally:
+            self._metrics.observe_write(plugin, time.monotonic() - start)
+
+        if self._params.live_mode:
+            self._metrics.lag.observe(
+                timedelta64_to_seconds(now64(self._timezone) - timestamp),
+            )
+
+        return written
+
     async def _execute_output(self) -> None:
         """Execute output plugins."""
         loop = asyncio.get_running_loop()
@@ -523,18 +1032,23 @@ class Executor:
         gathering_tasks: list[asyncio.Task] = []
         await logger.adebug('Starting to consume events queue')
         while True:
-            events = await self._events_queue.async_q.get()
+            batch = await self._events_queue.async_q.get()
             self._events_queue.async_q.task_done()
 
-            if events is None:
+            if batch is None:
                 break
 
+            self._metrics.events_queue_wait.observe(
+                time.monotonic() - batch.enqueued_at,
+            )
+
+            events = batch.events
             for plugin in self._output:
                 await self._output_semaphore.acquire()
 
                 task = loop.create_task(
                     asyncio.wait_for(
-                        plugin.write(events),
+                        self._write(plugin, events, batch.timestamp),
                         self._params.write_timeout,
                     ),
                     name=f'Writing with {plugin}',
@@ -555,6 +1069,27 @@ class Executor:
 
         self._end_execution_event.set()
 
+    def get_stats(self) -> PipelineStats:
+        """Get stats of pipeline stages. This method can be called from
+        any thread.
+
+        Returns
+        -------
+        PipelineStats
+            Stats of pipeline stages.
+
+        """
+        return self._metrics.snapshot(
+            timestamps_queue=QueueStats(
+                size=self._timestamps_queue.sync_q.qsize(),
+                max_size=self._timestamps_queue.maxsize,
+            ),
+            events_queue=QueueStats(
+                size=self._events_queue.sync_q.qsize(),
+                max_size=self._events_queue.maxsize,
+            ),
+        )
+
     def request_stop(self) -> None:
         """Request stop of execution. This method is expected to be
         called from thread other than the one executing `execute`
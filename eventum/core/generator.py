@@ -1,13 +1,22 @@
 """Module for managing event generation process."""
 
+import logging
+import multiprocessing as mp
 import os
+import signal
 import time
 from datetime import datetime
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event as ProcessEvent
+from queue import Empty
 from threading import Event, Lock, Thread, get_native_id
+from typing import TYPE_CHECKING, Any, Literal, assert_never
 
 import structlog
 from pytz import timezone
 
+import eventum.logging.config as logconf
 from eventum.core.config import GeneratorConfig
 from eventum.core.config_loader import ConfigurationLoadError, load
 from eventum.core.executor import (
@@ -21,11 +30,19 @@ from eventum.core.plugins_initializer import (
     InitializedPlugins,
     init_plugins,
 )
+from eventum.core.stats import GeneratorStats, collect_stats
 from eventum.logging.context import propagate_logger_context
 
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+type _Request = Literal['stop', 'stats']
+
 
 class Generator:
-    """Thread-wrapped generator."""
+    """Thread-wrapped or process-wrapped generator depending on
+    `isolation` parameter.
+    """
 
     def __init__(self, params: GeneratorParameters) -> None:
         """Initialize generator.
@@ -42,9 +59,13 @@ class Generator:
         self._plugins: InitializedPlugins | None = None
         self._executor: Executor | None = None
 
-        self._thread: Thread | None = None
-        self._initialized_event = Event()
-        self._successfully_done_event = Event()
+        self._worker: Thread | BaseProcess | None = None
+        self._initialized_event: Event | ProcessEvent = Event()
+        self._successfully_done_event: Event | ProcessEvent = Event()
+
+        # pipe to child process in process isolation mode
+        self._connection: Connection | None = None
+        self._connection_lock = Lock()
 
         self._logger = structlog.stdlib.get_logger().bind(
             generator_id=self._params.id,
@@ -152,8 +173,9 @@ class Generator:
             self._release()
 
     def start(self) -> bool:
-        """Start generator in separate thread waiting for its
-        initialization. Ignore call if generator is already running.
+        """Start generator in separate thread or process (depending on
+        `isolation` parameter) waiting for its initialization. Ignore
+        call if generator is already running.
 
         Returns
         -------
@@ -169,26 +191,170 @@ class Generator:
                 self._logger.debug('Generator is already running')
                 return True
 
-            self._logger.debug('Clearing status')
-            self._initialized_event.clear()
-            self._successfully_done_event.clear()
+            match self._params.isolation:
+                case 'thread':
+                    self._start_thread()
+                case 'process':
+                    self._start_process()
+                case v:
+                    assert_never(v)
+
+            return self._initialized_event.is_set()
+
+    def _start_thread(self) -> None:
+        """Start generator in separate thread waiting for its
+        initialization.
+        """
+        self._logger.debug('Clearing status')
+        self._initialized_event.clear()
+        self._successfully_done_event.clear()
+
+        self._logger.debug('Creating and starting thread')
+        self._worker = Thread(
+            target=propagate_logger_context()(self._start),
+            name=f'generator:{self._params.id}',
+        )
+        self._worker.start()
+
+        self._logger.debug('Waiting for initialization')
+        while self.is_initializing:
+            time.sleep(0.1)
 
-            self._logger.debug('Creating and starting thread')
-            self._thread = Thread(
-                target=propagate_logger_context()(self._start),
+    def _start_process(self) -> None:
+        """Start generator in separate process waiting for its
+        initialization.
+        """
+        context = mp.get_context('spawn')
+
+        self._logger.debug('Clearing status')
+        self._initialized_event = context.Event()
+        self._successfully_done_event = context.Event()
+
+        # connection lock is held until initialization is completed to
+        # receive start time before any other request is sent
+        with self._connection_lock:
+            self._connection, child_connection = context.Pipe()
+            log_queue = context.Queue()
+
+            self._logger.debug('Creating and starting process')
+            self._worker = context.Process(
+                target=_run_isolated,
+                kwargs={
+                    'params': self._params,
+                    'initialized_event': self._initialized_event,
+                    'successfully_done_event': self._successfully_done_event,
+                    'connection': child_connection,
+                    'log_queue': log_queue,
+                    'log_level': logging.getLogger().getEffectiveLevel(),
+                },
                 name=f'generator:{self._params.id}',
             )
-            self._thread.start()
-
-            self._logger.debug('Waiting for initialization')
+            self._worker.start()
+            child_connection.close()
+
+            Thread(
+                target=self._forward_logs,
+                args=(self._worker, log_queue),
+                name=f'generator-logs:{self._params.id}',
+                daemon=True,
+            ).start()
+
+            self._logger.debug(
+                'Waiting for initialization',
+                process_id=self._worker.pid,
+            )
             while self.is_initializing:
                 time.sleep(0.1)
 
-            return self._initialized_event.is_set()
+            if self._initialized_event.is_set():
+                self._start_time = self._connection.recv()
+
+    @staticmethod
+    def _forward_logs(process: BaseProcess, queue: 'Queue[Any]') -> None:
+        """Handle log records received from generator process until
+        the process terminates.
+
+        Parameters
+        ----------
+        process : BaseProcess
+            Generator process.
+
+        queue : Queue[Any]
+            Queue with log records of generator process.
+
+        """
+        while True:
+            try:
+                record: logging.LogRecord = queue.get(timeout=0.1)
+            except Empty:
+                if not process.is_alive():
+                    break
+                continue
+
+            logger = logging.getLogger(record.name)
+            if logger.isEnabledFor(record.levelno):
+                logger.handle(record)
+
+        queue.close()
+
+    def _send_request(
+        self,
+        request: _Request,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send request to generator process and receive response.
+
+        Parameters
+        ----------
+        request : _Request
+            Request to send.
+
+        timeout : float | None, default=None
+            Timeout (in seconds) of waiting until connection to
+            generator process is not used by other requests or by
+            starting of generator, if value is `None`, then wait
+            indefinitely.
+
+        Returns
+        -------
+        Any
+            Response of generator process.
+
+        Raises
+        ------
+        RuntimeError
+            If generator process is unavailable, busy for longer than
+            timeout or failed to handle request.
+
+        """
+        if not self._connection_lock.acquire(
+            timeout=-1 if timeout is None else timeout,
+        ):
+            msg = 'Generator process is busy'
+            raise RuntimeError(msg)
+
+        try:
+            if self._connection is None:
+                msg = 'Generator is not started in separate process'
+                raise RuntimeError(msg)
+
+            try:
+                self._connection.send(request)
+                response = self._connection.recv()
+            except (EOFError, OSError) as e:
+                msg = 'Generator process is unavailable'
+                raise RuntimeError(msg) from e
+        finally:
+            self._connection_lock.release()
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
 
     def stop(self) -> None:
-        """Stop generator with joining underlying thread. Ignore call
-        if generator is not running.
+        """Stop generator with joining underlying thread or process.
+        Ignore call if generator is not running.
         """
         self._logger.info('Stopping generator')
         self._logger.debug('Acquiring lock')
@@ -197,11 +363,21 @@ class Generator:
                 self._logger.debug('Generator is not running')
                 return
 
-            self._logger.debug('Requesting executor to stop')
-            self._executor.request_stop()  # type: ignore[union-attr]
+            if isinstance(self._worker, BaseProcess):
+                self._logger.debug('Requesting generator process to stop')
+                try:
+                    self._send_request('stop')
+                except RuntimeError as e:
+                    self._logger.debug(str(e))
+
+                self._logger.debug('Joining generator process')
+            else:
+                self._logger.debug('Requesting executor to stop')
+                self._executor.request_stop()  # type: ignore[union-attr]
 
-            self._logger.debug('Joining executing thread')
-            self._thread.join()  # type: ignore[union-attr]
+                self._logger.debug('Joining executing thread')
+
+            self._worker.join()  # type: ignore[union-attr]
 
     def _release(self) -> None:
         """Release resources of generator runtime after stopping or
@@ -213,10 +389,10 @@ class Generator:
 
     def join(self) -> None:
         """Wait until generator terminates."""
-        if self._thread is not None:
-            self._thread.join()
+        if self._worker is not None:
+            self._worker.join()
         else:
-            self._logger.debug('There is no executing thread')
+            self._logger.debug('There is no executing thread or process')
 
     def get_plugins_info(self) -> InitializedPlugins:
         """Get plugins information.
@@ -230,7 +406,8 @@ class Generator:
         ------
         RuntimeError
             If information about plugins is unavailable (e.g
-            generator wasn't yet started).
+            generator wasn't yet started or it is started in separate
+            process).
 
         """
         if self._plugins is None:
@@ -260,6 +437,46 @@ class Generator:
 
         return self._config
 
+    def get_stats(self, timeout: float | None = None) -> GeneratorStats:
+        """Get stats of running generator.
+
+        Parameters
+        ----------
+        timeout : float | None, default=None
+            Timeout (in seconds) of waiting for generator process to
+            become available for request while it is starting or
+            stopping, if value is `None`, then wait indefinitely. It is
+            used only in `process` isolation mode.
+
+        Returns
+        -------
+        GeneratorStats
+            Stats of generator.
+
+        Raises
+        ------
+        RuntimeError
+            If stats are unavailable (e.g generator is not running or
+            its process is busy for longer than timeout).
+
+        """
+        if isinstance(self._worker, BaseProcess):
+            return self._send_request('stats', timeout)  # type: ignore[no-any-return]
+
+        plugins = self._plugins
+        executor = self._executor
+        start_time = self._start_time
+
+        if plugins is None or start_time is None:
+            msg = 'No information about plugins is available'
+            raise RuntimeError(msg)
+
+        return collect_stats(
+            plugins=plugins,
+            start_time=start_time,
+            pipeline=None if executor is None else executor.get_stats(),
+        )
+
     @property
     def params(self) -> GeneratorParameters:
         """Generator parameters."""
@@ -269,8 +486,8 @@ class Generator:
     def is_initializing(self) -> bool:
         """Whether the generator is initializing."""
         return (
-            self._thread is not None
-            and self._thread.is_alive()
+            self._worker is not None
+            and self._worker.is_alive()
             and not self._initialized_event.is_set()
         )
 
@@ -278,8 +495,8 @@ class Generator:
     def is_running(self) -> bool:
         """Whether the generator is running."""
         return (
-            self._thread is not None
-            and self._thread.is_alive()
+            self._worker is not None
+            and self._worker.is_alive()
             and self._initialized_event.is_set()
         )
 
@@ -288,7 +505,7 @@ class Generator:
         """Whether the generator has ended execution with or without
         errors.
         """
-        return self._thread is not None and not self._thread.is_alive()
+        return self._worker is not None and not self._worker.is_alive()
 
     @property
     def is_ended_up_successfully(self) -> bool:
@@ -315,3 +532,71 @@ class Generator:
             raise RuntimeError(msg)
 
         return self._start_time
+
+
+def _run_isolated(  # noqa: PLR0913
+    params: GeneratorParameters,
+    initialized_event: ProcessEvent,
+    successfully_done_event: ProcessEvent,
+    connection: Connection,
+    log_queue: 'Queue[Any]',
+    log_level: int,
+) -> None:
+    """Run generator in current process serving requests of parent
+    process until the generator ends up.
+
+    Parameters
+    ----------
+    params : GeneratorParameters
+        Generator parameters.
+
+    initialized_event : ProcessEvent
+        Event to set when generator is initialized.
+
+    successfully_done_event : ProcessEvent
+        Event to set when generator ends up successfully.
+
+    connection : Connection
+        Connection to parent process for receiving requests and
+        sending responses.
+
+    log_queue : Queue[Any]
+        Queue for passing log records to parent process.
+
+    log_level : int
+        Log level.
+
+    """
+    # interruption is handled by parent process that stops generator
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logconf.use_queue(queue=log_queue, level=log_level)
+
+    generator = Generator(params.model_copy(update={'isolation': 'thread'}))
+    if not generator.start():
+        return
+
+    connection.send(generator.start_time)
+    initialized_event.set()
+
+    while generator.is_running:
+        if not connection.poll(0.1):
+            continue
+
+        request: _Request = connection.recv()
+        response: Any = None
+        try:
+            match request:
+                case 'stop':
+                    generator.stop()
+                case 'stats':
+                    response = generator.get_stats()
+                case r:
+                    assert_never(r)
+        except RuntimeError as e:
+            response = e
+
+        connection.send(response)
+
+    generator.join()
+    if generator.is_ended_up_successfully:
+        successfully_done_event.set()
@@ -0,0 +1,189 @@
+"""Metrics of generation pipeline stages."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import pairwise
+
+from eventum.core.stats import (
+    HistogramStats,
+    OutputWriteStats,
+    PipelineStats,
+    QueueStats,
+)
+from eventum.plugins.output.base.plugin import OutputPlugin
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+LAG_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram:
+    """Histogram of observed values with fixed buckets.
+
+    Notes
+    -----
+    Histogram is not guarded with lock, it is expected that values
+    are observed from single thread. Reading snapshot from other
+    thread can see values of concurrent observation partially
+    applied, that is acceptable for monitoring purposes.
+
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize histogram.
+
+        Parameters
+        ----------
+        buckets : Sequence[float]
+            Upper bounds of buckets in ascending order.
+
+        Raises
+        ------
+        ValueError
+            If buckets are empty or not sorted in ascending order.
+
+        """
+        if not buckets:
+            msg = 'At least one bucket must be provided'
+            raise ValueError(msg)
+
+        if any(a >= b for a, b in pairwise(buckets)):
+            msg = 'Buckets must be sorted in ascending order'
+            raise ValueError(msg)
+
+        self._buckets = tuple(buckets)
+
+        # last element is for values greater than last bucket bound
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Observe value.
+
+        Parameters
+        ----------
+        value : float
+            Value to observe.
+
+        """
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramStats:
+        """Get snapshot of histogram.
+
+        Returns
+        -------
+        HistogramStats
+            Snapshot with cumulative counts of buckets.
+
+        """
+        counts: list[int] = []
+        total = 0
+        for count in self._counts:
+            total += count
+            counts.append(total)
+
+        return HistogramStats(
+            buckets=list(self._buckets),
+            counts=counts[:-1],
+            count=total,
+            sum=self._sum,
+        )
+
+
+class PipelineMetrics:
+    """Metrics of generation pipeline stages.
+
+    Input stage is observed from thread iterating non interactive
+    input plugins, event stage is observed from thread of event plugin
+    execution and output stage is observed from event loop thread, so
+    each histogram has single writer.
+    """
+
+    def __init__(self, output: Sequence[OutputPlugin]) -> None:
+        """Initialize metrics.
+
+        Parameters
+        ----------
+        output : Sequence[OutputPlugin]
+            Output plugins to observe write latency of.
+
+        """
+        self.input_batch_duration = Histogram(LATENCY_BUCKETS)
+        self.timestamps_queue_wait = Histogram(LATENCY_BUCKETS)
+        self.event_batch_duration = Histogram(LATENCY_BUCKETS)
+        self.events_queue_wait = Histogram(LATENCY_BUCKETS)
+        self.lag = Histogram(LAG_BUCKETS)
+
+        self._output = list(output)
+        self._write_duration = {
+            plugin.id: Histogram(LATENCY_BUCKETS) for plugin in self._output
+        }
+
+    def observe_write(self, plugin: OutputPlugin, duration: float) -> None:
+        """Observe duration of write operation of output plugin.
+
+        Parameters
+        ----------
+        plugin : OutputPlugin
+            Output plugin that performed write.
+
+        duration : float
+            Duration (in seconds) of write operation.
+
+        """
+        self._write_duration[plugin.id].observe(duration)
+
+    def snapshot(
+        self,
+        timestamps_queue: QueueStats,
+        events_queue: QueueStats,
+    ) -> PipelineStats:
+        """Get snapshot of metrics.
+
+        Parameters
+        ----------
+        timestamps_queue : QueueStats
+            Current state of timestamps queue.
+
+        events_queue : QueueStats
+            Current state of events queue.
+
+        Returns
+        -------
+        PipelineStats
+            Snapshot of metrics.
+
+        """
+        return PipelineStats(
+            input_batch_duration=self.input_batch_duration.snapshot(),
+            timestamps_queue=timestamps_queue,
+            timestamps_queue_wait=self.timestamps_queue_wait.snapshot(),
+            event_batch_duration=self.event_batch_duration.snapshot(),
+            events_queue=events_queue,
+            events_queue_wait=self.events_queue_wait.snapshot(),
+            write_duration=[
+                OutputWriteStats(
+                    plugin_name=plugin.name,
+                    plugin_id=plugin.id,
+                    duration=self._write_duration[plugin.id].snapshot(),
+                )
+                for plugin in self._output
+            ],
+            lag=self.lag.snapshot(),
+        )
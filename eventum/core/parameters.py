@@ -1,12 +1,49 @@
 """Generator parameters."""
 
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pytz import all_timezones_set
 
 
+class AdaptiveBatchParameters(BaseModel, extra='forbid', frozen=True):
+    """Parameters of adaptive batch sizing.
+
+    Attributes
+    ----------
+    enabled : bool, default=False
+        Whether to adapt batch size to fill level of queues and
+        throughput of producing events instead of using static batch
+        size. Batch size parameter is used as initial size.
+
+    min_size : int, default=100
+        Minimum batch size.
+
+    max_size : int, default=100000
+        Maximum batch size.
+
+    target_latency : float, default=0.1
+        Desired time (in seconds) of both accumulating timestamps of
+        single batch and producing events for it when queues are nearly
+        empty.
+
+    """
+
+    enabled: bool = Field(default=False)
+    min_size: int = Field(default=100, ge=1)
+    max_size: int = Field(default=100_000, ge=1)
+    target_latency: float = Field(default=0.1, gt=0)
+
+    @model_validator(mode='after')
+    def validate_sizes(self) -> Self:  # noqa: D102
+        if self.min_size > self.max_size:
+            msg = 'Minimum size cannot be greater than maximum size'
+            raise ValueError(msg)
+
+        return self
+
+
 class BatchParameters(BaseModel, extra='forbid', frozen=True):
     """Batcher parameters.
 
@@ -18,14 +55,46 @@ class BatchParameters(BaseModel, extra='forbid', frozen=True):
     delay : float | None, default=1.0
         Batch delay (in seconds) for generating events.
 
+    flush_size : int | None, default=None
+        Maximum number of events that are passed to output plugins at
+        once. Events of each batch are produced and flushed in chunks
+        of this size, so output plugins start writing before the whole
+        batch is produced. If value is `None`, then batch is flushed
+        at once.
+
+    adaptive : AdaptiveBatchParameters, default=AdaptiveBatchParameters(...)
+        Parameters of adaptive batch sizing.
+
+    release_slice : float | None, default=None
+        Duration (in seconds) of time slices in which timestamps of
+        each batch are released in live mode. Slices are released when
+        current time reaches their last timestamp, so events are
+        published as smooth stream closely tracking wall clock time
+        instead of bursts of whole batches. If value is `None`, then
+        whole batch is released when current time reaches its last
+        timestamp.
+
+    run_length : bool, default=False
+        Whether to pass timestamps of non interactive input plugins
+        through the pipeline in run-length representation (timestamp
+        with number of its repetitions). Timestamps are expanded only
+        right before producing events, that reduces memory usage and
+        copying for plugins that generate many equal timestamps.
+
     Notes
     -----
-    At least one parameter must be not `None`.
+    At least one of `size` and `delay` parameters must be not `None`.
 
     """
 
     size: int | None = Field(default=10_000, ge=1)
     delay: float | None = Field(default=1.0, ge=0.1)
+    flush_size: int | None = Field(default=None, ge=1)
+    adaptive: AdaptiveBatchParameters = Field(
+        default_factory=AdaptiveBatchParameters,
+    )
+    release_slice: float | None = Field(default=None, ge=0.001)
+    run_length: bool = Field(default=False)
 
     @model_validator(mode='after')
     def validate_batch_params(self) -> Self:  # noqa: D102
@@ -79,6 +148,18 @@ class GenerationParameters(BaseModel, extra='forbid', frozen=True):
     write_timeout : int, default=10
         Timeout (in seconds) before canceling single write task.
 
+    workers : int, default=1
+        Number of worker processes for producing events. Each worker
+        holds its own instance of event plugin, so template states are
+        not shared between workers. Value `1` means producing in the
+        generator process itself.
+
+    isolation : Literal['thread', 'process'], default='thread'
+        Isolation mode of generator. In `thread` mode generator runs
+        in a thread of the application process, in `process` mode
+        generator runs in a dedicated child process, so its crashes or
+        memory growth do not affect other generators.
+
     """
 
     timezone: str = Field(default='UTC', min_length=3)
@@ -87,6 +168,8 @@ class GenerationParameters(BaseModel, extra='forbid', frozen=True):
     keep_order: bool = Field(default=False)
     max_concurrency: int = Field(default=100, ge=1)
     write_timeout: int = Field(default=10, ge=1)
+    workers: int = Field(default=1, ge=1)
+    isolation: Literal['thread', 'process'] = Field(default='thread')
 
     @field_validator('timezone')
     @classmethod
@@ -0,0 +1,282 @@
+"""Statistics of generator execution."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from eventum.core.plugins_initializer import InitializedPlugins
+
+
+@dataclass(frozen=True)
+class InputPluginStats:
+    """Stats of input plugin.
+
+    Attributes
+    ----------
+    plugin_name : str
+        Name of the plugin.
+
+    plugin_id : int
+        ID of the plugin.
+
+    generated : int
+        Number of generated timestamps.
+
+    """
+
+    plugin_name: str
+    plugin_id: int
+    generated: int
+
+
+@dataclass(frozen=True)
+class EventPluginStats:
+    """Stats of event plugin.
+
+    Attributes
+    ----------
+    plugin_name : str
+        Name of the plugin.
+
+    plugin_id : int
+        ID of the plugin.
+
+    produced : int
+        Number of produced events.
+
+    produce_failed : int
+        Number of unsuccessfully produced events.
+
+    """
+
+    plugin_name: str
+    plugin_id: int
+    produced: int
+    produce_failed: int
+
+
+@dataclass(frozen=True)
+class OutputPluginStats:
+    """Stats of output plugin.
+
+    Attributes
+    ----------
+    plugin_name : str
+        Name of the plugin.
+
+    plugin_id : int
+        ID of the plugin.
+
+    written : int
+        Number of written events.
+
+    write_failed : int
+        Number of unsuccessfully written events.
+
+    format_failed : int
+        Number of unsuccessfully formatted events.
+
+    """
+
+    plugin_name: str
+    plugin_id: int
+    written: int
+    write_failed: int
+    format_failed: int
+
+
+@dataclass(frozen=True)
+class HistogramStats:
+    """Snapshot of histogram.
+
+    Attributes
+    ----------
+    buckets : list[float]
+        Upper bounds of buckets.
+
+    counts : list[int]
+        Cumulative number of observations in each bucket, i.e. number
+        of observed values that are less or equal to bucket bound.
+
+    count : int
+        Total number of observations.
+
+    sum : float
+        Sum of all observed values.
+
+    """
+
+    buckets: list[float]
+    counts: list[int]
+    count: int
+    sum: float
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Stats of queue between pipeline stages.
+
+    Attributes
+    ----------
+    size : int
+        Current number of batches in the queue.
+
+    max_size : int
+        Maximum number of batches in the queue.
+
+    """
+
+    size: int
+    max_size: int
+
+
+@dataclass(frozen=True)
+class OutputWriteStats:
+    """Stats of write operations of output plugin.
+
+    Attributes
+    ----------
+    plugin_name : str
+        Name of the plugin.
+
+    plugin_id : int
+        ID of the plugin.
+
+    duration : HistogramStats
+        Duration (in seconds) of write operations.
+
+    """
+
+    plugin_name: str
+    plugin_id: int
+    duration: HistogramStats
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """Stats of generation pipeline stages.
+
+    Attributes
+    ----------
+    input_batch_duration : HistogramStats
+        Time (in seconds) of generating each batch of timestamps by non
+        interactive input plugins, waiting for publishing moments in
+        live mode is not included.
+
+    timestamps_queue : QueueStats
+        State of queue with timestamp batches.
+
+    timestamps_queue_wait : HistogramStats
+        Time (in seconds) that batches of timestamps wait in queue.
+
+    event_batch_duration : HistogramStats
+        Time (in seconds) of producing events for each batch of
+        timestamps or its chunk if flush size is set.
+
+    events_queue : QueueStats
+        State of queue with event batches.
+
+    events_queue_wait : HistogramStats
+        Time (in seconds) that batches of events wait in queue.
+
+    write_duration : list[OutputWriteStats]
+        Write latency of each output plugin.
+
+    lag : HistogramStats
+        Lag (in seconds) between timestamp of first event in batch and
+        wall clock at the moment of completing write of the batch by
+        each output plugin, it is observed only in live mode.
+
+    """
+
+    input_batch_duration: HistogramStats
+    timestamps_queue: QueueStats
+    timestamps_queue_wait: HistogramStats
+    event_batch_duration: HistogramStats
+    events_queue: QueueStats
+    events_queue_wait: HistogramStats
+    write_duration: list[OutputWriteStats]
+    lag: HistogramStats
+
+
+@dataclass(frozen=True)
+class GeneratorStats:
+    """Stats of generator.
+
+    Attributes
+    ----------
+    start_time : datetime
+        Start time of the generator.
+
+    input : list[InputPluginStats]
+        Stats of input plugins.
+
+    event : EventPluginStats
+        Stats of event plugin.
+
+    output : list[OutputPluginStats]
+        Stats of output plugins.
+
+    pipeline : PipelineStats | None, default=None
+        Stats of pipeline stages, `None` if they are unavailable.
+
+    """
+
+    start_time: datetime
+    input: list[InputPluginStats]
+    event: EventPluginStats
+    output: list[OutputPluginStats]
+    pipeline: PipelineStats | None = None
+
+
+def collect_stats(
+    plugins: InitializedPlugins,
+    start_time: datetime,
+    pipeline: PipelineStats | None = None,
+) -> GeneratorStats:
+    """Collect stats of generator from its plugins.
+
+    Parameters
+    ----------
+    plugins : InitializedPlugins
+        Initialized plugins of generator.
+
+    start_time : datetime
+        Start time of the generator.
+
+    pipeline : PipelineStats | None, default=None
+        Stats of pipeline stages.
+
+    Returns
+    -------
+    GeneratorStats
+        Collected stats.
+
+    """
+    return GeneratorStats(
+        start_time=start_time,
+        input=[
+            InputPluginStats(
+                plugin_name=plugin.name,
+                plugin_id=plugin.id,
+                generated=plugin.generated,
+            )
+            for plugin in plugins.input
+        ],
+        event=EventPluginStats(
+            plugin_name=plugins.event.name,
+            plugin_id=plugins.event.id,
+            produced=plugins.event.produced,
+            produce_failed=plugins.event.produce_failed,
+        ),
+        output=[
+            OutputPluginStats(
+                plugin_name=plugin.name,
+                plugin_id=plugin.id,
+                written=plugin.written,
+                write_failed=plugin.write_failed,
+                format_failed=plugin.format_failed,
+            )
+            for plugin in plugins.output
+        ],
+        pipeline=pipeline,
+    )
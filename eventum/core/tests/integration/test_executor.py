@@ -42,7 +42,27 @@ def file2(temp_dir):
 
 
 @pytest.fixture
-def executor(file1, file2):
+def flush_size():
+    return None
+
+
+@pytest.fixture
+def adaptive():
+    return {}
+
+
+@pytest.fixture
+def run_length():
+    return False
+
+
+@pytest.fixture
+def live_mode():
+    return False
+
+
+@pytest.fixture
+def executor(file1, file2, flush_size, adaptive, run_length, live_mode):
     return Executor(
         input=[
             StaticInputPlugin(
@@ -98,7 +118,16 @@ def executor(file1, file2):
             ),
         ],
         params=GeneratorParameters(
-            id='test', path=CONFIG_PATH, live_mode=False
+            id='test',
+            path=CONFIG_PATH,
+            live_mode=live_mode,
+            batch={
+                'size': 10_000,
+                'delay': None,
+                'flush_size': flush_size,
+                'adaptive': adaptive,
+                'run_length': run_length,
+            },
         ),
     )
 
@@ -115,3 +144,163 @@ def test_executor(executor, file1, file2):
 
         assert len(lines_1) == len(lines_2) == 200
         assert set(lines_1) == set(lines_1) == {'o_O\n'}
+
+
+def test_executor_stats(executor):
+    executor.execute()
+
+    stats = executor.get_stats()
+
+    assert (
+        stats.input_batch_duration.count
+        == stats.timestamps_queue_wait.count
+        == stats.event_batch_duration.count
+        == stats.events_queue_wait.count
+        >= 1
+    )
+    assert stats.timestamps_queue.size == stats.events_queue.size == 0
+    assert stats.timestamps_queue.max_size == 10
+
+    assert [s.plugin_id for s in stats.write_duration] == [1, 2]
+    for write_stats in stats.write_duration:
+        assert write_stats.duration.count == stats.events_queue_wait.count
+
+    # lag is observed only in live mode
+    assert stats.lag.count == 0
+
+
+@pytest.mark.parametrize('flush_size', [30])
+def test_executor_with_flush_size(executor, file1, file2):
+    executor.execute()
+
+    with file1.open() as f:
+        lines_1 = f.readlines()
+
+    with file2.open() as f:
+        lines_2 = f.readlines()
+
+    assert len(lines_1) == len(lines_2) == 200
+
+    stats = executor.get_stats()
+
+    # single batch of 200 timestamps is flushed in 7 chunks
+    assert stats.timestamps_queue_wait.count == 1
+    assert stats.event_batch_duration.count == 7
+    assert stats.events_queue_wait.count == 7
+
+
+@pytest.mark.parametrize(
+    'adaptive', [{'enabled': True, 'min_size': 10, 'max_size': 50}]
+)
+def test_executor_with_adaptive_batch_size(executor, file1, file2):
+    executor.execute()
+
+    with file1.open() as f:
+        lines_1 = f.readlines()
+
+    with file2.open() as f:
+        lines_2 = f.readlines()
+
+    assert len(lines_1) == len(lines_2) == 200
+
+    stats = executor.get_stats()
+
+    # batches never exceed maximum size of adaptive batch size
+    assert stats.timestamps_queue_wait.count >= 4
+
+
+@pytest.mark.parametrize('live_mode', [True])
+def test_executor_in_live_mode(executor, file1, file2):
+    executor.execute()
+
+    with file1.open() as f:
+        lines_1 = f.readlines()
+
+    with file2.open() as f:
+        lines_2 = f.readlines()
+
+    assert len(lines_1) == len(lines_2) == 200
+
+    # lag is observed only in live mode after each write
+    stats = executor.get_stats()
+    assert stats.lag.count >= 1
+    assert stats.lag.count == sum(
+        write_stats.duration.count for write_stats in stats.write_duration
+    )
+
+
+@pytest.mark.parametrize('run_length', [True])
+@pytest.mark.parametrize('flush_size', [30])
+def test_executor_with_run_length(executor, file1, file2):
+    executor.execute()
+
+    with file1.open() as f:
+        lines_1 = f.readlines()
+
+    with file2.open() as f:
+        lines_2 = f.readlines()
+
+    assert len(lines_1) == len(lines_2) == 200
+
+    stats = executor.get_stats()
+
+    # runs are expanded in chunks of flush size
+    assert stats.timestamps_queue_wait.count == 1
+    assert stats.event_batch_duration.count == 7
+
+
+@pytest.fixture
+def executor_with_workers(file1, file2):
+    return Executor(
+        input=[
+            StaticInputPlugin(
+                config=StaticInputPluginConfig(count=1000),
+                params={
+                    'base_path': GENERATOR_DIR,
+                    'id': 1,
+                    'timezone': timezone('UTC'),
+                },
+            ),
+        ],
+        event=TemplateEventPlugin(
+            config=TemplateEventPluginConfig(
+                root=TemplateEventPluginConfigForGeneralModes(
+                    params={},
+                    samples={},
+                    mode=TemplatePickingMode.ALL,
+                    templates=[
+                        {
+                            'test': TemplateConfigForGeneralModes(
+                                template=TEMPLATE_PATH
+                            )
+                        }
+                    ],
+                )
+            ),
+            params={'base_path': GENERATOR_DIR, 'id': 1},
+        ),
+        output=[
+            FileOutputPlugin(
+                config=FileOutputPluginConfig(
+                    path=file1,
+                    flush_interval=0,
+                    write_mode='overwrite',
+                ),
+                params={'id': 1, 'base_path': GENERATOR_DIR},
+            ),
+        ],
+        params=GeneratorParameters(
+            id='test', path=CONFIG_PATH, live_mode=False, workers=2
+        ),
+    )
+
+
+def test_executor_with_workers(executor_with_workers, file1):
+    executor_with_workers.execute()
+
+    with file1.open() as f:
+        lines = f.readlines()
+
+    assert len(lines) == 1000
+    assert set(lines) == {'o_O\n'}
+    assert executor_with_workers._event.produced == 1000
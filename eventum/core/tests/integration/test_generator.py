@@ -11,6 +11,7 @@ BASE_PATH = Path(__file__).resolve().parent
 GENERATOR_DIR = BASE_PATH / 'static'
 TEMPLATE_PATH = (GENERATOR_DIR / 'template.jinja').relative_to(GENERATOR_DIR)
 CONFIG_PATH = GENERATOR_DIR / 'test.yml'
+INFINITE_CONFIG_PATH = GENERATOR_DIR / 'test_infinite.yml'
 
 
 @pytest.fixture
@@ -61,3 +62,70 @@ def test_generator(generator):
 
     assert len(lines_1) == len(lines_2) == 200
     assert set(lines_1) == set(lines_1) == {'o_O\n'}
+
+
+@pytest.fixture
+def isolated_generator(file1, file2):
+    return Generator(
+        params=GeneratorParameters(
+            id='test',
+            path=CONFIG_PATH,
+            live_mode=False,
+            isolation='process',
+            params={'file1': str(file1), 'file2': str(file2)},
+        ),
+    )
+
+
+def test_isolated_generator(isolated_generator):
+    assert isolated_generator.start()
+
+    isolated_generator.join()
+
+    assert isolated_generator.is_ended_up
+    assert isolated_generator.is_ended_up_successfully
+
+    file1 = isolated_generator.params.params['file1']
+    file2 = isolated_generator.params.params['file2']
+
+    with Path(file1).open() as f:
+        lines_1 = f.readlines()
+
+    with Path(file2).open() as f:
+        lines_2 = f.readlines()
+
+    assert len(lines_1) == len(lines_2) == 200
+    assert set(lines_1) == set(lines_1) == {'o_O\n'}
+
+    with pytest.raises(RuntimeError):
+        isolated_generator.get_stats()
+
+
+def test_isolated_generator_stop(file1, file2):
+    generator = Generator(
+        params=GeneratorParameters(
+            id='test',
+            path=INFINITE_CONFIG_PATH,
+            live_mode=True,
+            isolation='process',
+            params={'file1': str(file1), 'file2': str(file2)},
+        ),
+    )
+    assert generator.start()
+    assert generator.is_running
+
+    stats = generator.get_stats()
+    assert stats.start_time == generator.start_time
+    assert [plugin.plugin_name for plugin in stats.output] == ['file', 'file']
+    assert stats.pipeline is not None
+    assert len(stats.pipeline.write_duration) == 2
+
+    # process is busy while connection is used by other request
+    with generator._connection_lock:
+        with pytest.raises(RuntimeError):
+            generator.get_stats(timeout=0.1)
+
+    generator.stop()
+
+    assert generator.is_ended_up
+    assert not generator.is_running
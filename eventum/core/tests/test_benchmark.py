@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import pytest
+
+from eventum.core.benchmark import (
+    BenchmarkError,
+    _estimate_quantile,
+    dump_results,
+    find_regressions,
+    run_benchmark,
+)
+from eventum.core.parameters import BatchParameters, GeneratorParameters
+from eventum.core.stats import HistogramStats
+
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_PATH = BASE_DIR / 'static' / 'benchmark_config.yml'
+INVALID_CONFIG_PATH = BASE_DIR / 'static' / 'invalid_yaml_config.yml'
+
+
+@pytest.fixture
+def params():
+    return GeneratorParameters(
+        id='test',
+        path=CONFIG_PATH,
+        live_mode=False,
+        batch=BatchParameters(size=100, delay=None),
+    )
+
+
+def test_run_benchmark(params):
+    result = run_benchmark(name='test', params=params)
+
+    assert result.name == 'test'
+    assert result.timestamps == 500
+    assert result.events == 500
+    assert result.bytes == 500 * len('o_O')
+    assert result.elapsed > 0
+
+    input, event, output = result.stages
+    assert input.name == 'input'
+    assert input.batches == 5
+    assert input.items == 500
+
+    assert event.name == 'event'
+    assert event.items == 500
+    assert event.batches == 5
+
+    assert output.name == 'output'
+    assert output.items == 500
+    assert output.batches == 5
+
+    for stage in result.stages:
+        assert 0 < stage.latency_p50 <= stage.latency_p99
+        assert stage.items_per_second > 0
+
+
+def test_run_benchmark_with_flush_size(params):
+    result = run_benchmark(
+        name='test',
+        params=params.model_copy(
+            update={'batch': BatchParameters(size=100, flush_size=30)},
+        ),
+    )
+
+    assert result.events == 500
+
+    # each batch of 100 events is flushed in 4 chunks
+    _, event, output = result.stages
+    assert event.batches == output.batches == 20
+
+
+def test_run_benchmark_without_null_output(params, tmp_path):
+    config_path = tmp_path / 'generator.yml'
+    config_path.write_text(
+        CONFIG_PATH.read_text().replace('"null": {}', 'stdout: {}'),
+    )
+    (tmp_path / 'template.jinja').write_text('o_O')
+
+    with pytest.raises(BenchmarkError):
+        run_benchmark(
+            name='test',
+            params=params.model_copy(update={'path': config_path}),
+        )
+
+
+def test_estimate_quantile():
+    histogram = HistogramStats(
+        buckets=[0.1, 0.2, 0.4],
+        counts=[0, 10, 30],
+        count=30,
+        sum=6.0,
+    )
+
+    assert _estimate_quantile(histogram, 0.5) == pytest.approx(0.25)
+    assert _estimate_quantile(histogram, 0.99) == pytest.approx(0.397)
+
+    empty = HistogramStats(buckets=[0.1], counts=[0], count=0, sum=0.0)
+    assert _estimate_quantile(empty, 0.5) == 0.0
+
+    overflow = HistogramStats(buckets=[0.1], counts=[0], count=1, sum=1.0)
+    assert _estimate_quantile(overflow, 0.5) == 0.1
+
+
+def test_run_benchmark_invalid_config():
+    with pytest.raises(BenchmarkError):
+        run_benchmark(
+            name='test',
+            params=GeneratorParameters(
+                id='test',
+                path=INVALID_CONFIG_PATH,
+                live_mode=False,
+            ),
+        )
+
+
+def test_find_regressions(params):
+    result = run_benchmark(name='test', params=params)
+    baseline = dump_results([result])
+
+    assert find_regressions(baseline, [result], tolerance=0) == []
+
+    for stage in baseline['results'][0]['stages']:
+        stage['items_per_second'] *= 2
+
+    regressions = find_regressions(baseline, [result], tolerance=0.1)
+
+    assert [r.stage for r in regressions] == ['input', 'event', 'output']
+    assert all(r.change == pytest.approx(-0.5) for r in regressions)
+
+
+def test_find_regressions_invalid_baseline(params):
+    result = run_benchmark(name='test', params=params)
+
+    with pytest.raises(ValueError):
+        find_regressions({'results': [{}]}, [result], tolerance=0.1)
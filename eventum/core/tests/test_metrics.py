@@ -0,0 +1,33 @@
+import pytest
+
+from eventum.core.metrics import Histogram
+
+
+def test_histogram():
+    histogram = Histogram([1, 5, 10])
+
+    for value in [0.5, 1, 3, 7, 100]:
+        histogram.observe(value)
+
+    stats = histogram.snapshot()
+
+    assert stats.buckets == [1, 5, 10]
+    assert stats.counts == [2, 3, 4]
+    assert stats.count == 5
+    assert stats.sum == 111.5
+
+
+def test_empty_histogram():
+    stats = Histogram([1]).snapshot()
+
+    assert stats.counts == [0]
+    assert stats.count == 0
+    assert stats.sum == 0
+
+
+def test_histogram_invalid_buckets():
+    with pytest.raises(ValueError):
+        Histogram([])
+
+    with pytest.raises(ValueError):
+        Histogram([5, 1])
@@ -1,5 +1,6 @@
 """Exceptions used across all subpackages."""
 
+from functools import partial
 from typing import Any
 
 
@@ -21,3 +22,8 @@ class ContextualError(Exception):
         super().__init__(*args)
 
         self.context = context
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # context is keyword only argument, so it must be bound to
+        # constructor explicitly for unpickling
+        return partial(type(self), context=self.context), self.args
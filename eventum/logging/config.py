@@ -4,7 +4,7 @@ import logging
 import logging.config
 import logging.handlers
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, assert_never
+from typing import TYPE_CHECKING, Any, Literal, assert_never
 
 import structlog
 
@@ -13,10 +13,12 @@ from eventum.logging.file_paths import (
     construct_generator_logfile_path,
     construct_main_logfile_path,
 )
-from eventum.logging.handlers import RoutingHandler
+from eventum.logging.handlers import EventDictQueueHandler, RoutingHandler
 from eventum.logging.processors import derive_extras, remove_keys_processor
 
 if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
     from structlog.typing import Processor
 
 
@@ -239,6 +241,43 @@ def use_console_and_file(
     )
 
 
+def use_queue(queue: 'Queue[Any]', level: int) -> None:
+    """Configure logging for sending log records to the queue. It is
+    used in child processes to pass their log records to the parent
+    process where they are handled by its handlers.
+
+    Parameters
+    ----------
+    queue : Queue[Any]
+        Multiprocessing queue for log records.
+
+    level : int
+        Log level.
+
+    """
+    logger = logging.getLogger()
+    logger.addHandler(EventDictQueueHandler(queue))
+    logger.setLevel(level)
+
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt='iso', utc=True),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            derive_extras(['generator_id'])(
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ),
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
 def _configure_uvicorn_logger(
     level: LogLevel,
     logs_dir: Path,
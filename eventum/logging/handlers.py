@@ -1,6 +1,8 @@
 """Custom handlers for logging system."""
 
+import copy
 import logging
+import logging.handlers
 from collections.abc import Callable, Hashable
 from typing import override
 
@@ -100,3 +102,33 @@ class RoutingHandler(logging.Handler):
             handler.close()
 
         super().close()
+
+
+class EventDictQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that passes log records with structlog event
+    dicts to the queue without formatting them. It is used to transfer
+    records to another process where they are formatted and handled
+    with its own logging configuration.
+    """
+
+    _PICKLABLE_TYPES = (str, int, float, bool, type(None))
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+
+        if isinstance(record.msg, dict):
+            record.msg = {
+                key: (
+                    value
+                    if isinstance(value, self._PICKLABLE_TYPES)
+                    else str(value)
+                )
+                for key, value in record.msg.items()
+            }
+
+        # exceptions are already rendered to event dict by structlog
+        record.exc_info = None
+        record.exc_text = None
+
+        return record
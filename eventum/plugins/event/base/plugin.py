@@ -1,13 +1,21 @@
 """Definition of base event plugin."""
 
+import traceback
 from abc import abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TypedDict, TypeVar, override
+from typing import Any, TypedDict, TypeVar, override
 
 from pydantic import RootModel
+from pytz import BaseTzInfo
 
 from eventum.plugins.base.plugin import Plugin, PluginParams
 from eventum.plugins.event.base.config import EventPluginConfig
+from eventum.plugins.event.exceptions import (
+    PluginExhaustedError,
+    PluginProduceError,
+)
+from eventum.plugins.input.protocols import IdentifiedTimestamps
 
 
 class ProduceParams(TypedDict):
@@ -27,6 +35,55 @@ class ProduceParams(TypedDict):
     tags: tuple[str, ...]
 
 
+class ProduceBatchParams(TypedDict):
+    """Params for `produce_batch` method of `EventPlugin`.
+
+    Attributes
+    ----------
+    timestamps : IdentifiedTimestamps
+        Timestamps of events with ids of input plugins that generated
+        them.
+
+    tags : dict[int, tuple[str, ...]]
+        Tags of input plugins with input plugin id in keys and tags
+        tuple in values.
+
+    timezone : BaseTzInfo
+        Time zone of timestamps.
+
+    """
+
+    timestamps: IdentifiedTimestamps
+    tags: dict[int, tuple[str, ...]]
+    timezone: BaseTzInfo
+
+
+@dataclass
+class ProduceBatchResult:
+    """Result of producing events for batch of timestamps.
+
+    Attributes
+    ----------
+    events : list[str]
+        Produced events in order of timestamps.
+
+    errors : list[PluginProduceError]
+        Errors occurred during producing events.
+
+    produce_failed : int
+        Number of unsuccessfully produced events.
+
+    exhausted : bool
+        Whether the event plugin is exhausted.
+
+    """
+
+    events: list[str] = field(default_factory=list)
+    errors: list[PluginProduceError] = field(default_factory=list)
+    produce_failed: int = 0
+    exhausted: bool = False
+
+
 class EventPluginParams(PluginParams):
     """Parameters for event plugin."""
 
@@ -39,7 +96,17 @@ ParamsT = TypeVar('ParamsT', bound=EventPluginParams)
 
 
 class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
-    """Base class for all event plugins."""
+    """Base class for all event plugins.
+
+    Other Parameters
+    ----------------
+    parallelizable : bool, default=True
+        Whether the plugin can be instantiated in several worker
+        processes that produce events independently of each other.
+        Plugins that consume shared finite source (e.g. file lines)
+        must be marked as non parallelizable.
+
+    """
 
     @override
     def __init__(self, config: ConfigT, params: ParamsT) -> None:
@@ -48,6 +115,16 @@ class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
         self._produced = 0
         self._produce_failed = 0
 
+    def __init_subclass__(
+        cls,
+        *,
+        parallelizable: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._parallelizable = parallelizable  # type: ignore[attr-defined]
+
     def produce(self, params: ProduceParams) -> list[str]:
         """Produce events with provided parameters.
 
@@ -90,6 +167,111 @@ class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
         """
         ...
 
+    def produce_batch(self, params: ProduceBatchParams) -> ProduceBatchResult:
+        """Produce events for batch of timestamps.
+
+        Parameters
+        ----------
+        params : ProduceBatchParams
+            Parameters for events producing.
+
+        Returns
+        -------
+        ProduceBatchResult
+            Result of producing.
+
+        Notes
+        -----
+        Unlike `produce` method, errors of producing events do not
+        interrupt producing the rest of the batch, they are collected
+        to the result instead. The same is for exhaustion of plugin,
+        in this case the result contains events produced before
+        exhaustion.
+
+        """
+        result = self._produce_batch(params=params)
+
+        self._produced += len(result.events)
+        self._produce_failed += result.produce_failed
+        return result
+
+    def _produce_batch(self, params: ProduceBatchParams) -> ProduceBatchResult:
+        """Produce events for batch of timestamps. Default
+        implementation calls `_produce` for each timestamp, plugins can
+        override it to process the whole batch at once.
+
+        Notes
+        -----
+        See `produce_batch` method for more info.
+
+        """
+        result = ProduceBatchResult()
+
+        timestamps = params['timestamps']
+        tags = params['tags']
+        tz = params['timezone']
+
+        produce_params: ProduceParams = ProduceParams(
+            tags=...,  # type: ignore[typeddict-item]
+            timestamp=...,  # type: ignore[typeddict-item]
+        )
+        for id, timestamp in zip(
+            timestamps['id'],
+            timestamps['timestamp'].astype(dtype=datetime),
+            strict=True,
+        ):
+            produce_params['tags'] = tags[id]
+            produce_params['timestamp'] = tz.localize(timestamp)
+
+            try:
+                result.events.extend(self._produce(produce_params))
+            except PluginProduceError as e:
+                result.errors.append(e)
+                result.produce_failed += 1
+            except PluginExhaustedError:
+                result.exhausted = True
+                result.produce_failed += 1
+                break
+            except Exception as e:  # noqa: BLE001
+                result.errors.append(
+                    PluginProduceError(
+                        'Unexpected error during event plugin execution',
+                        context={
+                            'reason': f'{e.__class__.__name__}: {e}',
+                            'traceback': ''.join(
+                                traceback.format_exception(e),
+                            ),
+                        },
+                    ),
+                )
+                result.produce_failed += 1
+
+        return result
+
+    def update_stats(self, produced: int, produce_failed: int) -> None:
+        """Update statistics with results of producing performed
+        outside of this plugin instance (e.g. by instances of the same
+        plugin in worker processes).
+
+        Parameters
+        ----------
+        produced : int
+            Number of produced events.
+
+        produce_failed : int
+            Number of unsuccessfully produced events.
+
+        """
+        self._produced += produced
+        self._produce_failed += produce_failed
+
+    @property
+    def is_parallelizable(self) -> bool:
+        """Whether the plugin can be instantiated in several worker
+        processes.
+        """
+        return self._parallelizable  # type: ignore[attr-defined]
+
     @property
     def produced(self) -> int:
         """Number of produced events."""
@@ -4,11 +4,14 @@ import os
 import re
 from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import cast, override
 
 from eventum.plugins.event.base.plugin import (
     EventPlugin,
     EventPluginParams,
+    ProduceBatchParams,
+    ProduceBatchResult,
     ProduceParams,
 )
 from eventum.plugins.event.exceptions import (
@@ -21,6 +24,7 @@ from eventum.plugins.exceptions import PluginConfigurationError
 
 class ReplayEventPlugin(
     EventPlugin[ReplayEventPluginConfig, EventPluginParams],
+    parallelizable=False,
 ):
     """Event plugin for producing events using existing log
     file by replaying it line by line.
@@ -242,20 +246,32 @@ class ReplayEventPlugin(
 
         return message[:match_start] + string + message[match_end:]
 
-    @override
-    def _produce(self, params: ProduceParams) -> list[str]:
-        try:
-            line = next(self._lines)
-        except StopIteration:
-            raise PluginExhaustedError from None
+    def _substitute_timestamp(self, line: str, timestamp: datetime) -> str:
+        """Substitute formatted timestamp into line in position defined
+        by timestamp pattern.
+
+        Parameters
+        ----------
+        line : str
+            Original line.
 
+        timestamp : datetime
+            Timestamp to substitute.
+
+        Returns
+        -------
+        str
+            Line with substituted timestamp or original line if
+            pattern is not set or substitution is failed.
+
+        """
         if self._pattern is None:
-            return [line]
+            return line
 
-        fmt_timestamp = self._format_timestamp(timestamp=params['timestamp'])
+        fmt_timestamp = self._format_timestamp(timestamp=timestamp)
 
         try:
-            line = self._substitute_string(
+            return self._substitute_string(
                 message=line,
                 string=fmt_timestamp,
                 pattern=self._pattern,
@@ -266,5 +282,49 @@ class ReplayEventPlugin(
                 'Failed to substitute timestamp into original message',
                 reason=str(e),
             )
+            return line
+
+    @override
+    def _produce(self, params: ProduceParams) -> list[str]:
+        try:
+            line = next(self._lines)
+        except StopIteration:
+            raise PluginExhaustedError from None
+
+        return [self._substitute_timestamp(line, params['timestamp'])]
+
+    @override
+    def _produce_batch(self, params: ProduceBatchParams) -> ProduceBatchResult:
+        result = ProduceBatchResult()
+
+        timestamps = params['timestamps']
+        count = len(timestamps)
+
+        lines = result.events
+        try:
+            lines.extend(islice(self._lines, count))
+        except PluginProduceError as e:
+            # lines iterator is finalized after propagating exception
+            result.errors.append(e)
+            result.produce_failed += 1
+            result.exhausted = True
+        else:
+            result.exhausted = len(lines) < count
+
+            # the same as for `produce`, exhaustion is counted as failure
+            if result.exhausted:
+                result.produce_failed += 1
+
+        if self._pattern is None:
+            return result
+
+        tz = params['timezone']
+        for i, timestamp in enumerate(
+            timestamps['timestamp'][: len(lines)].astype(dtype=datetime),
+        ):
+            lines[i] = self._substitute_timestamp(
+                line=lines[i],
+                timestamp=tz.localize(timestamp),
+            )
 
-        return [line]
+        return result
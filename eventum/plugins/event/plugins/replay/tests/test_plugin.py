@@ -1,7 +1,9 @@
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pytest
+from pytz import timezone
 
 from eventum.plugins.event.plugins.replay.config import ReplayEventPluginConfig
 from eventum.plugins.event.plugins.replay.plugin import ReplayEventPlugin
@@ -149,3 +151,49 @@ def test_plugin_missing_file():
             ),
             params={'id': 1},
         )
+
+
+def test_plugin_produce_batch():
+    plugin = ReplayEventPlugin(
+        config=ReplayEventPluginConfig(
+            path=STATIC_DIR / 'example',
+            timestamp_pattern=r'\[(?P<timestamp>.*?)\]',
+            timestamp_format='%Y',
+        ),
+        params={'id': 1},
+    )
+
+    timestamps = np.array(
+        [(np.datetime64('2020-01-01T00:00:00', 'us'), 1)] * 4,
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ('a',)},
+            'timezone': timezone('UTC'),
+        },
+    )
+
+    assert not result.errors
+    assert not result.exhausted
+    assert result.events == [
+        '127.0.0.1 - - [2020] "GET /index.html HTTP/1.1" 200 1024',
+        '127.0.0.1 - - [2020] "POST /form HTTP/1.1" 201 512',
+        '192.168.1.1 - - [2020] "GET /about.html HTTP/1.1" 200 2048',
+        '10.0.0.1 - - [2020] "DELETE /resource HTTP/1.1" 403 256',
+    ]
+    assert plugin.produced == 4
+
+    result = plugin.produce_batch(
+        params={
+            'timestamps': np.repeat(timestamps, 3),
+            'tags': {1: ('a',)},
+            'timezone': timezone('UTC'),
+        },
+    )
+
+    assert result.exhausted
+    assert len(result.events) == 6
+    assert plugin.produced == 10
+    assert plugin.produce_failed == 1
@@ -2,11 +2,14 @@
 
 from collections.abc import Callable
 from importlib import util
-from typing import override
+from types import ModuleType
+from typing import Any, override
 
 from eventum.plugins.event.base.plugin import (
     EventPlugin,
     EventPluginParams,
+    ProduceBatchParams,
+    ProduceBatchResult,
     ProduceParams,
 )
 from eventum.plugins.event.exceptions import PluginProduceError
@@ -29,9 +32,20 @@ class ScriptEventPlugin(
     ```
     For more information see documentation string of `ProduceParams`.
 
+    User script can also include optional function for producing
+    events for the whole batch of timestamps at once:
+    ```
+    def produce_batch(params: ProduceBatchParams) -> list[str]:
+        ...
+    ```
+    For more information see documentation string of
+    `ProduceBatchParams`. If function raises an exception, then none
+    of events of the batch are produced.
+
     """
 
     _FUNCTION_NAME = 'produce'
+    _BATCH_FUNCTION_NAME = 'produce_batch'
 
     @override
     def __init__(
@@ -41,22 +55,26 @@ class ScriptEventPlugin(
     ) -> None:
         super().__init__(config, params)
 
-        self._logger.debug('Importing function from external module')
-        self._function = self._import_function()
+        self._logger.debug('Importing functions from external module')
+        module = self._import_module()
+        self._function = self._import_function(module)
+        self._batch_function: (
+            Callable[[ProduceBatchParams], list[str]] | None
+        ) = getattr(module, ScriptEventPlugin._BATCH_FUNCTION_NAME, None)
 
-    def _import_function(self) -> Callable[[ProduceParams], str | list[str]]:
-        """Import the function from the user defined module.
+    def _import_module(self) -> ModuleType:
+        """Import the user defined module.
 
         Returns
         -------
-        Callable[[ProduceParams], str | list[str]]
-            Function.
+        ModuleType
+            Imported module.
 
         Raises
         ------
         PluginConfigurationError
-            If module is not found, function is not found in module or
-            other error occurred during module execution.
+            If module is not found or error occurred during module
+            execution.
 
         """
         script_path = self.resolve_path(self._config.path)
@@ -100,6 +118,32 @@ class ScriptEventPlugin(
                 },
             ) from e
 
+        return module
+
+    def _import_function(
+        self,
+        module: ModuleType,
+    ) -> Callable[[ProduceParams], str | list[str]]:
+        """Import the function from the user defined module.
+
+        Parameters
+        ----------
+        module : ModuleType
+            User defined module.
+
+        Returns
+        -------
+        Callable[[ProduceParams], str | list[str]]
+            Function.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If function is not found in module.
+
+        """
+        script_path = self.resolve_path(self._config.path)
+
         try:
             function = getattr(module, ScriptEventPlugin._FUNCTION_NAME)
         except AttributeError:
@@ -114,19 +158,25 @@ class ScriptEventPlugin(
 
         return function
 
-    @override
-    def _produce(self, params: ProduceParams) -> list[str]:
-        try:
-            result = self._function(params)
-        except Exception as e:
-            msg = 'Exception occurred during function execution'
-            raise PluginProduceError(
-                msg,
-                context={
-                    'reason': f'{e.__class__.__name__}: {e}',
-                },
-            ) from e
+    def _validate_result(self, result: Any) -> list[str]:
+        """Validate result returned by user function.
+
+        Parameters
+        ----------
+        result : Any
+            Result returned by user function.
+
+        Returns
+        -------
+        list[str]
+            Produced events.
 
+        Raises
+        ------
+        PluginProduceError
+            If result is of invalid type.
+
+        """
         if isinstance(result, str):
             return [result]
         if isinstance(result, list):
@@ -155,3 +205,42 @@ class ScriptEventPlugin(
             msg,
             context={},
         )
+
+    @override
+    def _produce(self, params: ProduceParams) -> list[str]:
+        try:
+            result = self._function(params)
+        except Exception as e:
+            msg = 'Exception occurred during function execution'
+            raise PluginProduceError(
+                msg,
+                context={
+                    'reason': f'{e.__class__.__name__}: {e}',
+                },
+            ) from e
+
+        return self._validate_result(result)
+
+    @override
+    def _produce_batch(self, params: ProduceBatchParams) -> ProduceBatchResult:
+        if self._batch_function is None:
+            return super()._produce_batch(params)
+
+        result = ProduceBatchResult()
+        try:
+            result.events = self._validate_result(self._batch_function(params))
+        except PluginProduceError as e:
+            result.errors.append(e)
+            result.produce_failed = len(params['timestamps'])
+        except Exception as e:  # noqa: BLE001
+            result.errors.append(
+                PluginProduceError(
+                    'Exception occurred during function execution',
+                    context={
+                        'reason': f'{e.__class__.__name__}: {e}',
+                    },
+                ),
+            )
+            result.produce_failed = len(params['timestamps'])
+
+        return result
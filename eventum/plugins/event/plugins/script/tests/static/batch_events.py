@@ -0,0 +1,14 @@
+def produce(params: dict) -> str | list[str]:
+    return 'single'
+
+
+def produce_batch(params: dict) -> list[str]:
+    tags: dict[int, tuple[str, ...]] = params['tags']
+
+    return [
+        f'{ts}, {tags[id]}'
+        for ts, id in zip(
+            params['timestamps']['timestamp'].astype(str),
+            params['timestamps']['id'],
+        )
+    ]
@@ -1,7 +1,9 @@
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pytest
+from pytz import timezone
 
 from eventum.plugins.event.exceptions import PluginProduceError
 from eventum.plugins.event.plugins.script.config import ScriptEventPluginConfig
@@ -80,3 +82,78 @@ def test_plugin_unexistent_file():
             config=ScriptEventPluginConfig(path=STATIC_DIR / 'abcdefg.py'),
             params={'id': 1},
         )
+
+
+@pytest.fixture
+def timestamps():
+    return np.array(
+        [
+            (np.datetime64('2020-01-01T00:00:00', 'us'), 1),
+            (np.datetime64('2020-01-01T00:00:01', 'us'), 2),
+        ],
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+
+
+def test_plugin_produce_batch(timestamps):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(path=STATIC_DIR / 'batch_events.py'),
+        params={'id': 1},
+    )
+
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ('a',), 2: ('b',)},
+            'timezone': timezone('UTC'),
+        },
+    )
+
+    assert result.events == [
+        "2020-01-01T00:00:00.000000, ('a',)",
+        "2020-01-01T00:00:01.000000, ('b',)",
+    ]
+    assert plugin.produced == 2
+
+
+def test_plugin_produce_batch_fallback(timestamps):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(path=STATIC_DIR / 'events_list.py'),
+        params={'id': 1},
+    )
+
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ('a',), 2: ('b',)},
+            'timezone': timezone('UTC'),
+        },
+    )
+
+    assert result.events == [
+        '2020-01-01T00:00:00+00:00',
+        'a',
+        '2020-01-01T00:00:01+00:00',
+        'b',
+    ]
+
+
+def test_plugin_produce_batch_exception_in_function(timestamps):
+    plugin = ScriptEventPlugin(
+        config=ScriptEventPluginConfig(
+            path=STATIC_DIR / 'exception_in_function.py'
+        ),
+        params={'id': 1},
+    )
+
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ('a',), 2: ('b',)},
+            'timezone': timezone('UTC'),
+        },
+    )
+
+    assert result.events == []
+    assert len(result.errors) == 2
+    assert plugin.produce_failed == 2
@@ -62,12 +62,18 @@ class CSVSampleConfig(BaseModel, frozen=True, extra='forbid'):
     source : Path
         Path to csv file.
 
+    cache : bool, default=False
+        Whether to cache parsed sample on disk (in directory next to
+        csv file) to load it without parsing on next loads until file
+        is changed.
+
     """
 
     type: Literal[SampleType.CSV]
     header: bool = False
     delimiter: str = Field(default=',', min_length=1)
     source: Path = Field(pattern=r'.*\.csv')
+    cache: bool = False
 
 
 class JSONSampleConfig(BaseModel, frozen=True, extra='forbid'):
@@ -81,15 +87,35 @@ class JSONSampleConfig(BaseModel, frozen=True, extra='forbid'):
     source : Path
         Path to json file.
 
+    cache : bool, default=False
+        Whether to cache parsed sample on disk (in directory next to
+        json file) to load it without parsing on next loads until file
+        is changed.
+
     """
 
     type: Literal[SampleType.JSON]
     source: Path = Field(pattern=r'.*\.json')
+    cache: bool = False
 
 
 SampleConfigModel = ItemsSampleConfig | CSVSampleConfig | JSONSampleConfig
 
 
+class SamplesLoadingMode(StrEnum):
+    """Modes of loading samples.
+
+    - `eager` - load all samples during plugin initialization;
+    - `lazy` - load each sample on its first access from template;
+    - `prefetch` - load samples in background after initialization,
+    sample that is accessed before it is loaded is loaded on access;
+    """
+
+    EAGER = 'eager'
+    LAZY = 'lazy'
+    PREFETCH = 'prefetch'
+
+
 class SampleConfig(RootModel, frozen=True):
     """Configuration of sample."""
 
@@ -186,6 +212,35 @@ class TemplateConfigForFSMMode(TemplateConfigForGeneralModes, frozen=True):
     initial: bool = False
 
 
+class TemplateBatchConfig(BaseModel, frozen=True, extra='forbid'):
+    """Configuration of batch rendering of templates. In batch
+    rendering templates are rendered once for the whole batch of
+    timestamps and get `timestamps` and `tags` lists instead of single
+    `timestamp` and `tags` values.
+
+    Events of the batch are produced in order of timestamps, so if
+    several templates are picked within the batch, each of them must
+    render exactly one event per timestamp it gets.
+
+    Attributes
+    ----------
+    separator : str, default=<new line>
+        Separator of events in rendered template.
+
+    """
+
+    separator: str = Field(default='\n', min_length=1)
+
+
+BATCH_RENDERING_MODES = frozenset(
+    {
+        TemplatePickingMode.ALL,
+        TemplatePickingMode.SPIN,
+        TemplatePickingMode.CHAIN,
+    },
+)
+
+
 class TemplateEventPluginConfigCommonFields(
     EventPluginConfig,
     frozen=True,
@@ -200,10 +255,36 @@ class TemplateEventPluginConfigCommonFields(
     sample : dict[str, SampleConfig]
         Samples passed to templates.
 
+    samples_loading : SamplesLoadingMode, default='eager'
+        Mode of loading samples. In `lazy` and `prefetch` modes
+        samples that are never accessed from templates are not loaded
+        (in `lazy` mode) and errors of loading samples are reported
+        when templates are rendered instead of plugin initialization.
+
+    batch : TemplateBatchConfig | None, default=None
+        Configuration of batch rendering, if value is `None` then
+        templates are rendered for each timestamp separately. Batch
+        rendering is supported only for `all`, `spin` and `chain`
+        picking modes.
+
     """
 
     params: dict[str, Any] = Field(default_factory=dict)
     samples: dict[str, SampleConfig] = Field(default_factory=dict)
+    samples_loading: SamplesLoadingMode = Field(
+        default=SamplesLoadingMode.EAGER,
+    )
+    batch: TemplateBatchConfig | None = Field(default=None)
+
+    @model_validator(mode='after')
+    def validate_batch_mode(self) -> Self:  # noqa: D102
+        mode = getattr(self, 'mode', None)
+
+        if self.batch is not None and mode not in BATCH_RENDERING_MODES:
+            msg = f'Batch rendering is not supported for `{mode}` mode'
+            raise ValueError(msg)
+
+        return self
 
     def get_picking_common_fields(self) -> dict[str, Any]:
         """Get common fields used in templates picking.
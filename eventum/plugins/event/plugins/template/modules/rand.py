@@ -1,10 +1,19 @@
-"""Rand module."""
+"""Rand module.
+
+Values that are expensive to generate one by one (random strings and
+normally distributed numbers) are taken from pools drawn in bulk using
+numpy random generator. Weighted choices use alias tables that are
+built once for each distinct list of weights, and large numbers of
+choices are made vectorized.
+"""
 
 import datetime as dt
 import ipaddress
+import os
 import random
 import uuid
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from string import (
     ascii_letters,
     ascii_lowercase,
@@ -12,10 +21,380 @@ from string import (
     digits,
     punctuation,
 )
-from typing import TypeVar
+from threading import Lock
+from typing import Any, TypeVar
+
+import numpy as np
 
 T = TypeVar('T')
 
+# number of values drawn at once to refill pools
+POOL_SIZE = 65536
+
+# minimal number of items picked at once for vectorized picking
+VECTORIZATION_THRESHOLD = 64
+
+_rng = np.random.default_rng()
+
+
+def _draw_normals(size: int) -> list[float]:
+    """Draw random numbers with standard normal distribution.
+
+    Parameters
+    ----------
+    size : int
+        Number of values.
+
+    Returns
+    -------
+    list[float]
+        Drawn values.
+
+    """
+    return _rng.standard_normal(size).tolist()  # type: ignore[return-value]
+
+
+class _ValuesPool[V]:
+    """Pool of random values refilled in bulk."""
+
+    def __init__(self, draw: Callable[[int], list[V]]) -> None:
+        """Initialize pool.
+
+        Parameters
+        ----------
+        draw : Callable[[int], list[V]]
+            Function for drawing specified number of values.
+
+        """
+        self._draw = draw
+        self._values: list[V] = []
+        self._position = 0
+        self._lock = Lock()
+
+    def clear(self) -> None:
+        """Drop drawn values."""
+        with self._lock:
+            self._values = []
+            self._position = 0
+
+    def take(self) -> V:
+        """Take random value.
+
+        Returns
+        -------
+        V
+            Random value.
+
+        """
+        with self._lock:
+            if self._position >= len(self._values):
+                self._values = self._draw(POOL_SIZE)
+                self._position = 0
+
+            value = self._values[self._position]
+            self._position += 1
+            return value
+
+
+class _CharactersPool:
+    """Pool of random characters of alphabet refilled in bulk."""
+
+    def __init__(self, alphabet: str) -> None:
+        """Initialize pool.
+
+        Parameters
+        ----------
+        alphabet : str
+            ASCII characters to draw.
+
+        """
+        self._alphabet = np.frombuffer(alphabet.encode('ascii'), np.uint8)
+        self._characters = ''
+        self._position = 0
+        self._lock = Lock()
+
+    def _draw(self, size: int) -> str:
+        """Draw random characters.
+
+        Parameters
+        ----------
+        size : int
+            Number of characters.
+
+        Returns
+        -------
+        str
+            Drawn characters.
+
+        """
+        indices = _rng.integers(0, self._alphabet.size, size)
+        return self._alphabet[indices].tobytes().decode('ascii')
+
+    def clear(self) -> None:
+        """Drop drawn characters."""
+        with self._lock:
+            self._characters = ''
+            self._position = 0
+
+    def take(self, size: int) -> str:
+        """Take random characters.
+
+        Parameters
+        ----------
+        size : int
+            Number of characters.
+
+        Returns
+        -------
+        str
+            Random characters.
+
+        """
+        if size <= 0:
+            return ''
+
+        if size > POOL_SIZE:
+            return self._draw(size)
+
+        with self._lock:
+            start = self._position
+            end = start + size
+
+            if end > len(self._characters):
+                self._characters = self._draw(POOL_SIZE)
+                start, end = 0, size
+
+            self._position = end
+            return self._characters[start:end]
+
+
+_normals = _ValuesPool(_draw_normals)
+
+_lowercase_letters = _CharactersPool(ascii_lowercase)
+_uppercase_letters = _CharactersPool(ascii_uppercase)
+_letters = _CharactersPool(ascii_letters)
+_digits = _CharactersPool(digits)
+_punctuation = _CharactersPool(punctuation)
+# only lowercase letters are used unlike in `string.hexdigits`
+_hex_digits = _CharactersPool(digits + 'abcdef')
+
+
+def _reset_after_fork() -> None:
+    """Reseed generator and drop drawn values in child process, so it
+    does not repeat random values of parent process.
+    """
+    global _rng  # noqa: PLW0603
+    _rng = np.random.default_rng()
+
+    for pool in (
+        _normals,
+        _lowercase_letters,
+        _uppercase_letters,
+        _letters,
+        _digits,
+        _punctuation,
+        _hex_digits,
+    ):
+        pool.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _AliasTable:
+    """Alias table for sampling from discrete distribution in constant
+    time (Vose's alias method).
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """Build alias table.
+
+        Parameters
+        ----------
+        weights : Sequence[float]
+            Weights of items.
+
+        Raises
+        ------
+        ValueError
+            If weights are empty, negative, not finite or their total
+            is zero.
+
+        """
+        values = np.asarray(weights, dtype=np.float64)
+
+        if values.ndim != 1 or values.size == 0:
+            msg = 'Weights must be non empty sequence'
+            raise ValueError(msg)
+
+        if not np.all(np.isfinite(values)) or np.any(values < 0):
+            msg = 'Weights must be finite non negative numbers'
+            raise ValueError(msg)
+
+        total = values.sum()
+        if total <= 0:
+            msg = 'Total of weights must be greater than zero'
+            raise ValueError(msg)
+
+        size = values.size
+        probabilities: list[float] = (values * (size / total)).tolist()  # type: ignore[assignment]
+        aliases = list(range(size))
+
+        small = [i for i, p in enumerate(probabilities) if p < 1]
+        large = [i for i, p in enumerate(probabilities) if p >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            aliases[less] = more
+            probabilities[more] += probabilities[less] - 1
+
+            if probabilities[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # leftovers are equal to 1 up to floating point errors
+        for i in small + large:
+            probabilities[i] = 1.0
+
+        self.size = size
+        self.probabilities = probabilities
+        self.aliases = aliases
+        self._probabilities_array = np.array(probabilities)
+        self._aliases_array = np.array(aliases, dtype=np.intp)
+
+    def pick(self) -> int:
+        """Pick random index.
+
+        Returns
+        -------
+        int
+            Picked index.
+
+        """
+        scaled = random.random() * self.size
+        index = int(scaled)
+
+        if scaled - index < self.probabilities[index]:
+            return index
+
+        return self.aliases[index]
+
+    def pick_many(self, k: int) -> list[int]:
+        """Pick random indices.
+
+        Parameters
+        ----------
+        k : int
+            Number of indices to pick.
+
+        Returns
+        -------
+        list[int]
+            Picked indices.
+
+        """
+        if k < VECTORIZATION_THRESHOLD:
+            return [self.pick() for _ in range(k)]
+
+        scaled = _rng.random(k) * self.size
+        indices = scaled.astype(np.intp)
+        accepted = scaled - indices < self._probabilities_array[indices]
+
+        picked = np.where(accepted, indices, self._aliases_array[indices])
+        return picked.tolist()  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=1024)
+def _get_alias_table(weights: tuple[float, ...]) -> _AliasTable:
+    """Get alias table for weights, tables are cached.
+
+    Parameters
+    ----------
+    weights : tuple[float, ...]
+        Weights of items.
+
+    Returns
+    -------
+    _AliasTable
+        Alias table.
+
+    Raises
+    ------
+    ValueError
+        If weights are invalid.
+
+    """
+    return _AliasTable(weights)
+
+
+def _get_weighted_table(
+    items: Sequence[Any],
+    weights: Sequence[float],
+) -> _AliasTable:
+    """Get alias table for weighted picking of items.
+
+    Parameters
+    ----------
+    items : Sequence[Any]
+        Items to pick from.
+
+    weights : Sequence[float]
+        Weights of items.
+
+    Returns
+    -------
+    _AliasTable
+        Alias table.
+
+    Raises
+    ------
+    ValueError
+        If number of weights does not match number of items or
+        weights are invalid.
+
+    Notes
+    -----
+    Tables are cached by values of weights, so each call still takes
+    linear time in number of weights for copying them to tuple (unless
+    weights are already tuple) and hashing it, that is much cheaper
+    than building the table.
+
+    """
+    if len(weights) != len(items):
+        msg = 'The number of weights does not match the population'
+        raise ValueError(msg)
+
+    if not isinstance(weights, tuple):
+        weights = tuple(weights)
+
+    return _get_alias_table(weights)
+
+
+_DECIMAL_OCTETS = tuple(str(octet) for octet in range(256))
+_HEX_OCTETS = tuple(f'{octet:02x}' for octet in range(256))
+
+
+def _format_ip_v4(value: int) -> str:
+    """Format integer as IPv4 address.
+
+    Parameters
+    ----------
+    value : int
+        Integer in range [0, 2^32).
+
+    Returns
+    -------
+    str
+        IPv4 address in dotted decimal notation.
+
+    """
+    octets = _DECIMAL_OCTETS
+    return (
+        f'{octets[value >> 24]}.{octets[(value >> 16) & 0xFF]}.'
+        f'{octets[(value >> 8) & 0xFF]}.{octets[value & 0xFF]}'
+    )
+
 
 def shuffle(items: Sequence[T]) -> list[T] | str:
     """Shuffle sequence elements."""
@@ -34,14 +413,25 @@ def choice(items: Sequence[T]) -> T:
 
 def choices(items: Sequence[T], n: int) -> list[T]:
     """Return `n` random items from non empty sequence."""
-    return random.choices(items, k=n)
+    if n < VECTORIZATION_THRESHOLD:
+        return random.choices(items, k=n)
+
+    if len(items) == 0:
+        msg = 'Cannot choose from an empty sequence'
+        raise IndexError(msg)
+
+    indices: list[int] = (
+        (_rng.random(n) * len(items)).astype(np.intp).tolist()  # type: ignore[assignment]
+    )
+    return [items[i] for i in indices]
 
 
 def weighted_choice(items: Sequence[T], weights: Sequence[float]) -> T:
     """Return random item from non empty sequence with `weights`
-    probability.
+    probability. Each call takes linear time in number of weights for
+    looking up cached alias table.
     """
-    return random.choices(items, weights=weights, k=1).pop()
+    return items[_get_weighted_table(items, weights).pick()]
 
 
 def weighted_choices(
@@ -52,7 +442,8 @@ def weighted_choices(
     """Return `n` random items from non empty sequence with `weights`
     probability.
     """
-    return random.choices(items, weights=weights, k=n)
+    table = _get_weighted_table(items, weights)
+    return [items[i] for i in table.pick_many(n)]
 
 
 class number:  # noqa: N801
@@ -73,7 +464,7 @@ class number:  # noqa: N801
         """Return random floating point number with Gaussian
         distribution.
         """
-        return random.gauss(mu, sigma)
+        return mu + sigma * _normals.take()
 
 
 class string:  # noqa: N801
@@ -84,43 +475,71 @@ class string:  # noqa: N801
         """Return string of specified `size` that contains random ASCII
         lowercase letters.
         """
-        return ''.join(random.choices(ascii_lowercase, k=size))
+        return _lowercase_letters.take(size)
 
     @staticmethod
     def letters_uppercase(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         uppercase letters.
         """
-        return ''.join(random.choices(ascii_uppercase, k=size))
+        return _uppercase_letters.take(size)
 
     @staticmethod
     def letters(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         letters.
         """
-        return ''.join(random.choices(ascii_letters, k=size))
+        return _letters.take(size)
 
     @staticmethod
     def digits(size: int) -> str:
         """Return string of specified `size` that contains random digit
         characters.
         """
-        return ''.join(random.choices(digits, k=size))
+        return _digits.take(size)
 
     @staticmethod
     def punctuation(size: int) -> str:
         """Return string of specified `size` that contains random ASCII
         punctuation characters.
         """
-        return ''.join(random.choices(punctuation, k=size))
+        return _punctuation.take(size)
 
     @staticmethod
     def hex(size: int) -> str:
-        """Return string of specified `size` that contains random hex
-        characters.
+        """Return string of specified `size` that contains random
+        lowercase hex characters.
         """
-        hexdigits = digits + 'abcdef'
-        return ''.join(random.choices(hexdigits, k=size))
+        return _hex_digits.take(size)
+
+
+# start and size of public IPv4 ranges
+_PUBLIC_IP_V4_RANGES = tuple(
+    (
+        int(ipaddress.IPv4Address(start)),
+        int(ipaddress.IPv4Address(end))
+        - int(ipaddress.IPv4Address(start))
+        + 1,
+    )
+    for start, end in (
+        ('1.0.0.0', '9.255.255.255'),
+        ('11.0.0.0', '100.63.255.255'),
+        ('100.128.0.0', '126.255.255.255'),
+        ('128.0.0.0', '169.253.255.255'),
+        ('169.255.0.0', '172.15.255.255'),
+        ('172.32.0.0', '191.255.255.255'),
+        ('192.0.1.0', '192.0.1.255'),
+        ('192.0.3.0', '192.88.98.255'),
+        ('192.88.100.0', '192.167.255.255'),
+        ('192.169.0.0', '198.17.255.255'),
+        ('198.20.0.0', '198.51.99.255'),
+        ('198.51.101.0', '203.0.112.255'),
+        ('203.0.114.0', '223.255.255.255'),
+    )
+)
+_PUBLIC_IP_V4_RANGES_TABLE = _AliasTable(
+    [5, 8, 6, 7, 4, 9, 3, 4, 5, 6, 4, 6, 8],
+)
 
 
 class network:  # noqa: N801
@@ -129,71 +548,43 @@ class network:  # noqa: N801
     @staticmethod
     def ip_v4() -> str:
         """Return random IPv4 address."""
-        return '.'.join(str(random.randint(0, 255)) for _ in range(4))
+        return _format_ip_v4(random.getrandbits(32))
 
     @staticmethod
     def ip_v4_private_a() -> str:
         """Return random private IPv4 address of Class A."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('10.0.0.0')),
-            int(ipaddress.IPv4Address('10.255.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        # 10.0.0.0 - 10.255.255.255
+        return _format_ip_v4(0x0A000000 | random.getrandbits(24))
 
     @staticmethod
     def ip_v4_private_b() -> str:
         """Return random private IPv4 address of Class B."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('172.16.0.0')),
-            int(ipaddress.IPv4Address('172.31.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        # 172.16.0.0 - 172.31.255.255
+        return _format_ip_v4(0xAC100000 | random.getrandbits(20))
 
     @staticmethod
     def ip_v4_private_c() -> str:
         """Return random private IPv4 address of Class C."""
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address('192.168.0.0')),
-            int(ipaddress.IPv4Address('192.168.255.255')),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        # 192.168.0.0 - 192.168.255.255
+        return _format_ip_v4(0xC0A80000 | random.getrandbits(16))
 
     @staticmethod
     def ip_v4_public() -> str:
         """Return random public IPv4 address."""
-        public_ranges = [
-            ('1.0.0.0', '9.255.255.255'),
-            ('11.0.0.0', '100.63.255.255'),
-            ('100.128.0.0', '126.255.255.255'),
-            ('128.0.0.0', '169.253.255.255'),
-            ('169.255.0.0', '172.15.255.255'),
-            ('172.32.0.0', '191.255.255.255'),
-            ('192.0.1.0', '192.0.1.255'),
-            ('192.0.3.0', '192.88.98.255'),
-            ('192.88.100.0', '192.167.255.255'),
-            ('192.169.0.0', '198.17.255.255'),
-            ('198.20.0.0', '198.51.99.255'),
-            ('198.51.101.0', '203.0.112.255'),
-            ('203.0.114.0', '223.255.255.255'),
-        ]
-
-        start, end = random.choices(
-            population=public_ranges,
-            weights=[5, 8, 6, 7, 4, 9, 3, 4, 5, 6, 4, 6, 8],
-            k=1,
-        ).pop()
-        ipv4_int = random.randint(
-            int(ipaddress.IPv4Address(start)),
-            int(ipaddress.IPv4Address(end)),
-        )
-        return str(ipaddress.IPv4Address(ipv4_int))
+        start, size = _PUBLIC_IP_V4_RANGES[_PUBLIC_IP_V4_RANGES_TABLE.pick()]
+        return _format_ip_v4(start + random.randrange(size))
 
     @staticmethod
     def mac() -> str:
         """Return random MAC address."""
-        mac = [random.randint(0x00, 0xFF) for _ in range(6)]
+        value = random.getrandbits(48)
+        octets = _HEX_OCTETS
 
-        return ':'.join(f'{x:02x}' for x in mac)
+        return (
+            f'{octets[value >> 40]}:{octets[(value >> 32) & 0xFF]}:'
+            f'{octets[(value >> 24) & 0xFF]}:{octets[(value >> 16) & 0xFF]}:'
+            f'{octets[(value >> 8) & 0xFF]}:{octets[value & 0xFF]}'
+        )
 
 
 class crypto:  # noqa: N801
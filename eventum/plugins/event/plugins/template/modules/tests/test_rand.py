@@ -1,6 +1,7 @@
 import datetime as dt
 import ipaddress
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from string import (
     ascii_letters,
     ascii_lowercase,
@@ -47,6 +48,12 @@ def test_weighted_choice():
     assert result in items
 
 
+def test_weighted_choice_with_tuple_weights():
+    items = ['a', 'b', 'c']
+    assert rand.weighted_choice(items, (0, 1, 0)) == 'b'
+    assert rand.weighted_choice(items, [0, 1, 0]) == 'b'
+
+
 def test_weighted_choices():
     items = ['red', 'green', 'blue']
     weights = [0.5, 0.3, 0.2]
@@ -55,6 +62,44 @@ def test_weighted_choices():
     assert all(item in items for item in results)
 
 
+def test_choices_vectorized():
+    items = ['x', 'y', 'z']
+    results = rand.choices(items, 10_000)
+    assert len(results) == 10_000
+    assert set(results) == set(items)
+
+    with pytest.raises(IndexError):
+        rand.choices([], 10_000)
+
+
+def test_weighted_choices_distribution():
+    items = ['a', 'b', 'c', 'd']
+    weights = [1, 0, 3, 0]
+
+    for n in (10, 10_000):
+        results = rand.weighted_choices(items, weights, n)
+        assert len(results) == n
+        assert set(results) <= {'a', 'c'}
+
+    results = rand.weighted_choices(items, weights, 100_000)
+    assert results.count('c') / len(results) == pytest.approx(0.75, abs=0.01)
+
+    assert all(
+        rand.weighted_choice(items, weights) in ('a', 'c') for _ in range(100)
+    )
+
+
+def test_weighted_choice_invalid_weights():
+    with pytest.raises(ValueError):
+        rand.weighted_choice(['a', 'b'], [1])
+
+    with pytest.raises(ValueError):
+        rand.weighted_choice(['a', 'b'], [0, 0])
+
+    with pytest.raises(ValueError):
+        rand.weighted_choices(['a', 'b'], [1, -1], 5)
+
+
 # ---- Number Namespace ----
 def test_number_integer():
     value = rand.number.integer(1, 10)
@@ -71,6 +116,19 @@ def test_number_gauss():
     assert isinstance(value, float)
 
 
+def test_number_gauss_from_threads():
+    def draw(_):
+        return [rand.number.gauss(0, 1) for _ in range(50_000)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        values = [
+            value for chunk in executor.map(draw, range(4)) for value in chunk
+        ]
+
+    assert len(values) == 200_000
+    assert len(set(values)) == len(values)
+
+
 # ---- String Namespace ----
 def test_string_letters_lowercase():
     result = rand.string.letters_lowercase(10)
@@ -108,6 +166,24 @@ def test_string_hex():
     assert all(c in '0123456789abcdef' for c in result)
 
 
+def test_string_sizes():
+    assert rand.string.letters(0) == ''
+    assert rand.string.letters(-1) == ''
+
+    result = rand.string.digits(rand.POOL_SIZE * 2)
+    assert len(result) == rand.POOL_SIZE * 2
+    assert all(c in digits for c in result)
+
+
+def test_string_pool_refill(monkeypatch):
+    monkeypatch.setattr(rand, 'POOL_SIZE', 16)
+
+    results = [rand.string.letters_lowercase(10) for _ in range(100)]
+    assert all(len(result) == 10 for result in results)
+    assert all(c in ascii_lowercase for result in results for c in result)
+    assert len(set(results)) > 1
+
+
 # ---- Network Namespace ----
 def test_ip_v4():
     ip = rand.network.ip_v4()
@@ -1,10 +1,13 @@
 """Definition of template event plugin."""
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from copy import copy
+from datetime import datetime
+from itertools import chain
 from threading import RLock
 from typing import Any, NotRequired, override
 
+import numpy as np
 from jinja2 import (
     BaseLoader,
     Environment,
@@ -18,6 +21,8 @@ from jinja2 import (
 from eventum.plugins.event.base.plugin import (
     EventPlugin,
     EventPluginParams,
+    ProduceBatchParams,
+    ProduceBatchResult,
     ProduceParams,
 )
 from eventum.plugins.event.exceptions import PluginProduceError
@@ -30,6 +35,7 @@ from eventum.plugins.event.plugins.template.context import EventContext
 from eventum.plugins.event.plugins.template.module_provider import (
     ModuleProvider,
 )
+from eventum.plugins.event.plugins.template.renderer import TemplateRenderer
 from eventum.plugins.event.plugins.template.sample_reader import (
     SampleLoadError,
     SamplesReader,
@@ -131,6 +137,15 @@ class TemplateEventPlugin(
         self._logger.debug('Loading templates')
         self._templates = self._load_templates()
 
+        self._logger.debug('Initializing template renderers')
+        self._renderers = {
+            alias: TemplateRenderer(
+                template=template,
+                vars={'locals': self._template_states[alias]},
+            )
+            for alias, template in self._templates.items()
+        }
+
         self._logger.debug('Initializing template picker')
         self._template_picker = self._initialize_template_picker()
 
@@ -161,7 +176,10 @@ class TemplateEventPlugin(
 
         """
         try:
-            return SamplesReader(self._config.root.samples)
+            return SamplesReader(
+                config=self._config.root.samples,
+                loading=self._config.root.samples_loading,
+            )
         except SampleLoadError as e:
             raise PluginConfigurationError(
                 str(e),
@@ -328,6 +346,62 @@ class TemplateEventPlugin(
                 context={'reason': str(e)},
             ) from None
 
+    def _render(self, alias: str, **vars: Any) -> str:
+        """Render template.
+
+        Parameters
+        ----------
+        alias : str
+            Alias of template to render.
+
+        **vars : Any
+            Variables to update in template context.
+
+        Returns
+        -------
+        str
+            Rendered template.
+
+        Raises
+        ------
+        PluginProduceError
+            If any error occurs during rendering.
+
+        """
+        try:
+            return self._renderers[alias].render(**vars)
+        except Exception as e:
+            msg = 'Failed to render template'
+            raise PluginProduceError(
+                msg,
+                context={
+                    'reason': str(e),
+                    'traceback': shorten_traceback(
+                        e,
+                        key_phrase='rewrite_traceback_stack(source=source)',
+                        start_position='after',
+                    ),
+                    'template_alias': alias,
+                },
+            ) from e
+
+    def _split_events(self, rendered: str) -> list[str]:
+        """Split events rendered in batch rendering mode.
+
+        Parameters
+        ----------
+        rendered : str
+            Rendered template.
+
+        Returns
+        -------
+        list[str]
+            Non empty events.
+
+        """
+        separator = self._config.root.batch.separator  # type: ignore[union-attr]
+        return [event for event in rendered.split(separator) if event]
+
     @override
     def _produce(self, params: ProduceParams) -> list[str]:
         self._event_context['timestamp'] = params['timestamp']
@@ -340,28 +414,18 @@ class TemplateEventPlugin(
 
         rendered: list[str] = []
         for alias in picked_aliases:
-            template = self._templates[alias]
-
-            try:
-                event = template.render(
-                    locals=self._template_states[alias],
-                    **params,
-                )
-            except Exception as e:
-                msg = 'Failed to render template'
-                raise PluginProduceError(
-                    msg,
-                    context={
-                        'reason': str(e),
-                        'traceback': shorten_traceback(
-                            e,
-                            key_phrase='rewrite_traceback_stack(source=source)',
-                            start_position='after',
+            if self._config.root.batch is None:
+                rendered.append(self._render(alias, **params))
+            else:
+                rendered.extend(
+                    self._split_events(
+                        self._render(
+                            alias,
+                            timestamps=[params['timestamp']],
+                            tags=[params['tags']],
                         ),
-                        'template_alias': alias,
-                    },
-                ) from e
-            rendered.append(event)
+                    ),
+                )
 
         # use local state of last rendered template for next calls
         locals = self._template_states[picked_aliases[-1]]
@@ -369,6 +433,134 @@ class TemplateEventPlugin(
 
         return rendered
 
+    @override
+    def _produce_batch(self, params: ProduceBatchParams) -> ProduceBatchResult:
+        if self._config.root.batch is None:
+            return super()._produce_batch(params)
+
+        tz = params['timezone']
+        timestamps = [
+            tz.localize(timestamp)
+            for timestamp in params['timestamps']['timestamp'].astype(
+                dtype=datetime,
+            )
+        ]
+        tags_map = params['tags']
+        ids: list[int] = params['timestamps']['id'].tolist()  # type: ignore[assignment]
+        tags = [tags_map[id] for id in ids]
+
+        picked = self._template_picker.pick_batch(len(timestamps))
+
+        result = ProduceBatchResult()
+        rendered_events: list[list[str]] = []
+        rendered_indices: list[Sequence[int]] = []
+        rendered_aliases: list[str] = []
+
+        for alias, indices in picked.items():
+            whole_batch = len(indices) == len(timestamps)
+
+            try:
+                rendered = self._render(
+                    alias,
+                    timestamps=(
+                        timestamps
+                        if whole_batch
+                        else [timestamps[i] for i in indices]
+                    ),
+                    tags=tags if whole_batch else [tags[i] for i in indices],
+                )
+            except PluginProduceError as e:
+                result.errors.append(e)
+                result.produce_failed += len(indices)
+                continue
+
+            events = self._split_events(rendered)
+
+            if len(picked) > 1 and len(events) != len(indices):
+                result.errors.append(
+                    PluginProduceError(
+                        'Number of events rendered in batch does not match '
+                        'number of timestamps passed to template',
+                        context={
+                            'template_alias': alias,
+                            'timestamps': len(indices),
+                            'events': len(events),
+                        },
+                    ),
+                )
+                result.produce_failed += len(indices)
+                continue
+
+            rendered_events.append(events)
+            rendered_indices.append(indices)
+            rendered_aliases.append(alias)
+
+        if not rendered_aliases:
+            return result
+
+        if len(rendered_aliases) == 1:
+            result.events = rendered_events[0]
+            last_alias = rendered_aliases[0]
+        else:
+            result.events, last_alias = self._merge_rendered_events(
+                events=rendered_events,
+                indices=rendered_indices,
+                aliases=rendered_aliases,
+            )
+
+        # use local state of last rendered template for next calls
+        self._event_context['locals'] = self._template_states[last_alias]
+
+        return result
+
+    @staticmethod
+    def _merge_rendered_events(
+        events: list[list[str]],
+        indices: list[Sequence[int]],
+        aliases: list[str],
+    ) -> tuple[list[str], str]:
+        """Merge events rendered by templates in batch rendering mode
+        into order of their timestamps.
+
+        Parameters
+        ----------
+        events : list[list[str]]
+            Events rendered by each template, one event per timestamp.
+
+        indices : list[Sequence[int]]
+            Ascending indices of timestamps passed to each template.
+
+        aliases : list[str]
+            Aliases of templates in order of picking for single
+            timestamp.
+
+        Returns
+        -------
+        tuple[list[str], str]
+            Merged events and alias of template that rendered last of
+            them. Events of the same timestamp are ordered the same way
+            as templates are picked.
+
+        """
+        keys = np.concatenate(
+            [
+                np.arange(i.start, i.stop, i.step)
+                if isinstance(i, range)
+                else np.asarray(i, dtype=np.int64)
+                for i in indices
+            ],
+        )
+
+        # sort is stable, so events of the same timestamp are kept in
+        # order of templates
+        order: list[int] = np.argsort(keys, kind='stable').tolist()  # type: ignore[assignment]
+        flat = list(chain.from_iterable(events))
+
+        sizes = np.cumsum([len(template_events) for template_events in events])
+        last_alias = aliases[int(np.searchsorted(sizes, order[-1], 'right'))]
+
+        return [flat[i] for i in order], last_alias
+
     @property
     def local_states(self) -> dict[str, SingleThreadState]:
         """Local states of templates."""
@@ -0,0 +1,123 @@
+"""Renderer of templates with reusable render context."""
+
+from typing import Any
+
+from jinja2 import Template, TemplateError, nodes
+
+
+class TemplateRenderer:
+    """Renderer of jinja template.
+
+    Unlike `Template.render`, that creates new context merging all
+    globals (e.g. `params`, `samples`, `module`) for each call, the
+    renderer creates context once and then only updates it with
+    variables of each rendering. Templates that consist only of static
+    text are rendered once.
+
+    Notes
+    -----
+    Variables provided at initialization are kept in context, so
+    variables that are changed between renderings must be provided in
+    each call of `render` method.
+
+    """
+
+    def __init__(self, template: Template, vars: dict[str, Any]) -> None:
+        """Initialize renderer.
+
+        Parameters
+        ----------
+        template : Template
+            Template to render.
+
+        vars : dict[str, Any]
+            Initial variables of template context.
+
+        """
+        self._template = template
+        self._environment = template.environment
+        self._render_func = template.root_render_func
+        self._context = template.new_context(vars)
+
+        self._static_output = (
+            self._render_func_output() if self._is_static() else None
+        )
+
+    def _is_static(self) -> bool:
+        """Check whether the template consists only of static text.
+
+        Returns
+        -------
+        bool
+            `True` if template is static, `False` otherwise or if
+            source of template is unavailable.
+
+        """
+        loader = self._environment.loader
+        if loader is None or self._template.name is None:
+            return False
+
+        try:
+            source, _, _ = loader.get_source(
+                self._environment,
+                self._template.name,
+            )
+            ast = self._environment.parse(source)
+        except TemplateError:
+            return False
+
+        return all(
+            isinstance(node, nodes.Output | nodes.TemplateData)
+            for node in ast.find_all(nodes.Node)
+        )
+
+    def _render_func_output(self) -> str:
+        """Render template using current context.
+
+        Returns
+        -------
+        str
+            Rendered template.
+
+        """
+        context = self._context
+
+        # clear variables and blocks that could be set by previous
+        # rendering on the template top level
+        context.vars.clear()
+        context.exported_vars.clear()
+        if context.blocks:
+            context.blocks = {
+                name: [block] for name, block in self._template.blocks.items()
+            }
+
+        try:
+            return ''.join(self._render_func(context))
+        except Exception:  # noqa: BLE001
+            self._environment.handle_exception()
+
+    def render(self, **vars: Any) -> str:
+        """Render template.
+
+        Parameters
+        ----------
+        **vars : Any
+            Variables to update in template context.
+
+        Returns
+        -------
+        str
+            Rendered template.
+
+        Raises
+        ------
+        Exception
+            If any error occurs during rendering, traceback is
+            rewritten the same way as in `Template.render`.
+
+        """
+        if self._static_output is not None:
+            return self._static_output
+
+        self._context.parent.update(vars)
+        return self._render_func_output()
@@ -0,0 +1,451 @@
+"""On-disk cache of parsed samples.
+
+Each cache entry is a directory with metadata file and files of
+columns. Columns of strings are stored in Arrow-like layout (UTF-8
+encoded data buffer with offsets of values) as `.npy` files that are
+memory mapped on load, so parsing of source file is not needed and
+pages of cache files are shared between processes using the same
+sample. Other columns are stored in JSON.
+"""
+
+import hashlib
+import json
+import operator
+import shutil
+import tempfile
+from collections.abc import Iterator, Sequence
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+# name of cache directory created next to source file of sample
+CACHE_DIRNAME = '.samples_cache'
+
+# version of cache layout, entries of other versions are not used
+CACHE_VERSION = 1
+
+METADATA_FILENAME = 'metadata.json'
+
+STRING_DTYPE = np.dtypes.StringDType()
+
+
+class StringColumn:
+    """Read only column of strings stored as UTF-8 encoded data buffer
+    with offsets of values.
+    """
+
+    def __init__(
+        self,
+        offsets: NDArray[np.int64],
+        data: NDArray[np.uint8],
+    ) -> None:
+        """Initialize column.
+
+        Parameters
+        ----------
+        offsets : NDArray[np.int64]
+            Offsets of values in data buffer, value `i` is located in
+            range [offsets[i], offsets[i + 1]), so number of offsets is
+            greater than number of values by one.
+
+        data : NDArray[np.uint8]
+            Data buffer with UTF-8 encoded values.
+
+        Raises
+        ------
+        ValueError
+            If offsets are inconsistent with data buffer.
+
+        """
+        if (
+            offsets.dtype != np.int64
+            or data.dtype != np.uint8
+            or offsets.ndim != 1
+            or offsets.size == 0
+            or offsets[0] != 0
+            or offsets[-1] != data.size
+        ):
+            msg = 'Offsets are inconsistent with data buffer'
+            raise ValueError(msg)
+
+        self._offsets = offsets
+        self._data = data
+        self._view = memoryview(data) if data.size > 0 else memoryview(b'')
+
+    @classmethod
+    def from_array(cls, array: NDArray) -> 'StringColumn':
+        """Create column from array of strings.
+
+        Parameters
+        ----------
+        array : NDArray
+            Array of strings.
+
+        Returns
+        -------
+        StringColumn
+            Created column.
+
+        """
+        encoded = [value.encode() for value in array]
+
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)),
+            out=offsets[1:],
+        )
+
+        return cls(
+            offsets=offsets,
+            data=np.frombuffer(b''.join(encoded), dtype=np.uint8),
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of values in column."""
+        return self._offsets.size - 1
+
+    @property
+    def offsets(self) -> NDArray[np.int64]:
+        """Offsets of values in data buffer."""
+        return self._offsets
+
+    @property
+    def data(self) -> NDArray[np.uint8]:
+        """Data buffer with UTF-8 encoded values."""
+        return self._data
+
+    def to_array(self) -> NDArray:
+        """Convert column to array of variable width strings.
+
+        Returns
+        -------
+        NDArray
+            Array of strings.
+
+        """
+        return np.array(list(self), dtype=STRING_DTYPE)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[str]:
+        view = self._view
+        offsets: list[int] = self._offsets.tolist()  # type: ignore[assignment]
+
+        for start, end in pairwise(offsets):
+            yield str(view[start:end], 'utf-8')
+
+    def __getitem__(self, key: Any) -> str | list[str]:
+        if isinstance(key, np.ndarray):
+            view = self._view
+            starts: list[int] = self._offsets[key].tolist()  # type: ignore[assignment]
+            ends: list[int] = self._offsets[key + 1].tolist()  # type: ignore[assignment]
+
+            return [
+                str(view[start:end], 'utf-8')
+                for start, end in zip(starts, ends, strict=True)
+            ]
+
+        index = operator.index(key)
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            msg = 'Column index out of range'
+            raise IndexError(msg)
+
+        start = int(self._offsets[index])
+        end = int(self._offsets[index + 1])
+
+        return str(self._view[start:end], 'utf-8')
+
+
+type Column = NDArray | StringColumn
+
+
+def _get_source_state(source: Path) -> dict[str, int]:
+    """Get state of source file that is used to detect its changes.
+
+    Parameters
+    ----------
+    source : Path
+        Path to source file of sample.
+
+    Returns
+    -------
+    dict[str, int]
+        Modification time (in nanoseconds) and size of source file.
+
+    Raises
+    ------
+    OSError
+        If source file cannot be accessed.
+
+    """
+    stat = source.stat()
+    return {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def get_cache_path(source: Path, options: dict[str, Any]) -> Path:
+    """Get path of cache entry for sample.
+
+    Parameters
+    ----------
+    source : Path
+        Path to source file of sample.
+
+    options : dict[str, Any]
+        JSON serializable options of sample loading.
+
+    Returns
+    -------
+    Path
+        Path of cache entry, entry is keyed by resolved path of source
+        file, its modification time, size and loading options.
+
+    Raises
+    ------
+    OSError
+        If source file cannot be accessed.
+
+    """
+    source = source.resolve()
+
+    key = json.dumps(
+        {
+            'version': CACHE_VERSION,
+            'path': str(source),
+            **_get_source_state(source),
+            'options': options,
+        },
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+
+    return source.parent / CACHE_DIRNAME / f'{source.name}.{digest}'
+
+
+def read_sample_cache(
+    path: Path,
+) -> tuple[list[Column], list[str] | None]:
+    """Read cache entry.
+
+    Parameters
+    ----------
+    path : Path
+        Path of cache entry.
+
+    Returns
+    -------
+    tuple[list[Column], list[str] | None]
+        Columns and headers of sample, columns of strings are memory
+        mapped.
+
+    Raises
+    ------
+    FileNotFoundError
+        If cache entry does not exist.
+
+    OSError
+        If cache entry cannot be read.
+
+    ValueError
+        If cache entry is corrupted.
+
+    """
+    with (path / METADATA_FILENAME).open() as f:
+        try:
+            metadata = json.load(f)
+            size: int = metadata['size']
+            headers: list[str] | None = metadata['headers']
+            kinds: list[str] = metadata['columns']
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            msg = f'Invalid metadata: {e}'
+            raise ValueError(msg) from None
+
+    columns: list[Column] = []
+    for i, kind in enumerate(kinds):
+        column: Column
+        if kind == 'string':
+            offsets = np.load(path / f'{i}.offsets.npy', mmap_mode='r')
+            data = (
+                np.load(path / f'{i}.data.npy', mmap_mode='r')
+                if offsets.size > 0 and offsets[-1] > 0
+                else np.empty(0, dtype=np.uint8)
+            )
+            column = StringColumn(offsets=offsets, data=data)
+        elif kind == 'json':
+            with (path / f'{i}.json').open() as f:
+                values = json.load(f)
+            column = np.fromiter(values, dtype=object, count=len(values))
+        else:
+            msg = f'Unknown column kind `{kind}`'
+            raise ValueError(msg)
+
+        if len(column) != size:
+            msg = 'Column size does not match sample size'
+            raise ValueError(msg)
+
+        columns.append(column)
+
+    return columns, headers
+
+
+def _write_column(directory: Path, index: int, column: Column) -> str:
+    """Write column to cache entry directory.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory of cache entry.
+
+    index : int
+        Index of column.
+
+    column : Column
+        Column to write.
+
+    Returns
+    -------
+    str
+        Kind of written column.
+
+    Raises
+    ------
+    OSError
+        If column cannot be written.
+
+    TypeError
+        If values of column cannot be serialized.
+
+    """
+    if isinstance(column, np.ndarray) and column.dtype == STRING_DTYPE:
+        column = StringColumn.from_array(column)
+
+    if isinstance(column, StringColumn):
+        np.save(directory / f'{index}.offsets.npy', column.offsets)
+        np.save(directory / f'{index}.data.npy', column.data)
+        return 'string'
+
+    with (directory / f'{index}.json').open('w') as f:
+        json.dump(column.tolist(), f)
+
+    return 'json'
+
+
+def _remove_stale_entries(
+    path: Path,
+    source_state: dict[str, int],
+) -> None:
+    """Remove entries of the same source file as provided entry that
+    were written for other state of source file.
+
+    Parameters
+    ----------
+    path : Path
+        Path of actual cache entry.
+
+    source_state : dict[str, int]
+        Current state of source file.
+
+    Notes
+    -----
+    Entries with unreadable metadata are also removed, entries for
+    other loading options of the same state of source file are kept.
+
+    """
+    source_name = path.name.rsplit('.', maxsplit=1)[0]
+    for entry in path.parent.glob(f'{source_name}.*'):
+        if entry == path or entry.name.rsplit('.', maxsplit=1)[0] != (
+            source_name
+        ):
+            continue
+
+        try:
+            with (entry / METADATA_FILENAME).open() as f:
+                entry_source_state = json.load(f)['source']
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            entry_source_state = None
+
+        if entry_source_state != source_state:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def write_sample_cache(
+    path: Path,
+    source: Path,
+    columns: Sequence[Column],
+    headers: Sequence[str] | None,
+) -> None:
+    """Write cache entry removing entries of the same source file that
+    are stale.
+
+    Parameters
+    ----------
+    path : Path
+        Path of cache entry.
+
+    source : Path
+        Path to source file of sample.
+
+    columns : Sequence[Column]
+        Columns of sample.
+
+    headers : Sequence[str] | None
+        Headers of sample.
+
+    Raises
+    ------
+    OSError
+        If cache entry cannot be written.
+
+    TypeError
+        If values of some column cannot be serialized.
+
+    Notes
+    -----
+    Entry is written to temporary directory that is renamed to entry
+    path, so concurrent readers never see partially written entry. If
+    entry is concurrently written by other process, then entry of that
+    process is kept.
+
+    Modification time and size of source file are stored in metadata
+    of entry, so entries are removed only when source file is changed.
+
+    """
+    source_state = _get_source_state(source.resolve())
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(tempfile.mkdtemp(prefix='.tmp-', dir=path.parent))
+
+    try:
+        kinds = [
+            _write_column(temp_dir, i, column)
+            for i, column in enumerate(columns)
+        ]
+        size = len(columns[0]) if columns else 0
+
+        with (temp_dir / METADATA_FILENAME).open('w') as f:
+            json.dump(
+                {
+                    'size': size,
+                    'headers': list(headers) if headers is not None else None,
+                    'columns': kinds,
+                    'source': source_state,
+                },
+                f,
+            )
+
+        try:
+            temp_dir.rename(path)
+        except OSError:
+            if not path.exists():
+                raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    _remove_stale_entries(path, source_state)
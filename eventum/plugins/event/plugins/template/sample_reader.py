@@ -2,11 +2,19 @@
 of different types.
 """
 
-from collections.abc import Callable, Iterable
-from typing import Any
-
+import csv
+import json
+import operator
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from functools import partial
+from itertools import batched, chain
+from threading import Lock, Thread
+from typing import Any, assert_never
+from weakref import WeakValueDictionary
+
+import numpy as np
 import structlog
-import tablib  # type: ignore[import-untyped]
+from numpy.typing import NDArray
 
 from eventum.exceptions import ContextualError
 from eventum.plugins.event.plugins.template.config import (
@@ -14,35 +22,443 @@ from eventum.plugins.event.plugins.template.config import (
     ItemsSampleConfig,
     JSONSampleConfig,
     SampleConfig,
+    SamplesLoadingMode,
     SampleType,
 )
+from eventum.plugins.event.plugins.template.sample_cache import (
+    STRING_DTYPE,
+    Column,
+    get_cache_path,
+    read_sample_cache,
+    write_sample_cache,
+)
 
 logger = structlog.stdlib.get_logger()
 
+# number of rows converted to columns at once during sample loading
+CHUNK_SIZE = 65536
+
+type Row = tuple[Any, ...]
+
 
 class SampleLoadError(ContextualError):
     """Failed to load sample."""
 
 
+def _to_column(values: Sequence[Any]) -> NDArray:
+    """Convert values of column to array.
+
+    Parameters
+    ----------
+    values : Sequence[Any]
+        Values of column.
+
+    Returns
+    -------
+    NDArray
+        Array of variable width strings if all values are strings,
+        array of python objects otherwise.
+
+    """
+    if all(isinstance(value, str) for value in values):
+        return np.array(values, dtype=STRING_DTYPE)
+
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _concatenate_column(parts: Sequence[NDArray]) -> NDArray:
+    """Concatenate parts of column converted from different chunks.
+
+    Parameters
+    ----------
+    parts : Sequence[NDArray]
+        Parts of column.
+
+    Returns
+    -------
+    NDArray
+        Concatenated column, if some of the parts are not arrays of
+        strings, then column is array of python objects.
+
+    """
+    if all(part.dtype == STRING_DTYPE for part in parts):
+        return np.concatenate(parts)
+
+    return np.concatenate([part.astype(object) for part in parts])
+
+
 class Sample:
-    """Immutable sample."""
+    """Immutable sample with columnar storage.
+
+    Each column of sample is stored in separate array, columns of
+    strings are stored as variable width strings and other columns as
+    python objects. Columns of samples loaded from cache can also be
+    memory mapped columns of strings. Rows are assembled from columns
+    on access.
+    """
 
-    def __init__(self, dataset: tablib.Dataset) -> None:
+    def __init__(
+        self,
+        columns: Sequence[Column],
+        headers: Sequence[str] | None = None,
+    ) -> None:
         """Initialize sample.
 
         Parameters
         ----------
-        dataset : tablib.Dataset
-            Sample data.
+        columns : Sequence[Column]
+            One dimensional arrays or columns of strings of the same
+            size with values of columns.
+
+        headers : Sequence[str] | None, default=None
+            Names of columns.
+
+        Raises
+        ------
+        ValueError
+            If columns have different sizes or number of headers does
+            not match number of columns.
+
+        """
+        sizes = {len(column) for column in columns}
+        if len(sizes) > 1:
+            msg = 'All columns must have the same size'
+            raise ValueError(msg)
+
+        if headers is not None and len(headers) != len(columns):
+            msg = (
+                f'Number of headers ({len(headers)}) does not match '
+                f'number of columns ({len(columns)})'
+            )
+            raise ValueError(msg)
+
+        for column in columns:
+            if isinstance(column, np.ndarray):
+                column.flags.writeable = False
+
+        self._columns = tuple(columns)
+        self._size = sizes.pop() if sizes else 0
+        self._headers = tuple(headers) if headers is not None else None
+        self._column_indices = (
+            {header: i for i, header in reversed(list(enumerate(headers)))}
+            if headers is not None
+            else {}
+        )
+
+        self._string_arrays: dict[int, NDArray] = {}
+
+        self._rng = np.random.default_rng()
+        self._cumulative_weights: dict[str, NDArray[np.float64]] = {}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        headers: Sequence[str] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> 'Sample':
+        """Create sample from rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            Rows of sample, all rows must have the same number of
+            values.
+
+        headers : Sequence[str] | None, default=None
+            Names of columns.
+
+        chunk_size : int, default=CHUNK_SIZE
+            Number of rows converted to columns at once.
+
+        Returns
+        -------
+        Sample
+            Created sample.
+
+        Raises
+        ------
+        ValueError
+            If rows have different number of values or number of
+            headers does not match number of values in rows.
 
         """
-        self._dataset = dataset
+        parts: list[list[NDArray]] = []
+
+        for chunk in batched(rows, chunk_size):
+            try:
+                chunk_columns = list(zip(*chunk, strict=True))
+            except ValueError:
+                msg = 'All rows must have the same number of values'
+                raise ValueError(msg) from None
+
+            if not parts:
+                parts = [[] for _ in chunk_columns]
+            elif len(chunk_columns) != len(parts):
+                msg = 'All rows must have the same number of values'
+                raise ValueError(msg)
+
+            for column_parts, values in zip(parts, chunk_columns, strict=True):
+                column_parts.append(_to_column(values))
+
+        if not parts and headers is not None:
+            parts = [[np.empty(0, dtype=STRING_DTYPE)] for _ in headers]
+
+        return cls(
+            columns=[_concatenate_column(part) for part in parts],
+            headers=headers,
+        )
+
+    @property
+    def headers(self) -> tuple[str, ...] | None:
+        """Names of columns, `None` if sample is without header."""
+        return self._headers
+
+    def column(self, name: str) -> NDArray:
+        """Get values of column.
+
+        Parameters
+        ----------
+        name : str
+            Name of column.
+
+        Returns
+        -------
+        NDArray
+            Read only array with values of column.
+
+        Raises
+        ------
+        KeyError
+            If no column with specified name exists.
+
+        Notes
+        -----
+        Memory mapped columns of strings are converted to arrays on
+        first lookup.
+
+        """
+        try:
+            index = self._column_indices[name]
+        except KeyError:
+            msg = f'No such column `{name}`'
+            raise KeyError(msg) from None
+
+        column = self._columns[index]
+        if isinstance(column, np.ndarray):
+            return column
+
+        if index not in self._string_arrays:
+            array = column.to_array()
+            array.flags.writeable = False
+            self._string_arrays[index] = array
+
+        return self._string_arrays[index]
+
+    def _get_rows(self, indices: NDArray[np.intp]) -> list[Row]:
+        """Get rows with specified indices.
+
+        Parameters
+        ----------
+        indices : NDArray[np.intp]
+            Indices of rows.
+
+        Returns
+        -------
+        list[Row]
+            Rows.
+
+        """
+        if not self._columns:
+            return [() for _ in range(indices.size)]
+
+        return list(
+            zip(*(column[indices] for column in self._columns), strict=True),
+        )
+
+    def _get_cumulative_weights(
+        self,
+        weights: str | Sequence[float],
+    ) -> NDArray[np.float64]:
+        """Get cumulative weights of rows.
+
+        Parameters
+        ----------
+        weights : str | Sequence[float]
+            Weights of rows or name of column with weights, cumulative
+            weights of column are computed once.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Cumulative weights.
+
+        Raises
+        ------
+        KeyError
+            If no column with specified name exists.
+
+        ValueError
+            If weights are invalid.
+
+        """
+        if isinstance(weights, str) and weights in self._cumulative_weights:
+            return self._cumulative_weights[weights]
+
+        values = (
+            self.column(weights).astype(np.float64)
+            if isinstance(weights, str)
+            else np.asarray(weights, dtype=np.float64)
+        )
+
+        if values.shape != (self._size,):
+            msg = (
+                f'Number of weights ({values.size}) does not match '
+                f'number of rows ({self._size})'
+            )
+            raise ValueError(msg)
+
+        if not np.all(np.isfinite(values)) or np.any(values < 0):
+            msg = 'Weights must be finite non negative numbers'
+            raise ValueError(msg)
+
+        cumulative = np.cumsum(values)
+        if cumulative.size == 0 or cumulative[-1] <= 0:
+            msg = 'Total of weights must be greater than zero'
+            raise ValueError(msg)
+
+        if isinstance(weights, str):
+            self._cumulative_weights[weights] = cumulative
+
+        return cumulative
+
+    def choices(
+        self,
+        k: int,
+        weights: str | Sequence[float] | None = None,
+    ) -> list[Row]:
+        """Pick random rows with replacement.
+
+        Parameters
+        ----------
+        k : int
+            Number of rows to pick.
+
+        weights : str | Sequence[float] | None, default=None
+            Weights of rows or name of column with weights, if `None`,
+            then all rows are equally likely picked.
+
+        Returns
+        -------
+        list[Row]
+            Picked rows.
+
+        Raises
+        ------
+        IndexError
+            If sample is empty.
+
+        KeyError
+            If no column with specified name exists.
+
+        ValueError
+            If weights are invalid.
+
+        """
+        if self._size == 0:
+            msg = 'Cannot choose from empty sample'
+            raise IndexError(msg)
+
+        if weights is None:
+            indices = self._rng.integers(0, self._size, size=k)
+        else:
+            cumulative = self._get_cumulative_weights(weights)
+            indices = np.searchsorted(
+                cumulative,
+                self._rng.random(k) * cumulative[-1],
+                side='right',
+            )
+            np.minimum(indices, self._size - 1, out=indices)
+
+        return self._get_rows(indices)
+
+    def choice(self, weights: str | Sequence[float] | None = None) -> Row:
+        """Pick random row.
+
+        Parameters
+        ----------
+        weights : str | Sequence[float] | None, default=None
+            Weights of rows or name of column with weights, if `None`,
+            then all rows are equally likely picked.
+
+        Returns
+        -------
+        Row
+            Picked row.
+
+        Raises
+        ------
+        IndexError
+            If sample is empty.
+
+        KeyError
+            If no column with specified name exists.
+
+        ValueError
+            If weights are invalid.
+
+        """
+        return self.choices(k=1, weights=weights)[0]
+
+    def sample(self, k: int) -> list[Row]:
+        """Pick random unique rows (without replacement).
+
+        Parameters
+        ----------
+        k : int
+            Number of rows to pick.
+
+        Returns
+        -------
+        list[Row]
+            Picked rows.
+
+        Raises
+        ------
+        ValueError
+            If `k` is negative or greater than number of rows.
+
+        """
+        if not 0 <= k <= self._size:
+            msg = 'Sample larger than number of rows or is negative'
+            raise ValueError(msg)
+
+        return self._get_rows(
+            self._rng.choice(self._size, size=k, replace=False),
+        )
 
     def __len__(self) -> int:
-        return len(self._dataset)
+        return self._size
+
+    def __iter__(self) -> Iterator[Row]:
+        if not self._columns:
+            return iter(())
+
+        return zip(*self._columns, strict=True)
+
+    def __getitem__(self, key: Any) -> Row | list[Row] | NDArray:
+        if isinstance(key, str):
+            return self.column(key)
+
+        if isinstance(key, slice):
+            return self._get_rows(np.arange(self._size)[key])
 
-    def __getitem__(self, key: Any) -> list | tuple:
-        return self._dataset[key]
+        index = operator.index(key)
+        if not -self._size <= index < self._size:
+            msg = 'Sample index out of range'
+            raise IndexError(msg)
+
+        return tuple([column[index] for column in self._columns])
 
 
 def _load_items_sample(config: ItemsSampleConfig) -> Sample:
@@ -58,20 +474,223 @@ def _load_items_sample(config: ItemsSampleConfig) -> Sample:
     Sample
         Loaded sample.
 
-    """
-    data = tablib.Dataset()
+    Raises
+    ------
+    ValueError
+        If items have different number of values.
 
+    """
     try:
         first_row = config.source[0]
     except IndexError:
         first_row = []
 
     if isinstance(first_row, Iterable) and not isinstance(first_row, str):
-        data.extend(config.source)
+        return Sample.from_rows(config.source)
+
+    return Sample.from_rows((item,) for item in config.source)
+
+
+def _read_csv_sample(config: CSVSampleConfig) -> Sample:
+    """Read and parse sample using configuration of type `csv`.
+
+    Parameters
+    ----------
+    config: CSVSampleConfig
+        Sample configuration.
+
+    Returns
+    -------
+    Sample
+        Loaded sample.
+
+    Raises
+    ------
+    Exception
+        If some error occurs during sample loading.
+
+    Notes
+    -----
+    Empty lines are skipped. Rows shorter than header (or than the
+    first row if sample is without header) are padded with empty
+    strings, while longer rows are considered invalid.
+
+    """
+    with config.source.open(newline='') as f:
+        reader = csv.reader(f, delimiter=config.delimiter)
+        rows: Iterator[list[str]] = (row for row in reader if row)
+
+        if config.header:
+            headers = next(rows, None)
+            width = len(headers) if headers is not None else 0
+        else:
+            headers = None
+            first_row = next(rows, None)
+            if first_row is None:
+                return Sample.from_rows(())
+
+            width = len(first_row)
+            rows = chain((first_row,), rows)
+
+        return Sample.from_rows(
+            _pad_csv_rows(rows, width=width),
+            headers=headers,
+        )
+
+
+def _pad_csv_rows(
+    rows: Iterable[list[str]],
+    width: int,
+) -> Iterator[list[str]]:
+    """Pad rows of CSV sample with empty strings to specified width.
+
+    Parameters
+    ----------
+    rows : Iterable[list[str]]
+        Rows to pad.
+
+    width : int
+        Number of values in each row.
+
+    Yields
+    ------
+    list[str]
+        Padded row.
+
+    Raises
+    ------
+    ValueError
+        If some row has more values than width.
+
+    """
+    for row in rows:
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        elif len(row) > width:
+            msg = (
+                f'Row has {len(row)} values while {width} values are expected'
+            )
+            raise ValueError(msg)
+
+        yield row
+
+
+def _read_json_sample(config: JSONSampleConfig) -> Sample:
+    """Read and parse sample using configuration of type `json`.
+
+    Parameters
+    ----------
+    config: JSONSampleConfig
+        Sample configuration.
+
+    Returns
+    -------
+    Sample
+        Loaded sample.
+
+    Raises
+    ------
+    Exception
+        If some error occurs during sample loading.
+
+    Notes
+    -----
+    Sample can be list of objects (keys of the first object are used
+    as headers), list of lists or list of single values.
+
+    """
+    with config.source.open() as f:
+        data = json.load(f)
+
+    if not isinstance(data, list):
+        msg = 'Sample must be a list'
+        raise TypeError(msg)
+
+    if not data:
+        return Sample.from_rows(())
+
+    if isinstance(data[0], dict):
+        headers = list(data[0].keys())
+        return Sample.from_rows(
+            (tuple(item[header] for header in headers) for item in data),
+            headers=headers,
+        )
+
+    if isinstance(data[0], list):
+        return Sample.from_rows(data)
+
+    return Sample.from_rows((item,) for item in data)
+
+
+def _load_cached_sample[ConfigT: CSVSampleConfig | JSONSampleConfig](
+    config: ConfigT,
+    read: Callable[[ConfigT], Sample],
+) -> Sample:
+    """Load sample from cache or read it and write to cache.
+
+    Parameters
+    ----------
+    config : ConfigT
+        Sample configuration.
+
+    read : Callable[[ConfigT], Sample]
+        Function for reading and parsing sample.
+
+    Returns
+    -------
+    Sample
+        Loaded sample.
+
+    Raises
+    ------
+    Exception
+        If some error occurs during sample reading.
+
+    Notes
+    -----
+    Failures of reading and writing cache are logged and sample is
+    read from source in that case.
+
+    """
+    try:
+        cache_path = get_cache_path(
+            source=config.source,
+            options=config.model_dump(mode='json', exclude={'cache'}),
+        )
+    except OSError:
+        return read(config)
+
+    try:
+        columns, headers = read_sample_cache(cache_path)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(
+            'Failed to read sample cache, sample will be read from source',
+            file_path=str(cache_path),
+            reason=str(e),
+        )
     else:
-        data.extend((item,) for item in config.source)
+        logger.debug('Sample is loaded from cache', file_path=str(cache_path))
+        return Sample(columns=columns, headers=headers)
+
+    sample = read(config)
+
+    try:
+        write_sample_cache(
+            path=cache_path,
+            source=config.source,
+            columns=sample._columns,  # noqa: SLF001
+            headers=sample.headers,
+        )
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(
+            'Failed to write sample cache',
+            file_path=str(cache_path),
+            reason=str(e),
+        )
 
-    return Sample(data)
+    return sample
 
 
 def _load_csv_sample(config: CSVSampleConfig) -> Sample:
@@ -93,15 +712,10 @@ def _load_csv_sample(config: CSVSampleConfig) -> Sample:
         If some error occurs during sample loading.
 
     """
-    data = tablib.Dataset()
-    with config.source.open() as f:
-        data.load(
-            in_stream=f,
-            format='csv',
-            headers=config.header,
-            delimiter=config.delimiter,
-        )
-        return Sample(data)
+    if config.cache:
+        return _load_cached_sample(config, _read_csv_sample)
+
+    return _read_csv_sample(config)
 
 
 def _load_json_sample(config: JSONSampleConfig) -> Sample:
@@ -123,13 +737,124 @@ def _load_json_sample(config: JSONSampleConfig) -> Sample:
         If some error occurs during sample loading.
 
     """
-    data = tablib.Dataset()
-    with config.source.open() as f:
-        data.load(
-            in_stream=f,
-            format='json',
+    if config.cache:
+        return _load_cached_sample(config, _read_json_sample)
+
+    return _read_json_sample(config)
+
+
+def _get_sample_key(config: SampleConfig) -> Hashable | None:
+    """Get key identifying loaded sample for sharing it.
+
+    Parameters
+    ----------
+    config : SampleConfig
+        Sample configuration.
+
+    Returns
+    -------
+    Hashable | None
+        Key consisting of sample type, resolved path of source file,
+        its modification time, size and loading options or `None` if
+        sample is not loaded from file or file cannot be accessed.
+
+    """
+    root = config.root
+    if isinstance(root, ItemsSampleConfig):
+        return None
+
+    try:
+        source = root.source.resolve()
+        stat = source.stat()
+    except OSError:
+        return None
+
+    return (
+        str(source),
+        stat.st_mtime_ns,
+        stat.st_size,
+        root.model_dump_json(exclude={'source', 'cache'}),
+    )
+
+
+class SampleRegistry:
+    """Process-wide registry of loaded samples for sharing them between
+    plugins.
+
+    Registry holds weak references to samples, so each sample is
+    reference counted by plugins using it and is released when the
+    last of them is released.
+    """
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+        self._samples: WeakValueDictionary[Hashable, Sample] = (
+            WeakValueDictionary()
         )
-        return Sample(data)
+        self._loading_locks: dict[Hashable, Lock] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, load: Callable[[], Sample]) -> Sample:
+        """Get registered sample or load and register it.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of sample.
+
+        load : Callable[[], Sample]
+            Function for loading sample if it is not registered.
+
+        Returns
+        -------
+        Sample
+            Registered or loaded sample.
+
+        Raises
+        ------
+        Exception
+            If some error occurs during sample loading.
+
+        Notes
+        -----
+        Concurrent calls with the same key load sample only once,
+        calls with different keys load samples concurrently.
+
+        """
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is not None:
+                logger.debug('Using already loaded sample')
+                return sample
+
+            loading_lock = self._loading_locks.setdefault(key, Lock())
+
+        with loading_lock:
+            with self._lock:
+                sample = self._samples.get(key)
+
+            if sample is not None:
+                logger.debug('Using already loaded sample')
+                return sample
+
+            try:
+                sample = load()
+            except BaseException:
+                with self._lock:
+                    self._loading_locks.pop(key, None)
+                raise
+
+            # sample is registered along with releasing the loading lock,
+            # so concurrent calls either wait on it or find the sample
+            with self._lock:
+                self._samples[key] = sample
+                self._loading_locks.pop(key, None)
+
+        return sample
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
 
 
 def _get_sample_loader(
@@ -165,9 +890,19 @@ def _get_sample_loader(
 
 
 class SamplesReader:
-    """Samples reader."""
+    """Samples reader.
+
+    Samples loaded from files are shared between all readers of the
+    process that load the same file with the same options.
+    """
 
-    def __init__(self, config: dict[str, SampleConfig]) -> None:
+    _REGISTRY = SampleRegistry()
+
+    def __init__(
+        self,
+        config: dict[str, SampleConfig],
+        loading: SamplesLoadingMode = SamplesLoadingMode.EAGER,
+    ) -> None:
         """Initialize samples reader.
 
         Parameters
@@ -175,50 +910,85 @@ class SamplesReader:
         config : dict[str, SampleConfig]
             Sample names to their configurations mapping.
 
+        loading : SamplesLoadingMode, default=SamplesLoadingMode.EAGER
+            Mode of loading samples.
+
         Raises
         ------
         SampleLoadError
-            If some error occurs during samples loading.
+            If some error occurs during samples loading in `eager`
+            mode.
 
         """
-        self._samples = self._load_samples(config)
+        self._config = config
+        self._samples: dict[str, Sample] = {}
+        self._loading_locks = {name: Lock() for name in config}
+
+        match loading:
+            case SamplesLoadingMode.EAGER:
+                for name in config:
+                    self._load_sample(name)
+            case SamplesLoadingMode.LAZY:
+                pass
+            case SamplesLoadingMode.PREFETCH:
+                Thread(
+                    target=self._prefetch_samples,
+                    name='samples-prefetch',
+                    daemon=True,
+                ).start()
+            case v:
+                assert_never(v)
 
     def __getitem__(self, name: str) -> Sample:
         try:
             return self._samples[name]
-        except KeyError as e:
-            msg = f'No such sample `{e}`'
-            raise KeyError(msg) from None
+        except KeyError:
+            pass
 
-    def _load_samples(
-        self,
-        config: dict[str, SampleConfig],
-    ) -> dict[str, Sample]:
-        """Load samples specified in config.
+        if name not in self._config:
+            msg = f'No such sample `{name}`'
+            raise KeyError(msg)
+
+        try:
+            return self._load_sample(name)
+        except SampleLoadError as e:
+            msg = f'Failed to load sample `{name}`: {e.context["reason"]}'
+            raise SampleLoadError(msg, context=e.context) from None
+
+    def _load_sample(self, name: str) -> Sample:
+        """Load sample if it is not loaded yet.
 
         Parameters
         ----------
-        config : dict[str, SampleConfig]
-            Sample names to their configurations mapping.
+        name : str
+            Name of sample.
 
         Returns
         -------
-        dict[str, Sample]
-            Sample names to their data mapping.
+        Sample
+            Loaded sample.
 
         Raises
         ------
         SampleLoadError
-            If some error occurs during samples loading.
+            If some error occurs during sample loading.
 
         """
-        samples: dict[str, Sample] = {}
+        with self._loading_locks[name]:
+            if name in self._samples:
+                return self._samples[name]
 
-        for name, sample_config in config.items():
             logger.debug('Loading sample', sample_alias=name)
+            sample_config = self._config[name]
             loader = _get_sample_loader(sample_config.root.type)
+            load = partial(loader, sample_config.root)  # type: ignore[arg-type]
+            key = _get_sample_key(sample_config)
             try:
-                sample = loader(sample_config.root)  # type: ignore[arg-type]
+                sample = (
+                    load()
+                    if key is None
+                    else SamplesReader._REGISTRY.get(key=key, load=load)
+                )
             except Exception as e:  # noqa: BLE001
                 msg = 'Failed to load sample'
                 raise SampleLoadError(
@@ -226,6 +996,18 @@ class SamplesReader:
                     context={'sample_alias': name, 'reason': str(e)},
                 ) from None
 
-            samples[name] = sample
+            self._samples[name] = sample
+            return sample
 
-        return samples
+    def _prefetch_samples(self) -> None:
+        """Load all samples logging errors, samples that failed to load
+        are loaded again on access.
+        """
+        for name in self._config:
+            try:
+                self._load_sample(name)
+            except SampleLoadError as e:
+                logger.warning(
+                    'Failed to prefetch sample, it will be loaded on access',
+                    **e.context,
+                )
@@ -1,7 +1,9 @@
 """Pickers for template picking modes."""
 
+import heapq
 import random
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, ClassVar, Generic, TypeVar, override
 
 from eventum.plugins.event.plugins.template.config import (
@@ -88,6 +90,32 @@ class TemplatePicker(ABC, Generic[T]):
         """
         ...
 
+    def pick_batch(self, count: int) -> dict[str, Sequence[int]]:
+        """Pick templates for batch of events. Picking for batch is
+        supported only in modes that pick templates regardless of
+        event context.
+
+        Parameters
+        ----------
+        count : int
+            Number of events in batch.
+
+        Returns
+        -------
+        dict[str, Sequence[int]]
+            Aliases of picked templates to ascending indices of events
+            mapping, aliases are ordered the same way as templates are
+            picked for single event.
+
+        Raises
+        ------
+        NotImplementedError
+            If picking for batch is not supported by picker.
+
+        """
+        msg = f'Picking for batch is not supported by {self.__class__}'
+        raise NotImplementedError(msg)
+
     @classmethod
     def get_picker(
         cls,
@@ -118,6 +146,48 @@ class TemplatePicker(ABC, Generic[T]):
             raise ValueError(msg) from None
 
 
+def _pick_cycle(
+    cycle: Sequence[str],
+    start: int,
+    count: int,
+) -> dict[str, Sequence[int]]:
+    """Pick templates for batch of events when templates are picked
+    one by one cycling through the sequence of aliases.
+
+    Parameters
+    ----------
+    cycle : Sequence[str]
+        Aliases of templates in order of picking, the same alias can
+        appear several times.
+
+    start : int
+        Position in the cycle of template picked for first event.
+
+    count : int
+        Number of events in batch.
+
+    Returns
+    -------
+    dict[str, Sequence[int]]
+        Aliases of picked templates to ascending indices of events
+        mapping.
+
+    """
+    size = len(cycle)
+    ranges: dict[str, list[range]] = {}
+
+    for offset in range(min(size, count)):
+        alias = cycle[(start + offset) % size]
+        ranges.setdefault(alias, []).append(range(offset, count, size))
+
+    return {
+        alias: alias_ranges[0]
+        if len(alias_ranges) == 1
+        else list(heapq.merge(*alias_ranges))
+        for alias, alias_ranges in ranges.items()
+    }
+
+
 class AllTemplatePicker(
     TemplatePicker[TemplateConfigForGeneralModes],
     mode=TemplatePickingMode.ALL,
@@ -136,6 +206,11 @@ class AllTemplatePicker(
     def pick(self, context: EventContext) -> tuple[str, ...]:
         return self._aliases
 
+    @override
+    def pick_batch(self, count: int) -> dict[str, Sequence[int]]:
+        indices = range(count)
+        return dict.fromkeys(self._aliases, indices) if count > 0 else {}
+
 
 class AnyTemplatePicker(
     TemplatePicker[TemplateConfigForGeneralModes],
@@ -203,6 +278,13 @@ class SpinTemplatePicker(
 
         return (alias,)
 
+    @override
+    def pick_batch(self, count: int) -> dict[str, Sequence[int]]:
+        picked = _pick_cycle(self._aliases, self._spin_index, count)
+        self._spin_index = (self._spin_index + count) % len(self._aliases)
+
+        return picked
+
 
 class FSMTemplatePicker(
     TemplatePicker[TemplateConfigForFSMMode],
@@ -300,6 +382,13 @@ class ChainTemplatePicker(
 
         return (alias,)
 
+    @override
+    def pick_batch(self, count: int) -> dict[str, Sequence[int]]:
+        picked = _pick_cycle(self._chain, self._chain_index, count)
+        self._chain_index = (self._chain_index + count) % len(self._chain)
+
+        return picked
+
 
 def get_picker_class(
     picking_mode: TemplatePickingMode,
@@ -2,12 +2,17 @@
 import os
 from datetime import datetime
 
+import numpy as np
+import pytest
 from jinja2 import DictLoader
+from pydantic import ValidationError
+from pytz import timezone
 
 from eventum.plugins.event.plugins.template.config import (
     CSVSampleConfig,
     ItemsSampleConfig,
     SampleType,
+    TemplateBatchConfig,
     TemplateConfigForGeneralModes,
     TemplateEventPluginConfig,
     TemplateEventPluginConfigForGeneralModes,
@@ -486,3 +491,170 @@ def test_tags():
 
     assert len(events) == 1
     assert events.pop() == 'interesting'
+
+
+def test_batch_rendering():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.SPIN,
+                batch=TemplateBatchConfig(),
+                templates=[
+                    {'a': TemplateConfigForGeneralModes(template='a.jinja')},
+                    {'b': TemplateConfigForGeneralModes(template='b.jinja')},
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={
+                    'a.jinja': (
+                        '{% for ts in timestamps %}'
+                        'a {{ ts.second }} {{ tags[loop.index0][0] }}\n'
+                        '{% endfor %}'
+                    ),
+                    'b.jinja': (
+                        '{% for ts in timestamps %}'
+                        'b {{ ts.second }}\n'
+                        '{% endfor %}'
+                    ),
+                }
+            ),
+        },
+    )
+
+    timestamps = np.array(
+        [(np.datetime64(f'2020-01-01T00:00:0{i}', 'us'), 1) for i in range(5)],
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ('tag',)},
+            'timezone': timezone('UTC'),
+        }
+    )
+
+    assert not result.errors
+    assert result.events == [
+        'a 0 tag',
+        'b 1',
+        'a 2 tag',
+        'b 3',
+        'a 4 tag',
+    ]
+    assert plugin.produced == 5
+
+    events = plugin.produce(
+        params={'tags': ('tag',), 'timestamp': datetime(2020, 1, 1, 0, 0, 5)}
+    )
+    assert events == ['b 5']
+
+
+def test_batch_rendering_all_mode_keeps_order():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                batch=TemplateBatchConfig(),
+                templates=[
+                    {'a': TemplateConfigForGeneralModes(template='a.jinja')},
+                    {'b': TemplateConfigForGeneralModes(template='b.jinja')},
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={
+                    'a.jinja': (
+                        '{% for ts in timestamps %}a {{ ts.second }}\n'
+                        '{% endfor %}'
+                    ),
+                    'b.jinja': (
+                        '{% for ts in timestamps %}b {{ ts.second }}\n'
+                        '{% endfor %}'
+                    ),
+                }
+            ),
+        },
+    )
+
+    timestamps = np.array(
+        [(np.datetime64(f'2020-01-01T00:00:0{i}', 'us'), 1) for i in range(3)],
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ()},
+            'timezone': timezone('UTC'),
+        }
+    )
+
+    assert not result.errors
+    assert result.events == ['a 0', 'b 0', 'a 1', 'b 1', 'a 2', 'b 2']
+
+
+def test_batch_rendering_events_count_mismatch():
+    plugin = TemplateEventPlugin(
+        config=TemplateEventPluginConfig(
+            root=TemplateEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.SPIN,
+                batch=TemplateBatchConfig(),
+                templates=[
+                    {'a': TemplateConfigForGeneralModes(template='a.jinja')},
+                    {'b': TemplateConfigForGeneralModes(template='b.jinja')},
+                ],
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={
+                    'a.jinja': (
+                        '{% for ts in timestamps %}a {{ ts.second }}\n'
+                        '{% endfor %}'
+                    ),
+                    'b.jinja': 'b',
+                }
+            ),
+        },
+    )
+
+    timestamps = np.array(
+        [(np.datetime64(f'2020-01-01T00:00:0{i}', 'us'), 1) for i in range(4)],
+        dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+    )
+    result = plugin.produce_batch(
+        params={
+            'timestamps': timestamps,
+            'tags': {1: ()},
+            'timezone': timezone('UTC'),
+        }
+    )
+
+    assert result.events == ['a 0', 'a 2']
+    assert len(result.errors) == 1
+    assert result.errors[0].context['template_alias'] == 'b'
+    assert plugin.produce_failed == 2
+
+
+def test_batch_rendering_unsupported_mode():
+    with pytest.raises(ValidationError):
+        TemplateEventPluginConfigForGeneralModes(
+            params={},
+            samples={},
+            mode=TemplatePickingMode.ANY,
+            batch=TemplateBatchConfig(),
+            templates=[
+                {'a': TemplateConfigForGeneralModes(template='a.jinja')},
+            ],
+        )
@@ -0,0 +1,80 @@
+import pytest
+from jinja2 import DictLoader, Environment
+
+from eventum.plugins.event.plugins.template.renderer import TemplateRenderer
+
+
+@pytest.fixture
+def env():
+    env = Environment(
+        loader=DictLoader(
+            mapping={
+                'static.jinja': 'static text',
+                'vars.jinja': '{{ a }}-{{ b }}-{{ c }}',
+                'set.jinja': (
+                    '{% if defined_before is defined %}leak{% endif %}'
+                    '{% set defined_before = 1 %}{{ a }}'
+                ),
+                'base.jinja': '[{% block body %}{% endblock %}]',
+                'child.jinja': (
+                    '{% extends "base.jinja" %}'
+                    '{% block body %}{{ a }}{% endblock %}'
+                ),
+                'error.jinja': '{{ 1 / a }}',
+            }
+        )
+    )
+    env.globals['c'] = 'global'
+    return env
+
+
+def test_render_vars(env):
+    renderer = TemplateRenderer(
+        template=env.get_template('vars.jinja'),
+        vars={'b': 'initial'},
+    )
+
+    assert renderer.render(a=1) == '1-initial-global'
+    assert renderer.render(a=2, b='updated') == '2-updated-global'
+
+
+def test_render_static(env):
+    renderer = TemplateRenderer(
+        template=env.get_template('static.jinja'),
+        vars={},
+    )
+
+    assert renderer.render() == 'static text'
+    assert renderer.render(a=1) == 'static text'
+
+
+def test_render_top_level_set_does_not_leak(env):
+    renderer = TemplateRenderer(
+        template=env.get_template('set.jinja'),
+        vars={},
+    )
+
+    assert renderer.render(a=1) == '1'
+    assert renderer.render(a=2) == '2'
+
+
+def test_render_inheritance(env):
+    renderer = TemplateRenderer(
+        template=env.get_template('child.jinja'),
+        vars={},
+    )
+
+    for i in range(3):
+        assert renderer.render(a=i) == f'[{i}]'
+
+
+def test_render_error(env):
+    renderer = TemplateRenderer(
+        template=env.get_template('error.jinja'),
+        vars={},
+    )
+
+    with pytest.raises(ZeroDivisionError):
+        renderer.render(a=0)
+
+    assert renderer.render(a=1) == '1.0'
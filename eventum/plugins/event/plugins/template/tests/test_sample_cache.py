@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from eventum.plugins.event.plugins.template.sample_cache import (
+    CACHE_DIRNAME,
+    STRING_DTYPE,
+    StringColumn,
+    get_cache_path,
+    read_sample_cache,
+    write_sample_cache,
+)
+
+
+def test_string_column():
+    column = StringColumn.from_array(
+        np.array(['a', '', 'юникод', 'last'], dtype=STRING_DTYPE)
+    )
+
+    assert len(column) == 4
+    assert column[0] == 'a'
+    assert column[1] == ''
+    assert column[2] == 'юникод'
+    assert column[-1] == 'last'
+    assert column[np.array([3, 0])] == ['last', 'a']
+    assert list(column) == ['a', '', 'юникод', 'last']
+    assert column.to_array().tolist() == ['a', '', 'юникод', 'last']
+
+    with pytest.raises(IndexError):
+        column[4]
+
+
+def test_string_column_with_invalid_offsets():
+    with pytest.raises(ValueError):
+        StringColumn(
+            offsets=np.array([0, 5], dtype=np.int64),
+            data=np.zeros(3, dtype=np.uint8),
+        )
+
+
+def test_cache_path(tmp_path):
+    source = tmp_path / 'sample.csv'
+    source.write_text('a,b\n')
+
+    path = get_cache_path(source, options={'delimiter': ','})
+
+    assert path.parent == tmp_path / CACHE_DIRNAME
+    assert path.name.startswith('sample.csv.')
+    assert path == get_cache_path(source, options={'delimiter': ','})
+    assert path != get_cache_path(source, options={'delimiter': ';'})
+
+    source.write_text('a,b,c\n')
+    assert path != get_cache_path(source, options={'delimiter': ','})
+
+
+def test_write_and_read_cache(tmp_path):
+    source = tmp_path / 'sample.json'
+    source.write_text('[]')
+    path = get_cache_path(source, options={})
+
+    strings = np.array(['John', 'Jane'], dtype=STRING_DTYPE)
+    objects = np.empty(2, dtype=object)
+    objects[:] = [{'age': 30}, [1, 2]]
+
+    write_sample_cache(
+        path, source, columns=[strings, objects], headers=['a', 'b']
+    )
+    columns, headers = read_sample_cache(path)
+
+    assert headers == ['a', 'b']
+    assert isinstance(columns[0], StringColumn)
+    assert list(columns[0]) == ['John', 'Jane']
+    assert list(columns[1]) == [{'age': 30}, [1, 2]]
+
+
+def test_stale_cache_is_removed(tmp_path):
+    source = tmp_path / 'sample.csv'
+    source.write_text('a\n')
+    stale_path = get_cache_path(source, options={})
+    write_sample_cache(stale_path, source, columns=[], headers=None)
+
+    source.write_text('a\nb\n')
+    path = get_cache_path(source, options={})
+    write_sample_cache(path, source, columns=[], headers=None)
+
+    assert path.exists()
+    assert not stale_path.exists()
+
+
+def test_cache_of_other_options_is_kept(tmp_path):
+    source = tmp_path / 'sample.csv'
+    source.write_text('a\n')
+    comma_path = get_cache_path(source, options={'delimiter': ','})
+    write_sample_cache(comma_path, source, columns=[], headers=None)
+
+    semicolon_path = get_cache_path(source, options={'delimiter': ';'})
+    write_sample_cache(semicolon_path, source, columns=[], headers=None)
+
+    assert comma_path.exists()
+    assert semicolon_path.exists()
+
+
+def test_read_missing_cache(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_sample_cache(tmp_path / 'missing')
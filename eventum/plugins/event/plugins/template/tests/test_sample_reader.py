@@ -1,3 +1,6 @@
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -7,11 +10,14 @@ from eventum.plugins.event.plugins.template.config import (
     ItemsSampleConfig,
     JSONSampleConfig,
     SampleConfig,
+    SamplesLoadingMode,
     SampleType,
 )
+from eventum.plugins.event.plugins.template.sample_cache import CACHE_DIRNAME
 from eventum.plugins.event.plugins.template.sample_reader import (
     Sample,
     SampleLoadError,
+    SampleRegistry,
     SamplesReader,
 )
 
@@ -171,6 +177,41 @@ def test_load_csv_sample_without_header(no_header_csv_sample_config):
     assert sample[2] == ('Jane', 'jane@example.com', 'HR')
 
 
+@pytest.mark.parametrize('header', [True, False])
+def test_load_ragged_csv_sample(tmp_path, header):
+    source = tmp_path / 'sample.csv'
+    source.write_text('name,role\nalice,admin\nbob\n')
+
+    sample = SamplesReader(
+        {
+            'csv_sample': SampleConfig(
+                root=CSVSampleConfig(
+                    type=SampleType.CSV, source=source, header=header
+                )
+            )
+        }
+    )['csv_sample']
+
+    assert sample[len(sample) - 2] == ('alice', 'admin')
+    assert sample[len(sample) - 1] == ('bob', '')
+
+
+def test_load_csv_sample_with_too_long_row(tmp_path):
+    source = tmp_path / 'sample.csv'
+    source.write_text('name,role\nalice,admin,extra\n')
+
+    with pytest.raises(SampleLoadError):
+        SamplesReader(
+            {
+                'csv_sample': SampleConfig(
+                    root=CSVSampleConfig(
+                        type=SampleType.CSV, source=source, header=True
+                    )
+                )
+            }
+        )
+
+
 def test_load_json_sample(json_sample_config):
     sample_reader = SamplesReader(json_sample_config)
     sample = sample_reader['json_sample']
@@ -201,3 +242,225 @@ def test_missing_samples(items_sample_config):
     sample_reader = SamplesReader(items_sample_config)
     with pytest.raises(KeyError):
         sample_reader['missing_samples']
+
+
+def test_csv_sample_columns(csv_sample_config):
+    sample = SamplesReader(csv_sample_config)['csv_sample']
+
+    assert sample.headers == ('name', 'email', 'position')
+    assert list(sample['name']) == ['John', 'Jane']
+    assert list(sample.column('position')) == ['Manager', 'HR']
+
+    with pytest.raises(KeyError):
+        sample.column('missing')
+
+
+def test_sample_rows_access():
+    sample = Sample.from_rows([('a', 1), ('b', 2), ('c', 3)], chunk_size=2)
+
+    assert len(sample) == 3
+    assert sample.headers is None
+    assert sample[-1] == ('c', 3)
+    assert sample[1:] == [('b', 2), ('c', 3)]
+    assert list(sample) == [('a', 1), ('b', 2), ('c', 3)]
+
+    with pytest.raises(IndexError):
+        sample[3]
+
+
+def test_sample_with_mixed_column_chunks():
+    sample = Sample.from_rows([('a',), ('b',), (1,)], chunk_size=2)
+
+    assert list(sample) == [('a',), ('b',), (1,)]
+
+
+def test_sample_with_inconsistent_rows():
+    with pytest.raises(ValueError):
+        Sample.from_rows([('a', 1), ('b',)])
+
+
+def test_sample_picks():
+    sample = Sample.from_rows(
+        [(str(i), i % 2) for i in range(100)],
+        headers=['value', 'weight'],
+    )
+
+    assert len(sample.choices(1000)) == 1000
+    assert sample.choice() in list(sample)
+
+    picked = sample.sample(100)
+    assert sorted(picked) == sorted(sample)
+
+    with pytest.raises(ValueError):
+        sample.sample(101)
+
+    weighted = sample.choices(1000, weights='weight')
+    assert all(weight == 1 for _, weight in weighted)
+
+    weights = [0.0] * 100
+    weights[42] = 1.0
+    assert sample.choice(weights=weights) == ('42', 0)
+
+    with pytest.raises(ValueError):
+        sample.choice(weights=[1.0])
+
+
+def test_empty_sample_picks():
+    sample = Sample.from_rows([], headers=['value'])
+
+    assert len(sample) == 0
+    assert sample.sample(0) == []
+
+    with pytest.raises(IndexError):
+        sample.choice()
+
+
+def test_load_cached_csv_sample(tmp_path):
+    source = tmp_path / 'sample.csv'
+    source.write_text((BASE_PATH / 'static/sample.csv').read_text())
+
+    config = {
+        'csv_sample': SampleConfig(
+            root=CSVSampleConfig(
+                type=SampleType.CSV,
+                source=source,
+                header=True,
+                cache=True,
+            )
+        )
+    }
+
+    parsed = SamplesReader(config)['csv_sample']
+    assert (tmp_path / CACHE_DIRNAME).exists()
+
+    cached = SamplesReader(config)['csv_sample']
+    assert cached.headers == parsed.headers
+    assert list(cached) == list(parsed)
+    assert cached[1] == ('Jane', 'jane@example.com', 'HR')
+    assert list(cached['name']) == ['John', 'Jane']
+    assert cached.choices(10, weights=[0, 1]) == [cached[1]] * 10
+
+
+def test_load_cached_nested_json_sample(tmp_path):
+    source = tmp_path / 'sample.json'
+    source.write_text((BASE_PATH / 'static/nested_sample.json').read_text())
+
+    config = {
+        'json_sample': SampleConfig(
+            root=JSONSampleConfig(
+                type=SampleType.JSON,
+                source=source,
+                cache=True,
+            )
+        )
+    }
+
+    parsed = SamplesReader(config)['json_sample']
+    cached = SamplesReader(config)['json_sample']
+
+    assert list(cached) == list(parsed)
+
+
+def test_samples_are_shared(
+    monkeypatch, csv_sample_config, other_delimiter_csv_sample_config
+):
+    registry = SampleRegistry()
+    monkeypatch.setattr(SamplesReader, '_REGISTRY', registry)
+
+    first = SamplesReader(csv_sample_config)
+    second = SamplesReader(csv_sample_config)
+    other = SamplesReader(other_delimiter_csv_sample_config)
+
+    assert first['csv_sample'] is second['csv_sample']
+    assert first['csv_sample'] is not other['csv_sample']
+    assert len(registry) == 2
+
+    del first, second
+    gc.collect()
+    assert len(registry) == 1
+
+
+def test_items_samples_are_not_shared(items_sample_config):
+    first = SamplesReader(items_sample_config)
+    second = SamplesReader(items_sample_config)
+
+    assert first['items_sample'] is not second['items_sample']
+
+
+def test_registry_loads_sample_once():
+    registry = SampleRegistry()
+    loads = []
+
+    def load():
+        time.sleep(0.05)
+        sample = Sample.from_rows([('a',)])
+        loads.append(sample)
+        return sample
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        samples = list(
+            executor.map(
+                lambda _: registry.get(key='key', load=load), range(4)
+            )
+        )
+
+    assert len(loads) == 1
+    assert all(sample is loads[0] for sample in samples)
+
+
+def test_registry_releases_loading_locks():
+    registry = SampleRegistry()
+
+    def fail():
+        raise OSError
+
+    with pytest.raises(OSError):
+        registry.get(key='key', load=fail)
+    assert registry._loading_locks == {}
+
+    sample = registry.get(key='key', load=lambda: Sample.from_rows([('a',)]))
+    assert registry._loading_locks == {}
+    assert registry.get(key='key', load=fail) is sample
+
+
+def test_lazy_loading(csv_sample_config, not_existing_csv_sample_config):
+    sample_reader = SamplesReader(
+        csv_sample_config, loading=SamplesLoadingMode.LAZY
+    )
+    assert sample_reader._samples == {}
+
+    sample = sample_reader['csv_sample']
+    assert sample[0] == ('John', 'john@example.com', 'Manager')
+    assert sample_reader['csv_sample'] is sample
+
+    sample_reader = SamplesReader(
+        not_existing_csv_sample_config, loading=SamplesLoadingMode.LAZY
+    )
+    with pytest.raises(SampleLoadError, match='csv_sample'):
+        sample_reader['csv_sample']
+
+    with pytest.raises(KeyError):
+        sample_reader['missing_sample']
+
+
+def test_prefetch_loading(csv_sample_config, not_existing_csv_sample_config):
+    sample_reader = SamplesReader(
+        csv_sample_config
+        | {'missing_sample': not_existing_csv_sample_config['csv_sample']},
+        loading=SamplesLoadingMode.PREFETCH,
+    )
+
+    sample = sample_reader['csv_sample']
+    assert sample[1] == ('Jane', 'jane@example.com', 'HR')
+
+    with pytest.raises(SampleLoadError):
+        sample_reader['missing_sample']
+
+
+def test_eager_loading_of_not_existing_sample(
+    not_existing_csv_sample_config,
+):
+    with pytest.raises(SampleLoadError):
+        SamplesReader(
+            not_existing_csv_sample_config, loading=SamplesLoadingMode.EAGER
+        )
@@ -176,3 +176,53 @@ def test_chain_template_picker():
     assert picker.pick({}) == ('template1',)  # type: ignore
     assert picker.pick({}) == ('template1',)  # type: ignore
     assert picker.pick({}) == ('template3',)  # type: ignore
+
+
+def picks_to_indices(picks):
+    indices = {}
+    for i, aliases in enumerate(picks):
+        for alias in aliases:
+            indices.setdefault(alias, []).append(i)
+    return indices
+
+
+@pytest.mark.parametrize('mode', ['all', 'spin', 'chain'])
+def test_pick_batch_matches_pick(mode):
+    config = {
+        f'template{i}': TemplateConfigForGeneralModes(
+            template=Path(f'test{i}.jinja')
+        )
+        for i in range(1, 4)
+    }
+    common_config = {
+        'chain': ['template1', 'template1', 'template3', 'template2']
+    }
+    picker_class = get_picker_class(TemplatePickingMode(mode))
+
+    single_picker = picker_class(config, common_config)
+    batch_picker = picker_class(config, common_config)
+
+    for count in (0, 1, 3, 10, 2):
+        expected = picks_to_indices(
+            [single_picker.pick({}) for _ in range(count)]  # type: ignore
+        )
+        picked = batch_picker.pick_batch(count)
+
+        assert {
+            alias: list(indices) for alias, indices in picked.items()
+        } == expected
+
+        if mode == 'all' and count > 0:
+            assert list(picked) == ['template1', 'template2', 'template3']
+
+
+def test_pick_batch_unsupported():
+    config = {
+        'template1': TemplateConfigForGeneralModes(
+            template=Path('test1.jinja')
+        ),
+    }
+    picker = AnyTemplatePicker(config, {})
+
+    with pytest.raises(NotImplementedError):
+        picker.pick_batch(1)
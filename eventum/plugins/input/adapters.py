@@ -1,7 +1,8 @@
 """Adapters for protocols defined in `protocols` module."""
 
-from collections.abc import AsyncIterator, Iterator
-from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+from collections.abc import AsyncIterator, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import override
 
 import janus
@@ -11,11 +12,14 @@ import structlog
 from eventum.logging.context import propagate_logger_context
 from eventum.plugins.input.base.plugin import InputPlugin
 from eventum.plugins.input.protocols import (
+    IdentifiedTimestampRuns,
     IdentifiedTimestamps,
     SupportsAsyncIdentifiedTimestampsIterate,
     SupportsIdentifiedTimestampsIterate,
     SupportsIdentifiedTimestampsSizedIterate,
 )
+from eventum.plugins.input.ring import BlocksRing
+from eventum.plugins.input.runs import IDENTIFIED_TIMESTAMP_RUNS_DTYPE
 
 logger = structlog.stdlib.get_logger()
 
@@ -49,16 +53,37 @@ class IdentifiedTimestampsPluginAdapter(
             msg = 'Parameter `size` must be greater or equal to 1'
             raise ValueError(msg)
 
+        ring = BlocksRing(block_size=size)
+
         for array in self._plugin.generate(size=size, skip_past=skip_past):
-            array_with_id: IdentifiedTimestamps = np.empty(
-                shape=array.size,
-                dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
-            )
-            array_with_id['timestamp'][:] = array
-            array_with_id['id'][:] = self._plugin.id
+            array_with_id = ring.acquire(array.size)
+            array_with_id['timestamp'] = array
+            array_with_id['id'] = self._plugin.id
 
             yield array_with_id
 
+    @override
+    def iterate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[IdentifiedTimestampRuns]:
+        if size < 1:
+            msg = 'Parameter `size` must be greater or equal to 1'
+            raise ValueError(msg)
+
+        for runs in self._plugin.generate_runs(size=size, skip_past=skip_past):
+            runs_with_id = np.empty(
+                runs.size,
+                dtype=IDENTIFIED_TIMESTAMP_RUNS_DTYPE,
+            )
+            runs_with_id['timestamp'] = runs['timestamp']
+            runs_with_id['count'] = runs['count']
+            runs_with_id['id'] = self._plugin.id
+
+            yield runs_with_id
+
 
 class AsyncIdentifiedTimestampsSyncAdapter(
     SupportsAsyncIdentifiedTimestampsIterate,
@@ -89,16 +114,19 @@ class AsyncIdentifiedTimestampsSyncAdapter(
         )
 
     def _start_iteration(self, *, skip_past: bool = True) -> None:
-        """Start iteration over target with producing to queue."""
-        for array in self._target.iterate(skip_past=skip_past):
-            self._queue.sync_q.put(array)
-
-    def _finalize_iteration(self, _: Future) -> None:
-        """Finalize iteration over target by putting sentinel to queue."""
-        # queue can be closed ahead of time if iteration coroutine
-        # is canceled
-        if not self._queue.closed:
-            self._queue.sync_q.put(None)
+        """Start iteration over target with producing to queue and
+        putting sentinel to queue in the end.
+        """
+        try:
+            for array in self._target.iterate(skip_past=skip_past):
+                self._queue.sync_q.put(array)
+        finally:
+            # sentinel is put from the iterating thread since blocking
+            # put must not be performed in the event loop thread;
+            # queue can be closed ahead of time if iteration coroutine
+            # is canceled
+            if not self._queue.closed:
+                self._queue.sync_q.put(None)
 
     @override
     async def iterate(
@@ -110,12 +138,11 @@ class AsyncIdentifiedTimestampsSyncAdapter(
             max_workers=1,
             thread_name_prefix='async-identified-timestamps-sync-adapter',
         ) as executor:
-            future = executor.submit(
+            executor.submit(
                 propagate_logger_context()(
                     lambda: self._start_iteration(skip_past=skip_past),
                 ),
             )
-            future.add_done_callback(self._finalize_iteration)
 
             try:
                 while True:
@@ -130,6 +157,123 @@ class AsyncIdentifiedTimestampsSyncAdapter(
                 await self._queue.aclose()
 
 
+class AsyncIdentifiedTimestampsAdapter(
+    SupportsAsyncIdentifiedTimestampsIterate,
+):
+    """Adapter for object that follows
+    `SupportsIdentifiedTimestampsIterate` protocol to follow
+    `SupportsAsyncIdentifiedTimestampsIterate` protocol by advancing
+    it on demand in a separate thread.
+
+    Notes
+    -----
+    Adapter is intended for targets that can block (e.g. reading files
+    or iterating over cron expressions), so each step of their
+    iteration is performed in a separate thread while event loop awaits
+    the result. Unlike `AsyncIdentifiedTimestampsSyncAdapter`, no queue
+    is used and target is advanced only when next array is requested,
+    so nothing is produced ahead of consumer. Targets that cannot
+    block should be adapted with
+    `AsyncIdentifiedTimestampsCooperativeAdapter`.
+
+    """
+
+    def __init__(self, target: SupportsIdentifiedTimestampsIterate) -> None:
+        """Initialize adapter.
+
+        Parameters
+        ----------
+        target : SupportsIdentifiedTimestampsIterate
+            Target to adapt.
+
+        """
+        self._target = target
+
+    @override
+    async def iterate(
+        self,
+        *,
+        skip_past: bool = True,
+    ) -> AsyncIterator[IdentifiedTimestamps]:
+        loop = asyncio.get_running_loop()
+        iterator = self._target.iterate(skip_past=skip_past)
+        advance = propagate_logger_context()(
+            lambda: next(iterator, None),
+        )
+
+        # single thread is used, so steps of iteration and closing of
+        # target generator are never performed concurrently
+        executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='async-identified-timestamps-adapter',
+        )
+        try:
+            while True:
+                array = await loop.run_in_executor(executor, advance)
+
+                if array is None:
+                    break
+
+                yield array
+        finally:
+            # coroutine can be canceled, so generator of target is
+            # closed explicitly instead of relying on garbage
+            # collection; executor is shut down without waiting, so
+            # event loop is not blocked by the step in progress
+            if isinstance(iterator, Generator):
+                executor.submit(iterator.close)
+
+            executor.shutdown(wait=False)
+
+
+class AsyncIdentifiedTimestampsCooperativeAdapter(
+    SupportsAsyncIdentifiedTimestampsIterate,
+):
+    """Adapter for object that follows
+    `SupportsIdentifiedTimestampsIterate` protocol to follow
+    `SupportsAsyncIdentifiedTimestampsIterate` protocol by advancing
+    it directly in event loop.
+
+    Notes
+    -----
+    Adapter is intended for targets that cannot block and produce each
+    array (i.e. chunk of timestamps) in bounded time, control is
+    returned to event loop after each array, so no thread or queue is
+    needed for iterating over target.
+
+    """
+
+    def __init__(self, target: SupportsIdentifiedTimestampsIterate) -> None:
+        """Initialize adapter.
+
+        Parameters
+        ----------
+        target : SupportsIdentifiedTimestampsIterate
+            Target to adapt.
+
+        """
+        self._target = target
+
+    @override
+    async def iterate(
+        self,
+        *,
+        skip_past: bool = True,
+    ) -> AsyncIterator[IdentifiedTimestamps]:
+        iterator = self._target.iterate(skip_past=skip_past)
+
+        try:
+            for array in iterator:
+                yield array
+
+                # consumer can proceed without suspending, so control
+                # is returned to event loop explicitly
+                await asyncio.sleep(0)
+        finally:
+            if isinstance(iterator, Generator):
+                iterator.close()
+
+
 class AsyncIdentifiedTimestampsEmptyAdapter(
     SupportsAsyncIdentifiedTimestampsIterate,
 ):
@@ -12,6 +12,8 @@ from pytz import BaseTzInfo
 from eventum.plugins.base.plugin import Plugin, PluginParams
 from eventum.plugins.input.base.config import InputPluginConfig
 from eventum.plugins.input.buffer import Buffer
+from eventum.plugins.input.protocols import TimestampRuns
+from eventum.plugins.input.runs import count_timestamps, encode_runs
 
 
 class InputPluginParams(PluginParams):
@@ -45,6 +47,11 @@ class InputPlugin(Plugin[ConfigT, ParamsT], register=False):
         since they are blocking generation due to unpredictable user
         interactions.
 
+    blocking : bool, default=False
+        Whether generation of non interactive input plugin can block
+        (e.g. on reading files), such plugins are iterated in separate
+        thread while other ones are iterated directly in event loop.
+
     """
 
     @override
@@ -63,11 +70,13 @@ class InputPlugin(Plugin[ConfigT, ParamsT], register=False):
         cls,
         *,
         interactive: bool = False,
+        blocking: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init_subclass__(**kwargs)
 
         cls._interactive = interactive  # type: ignore[attr-defined]
+        cls._blocking = blocking  # type: ignore[attr-defined]
 
     def generate(
         self,
@@ -130,11 +139,69 @@ class InputPlugin(Plugin[ConfigT, ParamsT], register=False):
         """
         ...
 
+    def generate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[TimestampRuns]:
+        """Generate timestamps in run-length representation.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps (i.e. sum of run counts) to generate
+            for each iteration, see `generate` method for details.
+
+        skip_past : bool, default=True
+            Whether to skip past timestamps before starting generation.
+
+        Yields
+        ------
+        TimestampRuns
+            Array of generated timestamp runs.
+
+        Raises
+        ------
+        PluginGenerationError
+            If any error occurs during timestamps generation.
+
+        """
+        self._generated = 0
+
+        for runs in self._generate_runs(size=size, skip_past=skip_past):
+            self._generated += count_timestamps(runs)
+            yield runs
+
+    def _generate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[TimestampRuns]:
+        """Generate timestamps in run-length representation.
+
+        Notes
+        -----
+        See `generate_runs` method for more info. By default, arrays of
+        `_generate` method are encoded, plugins that generate
+        repeated timestamps can override this method to avoid
+        materializing them.
+
+        """
+        for array in self._generate(size=size, skip_past=skip_past):
+            yield encode_runs(array)
+
     @property
     def is_interactive(self) -> bool:
         """Whether the plugin is interactive."""
         return self._interactive  # type: ignore[attr-defined]
 
+    @property
+    def is_blocking(self) -> bool:
+        """Whether generation of the plugin can block."""
+        return self._blocking  # type: ignore[attr-defined]
+
     @property
     def has_interaction(self) -> bool:
         """Whether the interactive plugin is ready to yield any
@@ -8,13 +8,177 @@ import numpy as np
 from numpy.typing import NDArray
 
 from eventum.plugins.input.protocols import (
+    IdentifiedTimestampRuns,
     IdentifiedTimestamps,
     SupportsIdentifiedTimestampsIterate,
     SupportsIdentifiedTimestampsSizedIterate,
 )
+from eventum.plugins.input.ring import BlocksRing
+from eventum.plugins.input.runs import (
+    RunsCursor,
+    batch_runs,
+    count_timestamps,
+)
 from eventum.plugins.input.utils.array_utils import chunk_array
 
 
+class AdaptiveBatchSize:
+    """Batch size that is adapted to downstream backpressure.
+
+    Size is updated by consumer of batches using observed fill level of
+    downstream queues, throughput of processing batches and rate of
+    receiving timestamps:
+
+    - if queues are filled above high watermark, downstream stages
+      cannot keep up and size is doubled to amortize overhead of
+      processing each batch;
+    - if queues are filled below low watermark, downstream stages are
+      idle and size is moved halfway to the size that can be both
+      received and processed within target latency, so batches stay
+      small at low EPS;
+    - otherwise size is kept.
+
+    Attributes
+    ----------
+    LOW_WATERMARK : float
+        Fill level of queues below which size is reduced.
+
+    HIGH_WATERMARK : float
+        Fill level of queues above which size is increased.
+
+    Notes
+    -----
+    Size can be updated and read from different threads, only single
+    thread must perform updates.
+
+    """
+
+    LOW_WATERMARK = 0.25
+    HIGH_WATERMARK = 0.75
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int,
+        max_size: int,
+        target_latency: float,
+    ) -> None:
+        """Initialize adaptive batch size.
+
+        Parameters
+        ----------
+        initial_size : int
+            Initial size, it is clamped to the bounds.
+
+        min_size : int
+            Minimum size.
+
+        max_size : int
+            Maximum size.
+
+        target_latency : float
+            Desired time (in seconds) of receiving timestamps of
+            single batch and of processing it by downstream stages.
+
+        Raises
+        ------
+        ValueError
+            If some parameter is out of allowed range.
+
+        """
+        if min_size < TimestampsBatcher.MIN_BATCH_SIZE:
+            msg = (
+                'Minimum size must be greater or equal to '
+                f'{TimestampsBatcher.MIN_BATCH_SIZE}'
+            )
+            raise ValueError(msg)
+
+        if max_size < min_size:
+            msg = 'Maximum size must be greater or equal to minimum size'
+            raise ValueError(msg)
+
+        if target_latency <= 0:
+            msg = 'Target latency must be greater than 0'
+            raise ValueError(msg)
+
+        self._min_size = min_size
+        self._max_size = max_size
+        self._target_latency = target_latency
+        self._size = self._clamp(initial_size)
+
+    def _clamp(self, size: float) -> int:
+        """Clamp size to the bounds.
+
+        Parameters
+        ----------
+        size : float
+            Size to clamp.
+
+        Returns
+        -------
+        int
+            Clamped size.
+
+        """
+        return max(self._min_size, min(self._max_size, round(size)))
+
+    def update(
+        self,
+        fill: float,
+        throughput: float | None = None,
+        input_rate: float | None = None,
+    ) -> None:
+        """Update size using observed state of pipeline.
+
+        Parameters
+        ----------
+        fill : float
+            Fill level of downstream queues in range [0; 1].
+
+        throughput : float | None, default=None
+            Number of timestamps processed by downstream stages per
+            second.
+
+        input_rate : float | None, default=None
+            Number of timestamps received from input per second (e.g.
+            in live mode it is close to EPS).
+
+        Notes
+        -----
+        When downstream stages are idle, size is moved to the size for
+        target latency at the lowest of the provided rates, if no rate
+        is provided, then size is moved to half of current size.
+
+        """
+        if fill >= self.HIGH_WATERMARK:
+            self._size = self._clamp(self._size * 2)
+        elif fill <= self.LOW_WATERMARK:
+            rates = [
+                rate for rate in (throughput, input_rate) if rate is not None
+            ]
+            if rates:
+                target = min(rates) * self._target_latency
+            else:
+                target = self._size / 2
+
+            self._size = self._clamp((self._size + target) / 2)
+
+    @property
+    def value(self) -> int:
+        """Current size."""
+        return self._size
+
+    @property
+    def min_size(self) -> int:
+        """Minimum size."""
+        return self._min_size
+
+    @property
+    def max_size(self) -> int:
+        """Maximum size."""
+        return self._max_size
+
+
 class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
     """Batcher of timestamps.
 
@@ -31,12 +195,14 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
     MIN_BATCH_SIZE = 1
     MIN_BATCH_DELAY = 0.1
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         source: SupportsIdentifiedTimestampsSizedIterate,
         batch_size: int | None = 100_000,
         batch_delay: float | None = None,
         lax: bool = False,  # noqa: FBT001, FBT002
+        adaptive_size: AdaptiveBatchSize | None = None,
+        run_length: bool = False,  # noqa: FBT001, FBT002
     ) -> None:
         """Initialize batcher.
 
@@ -59,13 +225,28 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
             chunked. In this mode iterations of consuming timestamps
             are isolated from each other and not concatenated.
 
+        adaptive_size : AdaptiveBatchSize | None, default=None
+            Adaptive batch size that is used instead of `batch_size`
+            parameter, its current value is taken at the beginning of
+            each batch.
+
+        run_length : bool, default=False
+            Whether to consume timestamps from source in run-length
+            representation and produce batches of identified timestamp
+            runs, in this mode size of batch is a number of timestamps
+            that runs of batch represent.
+
         Raises
         ------
         ValueError
             If some parameter is out of allowed range.
 
         """
-        if batch_size is None and batch_delay is None:
+        if (
+            batch_size is None
+            and batch_delay is None
+            and adaptive_size is None
+        ):
             msg = 'Batch size and delay cannot be both omitted'
             raise ValueError(msg)
 
@@ -84,9 +265,32 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
 
         self._batch_size = batch_size
         self._batch_delay = batch_delay
+        self._adaptive_size = adaptive_size
 
         self._source = source
         self._lax_mode_enabled = lax
+        self._run_length = run_length
+
+        if adaptive_size is not None:
+            block_size = adaptive_size.max_size
+        else:
+            block_size = batch_size or 10_000
+
+        self._ring = BlocksRing(block_size=block_size)
+
+    def _get_batch_size(self) -> int | None:
+        """Get size for the next batch.
+
+        Returns
+        -------
+        int | None
+            Batch size or `None` if size is not limited.
+
+        """
+        if self._adaptive_size is not None:
+            return self._adaptive_size.value
+
+        return self._batch_size
 
     def _iterate_without_delay(
         self,
@@ -100,34 +304,70 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
             Iterator to use.
 
         """
-        self._batch_size = cast('int', self._batch_size)
-        current_size = 0
-        to_concatenate: list[IdentifiedTimestamps] = []
+        if self._lax_mode_enabled:
+            for array in iterator:
+                yield from chunk_array(
+                    array=array,
+                    size=cast('int', self._get_batch_size()),
+                )
+            return
+
+        batch_size = cast('int', self._get_batch_size())
+        batch = self._ring.acquire(batch_size)
+        filled = 0
 
         for array in iterator:
-            to_concatenate.append(array)
-            current_size += array.size
+            offset = 0
+
+            while offset < array.size:
+                # full batches are sliced from source array as is
+                if filled == 0 and array.size - offset >= batch_size:
+                    yield array[offset : offset + batch_size]
+                    offset += batch_size
+
+                    # size can be changed only between batches
+                    batch_size = cast('int', self._get_batch_size())
+                    if batch.size != batch_size:
+                        batch = self._ring.acquire(batch_size)
+                    continue
+
+                count = min(batch_size - filled, array.size - offset)
+                batch[filled : filled + count] = array[offset : offset + count]
+                filled += count
+                offset += count
+
+                if filled == batch_size:
+                    yield batch
+                    batch_size = cast('int', self._get_batch_size())
+                    batch = self._ring.acquire(batch_size)
+                    filled = 0
+
+        if filled > 0:
+            yield batch[:filled]
+
+    def _concatenate(
+        self,
+        arrays: list[IdentifiedTimestamps],
+    ) -> IdentifiedTimestamps:
+        """Concatenate arrays into block of the ring.
 
-            if current_size >= self._batch_size or self._lax_mode_enabled:
-                chunks = chunk_array(
-                    array=np.concatenate(to_concatenate),
-                    size=self._batch_size,
-                )
-                to_concatenate.clear()
-                current_size = 0
+        Parameters
+        ----------
+        arrays : list[IdentifiedTimestamps]
+            Arrays to concatenate.
 
-                if (
-                    chunks[-1].size < self._batch_size
-                    and not self._lax_mode_enabled
-                ):
-                    last_partial_chunk = chunks.pop()
-                    to_concatenate.append(last_partial_chunk)
-                    current_size += last_partial_chunk.size
+        Returns
+        -------
+        IdentifiedTimestamps
+            Concatenated array or the array itself if only one array
+            is provided.
 
-                yield from chunks
+        """
+        if len(arrays) == 1:
+            return arrays[0]
 
-        if to_concatenate:
-            yield np.concatenate(to_concatenate)
+        out = self._ring.acquire(sum(array.size for array in arrays))
+        return np.concatenate(arrays, out=out)
 
     def _get_cutoff_index_by_delay(
         self,
@@ -164,6 +404,7 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
     def _get_cutoff_index_by_size(
         self,
         current_size: int,
+        batch_size: int | None,
         array: NDArray,
     ) -> int:
         """Get cutoff index by size condition.
@@ -173,6 +414,9 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
         current_size : int
             Current size of batch.
 
+        batch_size : int | None
+            Size limit of batch, `None` if size is not limited.
+
         array : NDArray
             Array to find index for.
 
@@ -182,11 +426,11 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
             Cutoff index.
 
         """
-        if self._batch_size is None:
+        if batch_size is None:
             return array.size
 
-        if (current_size + array.size) >= self._batch_size:
-            return self._batch_size - current_size
+        if (current_size + array.size) >= batch_size:
+            return batch_size - current_size
 
         return array.size
 
@@ -208,10 +452,11 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
             timedelta(seconds=self._batch_delay),
             'us',
         )
-        to_concatenate = []
+        to_concatenate: list[IdentifiedTimestamps] = []
         prev_array: IdentifiedTimestamps | None = None
 
         current_size = 0
+        batch_size: int | None = None
         latest_timestamp: np.datetime64 | None = None
 
         while True:
@@ -226,6 +471,7 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
 
             if latest_timestamp is None:
                 latest_timestamp = array['timestamp'][0] + delta
+                batch_size = self._get_batch_size()
 
             delay_cutoff_index = self._get_cutoff_index_by_delay(
                 latest=latest_timestamp,  # type: ignore[arg-type]
@@ -233,6 +479,7 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
             )
             size_cutoff_index = self._get_cutoff_index_by_size(
                 current_size=current_size,
+                batch_size=batch_size,
                 array=array,
             )
             cutoff_index = min(delay_cutoff_index, size_cutoff_index)
@@ -251,14 +498,149 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
                 if right_part.size > 0:
                     prev_array = right_part
 
-                yield np.concatenate(to_concatenate)
+                yield self._concatenate(to_concatenate)
 
                 to_concatenate.clear()
                 current_size = 0
                 latest_timestamp = None
 
         if to_concatenate:
-            yield np.concatenate(to_concatenate)
+            yield self._concatenate(to_concatenate)
+
+    def _iterate_runs_without_delay(
+        self,
+        iterator: Iterator[IdentifiedTimestampRuns],
+    ) -> Iterator[IdentifiedTimestampRuns]:
+        """Iterate over batches of runs without a set delay parameter.
+
+        Parameters
+        ----------
+        iterator: Iterator[IdentifiedTimestampRuns]
+            Iterator to use.
+
+        """
+        if self._lax_mode_enabled:
+            for array in iterator:
+                yield from batch_runs(
+                    [array],
+                    size=cast('int', self._get_batch_size()),
+                )
+            return
+
+        batch_size = cast('int', self._get_batch_size())
+        pending: list[IdentifiedTimestampRuns] = []
+        filled = 0
+
+        for array in iterator:
+            cursor = RunsCursor(array)
+
+            while cursor.remaining > 0:
+                head = cursor.take(batch_size - filled)
+                pending.append(head)
+                filled += count_timestamps(head)
+
+                if filled == batch_size:
+                    yield self._concatenate_runs(pending)
+                    pending.clear()
+                    filled = 0
+
+                    # size can be changed only between batches
+                    batch_size = cast('int', self._get_batch_size())
+
+        if pending:
+            yield self._concatenate_runs(pending)
+
+    def _concatenate_runs(
+        self,
+        arrays: list[IdentifiedTimestampRuns],
+    ) -> IdentifiedTimestampRuns:
+        """Concatenate arrays of runs.
+
+        Parameters
+        ----------
+        arrays : list[IdentifiedTimestampRuns]
+            Arrays to concatenate.
+
+        Returns
+        -------
+        IdentifiedTimestampRuns
+            Concatenated array or the array itself if only one array
+            is provided.
+
+        Notes
+        -----
+        Arrays of runs are small relative to number of timestamps they
+        represent, so they are concatenated without using blocks of
+        the ring.
+
+        """
+        if len(arrays) == 1:
+            return arrays[0]
+
+        return np.concatenate(arrays)
+
+    def _iterate_runs_with_delay(
+        self,
+        iterator: Iterator[IdentifiedTimestampRuns],
+    ) -> Iterator[IdentifiedTimestampRuns]:
+        """Iterate over batches of runs with a set delay parameter.
+
+        Parameters
+        ----------
+        iterator: Iterator[IdentifiedTimestampRuns]
+            Iterator to use.
+
+        """
+        delta = np.timedelta64(  # type: ignore[call-overload]
+            timedelta(seconds=cast('float', self._batch_delay)),
+            'us',
+        )
+        to_concatenate: list[IdentifiedTimestampRuns] = []
+        cursor: RunsCursor | None = None
+
+        current_size = 0
+        batch_size: int | None = None
+        latest_timestamp: np.datetime64 | None = None
+
+        while True:
+            # array is taken by parts with cursor, so the rest of array
+            # is not copied each time batch is cut off
+            if cursor is None or cursor.remaining == 0:
+                try:
+                    cursor = RunsCursor(next(iterator))
+                except StopIteration:
+                    break
+
+            timestamps = cursor.timestamps
+
+            if latest_timestamp is None:
+                latest_timestamp = timestamps[0] + delta
+                batch_size = self._get_batch_size()
+
+            delay_cutoff_index = self._get_cutoff_index_by_delay(
+                latest=latest_timestamp,  # type: ignore[arg-type]
+                array=timestamps,
+            )
+            part = cursor.take(
+                size=None if batch_size is None else batch_size - current_size,
+                end=cursor.index + delay_cutoff_index,
+            )
+            if part.size > 0:
+                to_concatenate.append(part)
+                current_size += count_timestamps(part)
+
+            # process cutoff
+            if cursor.remaining == 0 and not self._lax_mode_enabled:
+                continue
+
+            yield self._concatenate_runs(to_concatenate)
+
+            to_concatenate.clear()
+            current_size = 0
+            latest_timestamp = None
+
+        if to_concatenate:
+            yield self._concatenate_runs(to_concatenate)
 
     @override
     def iterate(
@@ -266,8 +648,20 @@ class TimestampsBatcher(SupportsIdentifiedTimestampsIterate):
         *,
         skip_past: bool = True,
     ) -> Iterator[IdentifiedTimestamps]:
+        if self._run_length:
+            runs_iterator = self._source.iterate_runs(
+                size=self._ring.block_size,
+                skip_past=skip_past,
+            )
+
+            if self._batch_delay is None:
+                yield from self._iterate_runs_without_delay(runs_iterator)
+            else:
+                yield from self._iterate_runs_with_delay(runs_iterator)
+            return
+
         iterator = self._source.iterate(
-            size=self._batch_size or 10_000,
+            size=self._ring.block_size,
             skip_past=skip_past,
         )
 
@@ -13,10 +13,17 @@ from numpy.typing import NDArray
 from eventum.plugins.input.base.plugin import InputPlugin
 from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.protocols import (
+    IdentifiedTimestampRuns,
     IdentifiedTimestamps,
     SupportsIdentifiedTimestampsSizedIterate,
+    TimestampRuns,
 )
-from eventum.plugins.input.utils.array_utils import chunk_array, merge_arrays
+from eventum.plugins.input.ring import IDENTIFIED_TIMESTAMPS_DTYPE
+from eventum.plugins.input.runs import (
+    IDENTIFIED_TIMESTAMP_RUNS_DTYPE,
+    batch_runs,
+)
+from eventum.plugins.input.utils.array_utils import merge_arrays
 
 logger = structlog.stdlib.get_logger()
 
@@ -71,7 +78,8 @@ class InputPluginsMerger(
         size: int,
         *,
         skip_past: bool,
-    ) -> Iterator[dict[str, NDArray[np.datetime64]]]:
+        runs: bool = False,
+    ) -> Iterator[dict[str, NDArray]]:
         """Slice timestamps from active generators.
 
         For each active generator current slice starts at earliest
@@ -86,11 +94,15 @@ class InputPluginsMerger(
         skip_past : bool
             Whether to skip past timestamps before starting slicing.
 
+        runs : bool, default=False
+            Whether to slice timestamp runs of generators instead of
+            timestamps.
+
         Yields
         ------
-        dict[str, NDArray[np.datetime64]]
+        dict[str, NDArray]
             Slices of generators as a map with plugin guids in keys and
-            arrays in values.
+            arrays (of timestamps or timestamp runs) in values.
 
         Notes
         -----
@@ -115,13 +127,20 @@ class InputPluginsMerger(
         """
         active_generators = {
             guid: {
-                'generate': plugin.generate(size, skip_past=skip_past),
+                'generate': (
+                    plugin.generate_runs(size, skip_past=skip_past)
+                    if runs
+                    else plugin.generate(size, skip_past=skip_past)
+                ),
                 'plugin': plugin,
             }
             for guid, plugin in self._plugins.items()
         }
 
-        next_arrays: dict[str, NDArray[np.datetime64]] = {}
+        def timestamps(array: NDArray) -> NDArray[np.datetime64]:
+            return array['timestamp'] if runs else array
+
+        next_arrays: dict[str, NDArray] = {}
         next_required_guids = list(active_generators.keys())
 
         while True:
@@ -141,7 +160,7 @@ class InputPluginsMerger(
                         continue
 
                     try:
-                        array = next(active_generators[guid]['generate'])  # type: ignore[call-overload]
+                        array = next(active_generators[guid]['generate'])  # type: ignore[call-overload, arg-type]
                         next_arrays[guid] = array
                     except StopIteration:
                         del active_generators[guid]
@@ -191,24 +210,24 @@ class InputPluginsMerger(
 
             # find cutoff timestamp
             cutoff_timestamp = min(
-                next_arrays.values(),
-                key=lambda arr: arr[-1],
-            )[-1]
+                timestamps(arr)[-1] for arr in next_arrays.values()
+            )
 
             # fill the slice
-            slice: dict[str, NDArray[np.datetime64]] = {}
+            slice: dict[str, NDArray] = {}
             for guid in tuple(next_arrays.keys()):
                 array = next_arrays[guid]
+                first, last = timestamps(array)[[0, -1]]
 
-                if array[-1] <= cutoff_timestamp:
+                if last <= cutoff_timestamp:
                     slice[guid] = array
                     del next_arrays[guid]
 
                     if guid in active_generators:
                         next_required_guids.append(guid)
-                elif array[0] < cutoff_timestamp < array[-1]:
+                elif first < cutoff_timestamp < last:
                     index = np.searchsorted(
-                        a=array,
+                        a=timestamps(array),
                         v=cutoff_timestamp,
                         side='right',
                     )
@@ -241,43 +260,165 @@ class InputPluginsMerger(
 
         consume_size = max(10_000, size // len(self._plugins))
 
-        current_size = 0
-        merged_arrays: list[IdentifiedTimestamps] = []
+        buffer = self._allocate(size)
+        filled = 0
 
         for arrays in self._slice(size=consume_size, skip_past=skip_past):
-            # build arrays with id from simple arrays
-            arrays_with_id: list[IdentifiedTimestamps] = []
-            for guid, array in arrays.items():
-                array_with_id = np.empty(
-                    shape=array.size,
-                    dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')],
-                )
-                array_with_id['timestamp'][:] = array
-                array_with_id['id'][:] = self._plugins[guid].id
+            total_size = sum(array.size for array in arrays.values())
+
+            if total_size == 0:
+                continue
+
+            # slice fits into buffer, so it is merged in place
+            if total_size <= size - filled:
+                self._merge(arrays, buffer[filled : filled + total_size])
+                filled += total_size
+
+                if filled == size:
+                    yield buffer
+                    buffer = self._allocate(size)
+                    filled = 0
+
+                continue
+
+            merged = self._allocate(total_size)
+            self._merge(arrays, merged)
+
+            position = 0
+            if filled > 0:
+                position = size - filled
+                buffer[filled:] = merged[:position]
+                yield buffer
+
+            # full batches are sliced from merged array as is
+            while total_size - position >= size:
+                yield merged[position : position + size]
+                position += size
+
+            buffer = self._allocate(size)
+            filled = total_size - position
+            buffer[:filled] = merged[position:]
+
+        if filled > 0:
+            yield buffer[:filled]
+
+    @override
+    def iterate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[IdentifiedTimestampRuns]:
+        if size < 1:
+            msg = 'Parameter `size` must be greater or equal to 1'
+            raise ValueError(msg)
+
+        consume_size = max(10_000, size // len(self._plugins))
 
-                arrays_with_id.append(array_with_id)
+        merged_slices = (
+            self._merge_runs(arrays)
+            for arrays in self._slice(
+                size=consume_size,
+                skip_past=skip_past,
+                runs=True,
+            )
+            if arrays
+        )
+        yield from batch_runs(merged_slices, size)
 
-            if len(arrays_with_id) > 1:
-                merged_array = merge_arrays(arrays_with_id)
-            else:
-                merged_array = arrays_with_id[0]
+    def _allocate(self, size: int) -> IdentifiedTimestamps:
+        """Allocate array of identified timestamps.
 
-            merged_arrays.append(merged_array)
+        Parameters
+        ----------
+        size : int
+            Size of array.
+
+        Returns
+        -------
+        IdentifiedTimestamps
+            Uninitialized array.
 
-            current_size += merged_array.size
+        """
+        return np.empty(shape=size, dtype=IDENTIFIED_TIMESTAMPS_DTYPE)
+
+    def _merge(
+        self,
+        arrays: dict[str, NDArray[np.datetime64]],
+        out: IdentifiedTimestamps,
+    ) -> None:
+        """Merge slice of timestamps into output array.
 
-            if current_size >= size:
-                result_array = np.concatenate(merged_arrays)
-                merged_arrays.clear()
+        Parameters
+        ----------
+        arrays : dict[str, NDArray[np.datetime64]]
+            Slices of generators as a map with plugin guids in keys and
+            arrays in values.
 
-                chunks = chunk_array(result_array, size)
-                if chunks[-1].size < size:
-                    merged_arrays.append(chunks.pop())
+        out : IdentifiedTimestamps
+            Output array with size equal to total size of slices.
 
-                for chunk in chunks:
-                    yield chunk
-                    current_size -= chunk.size
+        Notes
+        -----
+        Slices are merged in order of plugin ids, so timestamps that
+        are equal across plugins are ordered by ids.
 
-        if merged_arrays:
-            result_array = np.concatenate(merged_arrays)
-            yield from chunk_array(result_array, size)
+        """
+        guids = sorted(arrays.keys(), key=lambda guid: self._plugins[guid].id)
+
+        merge_arrays(
+            arrays=[arrays[guid] for guid in guids],
+            out=out['timestamp'],
+            labels=[self._plugins[guid].id for guid in guids],
+            labels_out=out['id'],
+        )
+
+    def _merge_runs(
+        self,
+        arrays: dict[str, TimestampRuns],
+    ) -> IdentifiedTimestampRuns:
+        """Merge slice of timestamp runs.
+
+        Parameters
+        ----------
+        arrays : dict[str, TimestampRuns]
+            Slices of generators as a map with plugin guids in keys and
+            arrays of runs in values.
+
+        Returns
+        -------
+        IdentifiedTimestampRuns
+            Merged runs.
+
+        Notes
+        -----
+        Runs are not joined across plugins, so equal timestamps of
+        different plugins remain separate runs ordered by plugin ids.
+
+        """
+        guids = sorted(arrays.keys(), key=lambda guid: self._plugins[guid].id)
+
+        concatenated = np.empty(
+            shape=sum(arrays[guid].size for guid in guids),
+            dtype=IDENTIFIED_TIMESTAMP_RUNS_DTYPE,
+        )
+        offsets = np.cumsum([0] + [arrays[guid].size for guid in guids])
+        for guid, offset in zip(guids, offsets, strict=False):
+            part = concatenated[offset : offset + arrays[guid].size]
+            part['timestamp'] = arrays[guid]['timestamp']
+            part['count'] = arrays[guid]['count']
+            part['id'] = self._plugins[guid].id
+
+        # runs are merged by timestamps with their positions in labels
+        # to reorder whole records afterwards
+        indices = np.empty(concatenated.size, dtype=np.int64)
+        merge_arrays(
+            arrays=[arrays[guid]['timestamp'] for guid in guids],
+            labels=[
+                np.arange(offset, offset + arrays[guid].size)
+                for guid, offset in zip(guids, offsets, strict=False)
+            ],
+            labels_out=indices,
+        )
+
+        return concatenated[indices]
@@ -5,13 +5,21 @@ from datetime import datetime
 from typing import override
 
 import croniter
-from numpy import datetime64
+import numpy as np
 from numpy.typing import NDArray
 
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.normalizers import normalize_versatile_daterange
 from eventum.plugins.input.plugins.cron.config import CronInputPluginConfig
+from eventum.plugins.input.plugins.cron.schedule import (
+    CronSchedule,
+    get_nonexistent_ranges,
+    shift_nonexistent,
+)
+from eventum.plugins.input.protocols import TimestampRuns
+from eventum.plugins.input.runs import TIMESTAMP_RUNS_DTYPE, batch_runs
+from eventum.plugins.input.utils.time_utils import to_naive
 
 
 class CronInputPlugin(InputPlugin[CronInputPluginConfig, InputPluginParams]):
@@ -27,13 +35,30 @@ class CronInputPlugin(InputPlugin[CronInputPluginConfig, InputPluginParams]):
     ) -> None:
         super().__init__(config, params)
 
-    @override
-    def _generate(
+    def _get_range(
         self,
-        size: int,
         *,
-        skip_past: bool = True,
-    ) -> Iterator[NDArray[datetime64]]:
+        skip_past: bool,
+    ) -> tuple[datetime, datetime] | None:
+        """Get range of generation.
+
+        Parameters
+        ----------
+        skip_past : bool
+            Whether to skip past timestamps.
+
+        Returns
+        -------
+        tuple[datetime, datetime] | None
+            Start and end of the range (both inclusive) or `None` if
+            there is nothing to generate.
+
+        Raises
+        ------
+        PluginGenerationError
+            If range cannot be normalized.
+
+        """
         now = datetime.now().astimezone(self._timezone)
 
         try:
@@ -62,9 +87,240 @@ class CronInputPlugin(InputPlugin[CronInputPluginConfig, InputPluginParams]):
                 self._logger.info(
                     'All timestamps are in past, nothing to generate',
                 )
-                return
+                return None
             start = max(start, now)
 
+        return start, end
+
+    def _compile_schedule(self) -> CronSchedule | None:
+        """Compile cron expression of config.
+
+        Returns
+        -------
+        CronSchedule | None
+            Compiled schedule or `None` if expression cannot be
+            compiled.
+
+        """
+        try:
+            return CronSchedule.compile(self._config.expression)
+        except ValueError as e:
+            self._logger.debug(
+                'Cron expression cannot be compiled, falling back to '
+                'iterating over expression',
+                reason=str(e),
+            )
+            return None
+
+    @property
+    @override
+    def is_blocking(self) -> bool:
+        # iterating over expression with `croniter` takes long time for
+        # each chunk of timestamps
+        return self._compile_schedule() is None
+
+    @override
+    def _generate(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[NDArray[np.datetime64]]:
+        date_range = self._get_range(skip_past=skip_past)
+        if date_range is None:
+            return
+
+        start, end = date_range
+        schedule = self._compile_schedule()
+
+        if schedule is None:
+            yield from self._generate_with_croniter(
+                size=size,
+                start=start,
+                end=end,
+            )
+        else:
+            yield from self._generate_with_schedule(
+                size=size,
+                schedule=schedule,
+                start=start,
+                end=end,
+            )
+
+    @override
+    def _generate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[TimestampRuns]:
+        schedule = self._compile_schedule()
+        if schedule is None:
+            yield from super()._generate_runs(size=size, skip_past=skip_past)
+            return
+
+        date_range = self._get_range(skip_past=skip_past)
+        if date_range is None:
+            return
+
+        start, end = date_range
+
+        def generate_blocks() -> Iterator[TimestampRuns]:
+            for timestamps in self._expand_schedule(
+                size=size,
+                schedule=schedule,
+                start=start,
+                end=end,
+            ):
+                runs = np.empty(timestamps.size, dtype=TIMESTAMP_RUNS_DTYPE)
+                runs['timestamp'] = timestamps
+                runs['count'] = self._config.count
+                yield runs
+
+        yield from batch_runs(generate_blocks(), size)
+
+    def _expand_schedule(
+        self,
+        size: int,
+        schedule: CronSchedule,
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[NDArray[np.datetime64]]:
+        """Expand compiled schedule in blocks of days.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps (including repetitions by `count`)
+            to approximately fit in one block.
+
+        schedule : CronSchedule
+            Compiled schedule.
+
+        start : datetime
+            Start of the range (inclusive).
+
+        end : datetime
+            End of the range (inclusive).
+
+        Yields
+        ------
+        NDArray[np.datetime64]
+            Non empty array of unique sorted moments of block.
+
+        Notes
+        -----
+        Schedule matches wall clock time of plugin timezone, moments
+        that do not exist due to forward DST transitions are shifted
+        forward the same way as `croniter` does (see
+        `shift_nonexistent`) and moments of repeated hour of backward
+        transitions are generated once.
+
+        """
+        start_moment = np.datetime64(to_naive(start, self._timezone), 'us')
+        end_moment = np.datetime64(to_naive(end, self._timezone), 'us')
+        nonexistent_ranges = get_nonexistent_ranges(self._timezone)
+
+        # number of days in block is chosen to fill about one read
+        # of requested size
+        day_size = max(1, schedule.offsets.size * self._config.count)
+        block_days = -(-size // day_size)
+
+        day = start_moment.astype('datetime64[D]')
+        last_day = end_moment.astype('datetime64[D]')
+
+        while day <= last_day:
+            days = min(block_days, int((last_day - day).astype(int)) + 1)
+            timestamps = schedule.expand(first_day=day, days=days)
+            day += days
+
+            # end of range is applied after shifting as shifted moments
+            # can exceed it
+            timestamps = shift_nonexistent(
+                timestamps[
+                    np.searchsorted(timestamps, start_moment, side='left') :
+                ],
+                nonexistent_ranges,
+            )
+            timestamps = timestamps[
+                : np.searchsorted(timestamps, end_moment, side='right')
+            ]
+
+            if timestamps.size > 0:
+                yield timestamps
+
+    def _generate_with_schedule(
+        self,
+        size: int,
+        schedule: CronSchedule,
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[NDArray[np.datetime64]]:
+        """Generate timestamps by expanding compiled schedule.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps to read from buffer.
+
+        schedule : CronSchedule
+            Compiled schedule.
+
+        start : datetime
+            Start of the range (inclusive).
+
+        end : datetime
+            End of the range (inclusive).
+
+        Yields
+        ------
+        NDArray[np.datetime64]
+            Array of timestamps.
+
+        """
+        for timestamps in self._expand_schedule(
+            size=size,
+            schedule=schedule,
+            start=start,
+            end=end,
+        ):
+            if self._config.count > 1:
+                self._buffer.mv_push(np.repeat(timestamps, self._config.count))
+            else:
+                self._buffer.mv_push(timestamps)
+
+            if self._buffer.size >= size:
+                yield from self._buffer.read(size, partial=False)
+
+        if self._buffer.size > 0:
+            yield from self._buffer.read(size, partial=True)
+
+    def _generate_with_croniter(
+        self,
+        size: int,
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[NDArray[np.datetime64]]:
+        """Generate timestamps by iterating over expression using
+        `croniter`.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps to read from buffer.
+
+        start : datetime
+            Start of the range (inclusive).
+
+        end : datetime
+            End of the range (inclusive).
+
+        Yields
+        ------
+        NDArray[np.datetime64]
+            Array of timestamps.
+
+        """
         cron_range: Iterator[datetime] = croniter.croniter_range(
             start=start,
             stop=end,
@@ -74,7 +330,7 @@ class CronInputPlugin(InputPlugin[CronInputPluginConfig, InputPluginParams]):
 
         for timestamp in cron_range:
             self._buffer.m_push(
-                timestamp=datetime64(timestamp.replace(tzinfo=None)),
+                timestamp=np.datetime64(timestamp.replace(tzinfo=None)),
                 multiply=self._config.count,
             )
 
@@ -0,0 +1,348 @@
+"""Compiled cron schedule for vectorized expansion of cron expressions."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from croniter import croniter
+from numpy.typing import NDArray
+from pytz import BaseTzInfo
+
+from eventum.plugins.input.utils.time_utils import get_utc_transitions
+
+SECONDS_FIELD_INDEX = 5
+YEARS_FIELD_INDEX = 6
+
+# 1970-01-01 is Thursday, cron weekdays start from Sunday
+EPOCH_WEEKDAY = 4
+
+
+def _compile_field(
+    values: Sequence[int | str],
+    size: int,
+) -> NDArray[np.bool_] | None:
+    """Compile expanded values of cron field to bitset.
+
+    Parameters
+    ----------
+    values : Sequence[int | str]
+        Expanded values of field.
+
+    size : int
+        Size of bitset.
+
+    Returns
+    -------
+    NDArray[np.bool_] | None
+        Bitset where matching values are set or `None` if field
+        matches any value.
+
+    Raises
+    ------
+    ValueError
+        If field contains values that cannot be compiled.
+
+    """
+    if list(values) == ['*']:
+        return None
+
+    if not all(isinstance(value, int) for value in values):
+        msg = f'Unsupported field values {values}'
+        raise ValueError(msg)
+
+    bitset = np.zeros(size, dtype=np.bool_)
+    bitset[np.array(values, dtype=np.int64)] = True
+
+    return bitset
+
+
+def _compile_years(values: Sequence[int | str]) -> NDArray[np.int64] | None:
+    """Compile expanded values of cron years field.
+
+    Parameters
+    ----------
+    values : Sequence[int | str]
+        Expanded values of field.
+
+    Returns
+    -------
+    NDArray[np.int64] | None
+        Sorted matching years or `None` if field matches any year.
+
+    Raises
+    ------
+    ValueError
+        If field contains values that cannot be compiled.
+
+    """
+    if list(values) == ['*']:
+        return None
+
+    if not all(isinstance(value, int) for value in values):
+        msg = f'Unsupported field values {values}'
+        raise ValueError(msg)
+
+    return np.unique(np.array(values, dtype=np.int64))
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """Cron expression compiled to bitsets of fields.
+
+    Attributes
+    ----------
+    offsets : NDArray[np.timedelta64]
+        Sorted offsets of matching moments from the beginning of the
+        day.
+
+    months : NDArray[np.bool_] | None
+        Bitset of matching months (1-12), `None` if any month matches.
+
+    days_of_month : NDArray[np.bool_] | None
+        Bitset of matching days of month (1-31), `None` if any day
+        matches.
+
+    days_of_week : NDArray[np.bool_] | None
+        Bitset of matching days of week (0-6, starting from Sunday),
+        `None` if any day matches.
+
+    years : NDArray[np.int64] | None
+        Sorted matching years, `None` if any year matches.
+
+    """
+
+    offsets: NDArray[np.timedelta64]
+    months: NDArray[np.bool_] | None
+    days_of_month: NDArray[np.bool_] | None
+    days_of_week: NDArray[np.bool_] | None
+    years: NDArray[np.int64] | None
+
+    @classmethod
+    def compile(cls, expression: str) -> 'CronSchedule':
+        """Compile cron expression.
+
+        Parameters
+        ----------
+        expression : str
+            Cron expression.
+
+        Returns
+        -------
+        CronSchedule
+            Compiled schedule.
+
+        Raises
+        ------
+        ValueError
+            If expression is invalid (`croniter` errors are subclasses
+            of `ValueError`) or uses features that cannot be compiled
+            (e.g. `L` or `#` specifiers).
+
+        Notes
+        -----
+        Random values (`R`) are resolved once during compilation, the
+        same way as `croniter` resolves them once per iteration.
+
+        """
+        fields, nth_weekdays = croniter.expand(expression)
+
+        if nth_weekdays:
+            msg = 'Nth weekday specifiers are not supported'
+            raise ValueError(msg)
+
+        minutes, hours, days_of_month, months, days_of_week = fields[:5]
+
+        seconds: Sequence[int | str] = [0]
+        if len(fields) > SECONDS_FIELD_INDEX:
+            seconds = fields[SECONDS_FIELD_INDEX]
+
+        years = None
+        if len(fields) > YEARS_FIELD_INDEX:
+            years = _compile_years(fields[YEARS_FIELD_INDEX])
+
+        time_fields = [
+            (_compile_field(values, size), size)
+            for values, size in ((hours, 24), (minutes, 60), (seconds, 60))
+        ]
+        offsets = np.zeros(1, dtype=np.int64)
+        for bitset, size in time_fields:
+            field_values = (
+                np.arange(size) if bitset is None else np.flatnonzero(bitset)
+            )
+            offsets = (offsets[:, np.newaxis] * size + field_values).ravel()
+
+        return cls(
+            offsets=offsets.astype('timedelta64[s]'),
+            months=_compile_field(months, size=13),
+            days_of_month=_compile_field(days_of_month, size=32),
+            days_of_week=_compile_field(days_of_week, size=7),
+            years=years,
+        )
+
+    def match_days(self, days: NDArray[np.datetime64]) -> NDArray[np.bool_]:
+        """Check which days match the schedule.
+
+        Parameters
+        ----------
+        days : NDArray[np.datetime64]
+            Days to check.
+
+        Returns
+        -------
+        NDArray[np.bool_]
+            Mask of matching days.
+
+        Notes
+        -----
+        As in `croniter`, if both day of month and day of week are
+        restricted, then day matches if any of them matches.
+
+        """
+        days = days.astype('datetime64[D]')
+        mask = np.ones(days.size, dtype=np.bool_)
+
+        months_start = days.astype('datetime64[M]')
+        years_start = days.astype('datetime64[Y]')
+
+        if self.months is not None:
+            month_numbers = (months_start - years_start).astype(np.int64) + 1
+            mask &= self.months[month_numbers]
+
+        if self.years is not None:
+            year_numbers = years_start.astype(np.int64) + 1970
+            mask &= np.isin(year_numbers, self.years)
+
+        days_mask: NDArray[np.bool_] | None = None
+        if self.days_of_month is not None:
+            days_numbers = (days - months_start).astype(np.int64) + 1
+            days_mask = self.days_of_month[days_numbers]
+
+        if self.days_of_week is not None:
+            weekdays = (days.astype(np.int64) + EPOCH_WEEKDAY) % 7
+            weekdays_mask = self.days_of_week[weekdays]
+            days_mask = (
+                weekdays_mask
+                if days_mask is None
+                else days_mask | weekdays_mask
+            )
+
+        if days_mask is not None:
+            mask &= days_mask
+
+        return mask
+
+    def expand(
+        self,
+        first_day: np.datetime64,
+        days: int,
+    ) -> NDArray[np.datetime64]:
+        """Expand schedule to matching moments of consecutive days.
+
+        Parameters
+        ----------
+        first_day : np.datetime64
+            First day to expand schedule for.
+
+        days : int
+            Number of days.
+
+        Returns
+        -------
+        NDArray[np.datetime64]
+            Sorted matching moments in naive wall clock time.
+
+        """
+        block = np.arange(
+            first_day.astype('datetime64[D]'),
+            first_day.astype('datetime64[D]') + days,
+        )
+        block = block[self.match_days(block)]
+
+        moments = (
+            block.astype('datetime64[us]')[:, np.newaxis]
+            + (self.offsets[np.newaxis, :])
+        )
+        return moments.ravel()  # type: ignore[return-value]
+
+
+def get_nonexistent_ranges(
+    timezone: BaseTzInfo,
+) -> tuple[NDArray[np.datetime64], NDArray[np.datetime64]]:
+    """Get ranges of wall clock time that do not exist in timezone due
+    to forward transitions (e.g. start of daylight saving time).
+
+    Parameters
+    ----------
+    timezone : BaseTzInfo
+        Timezone.
+
+    Returns
+    -------
+    tuple[NDArray[np.datetime64], NDArray[np.datetime64]]
+        Sorted starts (inclusive) and ends (exclusive) of ranges.
+
+    """
+    moments, offsets = get_utc_transitions(timezone)
+    forward = np.flatnonzero(offsets[1:] > offsets[:-1]) + 1
+
+    return (
+        moments[forward] + offsets[forward - 1],
+        moments[forward] + offsets[forward],
+    )
+
+
+def shift_nonexistent(
+    moments: NDArray[np.datetime64],
+    ranges: tuple[NDArray[np.datetime64], NDArray[np.datetime64]],
+) -> NDArray[np.datetime64]:
+    """Shift moments that fall within nonexistent ranges the same way
+    as `croniter` does.
+
+    Parameters
+    ----------
+    moments : NDArray[np.datetime64]
+        Sorted unique moments in naive wall clock time.
+
+    ranges : tuple[NDArray[np.datetime64], NDArray[np.datetime64]]
+        Nonexistent ranges as returned by `get_nonexistent_ranges`.
+
+    Returns
+    -------
+    NDArray[np.datetime64]
+        Sorted unique moments without nonexistent ones.
+
+    Notes
+    -----
+    First moment within each nonexistent range is shifted forward by
+    the length of the range (e.g. `0 2 * * *` produces 03:00 on day of
+    one hour forward transition), other moments of the range and
+    moments preceding the shifted one are dropped, as `croniter`
+    continues iteration from the shifted moment.
+
+    """
+    starts, ends = ranges
+
+    if starts.size == 0 or moments.size == 0:
+        return moments
+
+    indices = np.searchsorted(starts, moments, side='right') - 1
+    clipped_indices = np.maximum(indices, 0)
+    nonexistent = (indices >= 0) & (moments < ends[clipped_indices])
+
+    if not nonexistent.any():
+        return moments
+
+    # moments are sorted, so first moment of each range goes first
+    ranges_indices, first_positions = np.unique(
+        indices[nonexistent],
+        return_index=True,
+    )
+    shifted = moments[nonexistent][first_positions] + (
+        ends[ranges_indices] - starts[ranges_indices]
+    )
+
+    limits = ends.copy()
+    limits[ranges_indices] = shifted
+    dropped = (indices >= 0) & (moments < limits[clipped_indices])
+
+    return np.union1d(moments[~dropped], shifted)
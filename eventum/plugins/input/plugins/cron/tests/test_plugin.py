@@ -1,5 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import croniter
+import numpy as np
+import pytest
 from numpy import datetime64
 from pytz import timezone
 
@@ -27,3 +30,188 @@ def test_plugin():
     assert len(set(timestamps)) == 1440
     assert timestamps[0] == datetime64('2024-01-01T00:00:00')
     assert timestamps[-1] == datetime64('2024-01-01T23:59:00')
+
+
+@pytest.mark.parametrize(
+    ('expression', 'blocking'), [('*/5 * * * *', False), ('0 0 L * *', True)]
+)
+def test_plugin_is_blocking(expression, blocking):
+    plugin = CronInputPlugin(
+        config=CronInputPluginConfig(
+            expression=expression, count=1, start='now', end='+1d'
+        ),
+        params={'id': 1, 'timezone': timezone('UTC')},
+    )
+
+    assert plugin.is_blocking is blocking
+
+
+def _generate(expression, tz, start, end):
+    plugin = CronInputPlugin(
+        config=CronInputPluginConfig(
+            expression=expression,
+            count=1,
+            start=tz.localize(start),
+            end=tz.localize(end),
+        ),
+        params={'id': 1, 'timezone': tz},
+    )
+    return [
+        timestamp
+        for batch in plugin.generate(size=100, skip_past=False)
+        for timestamp in batch
+    ]
+
+
+def test_plugin_shifts_nonexistent_time_once():
+    tz = timezone('US/Eastern')
+
+    timestamps = _generate(
+        '*/30 * * * *',
+        tz,
+        datetime(2024, 3, 10, 1, 0),
+        datetime(2024, 3, 10, 4, 0),
+    )
+
+    assert timestamps == [
+        datetime64('2024-03-10T01:00:00'),
+        datetime64('2024-03-10T01:30:00'),
+        datetime64('2024-03-10T03:00:00'),
+        datetime64('2024-03-10T03:30:00'),
+        datetime64('2024-03-10T04:00:00'),
+    ]
+
+
+@pytest.mark.parametrize(
+    ('tz_name', 'day', 'expected'),
+    [
+        ('America/New_York', datetime(2024, 3, 10), '2024-03-10T03:00'),
+        ('Europe/Berlin', datetime(2024, 3, 31), '2024-03-31T03:00'),
+        ('Australia/Lord_Howe', datetime(2024, 10, 6), '2024-10-06T02:30'),
+    ],
+)
+def test_plugin_shifts_nonexistent_time(tz_name, day, expected):
+    tz = timezone(tz_name)
+    start = day - timedelta(days=1)
+    end = day + timedelta(days=1, hours=12)
+
+    timestamps = _generate('0 2 * * *', tz, start, end)
+
+    assert timestamps == [
+        datetime64(start.replace(hour=2)),
+        datetime64(expected),
+        datetime64(end.replace(hour=2)),
+    ]
+    assert timestamps == [
+        datetime64(timestamp.replace(tzinfo=None))
+        for timestamp in croniter.croniter_range(
+            start=tz.localize(start),
+            stop=tz.localize(end),
+            expr_format='0 2 * * *',
+            ret_type=datetime,
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    ('expression', 'tz_name'),
+    [
+        ('*/15 2 * * *', 'America/New_York'),
+        ('30 2,3 * * *', 'America/New_York'),
+        ('15,35,50 2 * * *', 'Australia/Lord_Howe'),
+        ('*/10 * * * *', 'Australia/Lord_Howe'),
+    ],
+)
+def test_plugin_matches_croniter_at_forward_transitions(expression, tz_name):
+    tz = timezone(tz_name)
+    start = datetime(2024, 3, 1)
+    end = datetime(2024, 11, 1)
+
+    expected = [
+        datetime64(timestamp.replace(tzinfo=None))
+        for timestamp in croniter.croniter_range(
+            start=tz.localize(start),
+            stop=tz.localize(end),
+            expr_format=expression,
+            ret_type=datetime,
+        )
+    ]
+
+    assert _generate(expression, tz, start, end) == expected
+
+
+def test_plugin_generates_repeated_time_once():
+    tz = timezone('US/Eastern')
+
+    timestamps = _generate(
+        '0 * * * *',
+        tz,
+        datetime(2024, 11, 3, 0, 0),
+        datetime(2024, 11, 3, 3, 0),
+    )
+
+    assert timestamps == [
+        datetime64('2024-11-03T00:00:00'),
+        datetime64('2024-11-03T01:00:00'),
+        datetime64('2024-11-03T02:00:00'),
+        datetime64('2024-11-03T03:00:00'),
+    ]
+
+
+@pytest.mark.parametrize(
+    'expression',
+    [
+        '*/7 9-17 * * 1-5',
+        '0 0 1,15 * 1',
+        '0 12 * 2 *',
+        '0 */10 * * * */15',
+        '0 0 1 1 * 0 2024-2026',
+        # not compilable expressions
+        '0 0 * * 5#2',
+        '0 0 L * *',
+    ],
+)
+def test_plugin_matches_croniter(expression):
+    tz = timezone('Europe/Berlin')
+    start = datetime(2023, 12, 25, 10, 3)
+    end = datetime(2025, 1, 3, 3, 7)
+
+    expected = [
+        datetime64(timestamp.replace(tzinfo=None))
+        for timestamp in croniter.croniter_range(
+            start=tz.localize(start),
+            stop=tz.localize(end),
+            expr_format=expression,
+            ret_type=datetime,
+        )
+    ]
+
+    assert _generate(expression, tz, start, end) == expected
+
+
+@pytest.mark.parametrize('expression', ['*/7 9-17 * * 1-5', '0 0 L * *'])
+def test_plugin_runs(expression):
+    tz = timezone('Europe/Berlin')
+
+    def create_plugin():
+        return CronInputPlugin(
+            config=CronInputPluginConfig(
+                expression=expression,
+                count=4,
+                start=tz.localize(datetime(2024, 1, 1)),
+                end=tz.localize(datetime(2024, 3, 1)),
+            ),
+            params={'id': 1, 'timezone': tz},
+        )
+
+    batches = list(create_plugin().generate_runs(skip_past=False, size=1000))
+
+    assert all(int(batch['count'].sum()) == 1000 for batch in batches[:-1])
+
+    expected = np.concatenate(
+        list(create_plugin().generate(skip_past=False, size=1000))
+    )
+    expanded = np.concatenate(
+        [np.repeat(batch['timestamp'], batch['count']) for batch in batches]
+    )
+    assert np.array_equal(expanded, expected)
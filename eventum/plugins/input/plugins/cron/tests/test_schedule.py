@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from pytz import timezone
+
+from eventum.plugins.input.plugins.cron.schedule import (
+    CronSchedule,
+    get_nonexistent_ranges,
+    shift_nonexistent,
+)
+
+
+def test_compile():
+    schedule = CronSchedule.compile('*/20 9,17 * * 1-5')
+
+    assert schedule.offsets.tolist() == [
+        np.timedelta64(hour * 3600 + minute * 60, 's').item()
+        for hour in (9, 17)
+        for minute in (0, 20, 40)
+    ]
+    assert schedule.months is None
+    assert schedule.days_of_month is None
+    assert schedule.days_of_week is not None
+    assert np.flatnonzero(schedule.days_of_week).tolist() == [1, 2, 3, 4, 5]
+    assert schedule.years is None
+
+
+@pytest.mark.parametrize('expression', ['0 0 L * *', '0 0 * * 5#2'])
+def test_compile_unsupported(expression):
+    with pytest.raises(ValueError):
+        CronSchedule.compile(expression)
+
+
+def test_match_days():
+    # 2024-01-01 is Monday
+    days = np.arange(np.datetime64('2024-01-01'), np.datetime64('2024-01-15'))
+
+    schedule = CronSchedule.compile('0 0 13 * 5')
+    matched = days[schedule.match_days(days)]
+
+    # day of month or day of week
+    assert matched.tolist() == [
+        np.datetime64('2024-01-05').item(),
+        np.datetime64('2024-01-12').item(),
+        np.datetime64('2024-01-13').item(),
+    ]
+
+
+def test_expand():
+    schedule = CronSchedule.compile('30 12 * * *')
+
+    moments = schedule.expand(np.datetime64('2024-02-28'), days=3)
+
+    assert moments.tolist() == [
+        np.datetime64('2024-02-28T12:30').item(),
+        np.datetime64('2024-02-29T12:30').item(),
+        np.datetime64('2024-03-01T12:30').item(),
+    ]
+
+
+def test_shift_nonexistent():
+    ranges = get_nonexistent_ranges(timezone('Europe/Berlin'))
+    moments = np.array(
+        [
+            '2024-03-31T01:59:59',
+            '2024-03-31T02:00:00',
+            '2024-03-31T02:59:59',
+            '2024-03-31T03:00:00',
+            '2024-03-31T03:30:00',
+            '2024-10-27T02:30:00',
+        ],
+        dtype='datetime64[us]',
+    )
+
+    assert shift_nonexistent(moments, ranges).tolist() == [
+        moments[0].item(),
+        moments[3].item(),
+        moments[4].item(),
+        moments[5].item(),
+    ]
+
+
+def test_shift_nonexistent_drops_moments_before_shifted():
+    # 30 minutes forward transition at 02:00
+    ranges = get_nonexistent_ranges(timezone('Australia/Lord_Howe'))
+    moments = np.array(
+        [
+            '2024-10-06T02:15:00',
+            '2024-10-06T02:40:00',
+            '2024-10-06T02:50:00',
+        ],
+        dtype='datetime64[us]',
+    )
+
+    assert shift_nonexistent(moments, ranges).tolist() == [
+        np.datetime64('2024-10-06T02:45:00').item(),
+        moments[2].item(),
+    ]
+
+
+def test_no_nonexistent_ranges_in_utc():
+    starts, ends = get_nonexistent_ranges(timezone('UTC'))
+
+    assert starts.size == ends.size == 0
@@ -3,7 +3,7 @@
 from collections.abc import Iterator
 from typing import override
 
-from numpy import datetime64, linspace, timedelta64
+from numpy import arange, datetime64, float64, timedelta64
 from numpy.typing import NDArray
 
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
@@ -12,7 +12,6 @@ from eventum.plugins.input.normalizers import normalize_versatile_daterange
 from eventum.plugins.input.plugins.linspace.config import (
     LinspaceInputPluginConfig,
 )
-from eventum.plugins.input.utils.array_utils import get_future_slice
 from eventum.plugins.input.utils.time_utils import now64, to_naive
 
 
@@ -24,9 +23,8 @@ class LinspaceInputPlugin(
 
     Notes
     -----
-    Plugin allocates all the timestamp at generation start. If you have
-    deal with large number of timestamps and need lazy evaluation, see
-    timer input plugin.
+    Timestamps are computed lazily for each generated array from range
+    of their indices, so memory usage does not depend on count.
 
     """
 
@@ -38,6 +36,108 @@ class LinspaceInputPlugin(
     ) -> None:
         super().__init__(config, params)
 
+        if self._config.endpoint:
+            self._divisor = self._config.count - 1
+        else:
+            self._divisor = self._config.count
+
+    def _compute(
+        self,
+        first: datetime64,
+        delta: timedelta64,
+        start_index: int,
+        stop_index: int,
+    ) -> NDArray[datetime64]:
+        """Compute timestamps in range of indices.
+
+        Parameters
+        ----------
+        first : datetime64
+            First timestamp of space.
+
+        delta : timedelta64
+            Duration of date range.
+
+        start_index : int
+            Index of first timestamp to compute (inclusive).
+
+        stop_index : int
+            Index of last timestamp to compute (exclusive).
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Computed timestamps.
+
+        Notes
+        -----
+        Values of space are computed the same way as in `numpy.linspace`
+        so that the result is identical to slice of full space.
+
+        """
+        space = arange(start_index, stop_index, dtype=float64)
+
+        if self._divisor > 0:
+            space *= 1 / self._divisor
+        else:
+            space *= 0
+
+        if (
+            self._config.endpoint
+            and self._config.count > 1
+            and stop_index == self._config.count
+        ):
+            space[-1] = 1
+
+        return first + (delta * space)  # type: ignore[no-any-return]
+
+    def _get_future_index(
+        self,
+        first: datetime64,
+        delta: timedelta64,
+        after: datetime64,
+    ) -> int:
+        """Get index of first timestamp that is after the moment.
+
+        Parameters
+        ----------
+        first : datetime64
+            First timestamp of space.
+
+        delta : timedelta64
+            Duration of date range.
+
+        after : datetime64
+            Cutoff moment.
+
+        Returns
+        -------
+        int
+            Index of first timestamp after the moment, equals to count
+            if all timestamps are not after the moment.
+
+        """
+        count = self._config.count
+
+        if delta == timedelta64(0, 'us') or self._divisor == 0:
+            return 0 if first > after else count
+
+        # estimation by inverse of linear function can be inaccurate
+        # due to rounding, so it is corrected using computed values
+        ratio = (after - first) / delta
+        index = min(max(int(ratio * self._divisor) + 1, 0), count)
+
+        def value(i: int) -> datetime64:
+            return self._compute(first, delta, i, i + 1)[0]
+
+        while index > 0 and value(index - 1) > after:
+            index -= 1
+
+        while index < count and value(index) <= after:
+            index += 1
+
+        return index
+
     @override
     def _generate(
         self,
@@ -66,29 +166,27 @@ class LinspaceInputPlugin(
             end_timestamp=end.isoformat(),
         )
 
-        space = linspace(
-            start=0,
-            stop=1,
-            num=self._config.count,
-            endpoint=self._config.endpoint,
-        )
-
         first = datetime64(to_naive(start, self._timezone).isoformat(), 'us')
-        timedelta = timedelta64((end - start), 'us')
-
-        timestamps = first + (timedelta * space)
+        delta = timedelta64((end - start), 'us')
 
         if skip_past:
-            timestamps = get_future_slice(
-                timestamps=timestamps,
+            start_index = self._get_future_index(
+                first=first,
+                delta=delta,
                 after=now64(self._timezone),
             )
-            if not timestamps:
+            if start_index == self._config.count:
                 self._logger.info(
                     'All timestamps are in past, nothing to generate',
                 )
                 return
-
-        self._buffer.mv_push(timestamps)
-
-        yield from self._buffer.read(size, partial=True)
+        else:
+            start_index = 0
+
+        for index in range(start_index, self._config.count, size):
+            yield self._compute(
+                first=first,
+                delta=delta,
+                start_index=index,
+                stop_index=min(index + size, self._config.count),
+            )
@@ -1,5 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import islice
 
+import numpy as np
 import pytest
 from numpy import datetime64
 from pytz import timezone
@@ -56,3 +58,45 @@ def test_plugin(start, end, count, endpoint, expected):
         timestamps.extend(batch)
 
     assert timestamps == expected
+
+
+def test_plugin_skips_past():
+    now = datetime.now().astimezone(timezone('UTC'))
+    config = LinspaceInputPluginConfig(
+        start=now - timedelta(hours=1),
+        end=now + timedelta(hours=1),
+        count=7201,
+    )
+
+    plugin = LinspaceInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    timestamps = np.concatenate(list(plugin.generate(size=1000)))
+
+    assert 3599 <= timestamps.size <= 3600
+    assert timestamps[-1] == datetime64(
+        (now + timedelta(hours=1)).replace(tzinfo=None)
+    )
+    assert np.all(
+        np.abs(np.diff(timestamps) - np.timedelta64(1, 's'))
+        <= np.timedelta64(1, 'us')
+    )
+
+
+def test_plugin_with_large_count():
+    config = LinspaceInputPluginConfig(
+        start=datetime(2024, 1, 1, tzinfo=timezone('UTC')),
+        end=datetime(2024, 1, 2, tzinfo=timezone('UTC')),
+        count=1_000_000_000,
+    )
+
+    plugin = LinspaceInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    batches = list(islice(plugin.generate(size=10_000, skip_past=False), 3))
+
+    assert [batch.size for batch in batches] == [10_000] * 3
+    assert batches[0][0] == datetime64('2024-01-01T00:00:00')
+    assert np.all(np.diff(np.concatenate(batches)) >= np.timedelta64(0, 'us'))
@@ -4,11 +4,13 @@ from collections.abc import Iterator
 from datetime import datetime
 from typing import override
 
-from numpy import datetime64
+from numpy import datetime64, empty
 from numpy.typing import NDArray
 
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.plugins.static.config import StaticInputPluginConfig
+from eventum.plugins.input.protocols import TimestampRuns
+from eventum.plugins.input.runs import TIMESTAMP_RUNS_DTYPE
 
 
 class StaticInputPlugin(
@@ -45,3 +47,24 @@ class StaticInputPlugin(
             multiply=self._config.count,
         )
         yield from self._buffer.read(size, partial=True)
+
+    @override
+    def _generate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[TimestampRuns]:
+        now = datetime.now().astimezone(self._timezone)
+        self._logger.debug(
+            'Generating in range',
+            start_timestamp=now.isoformat(),
+            end_timestamp=now.isoformat(),
+        )
+        timestamp = datetime64(now.replace(tzinfo=None), 'us')
+
+        for position in range(0, self._config.count, size):
+            runs = empty(1, dtype=TIMESTAMP_RUNS_DTYPE)
+            runs['timestamp'] = timestamp
+            runs['count'] = min(size, self._config.count - position)
+            yield runs
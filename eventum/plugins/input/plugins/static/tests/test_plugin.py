@@ -22,3 +22,19 @@ def test_plugin():
 
     ts = timezone('UTC').localize(datetime.fromisoformat(str(timestamps[0])))
     assert abs((ts - now).total_seconds()) < 1
+
+
+def test_plugin_runs():
+    config = StaticInputPluginConfig(count=50_000_000)
+    plugin = StaticInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    batches = list(plugin.generate_runs(size=20_000_000))
+
+    assert [batch['count'].tolist() for batch in batches] == [
+        [20_000_000],
+        [20_000_000],
+        [10_000_000],
+    ]
+    assert plugin.generated == 50_000_000
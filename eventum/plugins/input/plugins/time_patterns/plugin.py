@@ -100,8 +100,9 @@ class TimePatternInputPlugin(
         self._randomizer_factors = self._generate_randomizer_factors(
             count=self._config.randomizer.sampling,
         )
+        self._randomizer_position = 0
 
-    def _generate_randomizer_factors(self, count: int) -> Iterator[float]:
+    def _generate_randomizer_factors(self, count: int) -> NDArray[np.float64]:
         """Generate sample of factors for randomizer.
 
         Parameters
@@ -109,43 +110,68 @@ class TimePatternInputPlugin(
         count : int
             Number of unique factors.
 
-        Yields
-        ------
-        float
-            Randomizer factor.
-
-        Notes
-        -----
-        Factors are shuffled each time the sample is exhausted.
+        Returns
+        -------
+        NDArray[np.float64]
+            Randomizer factors.
 
         """
         match self._config.randomizer.direction:
             case RandomizerDirection.DECREASE:
-                factors = self._rng.uniform(
-                    low=(1 - self._config.randomizer.deviation),
-                    high=1,
-                    size=count,
-                )
+                low = 1 - self._config.randomizer.deviation
+                high = 1.0
             case RandomizerDirection.INCREASE:
-                factors = self._rng.uniform(
-                    low=1,
-                    high=(1 + self._config.randomizer.deviation),
-                    size=count,
-                )
+                low = 1.0
+                high = 1 + self._config.randomizer.deviation
             case RandomizerDirection.MIXED:
-                factors = self._rng.uniform(
-                    low=(1 - self._config.randomizer.deviation),
-                    high=(1 + self._config.randomizer.deviation),
-                    size=count,
-                )
+                low = 1 - self._config.randomizer.deviation
+                high = 1 + self._config.randomizer.deviation
             case direction:
                 assert_never(direction)
 
-        while True:
-            for factor in factors:
-                yield float(factor)
+        return self._rng.uniform(low=low, high=high, size=count)
 
-            self._rng.shuffle(factors)
+    def _draw_randomizer_factors(self, count: int) -> NDArray[np.float64]:
+        """Draw next factors from the sample of randomizer factors.
+
+        Parameters
+        ----------
+        count : int
+            Number of factors to draw.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Drawn factors.
+
+        Notes
+        -----
+        Factors are shuffled each time the sample is exhausted.
+
+        """
+        parts: list[NDArray[np.float64]] = []
+
+        while count > 0:
+            available = self._randomizer_factors.size - (
+                self._randomizer_position
+            )
+            if available == 0:
+                self._rng.shuffle(self._randomizer_factors)
+                self._randomizer_position = 0
+                continue
+
+            drawn = min(count, available)
+            parts.append(
+                self._randomizer_factors[
+                    self._randomizer_position : self._randomizer_position
+                    + drawn
+                ],
+            )
+            self._randomizer_position += drawn
+            count -= drawn
+
+        # concatenation copies factors, so shuffling does not affect them
+        return np.concatenate(parts)
 
     @property
     def _period_duration(self) -> timedelta:
@@ -155,40 +181,35 @@ class TimePatternInputPlugin(
 
         return timedelta(**{unit: value})
 
-    @property
-    def _period_size(self) -> int:
-        """Number of time points in period.
+    def _draw_period_sizes(self, count: int) -> NDArray[np.int64]:
+        """Draw number of time points for each of the periods.
 
-        Notes
-        -----
-        Each time the property is accessed the value can be different
-        due to randomizer factor.
+        Parameters
+        ----------
+        count : int
+            Number of periods.
+
+        Returns
+        -------
+        NDArray[np.int64]
+            Number of time points for each period.
 
         """
-        return int(
-            self._config.multiplier.ratio * next(self._randomizer_factors),
-        )
+        factors = self._draw_randomizer_factors(count)
+        return (self._config.multiplier.ratio * factors).astype(np.int64)
 
-    def _generate_distribution(
-        self,
-        size: int,
-        duration: np.timedelta64,
-    ) -> NDArray[np.timedelta64]:
-        """Generate distribution of time points for one period where
-        each point is expressed as time from the beginning of the
-        period.
+    def _generate_distribution(self, size: int) -> NDArray[np.float64]:
+        """Generate unsorted distribution of time points within period
+        where each point is expressed as fraction of period duration.
 
         Parameters
         ----------
         size : int
             Size of distribution.
 
-        duration : numpy.timedelta64
-            Duration of period.
-
         Returns
         -------
-        NDArray[numpy.timedelta64]
+        NDArray[np.float64]
             Generated distribution.
 
         """
@@ -197,48 +218,58 @@ class TimePatternInputPlugin(
             case Distribution.UNIFORM:
                 low = params.low  # type: ignore[union-attr]
                 high = params.high  # type: ignore[union-attr]
-                array = np.sort(self._rng.uniform(low, high, size))
+                return self._rng.uniform(low, high, size)
             case Distribution.TRIANGULAR:
                 left = params.left  # type: ignore[union-attr]
                 mode = params.mode  # type: ignore[union-attr]
                 right = params.right  # type: ignore[union-attr]
-                array = np.sort(self._rng.triangular(left, mode, right, size))
+                return self._rng.triangular(left, mode, right, size)
             case Distribution.BETA:
                 a = params.a  # type: ignore[union-attr]
                 b = params.b  # type: ignore[union-attr]
-                array = np.sort(self._rng.beta(a, b, size))
+                return self._rng.beta(a, b, size)
             case val:
                 assert_never(val)
 
-        return array * duration
-
-    def _generate_period_timeseries(
+    def _generate_periods_timeseries(
         self,
         start: np.datetime64,
-        size: int,
+        count: int,
         duration: np.timedelta64,
     ) -> NDArray[np.datetime64]:
-        """Generate array of timestamps distributed within one
-        period.
+        """Generate array of timestamps distributed within several
+        consecutive periods.
 
         Parameters
         ----------
         start : numpy.datetime64
-            Start timestamp of period.
+            Start timestamp of the first period.
 
-        size : int
-            Number of timestamps in period.
+        count : int
+            Number of periods.
 
         duration : numpy.timedelta64
-            Duration of period.
+            Duration of one period.
 
         Returns
         -------
         NDArray[numpy.datetime64]
             Generated array of timestamps.
 
+        Notes
+        -----
+        Time points of all periods are drawn as one sample, then each
+        point is offset by index of its period and whole block is
+        sorted at once, so no work is performed per period in Python.
+
         """
-        return self._generate_distribution(size, duration) + start
+        sizes = self._draw_period_sizes(count)
+
+        points = self._generate_distribution(int(sizes.sum()))
+        points += np.repeat(np.arange(count, dtype=np.float64), sizes)
+        points.sort()
+
+        return points * duration + start
 
     @override
     def _generate(
@@ -286,49 +317,39 @@ class TimePatternInputPlugin(
         start = np.datetime64(to_naive(start_dt, self._timezone))
         end = np.datetime64(to_naive(end_dt, self._timezone))
 
-        timestamps = self._generate_period_timeseries(
-            start=start,
-            size=self._period_size,
-            duration=delta,
-        )
-        if skip_past:
-            # in case we are at period duration but all timestamps
-            # are spaced in start of the period
-            timestamps = get_future_slice(
-                timestamps=timestamps,
-                after=now64(self._timezone),
+        # number of periods in block is chosen to fill about one read
+        # of requested size
+        block_periods = -(-size // self._config.multiplier.ratio)
+        periods_left = int(-((start - end) // delta))
+
+        is_first_block = True
+        while periods_left > 0:
+            count = min(block_periods, periods_left)
+            timestamps = self._generate_periods_timeseries(
+                start=start,
+                count=count,
+                duration=delta,
             )
-            if timestamps.size == 0:
-                self._logger.info(
-                    'All timestamps are in past, nothing to generate',
+            start += delta * count
+            periods_left -= count
+
+            if skip_past and is_first_block:
+                # in case we are at period duration but all timestamps
+                # are spaced in start of the period
+                timestamps = get_future_slice(
+                    timestamps=timestamps,
+                    after=now64(self._timezone),
                 )
+            is_first_block = False
 
-        timestamps = get_past_slice(
-            timestamps=timestamps,
-            before=end,
-        )
+            timestamps = get_past_slice(timestamps=timestamps, before=end)
 
-        while True:
             if timestamps.size != 0:
                 self._buffer.mv_push(timestamps)
 
                 if self._buffer.size >= size:
                     yield from self._buffer.read(size, partial=False)
 
-            start += delta
-
-            if start >= end:
-                break
-
-            timestamps = get_past_slice(
-                timestamps=self._generate_period_timeseries(
-                    start=start,
-                    size=self._period_size,
-                    duration=delta,
-                ),
-                before=end,
-            )
-
         yield from self._buffer.read(size, partial=True)
 
 
@@ -1,14 +1,17 @@
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 from pytz import timezone
 
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.input.plugins.time_patterns.config import (
+    TimePatternConfig,
     TimePatternsInputPluginConfig,
 )
 from eventum.plugins.input.plugins.time_patterns.plugin import (
+    TimePatternInputPlugin,
     TimePatternsInputPlugin,
 )
 
@@ -65,3 +68,41 @@ def test_time_pattern_invalid_config():
         TimePatternsInputPlugin(
             config=config, params={'id': 1, 'timezone': timezone('UTC')}
         )
+
+
+@pytest.mark.parametrize('size', [1, 1000, 100_000])
+def test_time_pattern_periods(size):
+    config = TimePatternConfig.model_validate(
+        {
+            'label': 'test',
+            'oscillator': {
+                'period': 1,
+                'unit': 'minutes',
+                'start': '2024-01-01T00:00:00',
+                'end': '2024-01-01T10:00:30',
+            },
+            'multiplier': {'ratio': 50},
+            'randomizer': {'deviation': 0, 'direction': 'mixed'},
+            'spreader': {
+                'distribution': 'uniform',
+                'parameters': {'low': 0, 'high': 0.5},
+            },
+        }
+    )
+    plugin = TimePatternInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    timestamps = np.concatenate(list(plugin.generate(size, skip_past=False)))
+
+    assert np.all(np.diff(timestamps) >= np.timedelta64(0))
+
+    # last period is cut at end of the range
+    periods, counts = np.unique(
+        timestamps.astype('datetime64[m]'), return_counts=True
+    )
+    assert periods.size == 601
+    assert np.all(counts == 50)
+
+    offsets = timestamps - timestamps.astype('datetime64[m]')
+    assert np.all(offsets < np.timedelta64(30, 's'))
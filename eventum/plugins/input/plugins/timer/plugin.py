@@ -2,17 +2,23 @@
 
 from collections.abc import Iterator
 from datetime import datetime, timedelta
-from itertools import repeat
 from typing import override
 
-from numpy import datetime64
+import numpy as np
 from numpy.typing import NDArray
+from pytz import timezone
 
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.normalizers import normalize_versatile_datetime
 from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
-from eventum.plugins.input.utils.time_utils import skip_periods, to_naive
+from eventum.plugins.input.protocols import TimestampRuns
+from eventum.plugins.input.runs import TIMESTAMP_RUNS_DTYPE, batch_runs
+from eventum.plugins.input.utils.time_utils import (
+    skip_periods,
+    to_naive,
+    utc_to_naive,
+)
 
 
 class TimerInputPlugin(InputPlugin[TimerInputPluginConfig, InputPluginParams]):
@@ -28,13 +34,31 @@ class TimerInputPlugin(InputPlugin[TimerInputPluginConfig, InputPluginParams]):
     ) -> None:
         super().__init__(config, params)
 
-    @override
-    def _generate(
+    def _get_periods(
         self,
-        size: int,
         *,
-        skip_past: bool = True,
-    ) -> Iterator[NDArray[datetime64]]:
+        skip_past: bool,
+    ) -> tuple[np.datetime64, np.timedelta64, int, int] | None:
+        """Get periods of generation.
+
+        Parameters
+        ----------
+        skip_past : bool
+            Whether to skip past periods.
+
+        Returns
+        -------
+        tuple[np.datetime64, np.timedelta64, int, int] | None
+            Start in UTC, duration of period and numbers of first and
+            last periods to generate (both inclusive), or `None` if
+            there is nothing to generate.
+
+        Raises
+        ------
+        PluginGenerationError
+            If generation range cannot be determined.
+
+        """
         start = normalize_versatile_datetime(
             value=self._config.start,
             timezone=self._timezone,
@@ -81,7 +105,6 @@ class TimerInputPlugin(InputPlugin[TimerInputPluginConfig, InputPluginParams]):
             )
             skipped_periods = (timestamp - start) // timeout
         else:
-            timestamp = start
             skipped_periods = 0
 
         if (
@@ -91,27 +114,77 @@ class TimerInputPlugin(InputPlugin[TimerInputPluginConfig, InputPluginParams]):
             self._logger.info(
                 'All timestamps are in past, nothing to generate',
             )
+            return None
+
+        start_utc = np.datetime64(to_naive(start, timezone('UTC')), 'us')
+        end_utc = np.datetime64(to_naive(end, timezone('UTC')), 'us')
+        period = np.timedelta64(timeout, 'us')
+
+        first_period = skipped_periods + 1
+        if self._config.repeat is None:
+            last_period = int((end_utc - start_utc) // period)
+        else:
+            last_period = self._config.repeat
+
+        return start_utc, period, first_period, last_period
+
+    @override
+    def _generate(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[NDArray[np.datetime64]]:
+        periods_range = self._get_periods(skip_past=skip_past)
+        if periods_range is None:
             return
 
-        for _ in (
-            repeat(None)
-            if self._config.repeat is None
-            else range(max(self._config.repeat - skipped_periods, 0))
-        ):
-            try:
-                timestamp += timeout
-            except OverflowError:
-                break
-
-            self._buffer.m_push(
-                timestamp=datetime64(
-                    to_naive(timestamp, self._timezone).isoformat(),
-                    'us',
-                ),
-                multiply=self._config.count,
+        start_utc, period, first_period, last_period = periods_range
+
+        # i-th timestamp belongs to period `first_period + i // count`,
+        # so arrays of exact size are computed without buffering
+        total = max(last_period - first_period + 1, 0) * self._config.count
+        for position in range(0, total, size):
+            indices = np.arange(position, min(position + size, total))
+            periods = first_period + indices // self._config.count
+
+            yield utc_to_naive(
+                timestamps=start_utc + periods * period,
+                timezone=self._timezone,
             )
-            if self._buffer.size >= size:
-                yield from self._buffer.read(size, partial=False)
 
-        if self._buffer.size > 0:
-            yield from self._buffer.read(size, partial=True)
+    @override
+    def _generate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[TimestampRuns]:
+        periods_range = self._get_periods(skip_past=skip_past)
+        if periods_range is None:
+            return
+
+        start_utc, period, first_period, last_period = periods_range
+
+        # each period is a single run of `count` timestamps
+        block_periods = -(-size // self._config.count)
+
+        def generate_blocks() -> Iterator[TimestampRuns]:
+            for block_start in range(
+                first_period,
+                last_period + 1,
+                block_periods,
+            ):
+                periods = np.arange(
+                    block_start,
+                    min(block_start + block_periods, last_period + 1),
+                )
+                runs = np.empty(periods.size, dtype=TIMESTAMP_RUNS_DTYPE)
+                runs['timestamp'] = utc_to_naive(
+                    timestamps=start_utc + periods * period,
+                    timezone=self._timezone,
+                )
+                runs['count'] = self._config.count
+                yield runs
+
+        yield from batch_runs(generate_blocks(), size)
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+import numpy as np
 from numpy import datetime64
 from pytz import timezone
 
@@ -24,3 +25,74 @@ def test_plugin():
     assert len(timestamps) == (86400 * 3)
     assert timestamps[0] == datetime64('2024-01-01T00:00:01')
     assert timestamps[-1] == datetime64('2024-01-02T00:00:00')
+
+
+def test_plugin_batches_have_exact_size():
+    start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone('UTC'))
+
+    plugin = TimerInputPlugin(
+        config=TimerInputPluginConfig(
+            start=start, seconds=0.5, count=3, repeat=1000
+        ),
+        params={'id': 1, 'timezone': timezone('UTC')},
+    )
+
+    batches = list(plugin.generate(skip_past=False, size=7))
+
+    assert [batch.size for batch in batches[:-1]] == [7] * 428
+    assert batches[-1].size == 3000 - 428 * 7
+    assert list(batches[0]) == (
+        [datetime64('2024-01-01T00:00:00.5')] * 3
+        + [datetime64('2024-01-01T00:00:01')] * 3
+        + [datetime64('2024-01-01T00:00:01.5')]
+    )
+
+
+def test_plugin_over_dst_transition():
+    tz = timezone('Europe/Berlin')
+    start = tz.localize(datetime(2024, 3, 31, 1, 30, 0))
+
+    plugin = TimerInputPlugin(
+        config=TimerInputPluginConfig(
+            start=start, seconds=1800, count=1, repeat=3
+        ),
+        params={'id': 1, 'timezone': tz},
+    )
+
+    timestamps = []
+    for batch in plugin.generate(skip_past=False, size=100):
+        timestamps.extend(batch)
+
+    # wall clock is moved from 02:00 to 03:00
+    assert timestamps == [
+        datetime64('2024-03-31T03:00:00'),
+        datetime64('2024-03-31T03:30:00'),
+        datetime64('2024-03-31T04:00:00'),
+    ]
+
+
+def test_plugin_runs():
+    tz = timezone('Europe/Berlin')
+    start = tz.localize(datetime(2024, 3, 31, 0, 0, 0))
+
+    def create_plugin():
+        return TimerInputPlugin(
+            config=TimerInputPluginConfig(
+                start=start, seconds=1800, count=3, repeat=20
+            ),
+            params={'id': 1, 'timezone': tz},
+        )
+
+    plugin = create_plugin()
+    batches = list(plugin.generate_runs(skip_past=False, size=7))
+
+    assert [int(batch['count'].sum()) for batch in batches] == [7] * 8 + [4]
+    assert plugin.generated == 60
+
+    expected = np.concatenate(
+        list(create_plugin().generate(skip_past=False, size=7))
+    )
+    expanded = np.concatenate(
+        [np.repeat(batch['timestamp'], batch['count']) for batch in batches]
+    )
+    assert np.array_equal(expanded, expected)
@@ -13,7 +13,9 @@ class TimestampsInputPluginConfig(InputPluginConfig, frozen=True):
     ----------
     source : list[datetime] | Path
         List of timestamps or path to file with new line separated
-        timestamps in ISO8601 format.
+        timestamps in ISO8601 format. If file has `.npy` extension, then
+        it is expected to contain one dimensional numpy array of `int64`
+        microseconds since Unix epoch in UTC.
 
     Notes
     -----
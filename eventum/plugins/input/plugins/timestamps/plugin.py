@@ -3,24 +3,42 @@
 from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import override
+from typing import cast, override
 
-from numpy import array, astype, datetime64
+from numpy import array, datetime64
 from numpy.typing import NDArray
+from pytz import timezone
 
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
+from eventum.plugins.input.exceptions import PluginGenerationError
 from eventum.plugins.input.plugins.timestamps.config import (
     TimestampsInputPluginConfig,
 )
+from eventum.plugins.input.plugins.timestamps.reader import (
+    load_binary_timestamps,
+    read_text_timestamps,
+)
 from eventum.plugins.input.utils.array_utils import get_future_slice
-from eventum.plugins.input.utils.time_utils import now64, to_naive
+from eventum.plugins.input.utils.time_utils import (
+    now64,
+    to_naive,
+    utc_to_naive,
+)
 
 
 class TimestampsInputPlugin(
     InputPlugin[TimestampsInputPluginConfig, InputPluginParams],
 ):
-    """Input plugin for generating events at specified timestamps."""
+    """Input plugin for generating events at specified timestamps.
+
+    Notes
+    -----
+    Timestamps from text files are read and parsed in chunks during
+    generation, timestamps from `.npy` files are memory mapped, so
+    memory usage does not depend on size of the file.
+
+    """
 
     @override
     def __init__(
@@ -30,22 +48,36 @@ class TimestampsInputPlugin(
     ) -> None:
         super().__init__(config, params)
 
+        self._timestamps: NDArray[datetime64] | None = None
+        self._binary_timestamps: NDArray[datetime64] | None = None
+        self._path: Path | None = None
+
         if isinstance(config.source, Path):
-            self._logger.debug(
-                'Reading timestamps from the file',
-                file_path=str(config.source),
-            )
-            timestamps: list[datetime] = [
-                to_naive(ts, self._timezone)
-                for ts in self._read_timestamps_from_file(
-                    self.resolve_path(config.source),
+            self._path = self.resolve_path(config.source)
+            if self._path.suffix == '.npy':
+                self._logger.debug(
+                    'Mapping timestamps from the binary file',
+                    file_path=str(config.source),
+                )
+                self._binary_timestamps = self._load_binary_timestamps(
+                    self._path,
+                )
+                is_empty = self._binary_timestamps.size == 0
+            else:
+                self._logger.debug(
+                    'Checking timestamps of the file',
+                    file_path=str(config.source),
                 )
-            ]
+                is_empty = self._check_text_timestamps(self._path)
         else:
             self._logger.debug('Reading timestamps from configuration')
-            timestamps = [to_naive(ts, self._timezone) for ts in config.source]
+            self._timestamps = array(
+                [to_naive(ts, self._timezone) for ts in config.source],
+                dtype='datetime64[us]',
+            )
+            is_empty = self._timestamps.size == 0
 
-        if not timestamps:
+        if is_empty:
             msg = 'Timestamps sequence is empty'
             if isinstance(config.source, list):
                 context = {}
@@ -57,13 +89,40 @@ class TimestampsInputPlugin(
                 context=context,
             )
 
-        self._timestamps: NDArray[datetime64] = array(
-            timestamps,
-            dtype='datetime64[us]',
-        )
+    def _load_binary_timestamps(self, filename: Path) -> NDArray[datetime64]:
+        """Load timestamps from specified binary file.
 
-    def _read_timestamps_from_file(self, filename: Path) -> list[datetime]:
-        """Read timestamps from specified file.
+        Parameters
+        ----------
+        filename : Path
+            Path to `.npy` file with timestamps.
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Memory mapped array of timestamps in naive UTC time.
+
+        Raises
+        ------
+        PluginConfigurationError
+            If cannot load the specified file.
+
+        """
+        try:
+            return load_binary_timestamps(filename)
+        except (OSError, ValueError) as e:
+            msg = 'Failed to load timestamps from file'
+            raise PluginConfigurationError(
+                msg,
+                context={
+                    'file_path': str(filename),
+                    'reason': str(e),
+                },
+            ) from None
+
+    def _check_text_timestamps(self, filename: Path) -> bool:
+        """Check that timestamps of specified text file can be read by
+        reading the first chunk of timestamps.
 
         Parameters
         ----------
@@ -73,8 +132,8 @@ class TimestampsInputPlugin(
 
         Returns
         -------
-        list[datetime]
-            List of datetime objects.
+        bool
+            Whether the file has no timestamps.
 
         Raises
         ------
@@ -84,12 +143,8 @@ class TimestampsInputPlugin(
 
         """
         try:
-            with filename.open() as f:
-                return [
-                    datetime.fromisoformat(line.strip())
-                    for line in f.readlines()
-                    if line.strip()
-                ]
+            chunks = read_text_timestamps(filename, self._timezone)
+            return next(chunks, None) is None
         except (OSError, ValueError) as e:
             msg = 'Failed to read timestamps from file'
             raise PluginConfigurationError(
@@ -100,6 +155,12 @@ class TimestampsInputPlugin(
                 },
             ) from None
 
+    @property
+    @override
+    def is_blocking(self) -> bool:
+        # timestamps of files are read or paged in during generation
+        return self._path is not None
+
     @override
     def _generate(
         self,
@@ -107,25 +168,196 @@ class TimestampsInputPlugin(
         *,
         skip_past: bool = True,
     ) -> Iterator[NDArray[datetime64]]:
-        start = self._timezone.localize(
-            astype(self._timestamps[0], datetime),  # type: ignore[arg-type]
-        )
-        end = self._timezone.localize(
-            astype(self._timestamps[-1], datetime),  # type: ignore[arg-type]
-        )
+        if self._binary_timestamps is not None:
+            yield from self._generate_from_binary(
+                self._binary_timestamps,
+                size=size,
+                skip_past=skip_past,
+            )
+        elif self._timestamps is not None:
+            yield from self._generate_from_array(
+                self._timestamps,
+                size=size,
+                skip_past=skip_past,
+            )
+        else:
+            yield from self._generate_from_text(
+                cast('Path', self._path),
+                size=size,
+                skip_past=skip_past,
+            )
+
+    def _log_range(self, start: datetime64, end: datetime64) -> None:
+        """Log range of generation.
+
+        Parameters
+        ----------
+        start : datetime64
+            First timestamp in naive time of plugin timezone.
+
+        end : datetime64
+            Last timestamp in naive time of plugin timezone.
+
+        """
+        start_dt = self._timezone.localize(start.astype(datetime))
+        end_dt = self._timezone.localize(end.astype(datetime))
         self._logger.debug(
             'Generating in range',
-            start_timestamp=start.isoformat(),
-            end_timestamp=end.isoformat(),
+            start_timestamp=start_dt.isoformat(),
+            end_timestamp=end_dt.isoformat(),
         )
 
+    def _generate_from_array(
+        self,
+        timestamps: NDArray[datetime64],
+        size: int,
+        *,
+        skip_past: bool,
+    ) -> Iterator[NDArray[datetime64]]:
+        """Generate timestamps from array of configuration.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps in naive time of plugin timezone.
+
+        size : int
+            Number of timestamps to read from buffer.
+
+        skip_past : bool
+            Whether to skip past timestamps.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Array of timestamps.
+
+        """
+        self._log_range(timestamps[0], timestamps[-1])
+
         if skip_past:
             timestamps = get_future_slice(
-                timestamps=self._timestamps,
+                timestamps=timestamps,
                 after=now64(timezone=self._timezone),
             )
-        else:
-            timestamps = self._timestamps
 
         self._buffer.mv_push(timestamps)
         yield from self._buffer.read(size, partial=True)
+
+    def _generate_from_binary(
+        self,
+        timestamps: NDArray[datetime64],
+        size: int,
+        *,
+        skip_past: bool,
+    ) -> Iterator[NDArray[datetime64]]:
+        """Generate timestamps from memory mapped array.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Memory mapped timestamps in naive UTC time.
+
+        size : int
+            Number of timestamps in each generated array.
+
+        skip_past : bool
+            Whether to skip past timestamps.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Array of timestamps, if plugin timezone is UTC, then arrays
+            are slices of memory mapped array without copying.
+
+        """
+        utc = timezone('UTC')
+        bounds = utc_to_naive(timestamps[[0, -1]], self._timezone)
+        self._log_range(bounds[0], bounds[-1])
+
+        if skip_past:
+            timestamps = get_future_slice(
+                timestamps=timestamps,
+                after=now64(timezone=utc),
+            )
+
+        convert = self._timezone.zone != utc.zone
+
+        for position in range(0, timestamps.size, size):
+            chunk = timestamps[position : position + size]
+
+            if convert:
+                chunk = utc_to_naive(chunk, self._timezone)
+
+            yield chunk
+
+    def _generate_from_text(
+        self,
+        filename: Path,
+        size: int,
+        *,
+        skip_past: bool,
+    ) -> Iterator[NDArray[datetime64]]:
+        """Generate timestamps by reading text file in chunks.
+
+        Parameters
+        ----------
+        filename : Path
+            Path to file with timestamps that are delimited with new
+            line.
+
+        size : int
+            Number of timestamps to read from buffer.
+
+        skip_past : bool
+            Whether to skip past timestamps.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Array of timestamps.
+
+        Raises
+        ------
+        PluginGenerationError
+            If cannot read content of the file or parse timestamps.
+
+        """
+        self._logger.debug(
+            'Generating from file',
+            file_path=str(filename),
+        )
+
+        now = now64(timezone=self._timezone) if skip_past else None
+
+        try:
+            for chunk in read_text_timestamps(filename, self._timezone):
+                timestamps = chunk
+
+                # file is sorted, so past timestamps can be only in the
+                # beginning of it
+                if now is not None:
+                    timestamps = get_future_slice(
+                        timestamps=timestamps,
+                        after=now,
+                    )
+                    if timestamps.size == 0:
+                        continue
+                    now = None
+
+                self._buffer.mv_push(timestamps)
+
+                if self._buffer.size >= size:
+                    yield from self._buffer.read(size, partial=False)
+        except (OSError, ValueError) as e:
+            msg = 'Failed to read timestamps from file'
+            raise PluginGenerationError(
+                msg,
+                context={
+                    'file_path': str(filename),
+                    'reason': str(e),
+                },
+            ) from None
+
+        if self._buffer.size > 0:
+            yield from self._buffer.read(size, partial=True)
@@ -0,0 +1,220 @@
+"""Readers of timestamps from files for streaming generation."""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+from pytz import BaseTzInfo
+
+from eventum.plugins.input.utils.time_utils import to_naive, utc_to_naive
+
+# approximate number of bytes of lines parsed at once
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# length of UTC offset suffix in format `+HH:MM`
+OFFSET_LENGTH = 6
+
+
+def _parse_with_offsets(lines: NDArray[np.bytes_]) -> NDArray[np.datetime64]:
+    """Parse stripped non empty ISO8601 timestamps with UTC offsets
+    (`Z` or `+HH:MM`) using fixed width representation of lines.
+
+    Parameters
+    ----------
+    lines : NDArray[np.bytes_]
+        Lines to parse.
+
+    Returns
+    -------
+    NDArray[np.datetime64]
+        Timestamps in naive UTC time.
+
+    Raises
+    ------
+    ValueError
+        If some of the lines are without UTC offset or cannot be
+        parsed.
+
+    """
+    lengths = np.strings.str_len(lines)
+    width = lines.dtype.itemsize
+    rows = np.arange(lines.size)
+
+    chars = lines.view(np.uint8).reshape(lines.size, width).copy()
+
+    is_utc = chars[rows, lengths - 1] == ord('Z')
+
+    offset_positions = np.maximum(lengths - OFFSET_LENGTH, 0)
+    signs = chars[rows, offset_positions]
+    has_offset = (
+        (lengths > OFFSET_LENGTH)
+        & ((signs == ord('+')) | (signs == ord('-')))
+        & (chars[rows, np.maximum(lengths - 3, 0)] == ord(':'))
+    )
+
+    if not np.all(is_utc | has_offset):
+        msg = 'Some of the timestamps are without UTC offset'
+        raise ValueError(msg)
+
+    # digits of offset hours and minutes in format `+HH:MM`
+    digit_positions = np.minimum(
+        offset_positions[:, np.newaxis] + [1, 2, 4, 5],
+        width - 1,
+    )
+    digits = chars[rows[:, np.newaxis], digit_positions].astype(np.int64)
+    digits -= ord('0')
+    digits[~has_offset] = 0
+
+    if np.any((digits < 0) | (digits > 9)):  # noqa: PLR2004
+        msg = 'Invalid UTC offset'
+        raise ValueError(msg)
+
+    minutes = (digits[:, 0] * 10 + digits[:, 1]) * 60 + (
+        digits[:, 2] * 10 + digits[:, 3]
+    )
+    minutes = np.where(signs == ord('-'), -minutes, minutes)
+
+    # offset suffixes are cut by filling them with null bytes
+    local_lengths = np.where(has_offset, offset_positions, lengths - 1)
+    chars[np.arange(width) >= local_lengths[:, np.newaxis]] = 0
+
+    local = chars.view(f'S{width}').ravel().astype('datetime64[us]')
+    offsets = minutes.astype('timedelta64[m]')
+
+    return local - offsets  # type: ignore[no-any-return]
+
+
+def parse_timestamps(
+    lines: list[bytes],
+    timezone: BaseTzInfo,
+) -> NDArray[np.datetime64]:
+    """Parse ISO8601 timestamps.
+
+    Parameters
+    ----------
+    lines : list[bytes]
+        Lines with timestamps, empty lines are skipped.
+
+    timezone : BaseTzInfo
+        Timezone to convert timestamps to.
+
+    Returns
+    -------
+    NDArray[np.datetime64]
+        Timestamps in naive time of timezone.
+
+    Raises
+    ------
+    ValueError
+        If some of the timestamps cannot be parsed.
+
+    Notes
+    -----
+    Timestamps with UTC offsets are parsed vectorized, if lines contain
+    timestamps without offset or in format that is not supported by
+    vectorized parsing, then lines are parsed one by one.
+
+    """
+    stripped: NDArray[np.bytes_] = np.strings.strip(  # type: ignore[assignment]
+        np.array(lines, dtype=np.bytes_),
+    )
+    stripped = stripped[np.strings.str_len(stripped) > 0]
+
+    if stripped.size == 0:
+        return np.empty(0, dtype='datetime64[us]')
+
+    try:
+        return utc_to_naive(_parse_with_offsets(stripped), timezone)
+    except ValueError:
+        pass
+
+    return np.array(
+        [
+            to_naive(datetime.fromisoformat(line.decode().strip()), timezone)
+            for line in lines
+            if line.strip()
+        ],
+        dtype='datetime64[us]',
+    )
+
+
+def read_text_timestamps(
+    path: Path,
+    timezone: BaseTzInfo,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[NDArray[np.datetime64]]:
+    """Read new line separated ISO8601 timestamps from file in chunks.
+
+    Parameters
+    ----------
+    path : Path
+        Path to file.
+
+    timezone : BaseTzInfo
+        Timezone to convert timestamps to.
+
+    chunk_size : int, default=CHUNK_SIZE
+        Approximate number of bytes to read and parse at once.
+
+    Yields
+    ------
+    NDArray[np.datetime64]
+        Non empty array of timestamps in naive time of timezone.
+
+    Raises
+    ------
+    OSError
+        If file cannot be read.
+
+    ValueError
+        If some of the timestamps cannot be parsed.
+
+    """
+    with path.open('rb') as f:
+        while lines := f.readlines(chunk_size):
+            timestamps = parse_timestamps(lines, timezone)
+
+            if timestamps.size > 0:
+                yield timestamps
+
+
+def load_binary_timestamps(path: Path) -> NDArray[np.datetime64]:
+    """Load timestamps from `.npy` file as memory mapped array.
+
+    Parameters
+    ----------
+    path : Path
+        Path to file with one dimensional array of `int64` microseconds
+        since Unix epoch (or `datetime64[us]`) in UTC.
+
+    Returns
+    -------
+    NDArray[np.datetime64]
+        Memory mapped array of timestamps in naive UTC time.
+
+    Raises
+    ------
+    OSError
+        If file cannot be read.
+
+    ValueError
+        If file has invalid format or array has unsupported shape or
+        data type.
+
+    """
+    array = np.load(path, mmap_mode='r', allow_pickle=False)
+
+    if array.ndim != 1:
+        msg = f'Array must be one dimensional, but got {array.ndim} dims'
+        raise ValueError(msg)
+
+    if array.dtype not in (np.dtype(np.int64), np.dtype('datetime64[us]')):
+        msg = (
+            'Array must be of `int64` or `datetime64[us]` data type, '
+            f'but got `{array.dtype}`'
+        )
+        raise ValueError(msg)
+
+    return array.view('datetime64[us]')
@@ -1,11 +1,14 @@
 import os
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from numpy import datetime64
 from pytz import timezone
 
+from eventum.plugins.exceptions import PluginConfigurationError
+
 from eventum.plugins.input.plugins.timestamps.config import (
     TimestampsInputPluginConfig,
 )
@@ -34,6 +37,7 @@ def test_plugin():
         datetime64('2024-01-01T00:00:00.050'),
         datetime64('2024-01-01T00:00:00.100'),
     ]
+    assert not plugin.is_blocking
 
 
 @pytest.fixture
@@ -52,6 +56,7 @@ def test_timestamps_from_file(timestamps_filename):
     plugin = TimestampsInputPlugin(
         config=config, params={'id': 1, 'timezone': timezone('Europe/Moscow')}
     )
+    assert plugin.is_blocking
 
     timestamps = []
     for batch in plugin.generate(size=100, skip_past=False):
@@ -62,3 +67,86 @@ def test_timestamps_from_file(timestamps_filename):
         datetime64('2024-01-01T03:00:00.050'),
         datetime64('2024-01-01T03:00:00.100'),
     ]
+
+
+def test_timestamps_from_file_skip_past(tmp_path):
+    now = datetime.now().astimezone(timezone('UTC'))
+    path = tmp_path / 'timestamps.log'
+    path.write_text(
+        ''.join(
+            f'{(now + timedelta(hours=hours)).isoformat()}\n'
+            for hours in range(-5, 5)
+        )
+    )
+
+    config = TimestampsInputPluginConfig(source=path)
+    plugin = TimestampsInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    timestamps = np.concatenate(list(plugin.generate(size=2)))
+
+    assert timestamps.size == 4
+    assert timestamps[0] == datetime64(
+        (now + timedelta(hours=1)).replace(tzinfo=None)
+    )
+
+
+def test_timestamps_from_empty_file(tmp_path):
+    path = tmp_path / 'timestamps.log'
+    path.write_text('\n\n')
+
+    with pytest.raises(PluginConfigurationError):
+        TimestampsInputPlugin(
+            config=TimestampsInputPluginConfig(source=path),
+            params={'id': 1, 'timezone': timezone('UTC')},
+        )
+
+
+def test_timestamps_from_invalid_file(tmp_path):
+    path = tmp_path / 'timestamps.log'
+    path.write_text('2024-01-01T00:00:00Z\ninvalid\n')
+
+    with pytest.raises(PluginConfigurationError):
+        TimestampsInputPlugin(
+            config=TimestampsInputPluginConfig(source=path),
+            params={'id': 1, 'timezone': timezone('UTC')},
+        )
+
+
+@pytest.fixture
+def binary_timestamps_filename(tmp_path):
+    path = tmp_path / 'timestamps.npy'
+    start = datetime64('2024-01-01T00:00:00', 'us').astype(np.int64)
+    np.save(path, start + np.arange(10, dtype=np.int64) * 1_000_000)
+
+    return path
+
+
+def test_timestamps_from_binary_file(binary_timestamps_filename):
+    config = TimestampsInputPluginConfig(source=binary_timestamps_filename)
+    plugin = TimestampsInputPlugin(
+        config=config, params={'id': 1, 'timezone': timezone('UTC')}
+    )
+
+    batches = list(plugin.generate(size=4, skip_past=False))
+
+    assert [batch.size for batch in batches] == [4, 4, 2]
+
+    # batches are slices of memory mapped file
+    assert all(isinstance(batch.base, np.memmap) for batch in batches)
+    assert batches[0][0] == datetime64('2024-01-01T00:00:00')
+    assert batches[-1][-1] == datetime64('2024-01-01T00:00:09')
+
+
+def test_timestamps_from_binary_file_in_other_tz(binary_timestamps_filename):
+    config = TimestampsInputPluginConfig(source=binary_timestamps_filename)
+    plugin = TimestampsInputPlugin(
+        config=config,
+        params={'id': 1, 'timezone': timezone('Europe/Moscow')},
+    )
+
+    timestamps = np.concatenate(list(plugin.generate(size=4, skip_past=False)))
+
+    assert timestamps.size == 10
+    assert timestamps[0] == datetime64('2024-01-01T03:00:00')
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from pytz import timezone
+
+from eventum.plugins.input.plugins.timestamps.reader import (
+    load_binary_timestamps,
+    parse_timestamps,
+    read_text_timestamps,
+)
+from eventum.plugins.input.utils.time_utils import to_naive
+
+LINES = [
+    b'2024-01-01T00:00:00Z\n',
+    b'2024-01-01T03:00:00.5+03:00\n',
+    b'2024-01-01 00:00:01.250-05:30\n',
+    b'\n',
+    b'  2024-07-01T00:00:00.000001+00:00  \n',
+]
+
+
+@pytest.mark.parametrize('tz', ['UTC', 'Europe/Berlin', 'Asia/Kolkata'])
+def test_parse_timestamps(tz):
+    tz = timezone(tz)
+
+    expected = np.array(
+        [
+            to_naive(datetime.fromisoformat(line.decode().strip()), tz)
+            for line in LINES
+            if line.strip()
+        ],
+        dtype='datetime64[us]',
+    )
+
+    assert np.array_equal(parse_timestamps(LINES, tz), expected)
+
+
+def test_parse_invalid_timestamps():
+    with pytest.raises(ValueError):
+        parse_timestamps(
+            [b'2024-01-01T00:00:00Z', b'invalid'], timezone('UTC')
+        )
+
+
+def test_read_text_timestamps(tmp_path):
+    path = tmp_path / 'timestamps.log'
+    path.write_bytes(b''.join(LINES * 10))
+
+    chunks = list(read_text_timestamps(path, timezone('UTC'), chunk_size=64))
+
+    assert len(chunks) > 1
+    assert np.array_equal(
+        np.concatenate(chunks),
+        np.tile(parse_timestamps(LINES, timezone('UTC')), 10),
+    )
+
+
+def test_load_binary_timestamps(tmp_path):
+    path = tmp_path / 'timestamps.npy'
+    np.save(path, np.array([0, 1_000_000], dtype=np.int64))
+
+    timestamps = load_binary_timestamps(path)
+
+    assert isinstance(timestamps.base, np.memmap)
+    assert timestamps.tolist() == [
+        datetime(1970, 1, 1, 0, 0, 0),
+        datetime(1970, 1, 1, 0, 0, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    'array',
+    [
+        np.zeros((2, 2), dtype=np.int64),
+        np.zeros(2, dtype=np.float64),
+    ],
+)
+def test_load_invalid_binary_timestamps(tmp_path, array):
+    path = tmp_path / 'timestamps.npy'
+    np.save(path, array)
+
+    with pytest.raises(ValueError):
+        load_binary_timestamps(path)
@@ -12,6 +12,20 @@ type IdentifiedTimestamps = Annotated[
     NDArray,
     np.dtype([('timestamp', 'datetime64[us]'), ('id', 'uint16')]),
 ]
+type TimestampRuns = Annotated[
+    NDArray,
+    np.dtype([('timestamp', 'datetime64[us]'), ('count', 'uint32')]),
+]
+type IdentifiedTimestampRuns = Annotated[
+    NDArray,
+    np.dtype(
+        [
+            ('timestamp', 'datetime64[us]'),
+            ('id', 'uint16'),
+            ('count', 'uint32'),
+        ],
+    ),
+]
 
 
 class SupportsIdentifiedTimestampsSizedIterate(Protocol):
@@ -51,6 +65,37 @@ class SupportsIdentifiedTimestampsSizedIterate(Protocol):
         """
         ...
 
+    def iterate_runs(
+        self,
+        size: int,
+        *,
+        skip_past: bool = True,
+    ) -> Iterator[IdentifiedTimestampRuns]:
+        """Iterate over arrays of identified timestamp runs.
+
+        Parameters
+        ----------
+        size : int
+            Number of timestamps (i.e. sum of run counts) to yield for
+            each iteration. Actual number can be lower than specified.
+            See `generate_runs` method of `InputPlugin` for details.
+
+        skip_past : bool, default=True
+            Whether to skip past timestamps before starting iteration.
+
+        Yields
+        ------
+        IdentifiedTimestampRuns
+            Array of timestamp runs with plugin ids.
+
+        Raises
+        ------
+        ValueError
+            If parameter `size` is less than 1.
+
+        """
+        ...
+
 
 class SupportsIdentifiedTimestampsIterate(Protocol):
     """Protocol for iterating over identified timestamps. Defines an
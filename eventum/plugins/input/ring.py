@@ -0,0 +1,161 @@
+"""Ring of preallocated blocks for identified timestamps arrays that
+allows to pass arrays between pipeline stages without reallocating
+memory for each of them.
+"""
+
+import weakref
+from collections import deque
+
+import numpy as np
+
+from eventum.plugins.input.protocols import IdentifiedTimestamps
+
+IDENTIFIED_TIMESTAMPS_DTYPE = np.dtype(
+    [('timestamp', 'datetime64[us]'), ('id', 'uint16')],
+)
+
+
+class BlocksRing:
+    """Ring of preallocated blocks of identified timestamps.
+
+    Arrays are acquired as leases of free ring blocks. Each acquired
+    array is the only owner of its block, all views of the array (e.g.
+    slices made in any stage of the pipeline) reference it instead of
+    the block. Block is returned to the ring by finalizer of the
+    acquired array when the array and all its views are garbage
+    collected, so consumers do not release arrays explicitly and never
+    observe overwritten data.
+
+    Notes
+    -----
+    Blocks are allocated lazily until ring capacity is reached. If all
+    blocks are in use or requested size exceeds block size, then array
+    is allocated outside of the ring.
+
+    Ring is not thread safe for acquiring, only one producer must
+    acquire arrays from the ring. Arrays can be released in any thread.
+
+    """
+
+    def __init__(self, block_size: int, capacity: int = 16) -> None:
+        """Initialize ring.
+
+        Parameters
+        ----------
+        block_size : int
+            Size of each block.
+
+        capacity : int, default=16
+            Maximum number of blocks in the ring.
+
+        Raises
+        ------
+        ValueError
+            If some parameter is less than 1.
+
+        """
+        if block_size < 1:
+            msg = 'Parameter `block_size` must be greater or equal to 1'
+            raise ValueError(msg)
+
+        if capacity < 1:
+            msg = 'Parameter `capacity` must be greater or equal to 1'
+            raise ValueError(msg)
+
+        self._block_size = block_size
+        self._capacity = capacity
+
+        # raw memory of blocks, blocks are exposed only through leases
+        self._blocks: list[memoryview] = []
+
+        # indices of blocks that are not leased, appending and popping
+        # of deque are thread safe, so blocks can be released by
+        # finalizers in any thread
+        self._free: deque[int] = deque()
+
+    def _allocate(self, size: int | None = None) -> IdentifiedTimestamps:
+        """Allocate new array.
+
+        Parameters
+        ----------
+        size : int | None, default=None
+            Size of array, block size is used if value is `None`.
+
+        Returns
+        -------
+        IdentifiedTimestamps
+            Allocated array.
+
+        """
+        return np.empty(
+            shape=self._block_size if size is None else size,
+            dtype=IDENTIFIED_TIMESTAMPS_DTYPE,
+        )
+
+    def _lease(self, index: int, size: int) -> IdentifiedTimestamps:
+        """Lease block of the ring.
+
+        Parameters
+        ----------
+        index : int
+            Index of the block.
+
+        size : int
+            Size of leased array.
+
+        Returns
+        -------
+        IdentifiedTimestamps
+            Array that owns the block until it is garbage collected.
+
+        """
+        # array created over memory view is the base of all its views,
+        # unlike slices of array that reference the array they are
+        # made of
+        array = np.frombuffer(
+            self._blocks[index],
+            dtype=IDENTIFIED_TIMESTAMPS_DTYPE,
+            count=size,
+        )
+        weakref.finalize(array, self._free.append, index)
+
+        return array
+
+    def acquire(self, size: int) -> IdentifiedTimestamps:
+        """Acquire uninitialized array of specified size.
+
+        Parameters
+        ----------
+        size : int
+            Size of array.
+
+        Returns
+        -------
+        IdentifiedTimestamps
+            Array that is a lease of free ring block or newly
+            allocated array if there are no free blocks.
+
+        """
+        if size > self._block_size:
+            return self._allocate(size)
+
+        try:
+            index = self._free.popleft()
+        except IndexError:
+            if len(self._blocks) >= self._capacity:
+                return self._allocate(size)
+
+            self._blocks.append(memoryview(self._allocate().view(np.uint8)))
+            index = len(self._blocks) - 1
+
+        return self._lease(index, size)
+
+    @property
+    def block_size(self) -> int:
+        """Size of each block."""
+        return self._block_size
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of blocks in the ring."""
+        return self._capacity
@@ -0,0 +1,264 @@
+"""Run-length representation of timestamps where each element of array
+is a timestamp with number of its repetitions. The representation is
+used to pass large number of equal timestamps through the pipeline
+without materializing them until events are produced.
+"""
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from eventum.plugins.input.protocols import (
+    IdentifiedTimestampRuns,
+    IdentifiedTimestamps,
+    TimestampRuns,
+)
+from eventum.plugins.input.ring import IDENTIFIED_TIMESTAMPS_DTYPE
+
+TIMESTAMP_RUNS_DTYPE = np.dtype(
+    [('timestamp', 'datetime64[us]'), ('count', 'uint32')],
+)
+IDENTIFIED_TIMESTAMP_RUNS_DTYPE = np.dtype(
+    [('timestamp', 'datetime64[us]'), ('id', 'uint16'), ('count', 'uint32')],
+)
+
+
+def encode_runs(timestamps: NDArray[np.datetime64]) -> TimestampRuns:
+    """Encode timestamps to runs of consecutive equal values.
+
+    Parameters
+    ----------
+    timestamps : NDArray[np.datetime64]
+        Timestamps to encode.
+
+    Returns
+    -------
+    TimestampRuns
+        Encoded runs.
+
+    """
+    if timestamps.size == 0:
+        return np.empty(0, dtype=TIMESTAMP_RUNS_DTYPE)
+
+    starts = np.flatnonzero(timestamps[1:] != timestamps[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+
+    runs = np.empty(starts.size, dtype=TIMESTAMP_RUNS_DTYPE)
+    runs['timestamp'] = timestamps[starts]
+    runs['count'] = np.diff(np.append(starts, timestamps.size))
+
+    return runs
+
+
+def expand_runs(runs: IdentifiedTimestampRuns) -> IdentifiedTimestamps:
+    """Expand runs to identified timestamps.
+
+    Parameters
+    ----------
+    runs : IdentifiedTimestampRuns
+        Runs to expand.
+
+    Returns
+    -------
+    IdentifiedTimestamps
+        Expanded timestamps.
+
+    """
+    timestamps = np.empty(
+        count_timestamps(runs),
+        dtype=IDENTIFIED_TIMESTAMPS_DTYPE,
+    )
+    timestamps['timestamp'] = np.repeat(runs['timestamp'], runs['count'])
+    timestamps['id'] = np.repeat(runs['id'], runs['count'])
+
+    return timestamps
+
+
+def is_runs(array: NDArray) -> bool:
+    """Check whether the array is array of runs.
+
+    Parameters
+    ----------
+    array : NDArray
+        Array to check.
+
+    Returns
+    -------
+    bool
+        `True` if array is array of runs, `False` otherwise.
+
+    """
+    return array.dtype.names is not None and 'count' in array.dtype.names
+
+
+def count_timestamps(runs: NDArray) -> int:
+    """Count timestamps in runs.
+
+    Parameters
+    ----------
+    runs : NDArray
+        Runs with `count` field.
+
+    Returns
+    -------
+    int
+        Total number of timestamps.
+
+    """
+    return int(runs['count'].sum())
+
+
+class RunsCursor:
+    """Cursor over array of runs that takes consecutive parts of it.
+
+    Notes
+    -----
+    Cumulative counts of runs are computed once, so taking each part
+    requires binary search and copying of only the taken runs instead
+    of processing the whole rest of array.
+
+    """
+
+    def __init__(self, runs: NDArray) -> None:
+        """Initialize cursor.
+
+        Parameters
+        ----------
+        runs : NDArray
+            Runs with `count` field.
+
+        """
+        self._runs = runs
+        self._cumulative = np.cumsum(runs['count'], dtype=np.int64)
+        self._total = int(self._cumulative[-1]) if runs.size > 0 else 0
+
+        # index of first run that is not taken completely and number
+        # of timestamps taken from the beginning of the array
+        self._index = 0
+        self._taken = 0
+
+    def take(self, size: int | None = None, end: int | None = None) -> NDArray:
+        """Take next part of runs.
+
+        Parameters
+        ----------
+        size : int | None, default=None
+            Maximum number of timestamps in the part, if value is
+            `None`, then number of timestamps is not limited.
+
+        end : int | None, default=None
+            Index of run in the array before which the part must end,
+            if value is `None`, then part can end at the end of array.
+
+        Returns
+        -------
+        NDArray
+            Part of runs, if its boundaries are inside of runs, then
+            counts of these runs are reduced in the part.
+
+        """
+        end = self._runs.size if end is None else min(end, self._runs.size)
+        if end <= self._index or size == 0:
+            return self._runs[self._index : self._index]
+
+        target = int(self._cumulative[end - 1])
+        if size is not None:
+            target = min(target, self._taken + size)
+
+        last = int(np.searchsorted(self._cumulative, target, side='left'))
+
+        # runs that are partially taken before or after the part have
+        # reduced counts, so part is copied only in this case
+        before = self._taken - (
+            int(self._cumulative[self._index - 1]) if self._index > 0 else 0
+        )
+        after = int(self._cumulative[last]) - target
+
+        part = self._runs[self._index : last + 1]
+        if before > 0 or after > 0:
+            part = part.copy()
+            part['count'][0] -= before
+            part['count'][-1] -= after
+
+        self._index = last if after > 0 else last + 1
+        self._taken = target
+
+        return part
+
+    @property
+    def index(self) -> int:
+        """Index of first run that is not taken completely."""
+        return self._index
+
+    @property
+    def timestamps(self) -> NDArray[np.datetime64]:
+        """Timestamps of runs that are not taken completely."""
+        return self._runs['timestamp'][self._index :]
+
+    @property
+    def remaining(self) -> int:
+        """Number of timestamps that are not taken."""
+        return self._total - self._taken
+
+
+def split_runs(runs: NDArray, size: int) -> tuple[NDArray, NDArray]:
+    """Split runs so that the first part contains specified number of
+    timestamps.
+
+    Parameters
+    ----------
+    runs : NDArray
+        Runs with `count` field to split.
+
+    size : int
+        Number of timestamps in the first part, if runs contain less
+        timestamps, then all runs are in the first part.
+
+    Returns
+    -------
+    tuple[NDArray, NDArray]
+        First and second parts of runs, if boundary is inside of run,
+        then the run is divided between the parts.
+
+    """
+    cursor = RunsCursor(runs)
+    return cursor.take(size), cursor.take()
+
+
+def batch_runs(arrays: Iterable[NDArray], size: int) -> Iterator[NDArray]:
+    """Rebatch arrays of runs to arrays with exactly specified number
+    of timestamps.
+
+    Parameters
+    ----------
+    arrays : Iterable[NDArray]
+        Arrays of runs with `count` field.
+
+    size : int
+        Number of timestamps in each produced array, the last array
+        can contain less timestamps.
+
+    Yields
+    ------
+    NDArray
+        Array of runs.
+
+    """
+    pending: list[NDArray] = []
+    pending_size = 0
+
+    for array in arrays:
+        cursor = RunsCursor(array)
+        while cursor.remaining > 0:
+            head = cursor.take(size - pending_size)
+            pending.append(head)
+            pending_size += count_timestamps(head)
+
+            if pending_size == size:
+                yield np.concatenate(pending)
+                pending.clear()
+                pending_size = 0
+
+    if pending:
+        yield np.concatenate(pending)
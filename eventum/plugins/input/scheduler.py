@@ -5,8 +5,9 @@ correspond to the value of those timestamps.
 import asyncio
 import time
 from collections.abc import AsyncIterator, Iterator
-from typing import TYPE_CHECKING, override
+from typing import override
 
+import numpy as np
 from pytz import BaseTzInfo
 
 from eventum.plugins.input.protocols import (
@@ -19,61 +20,121 @@ from eventum.plugins.input.utils.time_utils import (
     timedelta64_to_seconds,
 )
 
-if TYPE_CHECKING:
-    import numpy as np
-
 
 class BaseBatchScheduler:
     """Scheduler of timestamp batches. Scheduler iterates over batches
     of timestamps and does not yield them immediately, but it waits
     until current time reaches the last timestamp in the batch.
+
+    If slice duration is set, then each batch is divided into slices
+    of timestamps that fall into consecutive time windows of that
+    duration and each slice is released when current time reaches its
+    last timestamp, so timestamps are published as smooth stream
+    instead of bursts of whole batches.
+
+    Notes
+    -----
+    Clocks are matched once per batch: moments of releasing slices are
+    computed as deadlines on monotonic clock, so oversleeping or slow
+    consumer of one slice does not shift releasing of next ones, while
+    matching clocks for each batch follows adjustments of wall clock.
+
     """
 
     def __init__(
         self,
-        source: SupportsIdentifiedTimestampsIterate,
         timezone: BaseTzInfo,
+        slice_duration: float | None = None,
     ) -> None:
         """Initialize scheduler.
 
         Parameters
         ----------
-        source : SupportsIdentifiedTimestampsIterate
-            Timestamps source.
-
         timezone : BaseTzInfo, default=pytz.timezone('UTC')
             Timezone of timestamps in batches, used to match timestamps
             with current time.
 
+        slice_duration : float | None, default=None
+            Duration (in seconds) of time slices in which timestamps of
+            batch are released, if value is `None`, then whole batch is
+            released at once.
+
+        Raises
+        ------
+        ValueError
+            If slice duration is not positive.
+
         """
-        self._source = source
+        if slice_duration is not None and slice_duration <= 0:
+            msg = 'Slice duration must be greater than 0'
+            raise ValueError(msg)
+
         self._timezone = timezone
+        self._slice_duration = (
+            None
+            if slice_duration is None
+            else np.timedelta64(round(slice_duration * 1_000_000), 'us')
+        )
 
-    def _iterate(
+    def _slice(
         self,
-        *,
-        skip_past: bool = True,
+        array: IdentifiedTimestamps,
+    ) -> Iterator[IdentifiedTimestamps]:
+        """Slice array of timestamps by time windows.
+
+        Parameters
+        ----------
+        array : IdentifiedTimestamps
+            Array to slice.
+
+        Yields
+        ------
+        IdentifiedTimestamps
+            Non empty slice of array.
+
+        """
+        if self._slice_duration is None or array.size == 0:
+            yield array
+            return
+
+        timestamps = array['timestamp']
+        windows = (timestamps - timestamps[0]) // self._slice_duration
+        bounds = np.flatnonzero(windows[1:] != windows[:-1]) + 1
+
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [array.size]))
+
+        for start, end in zip(starts, ends, strict=True):
+            yield array[start:end]
+
+    def _schedule(
+        self,
+        array: IdentifiedTimestamps,
     ) -> Iterator[tuple[IdentifiedTimestamps, float]]:
-        """Iterate over arrays of identified timestamps.
+        """Schedule publishing of array of identified timestamps.
 
         Parameters
         ----------
-        skip_past : bool, default=True
-            Whether to skip past timestamps before starting iteration.
+        array : IdentifiedTimestamps
+            Array of timestamps received from source.
 
         Yields
         ------
         tuple[IdentifiedTimestamps, float]
-            Array of timestamps and number of seconds to wait before it
+            Slice of array and number of seconds to wait before it
             should be published.
 
         """
-        for array in self._source.iterate(skip_past=skip_past):
-            now = now64(self._timezone)
-            latest_ts: np.datetime64 = array['timestamp'][-1]
-            delta = latest_ts - now
+        reference = time.monotonic()
+        now = now64(self._timezone)
+
+        for part in self._slice(array):
+            latest_ts: np.datetime64 = part['timestamp'][-1]
+            deadline = reference + timedelta64_to_seconds(
+                timedelta=latest_ts - now,
+            )
 
-            yield (array, max(timedelta64_to_seconds(timedelta=delta), 0))
+            yield (part, max(deadline - time.monotonic(), 0))
 
 
 class BatchScheduler(SupportsIdentifiedTimestampsIterate, BaseBatchScheduler):
@@ -90,8 +151,10 @@ class BatchScheduler(SupportsIdentifiedTimestampsIterate, BaseBatchScheduler):
         self,
         source: SupportsIdentifiedTimestampsIterate,
         timezone: BaseTzInfo,
+        slice_duration: float | None = None,
     ) -> None:
-        BaseBatchScheduler.__init__(self, source, timezone)
+        BaseBatchScheduler.__init__(self, timezone, slice_duration)
+        self._source = source
 
     @override
     def iterate(
@@ -99,9 +162,10 @@ class BatchScheduler(SupportsIdentifiedTimestampsIterate, BaseBatchScheduler):
         *,
         skip_past: bool = True,
     ) -> Iterator[IdentifiedTimestamps]:
-        for array, delay in self._iterate(skip_past=skip_past):
-            time.sleep(delay)
-            yield array
+        for array in self._source.iterate(skip_past=skip_past):
+            for part, delay in self._schedule(array):
+                time.sleep(delay)
+                yield part
 
 
 class AsyncBatchScheduler(
@@ -112,17 +176,21 @@ class AsyncBatchScheduler(
 
     Notes
     -----
-    See `BaseBatchScheduler` documentation.
+    See `BaseBatchScheduler` documentation. Source is already async, so
+    it is up to source whether it is advanced in event loop or in a
+    separate thread.
 
     """
 
     @override
     def __init__(
         self,
-        source: SupportsIdentifiedTimestampsIterate,
+        source: SupportsAsyncIdentifiedTimestampsIterate,
         timezone: BaseTzInfo,
+        slice_duration: float | None = None,
     ) -> None:
-        BaseBatchScheduler.__init__(self, source, timezone)
+        BaseBatchScheduler.__init__(self, timezone, slice_duration)
+        self._source = source
 
     @override
     async def iterate(
@@ -130,6 +198,7 @@ class AsyncBatchScheduler(
         *,
         skip_past: bool = True,
     ) -> AsyncIterator[IdentifiedTimestamps]:
-        for array, delay in self._iterate(skip_past=skip_past):
-            await asyncio.sleep(delay)
-            yield array
+        async for array in self._source.iterate(skip_past=skip_past):
+            for part, delay in self._schedule(array):
+                await asyncio.sleep(delay)
+                yield part
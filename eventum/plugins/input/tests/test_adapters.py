@@ -1,8 +1,14 @@
+import asyncio
+import threading
+import time
+
 import numpy as np
 import pytest
 from pytz import timezone
 
 from eventum.plugins.input.adapters import (
+    AsyncIdentifiedTimestampsAdapter,
+    AsyncIdentifiedTimestampsCooperativeAdapter,
     AsyncIdentifiedTimestampsSyncAdapter,
     IdentifiedTimestampsPluginAdapter,
 )
@@ -42,6 +48,18 @@ def test_identified_timestamps_plugin_adapter(plugin):
     assert ids.pop() == 1437
 
 
+def test_identified_timestamps_plugin_adapter_runs(plugin):
+    adapted = IdentifiedTimestampsPluginAdapter(plugin=plugin)
+
+    runs = np.concatenate(
+        list(adapted.iterate_runs(size=1000, skip_past=False))
+    )
+
+    assert runs.size == plugin.generated
+    assert np.all(runs['count'] == 1)
+    assert np.all(runs['id'] == 1437)
+
+
 @pytest.mark.asyncio
 async def test_async_identified_timestamps_sync_adapter(plugin):
     source = IdentifiedTimestampsPluginAdapter(plugin=plugin)
@@ -50,3 +68,134 @@ async def test_async_identified_timestamps_sync_adapter(plugin):
 
     iterator = adapted.iterate()
     assert hasattr(iterator, '__anext__')
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_adapter(plugin):
+    source = IdentifiedTimestampsPluginAdapter(plugin=plugin)
+    batcher = TimestampsBatcher(source, batch_size=10)
+    adapted = AsyncIdentifiedTimestampsAdapter(target=batcher)
+
+    arrays = []
+    async for array in adapted.iterate(skip_past=False):
+        arrays.append(array)
+
+    assert np.concatenate(arrays).size == plugin.generated
+
+
+class BlockingTarget:
+    def __init__(self):
+        self.threads = set()
+        self.closed = False
+
+    def iterate(self, *, skip_past=True):
+        try:
+            for i in range(3):
+                self.threads.add(threading.get_ident())
+                time.sleep(0.05)
+                yield np.array([i])
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_adapter_does_not_block_loop():
+    target = BlockingTarget()
+    adapted = AsyncIdentifiedTimestampsAdapter(target=target)
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker = asyncio.create_task(tick())
+
+    arrays = [array async for array in adapted.iterate()]
+
+    ticker.cancel()
+
+    assert [array[0] for array in arrays] == [0, 1, 2]
+    assert threading.get_ident() not in target.threads
+
+    # event loop keeps running while target blocks
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_adapter_closes_target():
+    target = BlockingTarget()
+    adapted = AsyncIdentifiedTimestampsAdapter(target=target)
+
+    iterator = adapted.iterate()
+    await anext(iterator)
+    await iterator.aclose()
+
+    # target is closed in its thread without blocking event loop
+    for _ in range(100):
+        if target.closed:
+            break
+        await asyncio.sleep(0.01)
+
+    assert target.closed
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_adapter_does_not_wait_step():
+    target = BlockingTarget()
+    adapted = AsyncIdentifiedTimestampsAdapter(target=target)
+
+    task = asyncio.create_task(anext(adapted.iterate()))
+    await asyncio.sleep(0.01)
+
+    t1 = time.monotonic()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    t2 = time.monotonic()
+
+    # step in progress is not awaited on cancellation
+    assert (t2 - t1) < 0.03
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_cooperative_adapter(plugin):
+    source = IdentifiedTimestampsPluginAdapter(plugin=plugin)
+    batcher = TimestampsBatcher(source, batch_size=10)
+    adapted = AsyncIdentifiedTimestampsCooperativeAdapter(target=batcher)
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(tick())
+
+    arrays = []
+    async for array in adapted.iterate(skip_past=False):
+        arrays.append(array)
+
+    ticker.cancel()
+
+    assert np.concatenate(arrays).size == plugin.generated
+
+    # control is returned to event loop between arrays
+    assert ticks >= len(arrays) - 1
+
+
+@pytest.mark.asyncio
+async def test_async_identified_timestamps_cooperative_adapter_closes_target():
+    target = BlockingTarget()
+    adapted = AsyncIdentifiedTimestampsCooperativeAdapter(target=target)
+
+    iterator = adapted.iterate()
+    await anext(iterator)
+    await iterator.aclose()
+
+    assert target.closed
+    assert target.threads == {threading.get_ident()}
@@ -1,13 +1,18 @@
+import numpy as np
 import pytest
 from pytz import timezone
 
 from eventum.plugins.input.adapters import IdentifiedTimestampsPluginAdapter
-from eventum.plugins.input.batcher import TimestampsBatcher
+from eventum.plugins.input.batcher import (
+    AdaptiveBatchSize,
+    TimestampsBatcher,
+)
 from eventum.plugins.input.merger import InputPluginsMerger
 from eventum.plugins.input.plugins.cron.config import CronInputPluginConfig
 from eventum.plugins.input.plugins.cron.plugin import CronInputPlugin
 from eventum.plugins.input.plugins.static.config import StaticInputPluginConfig
 from eventum.plugins.input.plugins.static.plugin import StaticInputPlugin
+from eventum.plugins.input.runs import count_timestamps, expand_runs
 
 
 @pytest.fixture
@@ -102,3 +107,157 @@ def test_delay_with_size_batching(uneven_delay_source):
     batches = list(batcher.iterate(skip_past=False))
 
     assert [batch.size for batch in batches] == [10, 10, 10, 15, 5]
+
+
+@pytest.mark.parametrize('batch_delay', [None, 600])
+def test_batches_content_is_preserved(delay_source, batch_delay):
+    batcher = TimestampsBatcher(
+        source=delay_source, batch_size=7, batch_delay=batch_delay
+    )
+
+    # keep batches alive to check that their blocks are not reused
+    batches = list(batcher.iterate(skip_past=False))
+    timestamps = np.concatenate(batches)['timestamp']
+
+    assert timestamps.size == 60
+    assert np.all(np.diff(timestamps) == np.timedelta64(60, 's'))
+
+
+def test_adaptive_batch_size_grows_under_backpressure():
+    size = AdaptiveBatchSize(
+        initial_size=100, min_size=10, max_size=1000, target_latency=0.1
+    )
+
+    size.update(fill=AdaptiveBatchSize.HIGH_WATERMARK)
+    assert size.value == 200
+
+    for _ in range(10):
+        size.update(fill=1.0)
+    assert size.value == 1000
+
+
+def test_adaptive_batch_size_shrinks_when_idle():
+    size = AdaptiveBatchSize(
+        initial_size=1000, min_size=10, max_size=1000, target_latency=0.1
+    )
+
+    size.update(fill=0.0, throughput=2000)
+    assert size.value == 600  # halfway to 2000 * 0.1
+
+    size.update(fill=0.0)
+    assert size.value == 450  # halfway to half of size
+
+    for _ in range(20):
+        size.update(fill=0.0)
+    assert size.value == 10
+
+
+def test_adaptive_batch_size_follows_input_rate():
+    size = AdaptiveBatchSize(
+        initial_size=1000, min_size=10, max_size=1000, target_latency=0.1
+    )
+
+    # input rate is the limit at low EPS even if throughput is high
+    for _ in range(20):
+        size.update(fill=0.0, throughput=1_000_000, input_rate=500)
+    assert size.value == 50
+
+    size.update(fill=0.0, throughput=200, input_rate=1_000_000)
+    assert size.value == 35  # halfway to 200 * 0.1
+
+
+def test_adaptive_batch_size_is_kept_between_watermarks():
+    size = AdaptiveBatchSize(
+        initial_size=100, min_size=10, max_size=1000, target_latency=0.1
+    )
+
+    size.update(fill=0.5, throughput=1_000_000)
+    assert size.value == 100
+
+
+def test_adaptive_batch_size_is_clamped_initially():
+    size = AdaptiveBatchSize(
+        initial_size=1, min_size=10, max_size=1000, target_latency=0.1
+    )
+    assert size.value == 10
+
+
+@pytest.mark.parametrize(
+    ('min_size', 'max_size', 'target_latency'),
+    [(0, 10, 0.1), (10, 5, 0.1), (1, 10, 0)],
+)
+def test_adaptive_batch_size_invalid_parameters(
+    min_size, max_size, target_latency
+):
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(
+            initial_size=10,
+            min_size=min_size,
+            max_size=max_size,
+            target_latency=target_latency,
+        )
+
+
+def test_adaptive_size_batching(source):
+    adaptive_size = AdaptiveBatchSize(
+        initial_size=1000,
+        min_size=1000,
+        max_size=100_000,
+        target_latency=0.1,
+    )
+    batcher = TimestampsBatcher(
+        source=source,
+        batch_size=None,
+        batch_delay=None,
+        adaptive_size=adaptive_size,
+    )
+
+    sizes = []
+    for batch in batcher.iterate(skip_past=False):
+        sizes.append(batch.size)
+        adaptive_size.update(fill=1.0)
+
+    assert sum(sizes) == 1_000_000
+    assert sizes[:4] == [1000, 2000, 4000, 8000]
+    assert max(sizes) == 100_000
+
+
+def test_run_length_size_batching(source):
+    batcher = TimestampsBatcher(
+        source=source, batch_size=1000, batch_delay=None, run_length=True
+    )
+
+    batches = list(batcher.iterate(skip_past=False))
+
+    assert len(batches) == 1000
+    assert all(batch.size == 1 for batch in batches)
+    assert all(count_timestamps(batch) == 1000 for batch in batches)
+
+
+def test_run_length_delay_with_size_batching(uneven_delay_source):
+    batcher = TimestampsBatcher(
+        source=uneven_delay_source,
+        batch_size=15,
+        batch_delay=600,
+        run_length=True,
+    )
+
+    batches = list(batcher.iterate(skip_past=False))
+
+    assert [count_timestamps(batch) for batch in batches] == [
+        10,
+        10,
+        10,
+        15,
+        5,
+    ]
+
+    expected = np.concatenate(
+        list(
+            TimestampsBatcher(
+                source=uneven_delay_source, batch_size=15, batch_delay=600
+            ).iterate(skip_past=False)
+        )
+    )
+    expanded = np.concatenate([expand_runs(batch) for batch in batches])
+    assert np.array_equal(expanded, expected)
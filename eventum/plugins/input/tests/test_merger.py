@@ -11,6 +11,9 @@ from eventum.plugins.input.plugins.linspace.config import (
     LinspaceInputPluginConfig,
 )
 from eventum.plugins.input.plugins.linspace.plugin import LinspaceInputPlugin
+from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
+from eventum.plugins.input.plugins.timer.plugin import TimerInputPlugin
+from eventum.plugins.input.runs import count_timestamps, expand_runs
 
 
 def test_merger():
@@ -69,6 +72,66 @@ def test_merger():
     assert occurrences[3] == 100_000
 
 
+def test_merger_order_and_batch_sizes():
+    start = datetime(2024, 1, 1, tzinfo=timezone('UTC'))
+
+    plugins = [
+        LinspaceInputPlugin(
+            config=LinspaceInputPluginConfig(
+                start=start + timedelta(seconds=i),
+                end=start + timedelta(seconds=100 + i),
+                count=25_000,
+            ),
+            params={'id': 10 - i, 'timezone': timezone('UTC')},
+        )
+        for i in range(4)
+    ]
+
+    merger = InputPluginsMerger(plugins=plugins)
+
+    batches = list(merger.iterate(7000, skip_past=False))
+    array = np.concatenate(batches)
+
+    assert array.size == 100_000
+    assert all(batch.size == 7000 for batch in batches[:-1])
+    assert batches[-1].size == 100_000 % 7000
+
+    # equal timestamps are ordered by plugin ids
+    assert np.array_equal(array, np.sort(array, order=['timestamp', 'id']))
+
+
 def test_merger_with_no_provided_plugins():
     with pytest.raises(ValueError):
         InputPluginsMerger(plugins=[])
+
+
+def test_merger_runs():
+    start = datetime(2024, 1, 1, tzinfo=timezone('UTC'))
+
+    def create_merger():
+        return InputPluginsMerger(
+            plugins=[
+                TimerInputPlugin(
+                    config=TimerInputPluginConfig(
+                        start=start + timedelta(seconds=i),
+                        seconds=3,
+                        count=100 * (i + 1),
+                        repeat=1000,
+                    ),
+                    params={'id': 10 - i, 'timezone': timezone('UTC')},
+                )
+                for i in range(3)
+            ]
+        )
+
+    batches = list(create_merger().iterate_runs(7000, skip_past=False))
+
+    assert all(count_timestamps(batch) == 7000 for batch in batches[:-1])
+
+    expected = np.concatenate(
+        list(create_merger().iterate(7000, skip_past=False))
+    )
+    expanded = np.concatenate([expand_runs(batch) for batch in batches])
+
+    assert expanded.size == 600_000
+    assert np.array_equal(expanded, expected)
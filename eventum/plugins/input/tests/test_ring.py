@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+import pytest
+
+from eventum.plugins.input.ring import BlocksRing
+
+
+def data_address(array: np.ndarray) -> int:
+    return array.__array_interface__['data'][0]
+
+
+def test_acquire():
+    ring = BlocksRing(block_size=10, capacity=2)
+
+    array = ring.acquire(5)
+
+    assert array.size == 5
+    assert array.dtype.names == ('timestamp', 'id')
+
+
+def test_block_reused_when_released():
+    ring = BlocksRing(block_size=10, capacity=1)
+
+    array = ring.acquire(5)
+    address = data_address(array)
+    del array
+
+    assert data_address(ring.acquire(10)) == address
+
+
+def test_block_not_reused_while_views_alive():
+    ring = BlocksRing(block_size=10, capacity=2)
+
+    first = ring.acquire(10)
+    view = first[3:5]
+    address = data_address(first)
+    del first
+
+    second = ring.acquire(10)
+    assert data_address(second) != address
+
+    third = ring.acquire(10)
+    assert third.base is None
+    assert data_address(view) == address + 3 * view.itemsize
+
+
+def test_block_not_reused_while_nested_views_alive():
+    ring = BlocksRing(block_size=10, capacity=1)
+
+    array = ring.acquire(10)
+    array['id'] = 7
+    view = array[2:8][::2]
+    del array
+
+    other = ring.acquire(10)
+    other['id'] = 0
+
+    assert other.base is None
+    assert view['id'].tolist() == [7, 7, 7]
+
+
+def test_block_released_in_other_thread():
+    ring = BlocksRing(block_size=10, capacity=1)
+
+    array = ring.acquire(10)
+    address = data_address(array)
+
+    thread = threading.Thread(
+        target=lambda arrays: arrays.clear(), args=([array],)
+    )
+    del array
+    thread.start()
+    thread.join()
+
+    assert data_address(ring.acquire(10)) == address
+
+
+def test_oversized_acquire():
+    ring = BlocksRing(block_size=10)
+
+    array = ring.acquire(11)
+
+    assert array.size == 11
+    assert array.base is None
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        BlocksRing(block_size=0)
+
+    with pytest.raises(ValueError):
+        BlocksRing(block_size=10, capacity=0)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from eventum.plugins.input.runs import (
+    IDENTIFIED_TIMESTAMP_RUNS_DTYPE,
+    RunsCursor,
+    batch_runs,
+    count_timestamps,
+    encode_runs,
+    expand_runs,
+    is_runs,
+    split_runs,
+)
+
+
+@pytest.fixture
+def timestamps():
+    return np.array(
+        ['2024-01-01T00:00:00'] * 3
+        + ['2024-01-01T00:00:01']
+        + ['2024-01-01T00:00:02'] * 2,
+        dtype='datetime64[us]',
+    )
+
+
+@pytest.fixture
+def runs(timestamps):
+    encoded = encode_runs(timestamps)
+
+    runs = np.empty(encoded.size, dtype=IDENTIFIED_TIMESTAMP_RUNS_DTYPE)
+    runs['timestamp'] = encoded['timestamp']
+    runs['count'] = encoded['count']
+    runs['id'] = 1
+
+    return runs
+
+
+def test_encode_runs(timestamps):
+    runs = encode_runs(timestamps)
+
+    assert runs['count'].tolist() == [3, 1, 2]
+    assert np.array_equal(runs['timestamp'], np.unique(timestamps))
+
+
+def test_encode_empty_runs():
+    runs = encode_runs(np.array([], dtype='datetime64[us]'))
+
+    assert runs.size == 0
+    assert is_runs(runs)
+
+
+def test_expand_runs(timestamps, runs):
+    expanded = expand_runs(runs)
+
+    assert not is_runs(expanded)
+    assert np.array_equal(expanded['timestamp'], timestamps)
+    assert np.all(expanded['id'] == 1)
+
+
+def test_split_runs_inside_run(runs):
+    head, tail = split_runs(runs, 2)
+
+    assert head['count'].tolist() == [2]
+    assert tail['count'].tolist() == [1, 1, 2]
+
+    # source runs are not modified
+    assert runs['count'].tolist() == [3, 1, 2]
+
+
+def test_split_runs_on_boundary(runs):
+    head, tail = split_runs(runs, 4)
+
+    assert head['count'].tolist() == [3, 1]
+    assert tail['count'].tolist() == [2]
+
+
+def test_split_runs_with_exceeding_size(runs):
+    head, tail = split_runs(runs, 100)
+
+    assert head.size == 3
+    assert tail.size == 0
+
+
+def test_runs_cursor(runs):
+    cursor = RunsCursor(runs)
+
+    assert cursor.take(0).size == 0
+    assert cursor.take(2)['count'].tolist() == [2]
+    assert cursor.index == 0
+    assert cursor.remaining == 4
+
+    # part can be limited by index of run
+    assert cursor.take(end=1)['count'].tolist() == [1]
+    assert cursor.index == 1
+    assert cursor.take(end=1).size == 0
+
+    assert cursor.timestamps.size == 2
+    assert cursor.take(2)['count'].tolist() == [1, 1]
+    assert cursor.take()['count'].tolist() == [1]
+    assert cursor.remaining == 0
+    assert cursor.take().size == 0
+
+    # source runs are not modified
+    assert runs['count'].tolist() == [3, 1, 2]
+
+
+def test_runs_cursor_copies_only_divided_runs(runs):
+    cursor = RunsCursor(runs)
+
+    assert np.shares_memory(cursor.take(3), runs)
+    assert not np.shares_memory(cursor.take(2), runs)
+    assert cursor.take()['count'].tolist() == [1]
+
+
+def test_batch_runs(timestamps, runs):
+    batches = list(batch_runs([runs, runs], 4))
+
+    assert [count_timestamps(batch) for batch in batches] == [4, 4, 4]
+    assert np.array_equal(
+        np.concatenate([expand_runs(batch) for batch in batches])['timestamp'],
+        np.concatenate([timestamps, timestamps]),
+    )
@@ -1,10 +1,18 @@
 import time
+from datetime import datetime, timedelta
 
 import pytest
 from pytz import timezone
 
-from eventum.plugins.input.adapters import IdentifiedTimestampsPluginAdapter
+from eventum.plugins.input.adapters import (
+    AsyncIdentifiedTimestampsCooperativeAdapter,
+    IdentifiedTimestampsPluginAdapter,
+)
 from eventum.plugins.input.batcher import TimestampsBatcher
+from eventum.plugins.input.plugins.linspace.config import (
+    LinspaceInputPluginConfig,
+)
+from eventum.plugins.input.plugins.linspace.plugin import LinspaceInputPlugin
 from eventum.plugins.input.plugins.static.config import StaticInputPluginConfig
 from eventum.plugins.input.plugins.static.plugin import StaticInputPlugin
 from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
@@ -69,8 +77,10 @@ def test_scheduler_delay(delayed_source):
 @pytest.mark.asyncio
 async def test_async_scheduler(instant_source):
     scheduler = AsyncBatchScheduler(
-        source=TimestampsBatcher(
-            source=instant_source, batch_size=100, batch_delay=None
+        source=AsyncIdentifiedTimestampsCooperativeAdapter(
+            target=TimestampsBatcher(
+                source=instant_source, batch_size=100, batch_delay=None
+            )
         ),
         timezone=timezone('UTC'),
     )
@@ -88,8 +98,10 @@ async def test_async_scheduler(instant_source):
 @pytest.mark.asyncio
 async def test_async_scheduler_delay(delayed_source):
     scheduler = AsyncBatchScheduler(
-        source=TimestampsBatcher(
-            source=delayed_source, batch_size=100, batch_delay=None
+        source=AsyncIdentifiedTimestampsCooperativeAdapter(
+            target=TimestampsBatcher(
+                source=delayed_source, batch_size=100, batch_delay=None
+            )
         ),
         timezone=timezone('UTC'),
     )
@@ -102,3 +114,79 @@ async def test_async_scheduler_delay(delayed_source):
 
     assert len(batches) == 10
     assert (t2 - t1) >= 0.5
+
+
+@pytest.fixture
+def spread_source():
+    now = datetime.now().astimezone(timezone('UTC'))
+    return IdentifiedTimestampsPluginAdapter(
+        LinspaceInputPlugin(
+            config=LinspaceInputPluginConfig(
+                start=now + timedelta(seconds=0.01),
+                end=now + timedelta(seconds=0.5),
+                count=50,
+            ),
+            params={'id': 1, 'timezone': timezone('UTC')},
+        ),
+    )
+
+
+def _check_releases(releases):
+    for batch, released_at in releases:
+        latest = batch['timestamp'][-1].astype(datetime)
+        lag = released_at - timezone('UTC').localize(latest).timestamp()
+
+        # slice is never released ahead of its last timestamp
+        assert -0.005 <= lag < 0.1
+
+
+def test_scheduler_slices(spread_source):
+    scheduler = BatchScheduler(
+        source=TimestampsBatcher(
+            source=spread_source,
+            batch_size=1000,
+            batch_delay=None,
+        ),
+        timezone=timezone('UTC'),
+        slice_duration=0.05,
+    )
+
+    releases = [
+        (batch, time.time()) for batch in scheduler.iterate(skip_past=False)
+    ]
+
+    assert sum(batch.size for batch, _ in releases) == 50
+    assert 10 <= len(releases) <= 11
+    _check_releases(releases)
+
+
+@pytest.mark.asyncio
+async def test_async_scheduler_slices(spread_source):
+    scheduler = AsyncBatchScheduler(
+        source=AsyncIdentifiedTimestampsCooperativeAdapter(
+            target=TimestampsBatcher(
+                source=spread_source,
+                batch_size=1000,
+                batch_delay=None,
+            )
+        ),
+        timezone=timezone('UTC'),
+        slice_duration=0.05,
+    )
+
+    releases = []
+    async for batch in scheduler.iterate(skip_past=False):
+        releases.append((batch, time.time()))
+
+    assert sum(batch.size for batch, _ in releases) == 50
+    assert 10 <= len(releases) <= 11
+    _check_releases(releases)
+
+
+def test_scheduler_invalid_slice_duration(instant_source):
+    with pytest.raises(ValueError):
+        BatchScheduler(
+            source=TimestampsBatcher(source=instant_source),
+            timezone=timezone('UTC'),
+            slice_duration=0,
+        )
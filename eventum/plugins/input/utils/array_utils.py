@@ -1,9 +1,17 @@
 """Utils for working with numpy arrays."""
 
 from collections.abc import Sequence
+from typing import Any
 
-from numpy import concatenate, datetime64, searchsorted, sort
-from numpy.typing import NDArray
+from numpy import (
+    arange,
+    datetime64,
+    empty_like,
+    full,
+    intp,
+    searchsorted,
+)
+from numpy.typing import DTypeLike, NDArray
 
 
 def get_future_slice(
@@ -76,13 +84,157 @@ def chunk_array(array: NDArray, size: int) -> list[NDArray]:
     return [array[i : i + size] for i in range(0, array.size, size)]
 
 
-def merge_arrays(arrays: Sequence[NDArray]) -> NDArray:
+def _merge_two(
+    left: NDArray,
+    right: NDArray,
+    out: NDArray,
+) -> tuple[NDArray[intp], NDArray[intp]]:
+    """Merge two sorted arrays into output array.
+
+    Parameters
+    ----------
+    left : NDArray
+        Left array to merge, its elements precede equal elements of
+        right array.
+
+    right : NDArray
+        Right array to merge.
+
+    out : NDArray
+        Output array with size equal to total size of arrays.
+
+    Returns
+    -------
+    tuple[NDArray[intp], NDArray[intp]]
+        Positions of elements of left and right arrays in output array.
+
+    """
+    left_positions = searchsorted(right, left, side='left')
+    left_positions += arange(left.size)
+
+    right_positions = searchsorted(left, right, side='right')
+    right_positions += arange(right.size)
+
+    out[left_positions] = left
+    out[right_positions] = right
+
+    return left_positions, right_positions
+
+
+def _merge_nodes(
+    left: tuple[NDArray, NDArray | None],
+    right: tuple[NDArray, NDArray | None],
+    out: NDArray | None,
+    labels_out: NDArray | None,
+) -> tuple[NDArray, NDArray | None]:
+    """Merge two nodes of merge tree.
+
+    Parameters
+    ----------
+    left : tuple[NDArray, NDArray | None]
+        Left node as sorted array and optional labels of its elements.
+
+    right : tuple[NDArray, NDArray | None]
+        Right node as sorted array and optional labels of its elements.
+
+    out : NDArray | None
+        Output array for merged elements, new array is allocated if
+        value is `None`.
+
+    labels_out : NDArray | None
+        Output array for labels of merged elements, new array is
+        allocated if value is `None` and nodes have labels.
+
+    Returns
+    -------
+    tuple[NDArray, NDArray | None]
+        Merged node.
+
+    """
+    left_array, left_labels = left
+    right_array, right_labels = right
+    size = len(left_array) + len(right_array)
+
+    if out is None:
+        out = empty_like(left_array, shape=size)
+
+    left_positions, right_positions = _merge_two(left_array, right_array, out)
+
+    if left_labels is None or right_labels is None:
+        return out, None
+
+    if labels_out is None:
+        labels_out = empty_like(left_labels, shape=size)
+
+    labels_out[left_positions] = left_labels
+    labels_out[right_positions] = right_labels
+
+    return out, labels_out
+
+
+def _label_arrays(
+    arrays: Sequence[NDArray],
+    labels: Sequence[Any],
+    dtype: DTypeLike,
+) -> list[tuple[NDArray, NDArray | None]]:
+    """Build leaf nodes of merge tree with labeled elements.
+
+    Parameters
+    ----------
+    arrays : Sequence[NDArray]
+        Arrays to label.
+
+    labels : Sequence[Any]
+        Label for each of the arrays.
+
+    dtype : DTypeLike
+        Data type of labels.
+
+    Returns
+    -------
+    list[tuple[NDArray, NDArray | None]]
+        Arrays with labels of their elements.
+
+    Raises
+    ------
+    ValueError
+        If number of labels does not match number of arrays.
+
+    """
+    return [
+        (array, full(len(array), label, dtype=dtype))
+        for array, label in zip(arrays, labels, strict=True)
+    ]
+
+
+def merge_arrays(  # noqa: C901
+    arrays: Sequence[NDArray],
+    out: NDArray | None = None,
+    labels: Sequence[Any] | None = None,
+    labels_out: NDArray | None = None,
+) -> NDArray:
     """Merge sorted arrays.
 
+    Arrays are merged pairwise in a balanced tree of vectorized two-way
+    merges, so no sorting is performed and each element is moved once
+    per tree level.
+
     Parameters
     ----------
     arrays : Sequence[NDArray]
-        Arrays to merge.
+        Arrays sorted in ascending order to merge.
+
+    out : NDArray | None, default=None
+        Array with size equal to total size of arrays to write merged
+        elements to, new array is allocated if value is `None`.
+
+    labels : Sequence[Any] | None, default=None
+        Label for each of the arrays, if provided, then label of source
+        array is written for each merged element to `labels_out`.
+
+    labels_out : NDArray | None, default=None
+        Array with size equal to total size of arrays to write labels
+        of merged elements to, must be provided along with `labels`.
 
     Returns
     -------
@@ -92,19 +244,65 @@ def merge_arrays(arrays: Sequence[NDArray]) -> NDArray:
     Raises
     ------
     ValueError
-        If arrays sequence is empty.
+        If arrays sequence is empty, size of output arrays does not
+        match total size of arrays or labels are inconsistent with
+        arrays.
 
     Notes
     -----
-    If array is structured or multidimensional then zeroth axis is used.
+    Merge is stable: equal elements keep order of arrays in sequence.
+
+    Arrays must be one-dimensional, elements of structured arrays are
+    compared field by field.
 
     """
     if not arrays:
         msg = 'At least one array must be provided'
         raise ValueError(msg)
 
-    return sort(
-        a=concatenate(arrays),
-        kind='mergesort',
-        axis=0,
-    )
+    if (labels is None) != (labels_out is None):
+        msg = 'Parameters `labels` and `labels_out` must be provided together'
+        raise ValueError(msg)
+
+    total_size = sum(len(array) for array in arrays)
+
+    if out is None:
+        out = empty_like(arrays[0], shape=total_size)
+
+    for array_out in (out, labels_out):
+        if array_out is not None and len(array_out) != total_size:
+            msg = 'Size of output array must match total size of arrays'
+            raise ValueError(msg)
+
+    # each node of the tree is merged array and labels of its elements
+    nodes: list[tuple[NDArray, NDArray | None]] = [
+        (array, None) for array in arrays
+    ]
+    if labels is not None and labels_out is not None:
+        nodes = _label_arrays(arrays, labels, labels_out.dtype)
+
+    if len(nodes) == 1:
+        ((array, array_labels),) = nodes
+        out[:] = array
+
+        if labels_out is not None:
+            labels_out[:] = array_labels
+
+    while len(nodes) > 1:
+        is_last_level = len(nodes) == 2  # noqa: PLR2004
+        next_nodes = [
+            _merge_nodes(
+                left=nodes[i],
+                right=nodes[i + 1],
+                out=out if is_last_level else None,
+                labels_out=labels_out if is_last_level else None,
+            )
+            for i in range(0, len(nodes) - 1, 2)
+        ]
+
+        if len(nodes) % 2 == 1:
+            next_nodes.append(nodes[-1])
+
+        nodes = next_nodes
+
+    return out
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from eventum.plugins.input.utils.array_utils import (
     chunk_array,
@@ -94,7 +95,7 @@ def test_merge_arrays():
 
     values = set()
     for _ in range(10):
-        arr = np.random.uniform(0, 1000, 1000)
+        arr = np.sort(np.random.uniform(0, 1000, 1000))
         values |= set(arr)
         arrays.append(arr)
 
@@ -103,3 +104,45 @@ def test_merge_arrays():
     assert result.size == 10_000
     assert set(result) == set(values)
     assert np.all(result[:-1] <= result[1:])
+
+
+def test_merge_arrays_with_output_and_labels():
+    arrays = [
+        np.array([1, 3, 5, 5]),
+        np.array([2, 5, 6]),
+        np.array([], dtype=int),
+        np.array([0, 5]),
+    ]
+    out = np.empty(9, dtype=int)
+    labels_out = np.empty(9, dtype=np.uint16)
+
+    result = merge_arrays(
+        arrays, out=out, labels=[1, 2, 3, 4], labels_out=labels_out
+    )
+
+    assert result is out
+    assert out.tolist() == [0, 1, 2, 3, 5, 5, 5, 5, 6]
+    assert labels_out.tolist() == [4, 1, 2, 1, 1, 1, 2, 4, 2]
+
+
+def test_merge_single_array():
+    out = np.empty(3, dtype=int)
+    labels_out = np.empty(3, dtype=np.uint16)
+
+    merge_arrays(
+        [np.array([1, 2, 3])], out=out, labels=[7], labels_out=labels_out
+    )
+
+    assert out.tolist() == [1, 2, 3]
+    assert labels_out.tolist() == [7, 7, 7]
+
+
+def test_merge_arrays_invalid_parameters():
+    with pytest.raises(ValueError):
+        merge_arrays([])
+
+    with pytest.raises(ValueError):
+        merge_arrays([np.array([1]), np.array([2])], out=np.empty(3))
+
+    with pytest.raises(ValueError):
+        merge_arrays([np.array([1])], labels=[1])
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 import pytz
 from numpy import datetime64, timedelta64
@@ -9,6 +10,7 @@ from eventum.plugins.input.utils.time_utils import (
     skip_periods,
     timedelta64_to_seconds,
     to_naive,
+    utc_to_naive,
 )
 
 
@@ -63,3 +65,27 @@ def test_skip_periods():
             duration=timedelta(hours=-1),
             ret_timestamp='first_future',
         )
+
+
+@pytest.mark.parametrize(
+    'tz', ['UTC', 'Etc/GMT-3', 'Europe/Berlin', 'America/New_York']
+)
+def test_utc_to_naive(tz):
+    tz = pytz.timezone(tz)
+    timestamps = np.arange(
+        np.datetime64('2024-01-01T00:00:00', 'us'),
+        np.datetime64('2025-01-01T00:00:00', 'us'),
+        np.timedelta64(1234567, 's'),
+    )
+
+    expected = [
+        datetime64(
+            to_naive(pytz.utc.localize(timestamp), tz),
+            'us',
+        )
+        for timestamp in timestamps.tolist()
+    ]
+
+    assert utc_to_naive(timestamps, tz).tolist() == [
+        timestamp.item() for timestamp in expected
+    ]
@@ -1,10 +1,12 @@
 """Utils for time related operations."""
 
 from datetime import datetime, timedelta
+from functools import cache
 from math import ceil, floor
 from typing import Literal, assert_never
 
-from numpy import datetime64, timedelta64
+from numpy import array, datetime64, maximum, searchsorted, timedelta64
+from numpy.typing import NDArray
 from pytz import BaseTzInfo
 
 
@@ -67,6 +69,86 @@ def to_naive(timestamp: datetime, timezone: BaseTzInfo) -> datetime:
     return timestamp.astimezone(timezone).replace(tzinfo=None)
 
 
+@cache
+def get_utc_transitions(
+    timezone: BaseTzInfo,
+) -> tuple[NDArray[datetime64], NDArray[timedelta64]]:
+    """Get transitions of UTC offset in timezone.
+
+    Parameters
+    ----------
+    timezone : BaseTzInfo
+        Timezone to get transitions of.
+
+    Returns
+    -------
+    tuple[NDArray[datetime64], NDArray[timedelta64]]
+        Sorted moments of transitions in naive UTC time and UTC offsets
+        that are in effect starting from these moments. The first
+        moment precedes any representable timestamp.
+
+    Notes
+    -----
+    Returned arrays are cached for each timezone and must not be
+    modified.
+
+    """
+    # only timezones with transitions (`DstTzInfo`) have these
+    # attributes, other timezones have constant offset
+    transition_times: list[datetime] | None = getattr(
+        timezone,
+        '_utc_transition_times',
+        None,
+    )
+    transition_info: list[tuple[timedelta, timedelta, str]] | None = getattr(
+        timezone,
+        '_transition_info',
+        None,
+    )
+
+    if transition_times is None or transition_info is None:
+        moments = [datetime.min]
+        offsets = [timezone.utcoffset(datetime.min) or timedelta()]
+    else:
+        moments = [datetime.min, *transition_times[1:]]
+        offsets = [offset for offset, _, _ in transition_info]
+
+    return (
+        array(moments, dtype='datetime64[us]'),
+        array(offsets, dtype='timedelta64[us]'),
+    )
+
+
+def utc_to_naive(
+    timestamps: NDArray[datetime64],
+    timezone: BaseTzInfo,
+) -> NDArray[datetime64]:
+    """Convert array of naive UTC timestamps to naive timestamps of
+    specified timezone.
+
+    Parameters
+    ----------
+    timestamps : NDArray[datetime64]
+        Timestamps in naive UTC time.
+
+    timezone : BaseTzInfo
+        Timezone to convert timestamps to.
+
+    Returns
+    -------
+    NDArray[datetime64]
+        Timestamps in naive time of timezone.
+
+    """
+    moments, offsets = get_utc_transitions(timezone)
+
+    if offsets.size == 1:
+        return timestamps + offsets[0]
+
+    indices = searchsorted(moments, timestamps, side='right') - 1
+    return timestamps + offsets[maximum(indices, 0)]
+
+
 def skip_periods(
     start: datetime,
     moment: datetime,
@@ -0,0 +1 @@
+"""Package with null output plugin implementation."""
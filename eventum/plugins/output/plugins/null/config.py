@@ -0,0 +1,7 @@
+"""Definition of null output plugin config."""
+
+from eventum.plugins.output.base.config import OutputPluginConfig
+
+
+class NullOutputPluginConfig(OutputPluginConfig, frozen=True):
+    """Configuration for `null` output plugin."""
@@ -0,0 +1,43 @@
+"""Definition of null output plugin."""
+
+from collections.abc import Sequence
+from typing import override
+
+from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.plugins.null.config import NullOutputPluginConfig
+
+
+class NullOutputPlugin(
+    OutputPlugin[NullOutputPluginConfig, OutputPluginParams],
+):
+    """Output plugin that discards all events. It is useful for
+    measuring throughput of generation without any output overhead
+    except formatting, size of discarded events is counted.
+    """
+
+    @override
+    def __init__(
+        self,
+        config: NullOutputPluginConfig,
+        params: OutputPluginParams,
+    ) -> None:
+        super().__init__(config, params)
+        self._written_bytes = 0
+
+    @override
+    async def _open(self) -> None:
+        pass
+
+    @override
+    async def _close(self) -> None:
+        pass
+
+    @override
+    async def _write(self, events: Sequence[str]) -> int:
+        self._written_bytes += sum(len(event.encode()) for event in events)
+        return len(events)
+
+    @property
+    def written_bytes(self) -> int:
+        """Size of written events in bytes (in UTF-8 encoding)."""
+        return self._written_bytes
@@ -0,0 +1,39 @@
+import pytest
+
+from eventum.plugins.output.fields import JsonFormatterConfig
+from eventum.plugins.output.formatters import Format
+from eventum.plugins.output.plugins.null.config import NullOutputPluginConfig
+from eventum.plugins.output.plugins.null.plugin import NullOutputPlugin
+
+
+@pytest.mark.asyncio
+async def test_plugin_write():
+    plugin = NullOutputPlugin(
+        config=NullOutputPluginConfig(),
+        params={'id': 1},
+    )
+
+    await plugin.open()
+    written = await plugin.write(['event1', 'event2', 'event3'])
+    await plugin.close()
+
+    assert written == 3
+    assert plugin.written == 3
+    assert plugin.written_bytes == len('event1event2event3')
+
+
+@pytest.mark.asyncio
+async def test_plugin_write_with_format():
+    plugin = NullOutputPlugin(
+        config=NullOutputPluginConfig(
+            formatter=JsonFormatterConfig(format=Format.JSON),
+        ),
+        params={'id': 1},
+    )
+
+    await plugin.open()
+    written = await plugin.write(['{"a": 1}', 'not json'])
+    await plugin.close()
+
+    assert written == 1
+    assert plugin.written == 1
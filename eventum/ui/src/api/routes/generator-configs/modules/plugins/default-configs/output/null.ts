@@ -0,0 +1,3 @@
+import { NullOutputPluginConfig } from '@/api/routes/generator-configs/schemas/plugins/output/configs/null';
+
+export const NullOutputPluginDefaultConfig: NullOutputPluginConfig = {};
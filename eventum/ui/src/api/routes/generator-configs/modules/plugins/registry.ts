@@ -11,6 +11,7 @@ import {
   IconRepeat,
   IconTerminal2,
   IconTimeDuration45,
+  IconTrash,
 } from '@tabler/icons-react';
 
 import { EventPluginConfig } from '../../schemas/plugins/event';
@@ -32,6 +33,7 @@ import { TimestampsInputPluginDefaultConfig } from './default-configs/input/time
 import { ClickhouseOutputPluginDefaultConfig } from './default-configs/output/clickhouse';
 import { FileOutputPluginDefaultConfig } from './default-configs/output/file';
 import { HTTPOutputPluginDefaultConfig } from './default-configs/output/http';
+import { NullOutputPluginDefaultConfig } from './default-configs/output/null';
 import { OpensearchOutputPluginDefaultConfig } from './default-configs/output/opensearch';
 import { StdoutOutputPluginDefaultConfig } from './default-configs/output/stdout';
 import { IconClickHouse } from '@/components/ui/icons/IconClickHouse';
@@ -118,6 +120,11 @@ export const OUTPUT_PLUGINS_INFO = {
     icon: IconCode,
     description: 'Send events using HTTP requests',
   },
+  null: {
+    label: 'Null',
+    icon: IconTrash,
+    description: 'Discard events',
+  },
   opensearch: {
     label: 'OpenSearch',
     icon: IconOpenSearch,
@@ -161,6 +168,7 @@ export const OUTPUT_PLUGIN_DEFAULT_CONFIGS = {
   clickhouse: ClickhouseOutputPluginDefaultConfig,
   file: FileOutputPluginDefaultConfig,
   http: HTTPOutputPluginDefaultConfig,
+  null: NullOutputPluginDefaultConfig,
   opensearch: OpensearchOutputPluginDefaultConfig,
   stdout: StdoutOutputPluginDefaultConfig,
 } as const satisfies Record<OutputPluginName, OutputPluginConfig>;
@@ -9,6 +9,12 @@ export const enum SampleType {
   JSON = 'json',
 }
 
+export const enum SamplesLoadingMode {
+  Eager = 'eager',
+  Lazy = 'lazy',
+  Prefetch = 'prefetch',
+}
+
 export const enum TemplatePickingMode {
   All = 'all',
   Any = 'any',
@@ -29,12 +35,14 @@ const CSVSampleConfigSchema = z.object({
   header: z.boolean().optional(),
   delimiter: z.string().min(1),
   source: z.string().endsWith('.csv'),
+  cache: z.boolean().optional(),
 });
 export type CSVSampleConfig = z.infer<typeof CSVSampleConfigSchema>;
 
 const JSONSampleConfigSchema = z.object({
   type: z.literal(SampleType.JSON),
   source: z.string().endsWith('.json'),
+  cache: z.boolean().optional(),
 });
 export type JSONSampleConfig = z.infer<typeof JSONSampleConfigSchema>;
 
@@ -74,10 +82,23 @@ export type TemplateConfigForFSMMode = z.infer<
   typeof TemplateConfigForFSMModeSchema
 >;
 
+const TemplateBatchConfigSchema = z.object({
+  separator: z.string().min(1).optional(),
+});
+export type TemplateBatchConfig = z.infer<typeof TemplateBatchConfigSchema>;
+
 const TemplateEventPluginConfigCommonFieldsSchema =
   BaseEventPluginConfigSchema.extend({
     params: z.object().optional(),
     samples: z.record(z.string(), SampleConfigSchema).optional(),
+    samples_loading: z
+      .union([
+        z.literal(SamplesLoadingMode.Eager),
+        z.literal(SamplesLoadingMode.Lazy),
+        z.literal(SamplesLoadingMode.Prefetch),
+      ])
+      .optional(),
+    batch: TemplateBatchConfigSchema.nullable().optional(),
   });
 
 const TemplateEventPluginConfigForGeneralModesSchema =
@@ -6,6 +6,7 @@ export type OutputPluginName =
   | 'clickhouse'
   | 'file'
   | 'http'
+  | 'null'
   | 'opensearch'
   | 'stdout';
 
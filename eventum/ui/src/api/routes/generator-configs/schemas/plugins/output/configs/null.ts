@@ -0,0 +1,11 @@
+import z from 'zod';
+
+import { BaseOutputPluginConfigSchema } from '../base-config';
+
+export const NullOutputPluginConfigSchema = BaseOutputPluginConfigSchema;
+export type NullOutputPluginConfig = z.infer<
+  typeof NullOutputPluginConfigSchema
+>;
+export const NullOutputPluginNamedConfigSchema = z.object({
+  null: NullOutputPluginConfigSchema,
+});
@@ -12,6 +12,10 @@ import {
   HTTPOutputPluginConfigSchema,
   HTTPOutputPluginNamedConfigSchema,
 } from './configs/http';
+import {
+  NullOutputPluginConfigSchema,
+  NullOutputPluginNamedConfigSchema,
+} from './configs/null';
 import {
   OpensearchOutputPluginConfigSchema,
   OpensearchOutputPluginNamedConfigSchema,
@@ -25,6 +29,7 @@ export const OutputPluginNamedConfigSchema = z.union([
   ClickhouseOutputPluginNamedConfigSchema,
   FileOutputPluginNamedConfigSchema,
   HTTPOutputPluginNamedConfigSchema,
+  NullOutputPluginNamedConfigSchema,
   OpensearchOutputPluginNamedConfigSchema,
   StdoutOutputPluginNamedConfigSchema,
 ]);
@@ -36,6 +41,7 @@ export const OutputPluginConfigSchema = z.union([
   ClickhouseOutputPluginConfigSchema,
   FileOutputPluginConfigSchema,
   HTTPOutputPluginConfigSchema,
+  NullOutputPluginConfigSchema,
   OpensearchOutputPluginConfigSchema,
   StdoutOutputPluginConfigSchema,
 ]);
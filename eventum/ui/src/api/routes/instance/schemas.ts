@@ -49,9 +49,25 @@ export const APIParametersSchema = z.object({
   auth: AuthParametersSchema,
 });
 
+export const AdaptiveBatchParametersSchema = z
+  .object({
+    enabled: z.boolean(),
+    min_size: z.number().int().gte(1),
+    max_size: z.number().int().gte(1),
+    target_latency: z.number().gt(0),
+  })
+  .refine((value) => value.min_size <= value.max_size, {
+    message: 'Minimum size cannot be greater than maximum size',
+    path: ['min_size'],
+  });
+
 export const BatchParametersSchema = z.object({
   size: z.number().gte(1).int().nullable(),
   delay: z.number().gte(0.1).nullable(),
+  flush_size: z.number().int().gte(1).nullable(),
+  adaptive: AdaptiveBatchParametersSchema,
+  release_slice: z.number().gte(0.001).nullable(),
+  run_length: z.boolean(),
 });
 
 const QueueParametersSchema = z.object({
@@ -59,6 +75,8 @@ const QueueParametersSchema = z.object({
   max_event_batches: z.number().int().gte(1),
 });
 
+export const ISOLATION_MODES = ['thread', 'process'];
+
 export const GenerationParametersSchema = z.object({
   timezone: z.enum(TIMEZONES),
   batch: BatchParametersSchema,
@@ -66,6 +84,8 @@ export const GenerationParametersSchema = z.object({
   keep_order: z.boolean(),
   max_concurrency: z.number().int().gte(1),
   write_timeout: z.number().int().gte(1),
+  workers: z.number().int().gte(1),
+  isolation: z.enum(ISOLATION_MODES),
 });
 
 export const LOG_LEVELS = ['debug', 'info', 'warning', 'error', 'critical'];
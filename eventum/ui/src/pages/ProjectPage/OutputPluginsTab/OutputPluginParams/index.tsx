@@ -27,6 +27,7 @@ const pluginNamesToParamsComponent = {
   clickhouse: ClickhouseOutputPluginParams,
   file: FileOutputPluginParams,
   http: '',
+  null: '',
   opensearch: '',
   stdout: '',
 } as const satisfies {